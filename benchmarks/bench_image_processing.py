@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Verkleinern mit Draft-Modus/reduce() vs. vollständigem Dekodieren
+
+Vergleicht Laufzeit und Spitzen-Speicher (RSS) des bisherigen Pfads
+(Image.open + thumbnail() mit Platzhalter-Box 10000 bei nur einer Kante)
+mit ImageProcessor.resize_image/create_thumbnail.
+
+Jede Messung läuft in einem eigenen Prozess, damit der RSS-Höchststand
+(ru_maxrss) nicht von vorherigen Messungen verfälscht wird. Auch das
+Testbild wird in einem eigenen Prozess erzeugt: Linux übernimmt ru_maxrss
+über exec() hinweg, ein großer Elternprozess würde die Messung überdecken.
+
+Usage:
+    python benchmarks/bench_image_processing.py
+    python benchmarks/bench_image_processing.py --width 4032 --height 3024 --repeat 5
+"""
+import argparse
+import multiprocessing
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from PIL import Image, ImageDraw
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from image_processor import ImageProcessor
+
+# (Name, max_width, max_height) - typische Fälle beim Import
+CASES = [
+    ('thumbnail 300x300', 300, 300),
+    ('resize max_width=1200', 1200, None),
+    ('resize 1920x1080', 1920, 1080),
+]
+
+
+def create_source_image(path: Path, width: int, height: int):
+    """Erzeugt ein Handy-Foto-ähnliches JPEG (Verläufe + Formen, quality 90)"""
+    image = Image.linear_gradient('L').resize((width, height)).convert('RGB')
+    draw = ImageDraw.Draw(image)
+    step = max(width, height) // 20
+    for i in range(0, max(width, height), step):
+        draw.ellipse((i, i // 2, i + step * 3, i // 2 + step * 2),
+                     outline=(i % 255, 80, 200), width=8)
+    image.save(path, quality=90)
+
+
+def legacy_resize(image_path, output_path, max_width, max_height):
+    """Bisheriger Pfad (vor dem Draft-Modus)"""
+    image = Image.open(image_path)
+    image.thumbnail((max_width or 10000, max_height or 10000), Image.LANCZOS)
+    image.save(output_path, quality=85, optimize=True)
+
+
+def current_resize(image_path, output_path, max_width, max_height):
+    """Aktueller Pfad über ImageProcessor"""
+    ImageProcessor().resize_image(image_path, output_path,
+                                  max_width=max_width, max_height=max_height,
+                                  quality=85)
+
+
+VARIANTS = {
+    'legacy': legacy_resize,
+    'draft': current_resize,
+}
+
+
+def _measure(variant, image_path, output_path, max_width, max_height, repeat, queue):
+    """Läuft im Kindprozess: Zeit pro Durchlauf und zusätzlicher Spitzen-RSS"""
+    func = VARIANTS[variant]
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(image_path, output_path, max_width, max_height)
+        timings.append(time.perf_counter() - start)
+
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put({
+        'best_ms': min(timings) * 1000,
+        'mean_ms': sum(timings) / len(timings) * 1000,
+        'peak_rss_mb': max(peak_kb - baseline_kb, 0) / 1024,
+    })
+
+
+def run_variant(variant, image_path, output_path, max_width, max_height, repeat):
+    """Startet eine Messung in einem frischen Prozess"""
+    ctx = multiprocessing.get_context('spawn')
+    queue = ctx.Queue()
+    process = ctx.Process(target=_measure,
+                          args=(variant, image_path, output_path,
+                                max_width, max_height, repeat, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def run(width: int, height: int, repeat: int) -> list:
+    """Führt alle Fälle für beide Varianten aus und gibt die Ergebnisse zurück"""
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp) / 'source.jpg'
+        ctx = multiprocessing.get_context('spawn')
+        process = ctx.Process(target=create_source_image, args=(source, width, height))
+        process.start()
+        process.join()
+
+        for name, max_width, max_height in CASES:
+            row = {'case': name}
+            for variant in VARIANTS:
+                output = Path(tmp) / f'out_{variant}.jpg'
+                row[variant] = run_variant(variant, str(source), str(output),
+                                           max_width, max_height, repeat)
+            results.append(row)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--width', type=int, default=4032, help='Breite des Testbilds (default: 4032)')
+    parser.add_argument('--height', type=int, default=3024, help='Höhe des Testbilds (default: 3024)')
+    parser.add_argument('--repeat', type=int, default=3, help='Durchläufe pro Messung (default: 3)')
+    args = parser.parse_args()
+
+    print(f"Testbild: {args.width}x{args.height} JPEG, {args.repeat} Durchläufe\n")
+    print(f"{'Fall':<24} {'Variante':<8} {'best ms':>9} {'mean ms':>9} {'Peak RSS MB':>12}")
+    print("-" * 66)
+
+    for row in run(args.width, args.height, args.repeat):
+        for variant in VARIANTS:
+            r = row[variant]
+            print(f"{row['case']:<24} {variant:<8} {r['best_ms']:>9.1f} "
+                  f"{r['mean_ms']:>9.1f} {r['peak_rss_mb']:>12.1f}")
+        speedup = row['legacy']['best_ms'] / row['draft']['best_ms']
+        print(f"{'':<24} {'Faktor':<8} {speedup:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
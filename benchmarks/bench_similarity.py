@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Similarity-Engine mit Vorfiltern vs. vollständigem SequenceMatcher
+
+Vergleicht die bisherige Duplikat-Prüfung (immer SequenceMatcher.ratio())
+mit src/similarity.py (Längen-Schranke, quick_ratio(), dann ratio()) auf
+- den Eingaben aus tests/test_similarity_detection.py (beim Ausführen der
+  Tests mitgeschnitten; importiert dafür web/app.py wie die Tests selbst)
+- einem synthetischen Korpus: jeder "neue" Artikel wird gegen alle
+  bestehenden geprüft, wie in der Import-API
+
+Für 'sequence' wird zusätzlich geprüft, dass jede Entscheidung identisch ist.
+'ngram' und 'token_set' werden nur zur Einordnung mitgemessen.
+
+Usage:
+    python benchmarks/bench_similarity.py
+    python benchmarks/bench_similarity.py --existing 5000 --incoming 100 --seed 1
+"""
+import argparse
+import importlib.util
+import inspect
+import random
+import sys
+import time
+from difflib import SequenceMatcher
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR / "src"))
+
+from similarity import CONTENT_THRESHOLD, TITLE_THRESHOLD, are_similar_articles, is_similar
+
+WORDS = [
+    'Bundeskanzler', 'Regierung', 'Wien', 'Österreich', 'Koalition', 'Nationalrat',
+    'Kickl', 'Reform', 'Budget', 'Pensionen', 'Steuer', 'Wahl', 'Umfrage', 'Satire',
+    'Chefredakteur', 'Brüssel', 'Kommission', 'Trump', 'Grönland', 'Zölle', 'Börse',
+    'Inflation', 'Teuerung', 'Gemeinde', 'Bürgermeister', 'Landtag', 'Steiermark',
+    'heute', 'gestern', 'überraschend', 'angeblich', 'erneut', 'endlich', 'wieder',
+    'kündigt', 'fordert', 'verspricht', 'dementiert', 'bestätigt', 'plant', 'stoppt',
+    'der', 'die', 'das', 'und', 'mit', 'für', 'gegen', 'nach', 'vor', 'über', 'im',
+]
+
+
+def legacy_similarity(a: str, b: str) -> float:
+    """Bisherige Implementierung aus web/app.py"""
+    return SequenceMatcher(None, a.lower(), b.lower()).ratio()
+
+
+def legacy_are_similar(new_article: dict, existing_article: dict) -> bool:
+    """Bisherige are_similar_articles() mit den dokumentierten Thresholds"""
+    if legacy_similarity(new_article.get('title', ''), existing_article.get('title', '')) > TITLE_THRESHOLD:
+        return True
+    content1 = new_article.get('content', '')[:500]
+    content2 = existing_article.get('content', '')[:500]
+    return legacy_similarity(content1, content2) > CONTENT_THRESHOLD
+
+
+def collect_test_inputs():
+    """Führt die Similarity-Tests aus und schneidet alle Aufrufe mit"""
+    path = BASE_DIR / "tests" / "test_similarity_detection.py"
+    spec = importlib.util.spec_from_file_location("test_similarity_detection", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    article_pairs = []
+    string_pairs = []
+
+    def record_similarity(a, b, *args, **kwargs):
+        string_pairs.append((a, b))
+        return legacy_similarity(a, b)
+
+    def record_articles(new_article, existing_article, *args, **kwargs):
+        article_pairs.append((new_article, existing_article))
+        return are_similar_articles(new_article, existing_article, *args, **kwargs)
+
+    module.similarity = record_similarity
+    module.are_similar_articles = record_articles
+
+    for cls in (module.TestSimilarityDetection, module.TestImportDuplicateScenarios):
+        instance = cls()
+        for name, method in inspect.getmembers(instance, inspect.ismethod):
+            if name.startswith('test_'):
+                method()
+
+    return article_pairs, string_pairs
+
+
+def sentence(rng: random.Random, min_words: int, max_words: int) -> str:
+    return ' '.join(rng.choice(WORDS) for _ in range(rng.randint(min_words, max_words)))
+
+
+def mutate(rng: random.Random, text: str) -> str:
+    """Leichte Variante: Emoji, Tippfehler oder angehängter Satz"""
+    choice = rng.random()
+    if choice < 0.3:
+        return text.replace(' ', ' 🎭 ', 1)
+    if choice < 0.6:
+        pos = rng.randrange(len(text))
+        return text[:pos] + rng.choice('aeiouäöü') + text[pos + 1:]
+    return f"{text} {sentence(rng, 3, 8)}."
+
+
+def build_corpus(rng: random.Random, existing: int, incoming: int, duplicate_share: float):
+    """Bestehende Artikel + neue Artikel, ein Teil davon Varianten bestehender"""
+    articles = [
+        {'title': sentence(rng, 4, 10), 'content': '. '.join(sentence(rng, 8, 20) for _ in range(12))}
+        for _ in range(existing)
+    ]
+    new_articles = []
+    for _ in range(incoming):
+        if rng.random() < duplicate_share:
+            original = rng.choice(articles)
+            new_articles.append({'title': mutate(rng, original['title']),
+                                 'content': mutate(rng, original['content'])})
+        else:
+            new_articles.append({'title': sentence(rng, 4, 10),
+                                 'content': '. '.join(sentence(rng, 8, 20) for _ in range(12))})
+    return articles, new_articles
+
+
+def time_pairs(func, pairs, repeat: int = 1):
+    """Beste Laufzeit über repeat Durchläufe und die Entscheidungen"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        decisions = [func(a, b) for a, b in pairs]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, decisions
+
+
+def report(label: str, pairs, repeat: int, variants):
+    print(f"\n{label}: {len(pairs)} Paare")
+    baseline_time, baseline = time_pairs(legacy_are_similar, pairs, repeat)
+    print(f"  {'legacy':<12} {baseline_time * 1000:9.1f} ms  "
+          f"({len(pairs) / baseline_time:,.0f} Paare/s)  Duplikate: {sum(baseline)}")
+
+    for name, func, check in variants:
+        elapsed, decisions = time_pairs(func, pairs, repeat)
+        mismatches = sum(1 for x, y in zip(baseline, decisions) if x != y)
+        status = (f"abweichend: {mismatches}" if mismatches else "identisch") if check else "-"
+        print(f"  {name:<12} {elapsed * 1000:9.1f} ms  ({len(pairs) / elapsed:,.0f} Paare/s)  "
+              f"Duplikate: {sum(decisions)}  Speedup: {baseline_time / elapsed:5.1f}x  "
+              f"Entscheidungen: {status}")
+        if check and mismatches:
+            raise SystemExit(f"✗ {name}: {mismatches} Entscheidungen weichen von legacy ab")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark der Similarity-Engine")
+    parser.add_argument('--existing', type=int, default=1000, help='Bestehende Artikel (default: 1000)')
+    parser.add_argument('--incoming', type=int, default=20, help='Neue Artikel (default: 20)')
+    parser.add_argument('--duplicates', type=float, default=0.2,
+                        help='Anteil Varianten unter den neuen Artikeln (default: 0.2)')
+    parser.add_argument('--repeat', type=int, default=3, help='Wiederholungen, beste zählt (default: 3)')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    variants = [
+        ('sequence', lambda a, b: are_similar_articles(a, b), True),
+        ('ngram', lambda a, b: are_similar_articles(a, b, metric='ngram'), False),
+        ('token_set', lambda a, b: are_similar_articles(a, b, metric='token_set'), False),
+    ]
+
+    article_pairs, string_pairs = collect_test_inputs()
+    report("Test-Eingaben (are_similar_articles)", article_pairs, args.repeat * 10, variants)
+
+    for threshold in (TITLE_THRESHOLD, CONTENT_THRESHOLD):
+        mismatches = sum(1 for a, b in string_pairs
+                         if is_similar(a, b, threshold) != (legacy_similarity(a, b) > threshold))
+        print(f"  similarity()-Aufrufe aus den Tests bei {threshold:.2f}: "
+              f"{len(string_pairs)} Paare, {mismatches} Abweichungen")
+        if mismatches:
+            raise SystemExit("✗ is_similar() weicht von similarity() ab")
+
+    rng = random.Random(args.seed)
+    articles, new_articles = build_corpus(rng, args.existing, args.incoming, args.duplicates)
+    pairs = [(new, existing) for new in new_articles for existing in articles]
+    report(f"Synthetischer Korpus ({args.incoming} neu × {args.existing} bestehend)",
+           pairs, args.repeat, variants)
+
+
+if __name__ == "__main__":
+    main()
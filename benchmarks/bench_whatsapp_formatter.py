@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Benchmark: WhatsAppFormatter.convert mit vorkompilierten Mustern vs. bisherige Version
+
+Vergleicht die bisherige Implementierung (ein re.sub pro Schritt, sechs
+Überschriften-Durchläufe, immer alle Schritte) mit src/whatsapp_formatter.py
+(vorkompilierte Muster, ein Durchlauf für ## bis ######, Schritte ohne
+passende Zeichen im Text werden übersprungen) auf
+- einem synthetischen Korpus aus Markdown-Artikeln (wie im Editor erstellt)
+- einem Korpus aus Fließtext ohne Markdown (z.B. WhatsApp-Importe)
+- optional den Artikeln einer Datenbank (--db)
+
+Für jeden Text wird geprüft, dass die Ausgabe identisch ist. Die bisherige
+Version kommt aus tests/test_whatsapp_formatter.py (legacy_convert).
+
+Usage:
+    python benchmarks/bench_whatsapp_formatter.py
+    python benchmarks/bench_whatsapp_formatter.py --articles 5000 --db database/articles.db
+"""
+import argparse
+import importlib.util
+import random
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR / "src"))
+
+from whatsapp_formatter import WhatsAppFormatter
+
+WORDS = [
+    'Bundeskanzler', 'Regierung', 'Wien', 'Österreich', 'Koalition', 'Nationalrat',
+    'Kickl', 'Reform', 'Budget', 'Pensionen', 'Steuer', 'Wahl', 'Umfrage', 'Satire',
+    'heute', 'gestern', 'überraschend', 'angeblich', 'erneut', 'kündigt', 'fordert',
+    'der', 'die', 'das', 'und', 'mit', 'für', 'gegen', 'nach', 'vor', 'über', 'im',
+]
+
+
+def load_legacy_convert():
+    path = BASE_DIR / "tests" / "test_whatsapp_formatter.py"
+    spec = importlib.util.spec_from_file_location("test_whatsapp_formatter", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.legacy_convert
+
+
+def sentence(rng: random.Random, min_words: int = 6, max_words: int = 20) -> str:
+    return ' '.join(rng.choice(WORDS) for _ in range(rng.randint(min_words, max_words))) + '.'
+
+
+def markdown_article(rng: random.Random) -> str:
+    """Artikel mit Überschriften, Hervorhebungen, Listen, Links und Code"""
+    parts = [f"# {sentence(rng, 3, 6)}"]
+    for _ in range(rng.randint(2, 5)):
+        parts.append(f"## {sentence(rng, 2, 5)}")
+        words = sentence(rng, 30, 80).split()
+        for marker in ('**', '*', '_', '~~', '`'):
+            if rng.random() < 0.5:
+                pos = rng.randrange(len(words))
+                words[pos] = f"{marker}{words[pos]}{marker}"
+        if rng.random() < 0.5:
+            words.append(f"[{rng.choice(WORDS)}](https://example.com/{rng.randint(1, 999)})")
+        parts.append(' '.join(words))
+        if rng.random() < 0.5:
+            parts.append('\n'.join(f"- {sentence(rng, 2, 6)}" for _ in range(rng.randint(2, 5))))
+    return '\n\n'.join(parts)
+
+
+def plain_article(rng: random.Random) -> str:
+    """Fließtext in Absätzen, ohne Markdown"""
+    return '\n\n'.join(' '.join(sentence(rng) for _ in range(rng.randint(2, 6)))
+                       for _ in range(rng.randint(3, 8)))
+
+
+def load_db_articles(db_path: str, limit: int):
+    conn = sqlite3.connect(db_path)
+    try:
+        return [row[0] for row in conn.execute("SELECT content FROM articles ORDER BY id LIMIT ?", (limit,))]
+    finally:
+        conn.close()
+
+
+def time_convert(func, texts, repeat: int):
+    """Beste Laufzeit über repeat Durchläufe und die Ausgaben"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        outputs = [func(text) for text in texts]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, outputs
+
+
+def report(label: str, texts, repeat: int, legacy_convert):
+    size = sum(len(text) for text in texts)
+    print(f"\n{label}: {len(texts)} Texte, {size / 1024 / 1024:.1f} MB")
+    legacy_time, expected = time_convert(legacy_convert, texts, repeat)
+    new_time, outputs = time_convert(WhatsAppFormatter.convert, texts, repeat)
+
+    mismatches = sum(1 for x, y in zip(expected, outputs) if x != y)
+    print(f"  {'legacy':<10} {legacy_time * 1000:9.1f} ms  ({len(texts) / legacy_time:,.0f} Texte/s)")
+    print(f"  {'convert':<10} {new_time * 1000:9.1f} ms  ({len(texts) / new_time:,.0f} Texte/s)  "
+          f"Speedup: {legacy_time / new_time:4.1f}x  "
+          f"Ausgabe: {f'abweichend: {mismatches}' if mismatches else 'identisch'}")
+    if mismatches:
+        raise SystemExit(f"✗ {mismatches} Ausgaben weichen von legacy ab")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark von WhatsAppFormatter.convert")
+    parser.add_argument('--articles', type=int, default=2000, help='Artikel pro Korpus (default: 2000)')
+    parser.add_argument('--db', help='Zusätzlich die Artikel dieser Datenbank messen')
+    parser.add_argument('--repeat', type=int, default=3, help='Wiederholungen, beste zählt (default: 3)')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    legacy_convert = load_legacy_convert()
+    rng = random.Random(args.seed)
+
+    report("Markdown-Artikel", [markdown_article(rng) for _ in range(args.articles)],
+           args.repeat, legacy_convert)
+    report("Fließtext ohne Markdown", [plain_article(rng) for _ in range(args.articles)],
+           args.repeat, legacy_convert)
+    if args.db:
+        report(f"Datenbank {args.db}", load_db_articles(args.db, args.articles), args.repeat, legacy_convert)
+
+
+if __name__ == "__main__":
+    main()
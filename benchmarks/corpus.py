@@ -0,0 +1,220 @@
+"""
+Synthetischer Korpus für die Benchmarks (ohne Netzwerk, reproduzierbar per Seed)
+
+generate_articles() erzeugt Artikel wie aus dem Editor: deutscher
+Markdown-Text mit Überschriften, Hervorhebungen, Listen, Links, Zitaten,
+gelegentlich Tabellen, Code und eingebetteten Bildern, dazu Tags aus den
+Kategorien des Auto-Taggers, Autor, Datum und Veröffentlichungsstatus.
+Die Wortliste enthält Begriffe, auf die der Auto-Tagger anspringt.
+
+build_database() legt daraus eine SQLite-Datenbank mit dem Schema von
+web/app.py an; ein Teil der Artikel bekommt Bilder (JPEG, mit PIL erzeugt).
+
+Usage:
+    articles = generate_articles(1000, seed=42)
+    db_path, image_paths = build_database(Path('/tmp/bench'), articles, images=20)
+"""
+import random
+import sqlite3
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from PIL import Image, ImageDraw
+
+BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR / "src"))
+
+from auto_tagger import TAG_RULES
+from db_manager import FEED_STATE_SCHEMA, TAG_STATS_SCHEMA, DatabaseManager
+
+WORDS = [
+    'Bundeskanzler', 'Regierung', 'Wien', 'Österreich', 'Koalition', 'Nationalrat',
+    'Kickl', 'Reform', 'Budget', 'Pensionen', 'Steuer', 'Wahl', 'Umfrage', 'Satire',
+    'Chefredakteur', 'Brüssel', 'Kommission', 'Trump', 'Grönland', 'Zölle', 'Börse',
+    'Inflation', 'Teuerung', 'Gemeinde', 'Bürgermeister', 'Landtag', 'Steiermark',
+    'Bundestag', 'Berlin', 'Merz', 'Washington', 'Pentagon', 'Klimaschutz', 'Heizung',
+    'Schnitzel', 'Kaffeehaus', 'Grätzl', 'Straßenbahn', 'Pressekonferenz', 'Studie',
+    'heute', 'gestern', 'überraschend', 'angeblich', 'erneut', 'endlich', 'wieder',
+    'kündigt', 'fordert', 'verspricht', 'dementiert', 'bestätigt', 'plant', 'stoppt',
+    'der', 'die', 'das', 'und', 'mit', 'für', 'gegen', 'nach', 'vor', 'über', 'im',
+    'ein', 'eine', 'nicht', 'auch', 'sich', 'wird', 'hat', 'sind', 'noch', 'schon',
+]
+
+AUTHORS = ['Redaktion', 'Anna Gruber', 'Max Huber', 'Lena Wagner', None]
+
+TAGS = list(TAG_RULES) + ['Satire', 'Kommentar', 'Eilmeldung']
+
+# Schema wie init_database() in web/app.py
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS articles (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT NOT NULL,
+        content TEXT NOT NULL,
+        author TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        published BOOLEAN DEFAULT 0,
+        tags TEXT,
+        title_key TEXT,
+        content_hash TEXT
+    );
+    CREATE TABLE IF NOT EXISTS images (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        article_id INTEGER,
+        filename TEXT NOT NULL,
+        filepath TEXT NOT NULL,
+        alt_text TEXT,
+        caption TEXT,
+        uploaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        width INTEGER,
+        height INTEGER,
+        file_size INTEGER,
+        mime_type TEXT,
+        sha256 TEXT,
+        FOREIGN KEY (article_id) REFERENCES articles(id) ON DELETE CASCADE
+    );
+    CREATE INDEX IF NOT EXISTS idx_articles_published ON articles(published);
+    CREATE INDEX IF NOT EXISTS idx_articles_title_key ON articles(title_key);
+    CREATE INDEX IF NOT EXISTS idx_articles_content_hash ON articles(content_hash);
+    CREATE INDEX IF NOT EXISTS idx_images_article ON images(article_id);
+"""
+
+
+def sentence(rng: random.Random, min_words: int = 6, max_words: int = 20) -> str:
+    words = [rng.choice(WORDS) for _ in range(rng.randint(min_words, max_words))]
+    words[0] = words[0][:1].upper() + words[0][1:]
+    return ' '.join(words) + rng.choice('..!?')
+
+
+def paragraph(rng: random.Random) -> str:
+    """Absatz mit Hervorhebungen und gelegentlich einem Link"""
+    words = ' '.join(sentence(rng) for _ in range(rng.randint(2, 5))).split()
+    for marker in ('**', '*', '_', '~~', '`'):
+        if rng.random() < 0.4:
+            pos = rng.randrange(len(words))
+            words[pos] = f"{marker}{words[pos]}{marker}"
+    if rng.random() < 0.4:
+        words.append(f"[{rng.choice(WORDS)}](https://example.com/{rng.randint(1, 999)})")
+    return ' '.join(words)
+
+
+def markdown_article(rng: random.Random, image_url: str = None) -> str:
+    """Artikel mit Überschriften, Absätzen, Listen, Zitaten, Tabellen und Code"""
+    parts = [paragraph(rng)]
+    if image_url:
+        parts.append(f"![{sentence(rng, 2, 4)}]({image_url})")
+    for _ in range(rng.randint(2, 5)):
+        parts.append(f"## {sentence(rng, 2, 5)}")
+        parts.extend(paragraph(rng) for _ in range(rng.randint(1, 3)))
+        choice = rng.random()
+        if choice < 0.3:
+            parts.append('\n'.join(f"- {sentence(rng, 2, 6)}" for _ in range(rng.randint(2, 5))))
+        elif choice < 0.45:
+            parts.append(f"> {sentence(rng)}\n> - {rng.choice(AUTHORS[:-1])}")
+        elif choice < 0.55:
+            rows = [f"| {rng.choice(WORDS)} | {rng.randint(1, 99)} % |" for _ in range(rng.randint(2, 4))]
+            parts.append('\n'.join(['| Partei | Umfrage |', '|---|---|'] + rows))
+        elif choice < 0.6:
+            parts.append(f"```\n{sentence(rng, 3, 8)}\n```")
+    return '\n\n'.join(parts)
+
+
+def generate_articles(count: int, seed: int = 42, published_share: float = 0.7,
+                      image_share: float = 0.3,
+                      start: datetime = datetime(2025, 1, 1)) -> List[Dict[str, Any]]:
+    """Erzeugt count Artikel (Dicts wie für DatabaseManager.bulk_add_articles)
+
+    Args:
+        count: Anzahl Artikel
+        seed: Seed des Zufallsgenerators (gleicher Seed = gleicher Korpus)
+        published_share: Anteil veröffentlichter Artikel
+        image_share: Anteil Artikel mit eingebettetem Bild im Markdown
+        start: Datum des ersten Artikels, danach im Abstand von ~3 Stunden
+    """
+    rng = random.Random(seed)
+    articles = []
+    created = start
+    for _ in range(count):
+        created += timedelta(minutes=rng.randint(30, 330))
+        image_url = f"/media/images/bench_{rng.randrange(20):04d}.jpg" if rng.random() < image_share else None
+        articles.append({
+            'title': sentence(rng, 4, 10).rstrip('.!?'),
+            'content': markdown_article(rng, image_url),
+            'author': rng.choice(AUTHORS),
+            'published': rng.random() < published_share,
+            'tags': rng.sample(TAGS, rng.randint(1, 3)),
+            'created_at': created.strftime('%Y-%m-%d %H:%M:%S'),
+        })
+    return articles
+
+
+def write_image(path: Path, seed: int, size: Tuple[int, int] = (1200, 800)) -> Path:
+    """Schreibt ein JPEG mit Verlauf und Formen (komprimiert ähnlich wie ein Foto)"""
+    rng = random.Random(seed)
+    width, height = size
+    image = Image.linear_gradient('L').resize(size).convert('RGB')
+    draw = ImageDraw.Draw(image)
+    for _ in range(25):
+        x, y = rng.randrange(width), rng.randrange(height)
+        radius = rng.randint(10, width // 6)
+        color = (rng.randrange(256), rng.randrange(256), rng.randrange(256))
+        draw.ellipse([x - radius, y - radius, x + radius, y + radius], fill=color)
+    image.save(path, 'JPEG', quality=90)
+    return path
+
+
+def write_logo(path: Path, size: int = 400) -> Path:
+    """Schreibt ein PNG-Logo mit Transparenz (für add_watermark)"""
+    logo = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(logo)
+    draw.ellipse([0, 0, size - 1, size - 1], fill=(200, 30, 30, 230))
+    draw.rectangle([size // 4, size // 3, size * 3 // 4, size * 2 // 3], fill=(255, 255, 255, 255))
+    logo.save(path, 'PNG')
+    return path
+
+
+def build_database(directory: Path, articles: List[Dict[str, Any]], images: int = 20,
+                   image_share: float = 0.3, seed: int = 42) -> Tuple[Path, List[Path]]:
+    """Legt articles.db und media/images/ in directory an
+
+    Es werden images verschiedene JPEGs erzeugt; image_share der Artikel
+    bekommt ein bis drei Einträge in der images-Tabelle, die auf diese
+    Dateien verweisen (wie nach einem Upload).
+
+    Returns:
+        (Pfad der Datenbank, Pfade der Bilder)
+    """
+    rng = random.Random(seed)
+    image_dir = directory / 'media' / 'images'
+    image_dir.mkdir(parents=True, exist_ok=True)
+    image_paths = [write_image(image_dir / f"bench_{i:04d}.jpg", seed + i) for i in range(images)]
+
+    db_path = directory / 'articles.db'
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA)
+    conn.executescript(TAG_STATS_SCHEMA)  # Trigger zählen die Tags beim Einfügen mit
+    conn.executescript(FEED_STATE_SCHEMA)
+    conn.close()
+
+    manager = DatabaseManager(str(db_path))
+    manager.bulk_add_articles(articles)
+
+    if image_paths:
+        conn = sqlite3.connect(db_path)
+        with conn:
+            article_ids = [row[0] for row in conn.execute("SELECT id FROM articles ORDER BY id")]
+            rows = []
+            for article_id in article_ids:
+                if rng.random() >= image_share:
+                    continue
+                for path in rng.sample(image_paths, min(len(image_paths), rng.randint(1, 3))):
+                    rows.append((article_id, path.name, f"media/images/{path.name}", sentence(rng, 2, 4),
+                                 1200, 800, path.stat().st_size, 'image/jpeg'))
+            conn.executemany(
+                "INSERT INTO images (article_id, filename, filepath, alt_text, width, height, file_size, mime_type) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        conn.close()
+
+    return db_path, image_paths
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Lasttest: Durchsatz und Tail-Latenzen der Flask-App unter Gunicorn
+
+Legt einen synthetischen Korpus (benchmarks/corpus.py) in einer temporären
+Datenbank an, startet die App darauf unter Gunicorn mit gunicorn.conf.py
+(DB_PATH/LOG_DIR zeigen ins temporäre Verzeichnis, die echte Datenbank
+bleibt unberührt) und spielt mit --clients parallelen Clients einen
+gewichteten Traffic-Mix ab:
+
+    reader_index    GET  /reader/
+    reader_article  GET  /reader/article/<id>
+    search          GET  /reader/?q=<Begriff>
+    tag             GET  /reader/tag/<Tag>
+    export          GET  /admin/api/export/articles
+    import          POST /admin/api/import/articles (1-5 neue Artikel)
+
+Pro Route werden p50/p95/p99-Latenz, Requests pro Sekunde und die
+Fehlerquote (Status >= 400 oder Verbindungsfehler) ausgegeben, optional als
+JSON (--output). Alles läuft auf 127.0.0.1, es wird kein Netzwerk benötigt.
+
+Usage:
+    python benchmarks/load_test.py
+    python benchmarks/load_test.py --duration 60 --clients 32 --workers 4 --threads 4
+    python benchmarks/load_test.py --mix reader_article=80,search=20 --output load.json
+"""
+import argparse
+import http.client
+import json
+import os
+import platform
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import build_database, generate_articles, markdown_article, sentence
+
+DEFAULT_MIX = 'reader_index=25,reader_article=40,search=15,tag=15,export=2,import=3'
+SEARCH_TERMS = ['Wien', 'Grönland', 'Pressekonferenz', 'Budget', 'Kaffeehaus', 'gibtsnicht']
+
+# Request: (Methode, Pfad ohne Prefix, Body)
+Request = Tuple[str, str, Optional[bytes]]
+
+
+def build_routes(articles: List[Dict[str, Any]], seed: int) -> Dict[str, Callable[[random.Random], Request]]:
+    """Request-Erzeuger pro Route, auf Basis des Korpus"""
+    published_ids = [i for i, article in enumerate(articles, start=1) if article['published']]
+    tags = sorted({tag for article in articles if article['published'] for tag in article['tags']})
+    counter = iter(range(10 ** 9))
+    lock = threading.Lock()
+
+    def new_articles(rng):
+        with lock:
+            number = next(counter)
+        return [{'title': f"Lasttest {seed}-{number}-{i} {sentence(rng, 3, 6)}",
+                 'content': markdown_article(rng), 'tags': ['Lasttest'], 'published': False}
+                for i in range(rng.randint(1, 5))]
+
+    return {
+        'reader_index': lambda rng: ('GET', '/reader/', None),
+        'reader_article': lambda rng: ('GET', f'/reader/article/{rng.choice(published_ids)}', None),
+        'search': lambda rng: ('GET', f'/reader/?q={quote(rng.choice(SEARCH_TERMS))}', None),
+        'tag': lambda rng: ('GET', f'/reader/tag/{quote(rng.choice(tags))}', None),
+        'export': lambda rng: ('GET', '/admin/api/export/articles', None),
+        'import': lambda rng: ('POST', '/admin/api/import/articles',
+                               json.dumps({'articles': new_articles(rng)}).encode('utf-8')),
+    }
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    """'reader_index=25,search=15' -> {'reader_index': 25.0, 'search': 15.0}"""
+    weights = {}
+    for part in mix.split(','):
+        name, _, weight = part.strip().partition('=')
+        try:
+            weights[name] = float(weight or 1)
+        except ValueError:
+            raise ValueError(f"Ungültiges Gewicht für {name}: {weight}")
+        if weights[name] < 0:
+            raise ValueError(f"Negatives Gewicht für {name}")
+    if not any(weights.values()):
+        raise ValueError("Traffic-Mix ohne Gewichte")
+    return weights
+
+
+def percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    """Perzentil nach Nearest-Rank auf einer sortierten Liste"""
+    if not sorted_values:
+        return None
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def summarize(samples: Dict[str, List[Tuple[float, int]]], elapsed: float) -> Dict[str, Dict[str, Any]]:
+    """Latenz-Perzentile (ms), Requests/s und Fehlerquote pro Route und gesamt
+
+    Fehler sind Status >= 400 und Verbindungsfehler (Status 0).
+    """
+    def stats(entries):
+        latencies = sorted(seconds * 1000 for seconds, _ in entries)
+        errors = sum(1 for _, status in entries if not 0 < status < 400)
+        statuses = {}
+        for _, status in entries:
+            statuses[str(status)] = statuses.get(str(status), 0) + 1
+        return {
+            'requests': len(entries),
+            'errors': errors,
+            'statuses': dict(sorted(statuses.items())),
+            'error_rate': round(errors / len(entries), 4) if entries else 0.0,
+            'rps': round(len(entries) / elapsed, 2) if elapsed else 0.0,
+            'p50_ms': _round(percentile(latencies, 50)),
+            'p95_ms': _round(percentile(latencies, 95)),
+            'p99_ms': _round(percentile(latencies, 99)),
+            'max_ms': _round(latencies[-1] if latencies else None),
+        }
+
+    result = {route: stats(entries) for route, entries in sorted(samples.items())}
+    result['total'] = stats([entry for entries in samples.values() for entry in entries])
+    return result
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 2) if value is not None else None
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def request(port: int, method: str, path: str, body: bytes = None, timeout: float = 30) -> int:
+    """Ein Request auf eigener Verbindung; liefert den HTTP-Status"""
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=timeout)
+    try:
+        headers = {'User-Agent': 'fakedaily-loadtest'}
+        if body is not None:
+            headers['Content-Type'] = 'application/json'
+        conn.request(method, path, body=body, headers=headers)
+        response = conn.getresponse()
+        response.read()
+        return response.status
+    finally:
+        conn.close()
+
+
+def start_server(port: int, db_path: Path, log_dir: Path, workers: int, threads: int,
+                 prefix: str) -> subprocess.Popen:
+    """Startet Gunicorn mit web.app:create_app() auf 127.0.0.1:port und wartet auf /health
+
+    Es gilt die Produktiv-Konfiguration (gunicorn.conf.py: preload,
+    Keep-Alive, Worker-Recycling); Bind-Adresse, Worker und Threads kommen
+    von den Argumenten.
+    """
+    env = dict(os.environ, DB_PATH=str(db_path), LOG_DIR=str(log_dir), APP_PREFIX=prefix,
+               SLOW_QUERY_MS='60000', PYTHONUNBUFFERED='1')
+    command = [
+        sys.executable, '-m', 'gunicorn',
+        '--config', str(BASE_DIR / 'gunicorn.conf.py'),
+        '--bind', f'127.0.0.1:{port}',
+        '--workers', str(workers),
+        '--threads', str(threads),
+        '--pythonpath', str(BASE_DIR),
+        '--log-level', 'warning',
+        'web.app:create_app()',
+    ]
+    server = subprocess.Popen(command, env=env, stdout=subprocess.DEVNULL,
+                              stderr=open(log_dir / 'gunicorn.log', 'wb'))
+
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"Gunicorn beendet (Exit-Code {server.returncode}), "
+                               f"siehe {log_dir / 'gunicorn.log'} - ist gunicorn installiert?")
+        try:
+            if request(port, 'GET', '/health', timeout=2) == 200:
+                return server
+        except OSError:
+            pass
+        time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError("Gunicorn nicht innerhalb von 60 s bereit")
+
+
+def run_clients(port: int, prefix: str, routes: Dict[str, Callable[[random.Random], Request]],
+                weights: Dict[str, float], clients: int, duration: float, warmup: float,
+                seed: int) -> Tuple[Dict[str, List[Tuple[float, int]]], float]:
+    """Lässt clients Threads bis zum Ende von warmup + duration Requests senden
+
+    Returns:
+        ({Route: [(Sekunden, HTTP-Status oder 0)]}, gemessene Dauer) - ohne die Aufwärmphase
+    """
+    names = [name for name, weight in weights.items() if weight > 0]
+    route_weights = [weights[name] for name in names]
+    samples = {name: [] for name in names}
+    lock = threading.Lock()
+    start = time.monotonic()
+    measure_from = start + warmup
+    stop_at = measure_from + duration
+
+    def client(number):
+        rng = random.Random(seed * 1000 + number)
+        while True:
+            sent = time.monotonic()
+            if sent >= stop_at:
+                return
+            name = rng.choices(names, weights=route_weights)[0]
+            method, path, body = routes[name](rng)
+            try:
+                status = request(port, method, prefix + path, body)
+            except OSError:
+                status = 0
+            finished = time.monotonic()
+            if sent >= measure_from:
+                with lock:
+                    samples[name].append((finished - sent, status))
+
+    threads = [threading.Thread(target=client, args=(i,), daemon=True) for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return samples, time.monotonic() - measure_from
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Lasttest der Flask-App unter Gunicorn (nur localhost)")
+    parser.add_argument('--articles', type=int, default=2000, help='Artikel im Korpus (default: 2000)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--duration', type=float, default=30, help='Messdauer in Sekunden (default: 30)')
+    parser.add_argument('--warmup', type=float, default=3, help='Aufwärmphase ohne Messung (default: 3)')
+    parser.add_argument('--clients', type=int, default=16, help='Parallele Clients (default: 16)')
+    parser.add_argument('--workers', type=int, default=2, help='Gunicorn-Worker (default: 2)')
+    parser.add_argument('--threads', type=int, default=4, help='Threads pro Worker (default: 4)')
+    parser.add_argument('--mix', default=DEFAULT_MIX, help=f'Gewichte pro Route (default: {DEFAULT_MIX})')
+    parser.add_argument('--prefix', default='', help='APP_PREFIX der App (z.B. /cms)')
+    parser.add_argument('--output', help='Ergebnis als JSON speichern')
+    parser.add_argument('--keep', action='store_true',
+                        help='Temporäres Verzeichnis (Datenbank, Logs) nicht löschen')
+    args = parser.parse_args()
+
+    prefix = args.prefix.rstrip('/')
+    try:
+        weights = parse_mix(args.mix)
+    except ValueError as e:
+        raise SystemExit(f"✗ {e}")
+
+    workdir = Path(tempfile.mkdtemp(prefix='fakedaily-load-'))
+    server = None
+    try:
+        articles = generate_articles(args.articles, seed=args.seed)
+        routes = build_routes(articles, args.seed)
+        unknown = set(weights) - set(routes)
+        if unknown:
+            raise SystemExit(f"✗ Unbekannte Routen: {', '.join(sorted(unknown))} (verfügbar: {', '.join(routes)})")
+
+        print(f"Korpus: {args.articles} Artikel in {workdir}")
+        db_path, _ = build_database(workdir, articles, seed=args.seed)
+        log_dir = workdir / 'logs'
+        log_dir.mkdir()
+
+        port = free_port()
+        server = start_server(port, db_path, log_dir, args.workers, args.threads, prefix)
+        print(f"Gunicorn: 127.0.0.1:{port}, {args.workers} Worker × {args.threads} Threads")
+        print(f"Last: {args.clients} Clients, {args.warmup:g} s Aufwärmen + {args.duration:g} s Messung\n")
+
+        samples, elapsed = run_clients(port, prefix, routes, weights, args.clients,
+                                       args.duration, args.warmup, args.seed)
+    finally:
+        if server is not None:
+            server.terminate()
+            try:
+                server.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                server.kill()
+        if args.keep:
+            print(f"\nDatenbank und Logs: {workdir}")
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    summary = summarize(samples, elapsed)
+
+    print(f"  {'Route':<16} {'Requests':>9} {'RPS':>8} {'p50':>9} {'p95':>9} {'p99':>9} {'Fehler':>8}")
+    for route, stats in summary.items():
+        def ms(value):
+            return f"{value:7.1f}ms" if value is not None else f"{'-':>9}"
+        print(f"  {route:<16} {stats['requests']:>9} {stats['rps']:>8.1f} {ms(stats['p50_ms'])} "
+              f"{ms(stats['p95_ms'])} {ms(stats['p99_ms'])} {stats['error_rate']:>8.1%}")
+
+    if args.output:
+        result = {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'environment': {'python': platform.python_version(), 'platform': platform.platform(),
+                            'cpus': os.cpu_count()},
+            'config': {'articles': args.articles, 'seed': args.seed, 'duration': args.duration,
+                       'warmup': args.warmup, 'clients': args.clients, 'workers': args.workers,
+                       'threads': args.threads, 'mix': weights},
+            'elapsed': round(elapsed, 3),
+            'routes': summary,
+        }
+        Path(args.output).write_text(json.dumps(result, indent=2, ensure_ascii=False) + '\n', encoding='utf-8')
+        print(f"\n✓ Ergebnis gespeichert: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
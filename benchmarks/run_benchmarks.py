@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Benchmark-Suite: Hot Paths des CMS auf einem synthetischen Korpus
+
+Erzeugt einen Korpus (benchmarks/corpus.py) in einem temporären
+Verzeichnis - Datenbank mit Artikeln und Bildern - und misst:
+- DatabaseManager: Listen (alle/veröffentlichte, nach Tag), Tag-Statistik,
+  Feed-Auswahl (gesamt und pro Tag), Suche, Export-Iteration mit Bildern
+- Markdown-Rendering (Konfiguration wie web/app.py; Excerpts und ganze Artikel)
+- auto_tagger.generate_tags
+- similarity.are_similar_articles (neue × bestehende Artikel, wie beim Import)
+- WhatsAppFormatter.convert
+- ImageProcessor.add_watermark
+
+Jeder Fall läuft einmal zum Aufwärmen und dann --repeat mal; verglichen wird
+der Median. Mit --output werden die Ergebnisse als JSON gespeichert, mit
+--baseline gegen eine gespeicherte Datei verglichen: ist ein Fall um mehr als
+--tolerance langsamer, endet das Skript mit Exit-Code 1 (z.B. vor Deploys).
+
+Baselines sind nur auf derselben Maschine mit demselben Korpus (--articles,
+--images, --seed) vergleichbar; bei abweichendem Korpus bricht der Vergleich ab.
+
+Usage:
+    python benchmarks/run_benchmarks.py --output benchmarks/baseline.json
+    python benchmarks/run_benchmarks.py --baseline benchmarks/baseline.json
+    python benchmarks/run_benchmarks.py --only db. --only markdown --repeat 10
+    python benchmarks/run_benchmarks.py --list
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+import markdown
+
+BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from auto_tagger import generate_tags
+from corpus import build_database, generate_articles, sentence, write_logo
+from db_manager import DatabaseManager
+from image_processor import ImageProcessor
+from similarity import are_similar_articles
+from whatsapp_formatter import WhatsAppFormatter
+
+RESULT_VERSION = 1
+DEFAULT_TOLERANCE = 0.25
+
+# (Name, Funktion für einen Durchlauf, Operationen pro Durchlauf)
+Case = Tuple[str, Callable[[], Any], int]
+
+
+def build_cases(workdir: Path, articles: List[Dict[str, Any]], image_paths: List[Path],
+                db_path: Path, seed: int) -> List[Case]:
+    """Alle Benchmark-Fälle auf dem erzeugten Korpus"""
+    rng = random.Random(seed)
+    db = DatabaseManager(str(db_path))
+    md = markdown.Markdown(extensions=['fenced_code', 'tables', 'nl2br'])  # wie web/app.py
+    formatter = WhatsAppFormatter()
+
+    tags = sorted({tag for article in articles for tag in article['tags']})[:3]
+    search_terms = ['Wien', 'Grönland', 'Pressekonferenz', 'gibtsnicht']
+    sample = articles[:200]
+    existing = articles[:500]
+    incoming = [{'title': sentence(rng, 4, 10), 'content': sentence(rng, 40, 80)} for _ in range(20)]
+
+    def render_markdown(texts):
+        for text in texts:
+            md.reset().convert(text)
+
+    def iterate_export():
+        for _ in db.iter_articles_with_images():
+            pass
+
+    def check_duplicates():
+        for new in incoming:
+            for article in existing:
+                are_similar_articles(new, article)
+
+    watermark_dir = workdir / 'watermarked'
+    watermark_dir.mkdir(exist_ok=True)
+    processor = ImageProcessor(logo_path=str(write_logo(workdir / 'logo.png')))
+    watermark_images = image_paths[:5]
+
+    def add_watermarks():
+        for path in watermark_images:
+            processor.add_watermark(str(path), str(watermark_dir / path.name))
+
+    return [
+        ('db.get_all_articles', lambda: db.get_all_articles(), 1),
+        ('db.get_all_articles.published', lambda: db.get_all_articles(published_only=True), 1),
+        ('db.get_articles_by_tag', lambda: [db.get_articles_by_tag(tag, published_only=True) for tag in tags],
+         len(tags)),
+        ('db.get_tag_stats', lambda: db.get_tag_stats(published_only=True), 1),
+        ('db.get_feed_articles', lambda: [db.get_feed_articles(20, tag=tag) for tag in [None, *tags]],
+         len(tags) + 1),
+        ('db.search_articles', lambda: [db.search_articles(term) for term in search_terms], len(search_terms)),
+        ('db.iter_articles_with_images', iterate_export, 1),
+        ('markdown.excerpt', lambda: render_markdown(a['content'][:300] for a in sample), len(sample)),
+        ('markdown.article', lambda: render_markdown(a['content'] for a in sample), len(sample)),
+        ('auto_tagger.generate_tags', lambda: [generate_tags(a['title'], a['content']) for a in sample],
+         len(sample)),
+        ('similarity.are_similar_articles', check_duplicates, len(incoming) * len(existing)),
+        ('whatsapp.convert', lambda: [formatter.convert(a['content']) for a in sample], len(sample)),
+        ('image.add_watermark', add_watermarks, len(watermark_images)),
+    ]
+
+
+def measure(func: Callable[[], Any], repeat: int) -> List[float]:
+    """Laufzeiten in Sekunden (nach einem Aufwärm-Durchlauf)"""
+    func()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def summarize(timings: List[float], ops: int) -> Dict[str, Any]:
+    median = statistics.median(timings)
+    return {
+        'median_ms': round(median * 1000, 4),
+        'min_ms': round(min(timings) * 1000, 4),
+        'max_ms': round(max(timings) * 1000, 4),
+        'ops': ops,
+        'per_op_us': round(median / ops * 1e6, 3),
+        'repeat': len(timings),
+    }
+
+
+def environment() -> Dict[str, Any]:
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any],
+            tolerance: float = DEFAULT_TOLERANCE) -> List[Dict[str, Any]]:
+    """Vergleicht die Mediane zweier Ergebnis-Dateien
+
+    Returns:
+        Eine Zeile pro Fall mit status 'ok', 'langsamer', 'schneller',
+        'neu' (nicht in der Baseline) oder 'fehlt' (nur in der Baseline)
+
+    Raises:
+        ValueError: wenn Korpus oder Format der Baseline abweichen
+    """
+    if baseline.get('version') != RESULT_VERSION:
+        raise ValueError(f"Baseline hat Format {baseline.get('version')}, erwartet {RESULT_VERSION}")
+    if baseline.get('corpus') != results.get('corpus'):
+        raise ValueError(f"Baseline wurde mit anderem Korpus erstellt: {baseline.get('corpus')}")
+
+    rows = []
+    current_cases = results['results']
+    baseline_cases = baseline['results']
+    for name, current in current_cases.items():
+        before = baseline_cases.get(name)
+        if before is None:
+            rows.append({'name': name, 'baseline_ms': None, 'median_ms': current['median_ms'],
+                         'ratio': None, 'status': 'neu'})
+            continue
+        ratio = current['median_ms'] / before['median_ms'] if before['median_ms'] else float('inf')
+        if ratio > 1 + tolerance:
+            status = 'langsamer'
+        elif ratio < 1 - tolerance:
+            status = 'schneller'
+        else:
+            status = 'ok'
+        rows.append({'name': name, 'baseline_ms': before['median_ms'], 'median_ms': current['median_ms'],
+                     'ratio': round(ratio, 3), 'status': status})
+    for name, before in baseline_cases.items():
+        if name not in current_cases:
+            rows.append({'name': name, 'baseline_ms': before['median_ms'], 'median_ms': None,
+                         'ratio': None, 'status': 'fehlt'})
+    return rows
+
+
+def run(articles_count: int, images: int, seed: int, repeat: int, only: List[str] = None,
+        progress: Callable[[str, Dict[str, Any]], None] = None) -> Dict[str, Any]:
+    """Erzeugt den Korpus, führt die (gefilterten) Fälle aus und liefert das Ergebnis-Dict"""
+    workdir = Path(tempfile.mkdtemp(prefix='fakedaily-bench-'))
+    try:
+        start = time.perf_counter()
+        articles = generate_articles(articles_count, seed=seed)
+        db_path, image_paths = build_database(workdir, articles, images=images, seed=seed)
+        corpus_seconds = time.perf_counter() - start
+
+        results = {}
+        for name, func, ops in build_cases(workdir, articles, image_paths, db_path, seed):
+            if only and not any(pattern in name for pattern in only):
+                continue
+            if ops == 0:
+                continue
+            results[name] = summarize(measure(func, repeat), ops)
+            if progress:
+                progress(name, results[name])
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    return {
+        'version': RESULT_VERSION,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'environment': environment(),
+        'corpus': {'articles': articles_count, 'images': images, 'seed': seed},
+        'corpus_seconds': round(corpus_seconds, 3),
+        'results': results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark-Suite der CMS-Hot-Paths")
+    parser.add_argument('--articles', type=int, default=2000, help='Artikel im Korpus (default: 2000)')
+    parser.add_argument('--images', type=int, default=20, help='Erzeugte Bilder (default: 20)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--repeat', type=int, default=5, help='Messungen pro Fall, Median zählt (default: 5)')
+    parser.add_argument('--only', action='append', help='Nur Fälle, deren Name dies enthält (mehrfach möglich)')
+    parser.add_argument('--output', help='Ergebnisse als JSON speichern')
+    parser.add_argument('--baseline', help='Mit gespeicherter JSON-Datei vergleichen')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help=f'Erlaubte Verlangsamung als Anteil (default: {DEFAULT_TOLERANCE})')
+    parser.add_argument('--list', action='store_true', help='Nur die Namen der Fälle ausgeben')
+    args = parser.parse_args()
+
+    if args.list:
+        with tempfile.TemporaryDirectory() as tmp:
+            articles = generate_articles(1, seed=args.seed)
+            for name, _, _ in build_cases(Path(tmp), articles, [], Path(tmp) / 'articles.db', args.seed):
+                print(name)
+        return
+
+    baseline = None
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding='utf-8'))
+
+    print(f"Korpus: {args.articles} Artikel, {args.images} Bilder, Seed {args.seed}; "
+          f"{args.repeat} Messungen pro Fall\n")
+
+    def show(name, result):
+        print(f"  {name:<34} {result['median_ms']:10.2f} ms  "
+              f"({result['ops']} Ops, {result['per_op_us']:,.1f} µs/Op)")
+
+    results = run(args.articles, args.images, args.seed, args.repeat, args.only, progress=show)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2, ensure_ascii=False) + '\n', encoding='utf-8')
+        print(f"\n✓ Ergebnisse gespeichert: {args.output}")
+
+    if baseline is None:
+        return
+
+    try:
+        rows = compare(results, baseline, args.tolerance)
+    except ValueError as e:
+        raise SystemExit(f"✗ {e}")
+
+    print(f"\nVergleich mit {args.baseline} (Toleranz {args.tolerance:.0%}):")
+    for row in rows:
+        before = f"{row['baseline_ms']:10.2f}" if row['baseline_ms'] is not None else f"{'-':>10}"
+        after = f"{row['median_ms']:10.2f}" if row['median_ms'] is not None else f"{'-':>10}"
+        ratio = f"{row['ratio']:5.2f}x" if row['ratio'] is not None else f"{'-':>6}"
+        print(f"  {row['name']:<34} {before} → {after} ms  {ratio}  {row['status']}")
+
+    regressions = [row['name'] for row in rows if row['status'] == 'langsamer']
+    if regressions:
+        raise SystemExit(f"✗ {len(regressions)} Fälle langsamer als die Baseline: {', '.join(regressions)}")
+    print("✓ Keine Verlangsamung gegenüber der Baseline")
+
+
+if __name__ == "__main__":
+    main()
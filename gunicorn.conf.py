@@ -0,0 +1,68 @@
+"""
+Gunicorn-Konfiguration für den Produktivbetrieb
+
+Start (Dockerfile-CMD):
+    gunicorn -c gunicorn.conf.py 'web.app:create_app()'
+
+Alle Werte kommen aus Umgebungsvariablen (docker-compose.yml):
+
+    HOST, PORT                    Bind-Adresse (default: 0.0.0.0:5001)
+    GUNICORN_WORKERS              Worker-Prozesse (default: 2 × CPUs + 1, höchstens 8)
+    GUNICORN_THREADS              Threads pro Worker (default: 4, > 1 = gthread-Worker)
+    GUNICORN_PRELOAD              App vor dem fork laden (default: true)
+    GUNICORN_KEEPALIVE            Sekunden, die Keep-Alive-Verbindungen offen bleiben (default: 5)
+    GUNICORN_MAX_REQUESTS         Worker nach N Requests neu starten (default: 1000, 0 = nie)
+    GUNICORN_MAX_REQUESTS_JITTER  Zufälliger Zuschlag, damit nicht alle gleichzeitig neu starten (default: 100)
+    GUNICORN_TIMEOUT              Hängende Worker nach N Sekunden neu starten (default: 60)
+    GUNICORN_GRACEFUL_TIMEOUT     Zeit für laufende Requests bei Reload/Stop (default: 30)
+    GUNICORN_LOG_LEVEL            Log-Level des Servers (default: info)
+
+Mit preload wird web/app.py einmal im Master importiert und per
+create_app() gestartet (DB-Migration, Logging, Templates, Markdown); die
+Worker erben das per fork() (copy-on-write). Der Logging-Hintergrund-Thread wird im Worker per
+os.register_at_fork neu gestartet (src/log_queue.py); DB-Verbindungen werden
+pro Aufruf geöffnet und daher nicht zwischen Prozessen geteilt. Alle Worker
+schreiben in dieselben Dateien unter logs/; die tägliche Rotation läuft unter
+einer Dateisperre nur einmal (src/log_rotation.py).
+
+Reload ohne Verbindungsabbruch: kill -HUP <master> startet neue Worker und
+beendet die alten, sobald ihre Requests fertig sind (graceful_timeout). Mit
+preload lädt HUP den App-Code nicht neu - neuer Code kommt mit einem neuen
+Container bzw. per USR2 (neuer Master) und anschließend TERM an den alten.
+"""
+import multiprocessing
+import os
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.environ.get(name, '').strip()
+    return int(value) if value else default
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.environ.get(name, '').strip().lower()
+    return value in ('1', 'true', 'yes', 'on') if value else default
+
+
+bind = f"{os.environ.get('HOST', '0.0.0.0')}:{_env_int('PORT', 5001)}"
+
+workers = _env_int('GUNICORN_WORKERS', min(multiprocessing.cpu_count() * 2 + 1, 8))
+threads = _env_int('GUNICORN_THREADS', 4)
+
+preload_app = _env_bool('GUNICORN_PRELOAD', True)
+
+keepalive = _env_int('GUNICORN_KEEPALIVE', 5)
+max_requests = _env_int('GUNICORN_MAX_REQUESTS', 1000)
+max_requests_jitter = _env_int('GUNICORN_MAX_REQUESTS_JITTER', 100)
+timeout = _env_int('GUNICORN_TIMEOUT', 60)
+graceful_timeout = _env_int('GUNICORN_GRACEFUL_TIMEOUT', 30)
+
+# Heartbeat-Dateien im RAM statt im Container-Dateisystem (overlayfs kann blockieren)
+if os.path.isdir('/dev/shm'):
+    worker_tmp_dir = '/dev/shm'
+
+# Kein Access-Log von Gunicorn: es enthielte volle IP-Adressen. Requests
+# protokolliert die App selbst anonymisiert in logs/requests.log (DSGVO).
+accesslog = None
+errorlog = '-'
+loglevel = os.environ.get('GUNICORN_LOG_LEVEL', 'info')
@@ -59,12 +59,32 @@ fi
 # 1. JSON-Import
 echo -e "${BLUE}[1/2]${NC} Importiere Artikel..."
 
-response=$(curl -s -X POST "$SERVER_URL/admin/api/import/articles" \
+# Als Import-Job starten (antwortet sofort), dann Status abfragen bis fertig
+job=$(curl -s -X POST "$SERVER_URL/admin/api/import/articles?async=1" \
     -H "Content-Type: application/json" \
     -d @"$JSON_FILE")
 
+job_id=$(echo "$job" | jq -r '.job_id // empty' 2>/dev/null)
+if [ -z "$job_id" ]; then
+    echo -e "${RED}✗${NC} Import fehlgeschlagen"
+    echo "$job" | jq '.' 2>/dev/null || echo "$job"
+    exit 1
+fi
+
+total=$(echo "$job" | jq -r '.total')
+while true; do
+    response=$(curl -s "$SERVER_URL/admin/api/import/jobs/$job_id")
+    status=$(echo "$response" | jq -r '.status // "unbekannt"' 2>/dev/null)
+    processed=$(echo "$response" | jq -r '.processed // 0' 2>/dev/null)
+    echo -ne "\r  Fortschritt: $processed/$total ($status)   "
+    case "$status" in
+        queued|running) sleep 2 ;;
+        *) echo ""; break ;;
+    esac
+done
+
 # Prüfen ob erfolgreich
-if echo "$response" | jq -e '.success' > /dev/null 2>&1; then
+if [ "$status" = "done" ]; then
     imported=$(echo "$response" | jq -r '.imported // 0')
     updated=$(echo "$response" | jq -r '.updated // 0')
     skipped=$(echo "$response" | jq -r '.skipped // 0')
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Archiv-Transfer: Artikel + Bilder als ein tar/zip-Archiv exportieren/importieren
+
+Alle Befehle arbeiten als Stream, das Archiv wird nie komplett im Speicher gehalten.
+Ohne server_url wird direkt mit der lokalen Datenbank (database/articles.db) gearbeitet.
+
+Usage:
+    python scripts/archive_transfer.py export <archiv> [server_url] [--format tar|zip]
+    python scripts/archive_transfer.py import <archiv> [server_url]
+    python scripts/archive_transfer.py copy <quelle_url> <ziel_url>
+
+Beispiele:
+    # Stage -> Datei
+    python scripts/archive_transfer.py export stage.tar http://stage:5001
+    # Datei -> Prod
+    python scripts/archive_transfer.py import stage.tar http://prod:5001
+    # Stage -> Prod direkt (ein Request pro Richtung, keine Zwischendatei)
+    python scripts/archive_transfer.py copy http://stage:5001 http://prod:5001
+    # Datei -> lokale Datenbank
+    python scripts/archive_transfer.py import stage.tar
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from content_archive import ARCHIVE_FORMATS, CHUNK_SIZE, CONTENT_TYPES, ArchiveImporter, iter_archive
+
+BASE_DIR = Path(__file__).parent.parent
+UPLOAD_FOLDER = BASE_DIR / 'media' / 'images'
+
+
+def _api_url(server_url: str, prefix: str, path: str) -> str:
+    return f"{server_url.rstrip('/')}{prefix}/admin/api/{path}"
+
+
+def _format_from_path(path: Path, default: str = 'tar') -> str:
+    suffix = path.suffix.lower().lstrip('.')
+    return suffix if suffix in ARCHIVE_FORMATS else default
+
+
+def _print_import_stats(stats: dict):
+    print(f"✓ Importiert: {stats['imported']}, Aktualisiert: {stats['updated']}, "
+          f"Übersprungen: {stats['skipped']}")
+    print(f"✓ Bilder: {stats['images']} (ersetzt: {stats.get('images_replaced', 0)}, "
+          f"übersprungen: {stats['images_skipped']})")
+    for error in stats.get('errors', []):
+        print(f"  ✗ {error}")
+
+
+def export_archive(archive: Path, server_url: str = None, fmt: str = 'tar',
+                   prefix: str = '/cms', timeout: float = 600):
+    """Schreibt ein Archiv vom Server (oder der lokalen DB) in eine Datei"""
+    started = time.perf_counter()
+
+    with open(archive, 'wb') as f:
+        if server_url:
+            import requests
+            url = _api_url(server_url, prefix, 'export/archive')
+            with requests.get(url, params={'format': fmt}, stream=True, timeout=timeout) as response:
+                response.raise_for_status()
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    f.write(chunk)
+        else:
+            from db_manager import DatabaseManager
+            for chunk in iter_archive(DatabaseManager(), UPLOAD_FOLDER, fmt):
+                f.write(chunk)
+
+    size_mb = archive.stat().st_size / (1024 * 1024)
+    print(f"✓ Archiv geschrieben: {archive} ({size_mb:.1f} MB in {time.perf_counter() - started:.1f}s)")
+
+
+def import_archive(archive: Path, server_url: str = None, prefix: str = '/cms',
+                   timeout: float = 600) -> dict:
+    """Importiert eine Archiv-Datei auf dem Server (oder in die lokale DB)"""
+    fmt = _format_from_path(archive)
+
+    with open(archive, 'rb') as f:
+        if server_url:
+            import requests
+            url = _api_url(server_url, prefix, 'import/archive')
+            response = requests.post(url, data=f, params={'format': fmt},
+                                     headers={'Content-Type': CONTENT_TYPES[fmt]},
+                                     timeout=timeout)
+            stats = response.json()
+            if not response.ok:
+                raise RuntimeError(stats.get('error', f"HTTP {response.status_code}"))
+        else:
+            from db_manager import DatabaseManager
+            stats = ArchiveImporter(DatabaseManager(), UPLOAD_FOLDER).import_stream(f, fmt)
+
+    _print_import_stats(stats)
+    return stats
+
+
+def copy_archive(source_url: str, target_url: str, prefix: str = '/cms',
+                 timeout: float = 600) -> dict:
+    """Überträgt alle Inhalte von einem Server direkt zum anderen (tar-Stream)"""
+    import requests
+
+    with requests.get(_api_url(source_url, prefix, 'export/archive'),
+                      params={'format': 'tar'}, stream=True, timeout=timeout) as source:
+        source.raise_for_status()
+        # Generator -> chunked Upload, der Export fließt direkt in den Import
+        response = requests.post(_api_url(target_url, prefix, 'import/archive'),
+                                 data=source.iter_content(CHUNK_SIZE),
+                                 params={'format': 'tar'},
+                                 headers={'Content-Type': CONTENT_TYPES['tar']},
+                                 timeout=timeout)
+    stats = response.json()
+    if not response.ok:
+        raise RuntimeError(stats.get('error', f"HTTP {response.status_code}"))
+
+    _print_import_stats(stats)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Artikel + Bilder als Archiv übertragen")
+    parser.add_argument('--prefix', default='/cms',
+                        help='APP_PREFIX der Server (default: /cms, leer für keinen)')
+    parser.add_argument('--timeout', type=float, default=600,
+                        help='Timeout pro Request in Sekunden (default: 600)')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    export_parser = commands.add_parser('export', help='Archiv erstellen')
+    export_parser.add_argument('archive', type=Path)
+    export_parser.add_argument('server_url', nargs='?')
+    export_parser.add_argument('--format', choices=ARCHIVE_FORMATS,
+                               help='Archivformat (default: aus Dateiendung, sonst tar)')
+
+    import_parser = commands.add_parser('import', help='Archiv importieren')
+    import_parser.add_argument('archive', type=Path)
+    import_parser.add_argument('server_url', nargs='?')
+
+    copy_parser = commands.add_parser('copy', help='Direkt von Server zu Server übertragen')
+    copy_parser.add_argument('source_url')
+    copy_parser.add_argument('target_url')
+
+    args = parser.parse_args()
+    prefix = args.prefix.rstrip('/')
+
+    try:
+        if args.command == 'export':
+            fmt = args.format or _format_from_path(args.archive)
+            export_archive(args.archive, args.server_url, fmt, prefix, args.timeout)
+        elif args.command == 'import':
+            if not args.archive.is_file():
+                print(f"✗ Archiv nicht gefunden: {args.archive}")
+                sys.exit(1)
+            stats = import_archive(args.archive, args.server_url, prefix, args.timeout)
+            if stats.get('errors'):
+                sys.exit(1)
+        else:
+            stats = copy_archive(args.source_url, args.target_url, prefix, args.timeout)
+            if stats.get('errors'):
+                sys.exit(1)
+    except Exception as e:
+        print(f"✗ Fehler: {e}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Ergänzt Bild-Metadaten (Breite, Höhe, Bytes, MIME-Typ, SHA-256) für bestehende Bilder
+
+Liest nur die Bild-Header (kein vollständiges Dekodieren), daher auch für
+große Bestände in media/images schnell.
+
+Usage:
+    python scripts/backfill_image_metadata.py          # Nur Bilder ohne Metadaten
+    python scripts/backfill_image_metadata.py --all    # Alle Bilder neu einlesen
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from db_manager import DatabaseManager
+from image_processor import ImageProcessor
+
+def backfill_image_metadata(refresh_all: bool = False):
+    """
+    Liest Metadaten für alle Bilder in der Datenbank ein
+
+    Args:
+        refresh_all: Auch Bilder mit vorhandenen Metadaten neu einlesen
+    """
+    db = DatabaseManager()
+    base_dir = Path(__file__).parent.parent
+
+    conn = db.get_connection()
+    cursor = conn.cursor()
+    if refresh_all:
+        cursor.execute("SELECT id, filepath FROM images")
+    else:
+        cursor.execute("SELECT id, filepath FROM images WHERE sha256 IS NULL")
+    images = cursor.fetchall()
+    conn.close()
+
+    if not images:
+        print("Keine Bilder ohne Metadaten gefunden.")
+        return
+
+    print(f"Gefunden: {len(images)} Bild(er)\n")
+
+    updated = 0
+    errors = 0
+
+    for image in images:
+        full_path = base_dir / image['filepath']
+
+        if not full_path.exists():
+            print(f"✗ Bild nicht gefunden: {image['filepath']}")
+            errors += 1
+            continue
+
+        try:
+            metadata = ImageProcessor.read_metadata(str(full_path))
+            db.update_image_metadata(image['id'], **metadata)
+            print(f"✓ {image['filepath']}: {metadata['width']}x{metadata['height']}, "
+                  f"{metadata['file_size']} Bytes")
+            updated += 1
+        except Exception as e:
+            print(f"✗ Fehler bei {image['filepath']}: {e}")
+            errors += 1
+
+    print(f"\n{'='*60}")
+    print("Fertig!")
+    print(f"  Aktualisiert: {updated}")
+    print(f"  Fehler: {errors}")
+    print(f"{'='*60}")
+
+def main():
+    refresh_all = '--all' in sys.argv
+    backfill_image_metadata(refresh_all=refresh_all)
+
+if __name__ == "__main__":
+    main()
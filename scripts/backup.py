@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Backup von Datenbank, Bildern und JSON-Export im laufenden Betrieb
+
+Legt unter dem Backup-Ordner ein Verzeichnis backup_YYYYMMDD_HHMMSS an
+(Aufbau siehe src/db_backup.py). Die Datenbank wird per SQLite-Backup-API
+seitenweise kopiert, die App muss dafür nicht gestoppt werden. Bilder, die
+seit dem letzten Backup unverändert sind, werden per Hardlink übernommen.
+
+Pfade kommen aus den Argumenten oder den Umgebungsvariablen DB_PATH,
+IMAGES_PATH und BACKUP_ROOT (wie in docker-compose.yml).
+
+Usage:
+    python scripts/backup.py                          # nach backups/
+    python scripts/backup.py --keep 14                # danach nur die 14 neuesten behalten
+    python scripts/backup.py --target /mnt/backup --pages 256 --sleep 0.01
+    python scripts/backup.py --archive                # zusätzlich als .tar.gz (z.B. zum Kopieren)
+
+Wiederherstellen (App vorher stoppen):
+    cp backups/backup_.../articles.db database/articles.db
+    cp -a backups/backup_.../images/. media/images/
+"""
+import argparse
+import os
+import shutil
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR / "src"))
+
+from db_backup import DEFAULT_PAGES, create_backup
+
+
+def format_bytes(size: int) -> str:
+    for unit in ('B', 'KiB', 'MiB', 'GiB'):
+        if size < 1024 or unit == 'GiB':
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+def print_summary(summary: dict):
+    database = summary['database']
+    images = summary['images']
+    print(f"✓ Datenbank:  {database['pages']} Seiten, {format_bytes(database['bytes'])} "
+          f"in {database['seconds']}s")
+    print(f"✓ Bilder:     {images['files']} ({images['linked']} verlinkt, {images['copied']} kopiert, "
+          f"{format_bytes(images['bytes_copied'])} neu) in {images['seconds']}s")
+    if 'export' in summary:
+        print(f"✓ JSON:       {summary['export']['count']} Artikel in {summary['export']['seconds']}s")
+    print(f"\nBackup: {summary['path']} ({summary['seconds']}s"
+          f"{', Basis ' + summary['previous'] if summary['previous'] else ', erstes Backup'})")
+    for name in summary['removed']:
+        print(f"  entfernt: {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Online-Backup von Datenbank, Bildern und JSON-Export")
+    parser.add_argument('--db', default=os.environ.get('DB_PATH', str(BASE_DIR / 'database' / 'articles.db')),
+                        help='Datenbank (default: $DB_PATH oder database/articles.db)')
+    parser.add_argument('--images', default=os.environ.get('IMAGES_PATH', str(BASE_DIR / 'media' / 'images')),
+                        help='Bild-Ordner (default: $IMAGES_PATH oder media/images)')
+    parser.add_argument('--target', default=os.environ.get('BACKUP_ROOT', str(BASE_DIR / 'backups')),
+                        help='Backup-Ordner (default: $BACKUP_ROOT oder backups/)')
+    parser.add_argument('--pages', type=int, default=DEFAULT_PAGES,
+                        help=f'DB-Seiten pro Kopierschritt, 0 = alles auf einmal (default: {DEFAULT_PAGES})')
+    parser.add_argument('--sleep', type=float, default=0.0, help='Pause zwischen Kopierschritten in Sekunden')
+    parser.add_argument('--keep', type=int, default=0, help='Nur die N neuesten Backups behalten (default: alle)')
+    parser.add_argument('--no-export', action='store_true', help='Keinen JSON-Export schreiben')
+    parser.add_argument('--archive', action='store_true', help='Backup zusätzlich als .tar.gz daneben ablegen')
+    args = parser.parse_args()
+
+    if not Path(args.db).exists():
+        raise SystemExit(f"✗ Datenbank nicht gefunden: {args.db}")
+
+    summary = create_backup(args.target, args.db, args.images, pages=args.pages, sleep=args.sleep,
+                            export=not args.no_export, keep=args.keep)
+    print_summary(summary)
+
+    if args.archive:
+        path = Path(summary['path'])
+        archive = shutil.make_archive(str(path), 'gztar', root_dir=path.parent, base_dir=path.name)
+        print(f"✓ Archiv: {archive}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,235 @@
 #!/usr/bin/env python3
 """
 Batch-Import von Artikeln aus JSON oder CSV
+
+Die Eingabe wird gestreamt (nicht komplett geladen) und batchweise per
+DatabaseManager.bulk_add_articles in wenigen Transaktionen eingefügt.
+Nach jedem Batch wird ein Checkpoint geschrieben; bricht der Import ab,
+setzt ein erneuter Aufruf mit derselben Datei dort wieder an.
+Artikel, deren normalisierter Inhalt (content_hash) schon in der DB oder
+weiter vorne in der Datei vorkommt, werden als Duplikate übersprungen -
+ein erneuter Import derselben Datei fügt also nichts ein. Ungültige
+Datensätze (title/content fehlen oder sind kein Text, Einfügen scheitert)
+werden übersprungen und gezählt, der Import läuft weiter.
+
+Usage:
+    python scripts/batch_import.py artikel.json [--batch-size 1000] [--restart]
+    python scripts/batch_import.py artikel.ndjson
+    python scripts/batch_import.py artikel.csv
 """
 import sys
+import os
 import json
 import csv
+import time
+import argparse
+from itertools import islice
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from db_manager import DatabaseManager
+from db_manager import DatabaseManager, content_hash
+
+DEFAULT_BATCH_SIZE = 1000
+READ_CHUNK_SIZE = 64 * 1024
+
+def iter_json_array(f, chunk_size: int = READ_CHUNK_SIZE):
+    """
+    Liest ein JSON-Array Element für Element aus einer Textdatei
+
+    Es wird immer nur ein Lesepuffer plus das aktuelle Element gehalten,
+    nicht die ganze Datei (Ersatz für json.load bei großen Archiven).
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    pos = 0
+    started = False
+    eof = False
+
+    def fill():
+        nonlocal buffer, pos, eof
+        chunk = f.read(chunk_size)
+        if not chunk:
+            eof = True
+        buffer = buffer[pos:] + chunk
+        pos = 0
+
+    while True:
+        # Whitespace und Trennzeichen überspringen
+        while pos < len(buffer) and buffer[pos] in ' \t\r\n' + (',' if started else ''):
+            pos += 1
+        if pos >= len(buffer):
+            if eof:
+                raise ValueError("Unerwartetes Dateiende: JSON-Array nicht abgeschlossen")
+            fill()
+            continue
+
+        if not started:
+            if buffer[pos] != '[':
+                raise ValueError("JSON-Datei muss ein Array von Artikeln enthalten")
+            started = True
+            pos += 1
+            continue
+
+        if buffer[pos] == ']':
+            return
+
+        try:
+            item, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            # Element ragt über das Pufferende hinaus -> nachladen
+            if eof:
+                raise
+            fill()
+            continue
+
+        if end == len(buffer) and not eof:
+            # Zahl/Literal am Pufferende könnte abgeschnitten sein
+            fill()
+            continue
+
+        pos = end
+        yield item
 
-def import_from_json(json_file: str):
+def iter_ndjson(f):
+    """Liest NDJSON (ein Artikel pro Zeile)"""
+    for line in f:
+        if line.strip():
+            yield json.loads(line)
+
+def iter_csv(f):
+    """
+    Liest Artikel aus CSV
+
+    Erwartete Spalten: title, content, author, published, tags
     """
-    Importiert Artikel aus JSON-Datei
-    
+    for row in csv.DictReader(f):
+        tags = row.get('tags', '').split(',') if row.get('tags') else None
+        tags = [t.strip() for t in tags] if tags else None
+
+        yield {
+            'title': row.get('title'),
+            'content': row.get('content'),
+            'author': row.get('author'),
+            'published': (row.get('published') or '').lower() in ['true', '1', 'yes'],
+            'tags': tags,
+            'created_at': row.get('created_at') or None,
+        }
+
+def checkpoint_path(input_file: str) -> Path:
+    return Path(f"{input_file}.checkpoint")
+
+def load_checkpoint(input_file: str) -> int:
+    """Liefert die Anzahl bereits verarbeiteter Datensätze (0 wenn kein passender Checkpoint)"""
+    path = checkpoint_path(input_file)
+    if not path.exists():
+        return 0
+
+    with open(path, 'r', encoding='utf-8') as f:
+        checkpoint = json.load(f)
+
+    # Checkpoint gilt nur für genau diese Datei (Größe + Änderungszeit)
+    stat = os.stat(input_file)
+    if checkpoint.get('size') != stat.st_size or checkpoint.get('mtime') != stat.st_mtime:
+        print(f"⚠ Checkpoint passt nicht zur Datei (geändert?) - starte von vorn")
+        return 0
+
+    return checkpoint.get('records', 0)
+
+def save_checkpoint(input_file: str, records: int):
+    """Schreibt den Checkpoint atomar"""
+    stat = os.stat(input_file)
+    path = checkpoint_path(input_file)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'records': records, 'size': stat.st_size, 'mtime': stat.st_mtime}, f)
+    os.replace(tmp_path, path)
+
+def import_records(records, input_file: str, db: DatabaseManager = None,
+                   batch_size: int = DEFAULT_BATCH_SIZE, resume: bool = True) -> int:
+    """
+    Importiert Datensätze batchweise mit Fortschrittsanzeige und Checkpoint
+
+    Args:
+        records: Iterable von Artikel-Dicts (in Datei-Reihenfolge)
+        input_file: Quelldatei (für den Checkpoint)
+        db: DatabaseManager (default: Standard-Datenbank)
+        batch_size: Artikel pro Transaktion
+        resume: An einem vorhandenen Checkpoint weitermachen
+
+    Returns:
+        Anzahl in diesem Lauf importierter Artikel
+    """
+    db = db or DatabaseManager()
+
+    start = load_checkpoint(input_file) if resume else 0
+    if start:
+        print(f"↻ Setze nach {start} Datensätzen fort (Checkpoint)")
+
+    # Position zählt alle gelesenen Datensätze, auch ungültige -
+    # nur so passt sie beim Fortsetzen wieder zur Datei
+    position = {'records': start}
+    invalid = []
+    duplicates = []
+    started = time.perf_counter()
+
+    # Inhalts-Hashes einmal laden: exakte Duplikate sind dann ein Set-Lookup
+    _, hash_map = db.get_duplicate_key_maps()
+    known_hashes = set(hash_map)
+
+    def skip(title, reason):
+        invalid.append(position['records'])
+        print(f"✗ Datensatz {position['records']} übersprungen ('{title}'): {reason}")
+
+    def valid_articles():
+        for record in islice(records, start, None):
+            position['records'] += 1
+            if (not isinstance(record, dict) or not record.get('title') or not record.get('content')
+                    or not isinstance(record['title'], str) or not isinstance(record['content'], str)):
+                title = record.get('title', 'unbekannt') if isinstance(record, dict) else 'unbekannt'
+                skip(title, 'title und content als Text erforderlich')
+                continue
+            try:
+                fingerprint = content_hash(record['content'])
+            except Exception as e:
+                skip(record['title'], str(e))
+                continue
+            if fingerprint in known_hashes:
+                duplicates.append(position['records'])
+                continue
+            known_hashes.add(fingerprint)
+            yield record
+
+    def on_error(record, error):
+        # Einfügen gescheitert (z.B. tags nicht serialisierbar); die Position ist
+        # hier schon weitergezählt, gemeldet wird daher nur der Titel
+        invalid.append(record.get('title'))
+        print(f"✗ Artikel '{record.get('title')}' übersprungen: {error}")
+
+    def on_batch(inserted):
+        save_checkpoint(input_file, position['records'])
+        elapsed = time.perf_counter() - started
+        print(f"  … {inserted} Artikel importiert ({inserted / elapsed:.0f}/s)")
+
+    imported = db.bulk_add_articles(valid_articles(), batch_size=batch_size, progress=on_batch,
+                                    on_error=on_error)
+
+    # Vollständig durchgelaufen -> Checkpoint wird nicht mehr gebraucht
+    checkpoint_path(input_file).unlink(missing_ok=True)
+
+    elapsed = time.perf_counter() - started
+    print(f"\n✓ {imported} Artikel erfolgreich importiert ({elapsed:.1f}s)")
+    if duplicates:
+        print(f"= {len(duplicates)} Duplikate übersprungen (gleicher Inhalt bereits vorhanden)")
+    if invalid:
+        print(f"⚠ {len(invalid)} Datensätze übersprungen")
+    return imported
+
+def import_from_json(json_file: str, db: DatabaseManager = None,
+                     batch_size: int = DEFAULT_BATCH_SIZE, resume: bool = True) -> int:
+    """
+    Importiert Artikel aus JSON-Datei (Array) oder NDJSON (.ndjson/.jsonl)
+
     Erwartetes Format:
     [
         {
@@ -27,62 +242,22 @@ def import_from_json(json_file: str):
         ...
     ]
     """
-    db = DatabaseManager()
-    
     with open(json_file, 'r', encoding='utf-8') as f:
-        articles = json.load(f)
-    
-    imported = 0
-    for article in articles:
-        try:
-            article_id = db.add_article(
-                title=article['title'],
-                content=article['content'],
-                author=article.get('author'),
-                published=article.get('published', False),
-                tags=article.get('tags')
-            )
-            print(f"✓ Importiert: {article['title']} (ID: {article_id})")
-            imported += 1
-        except Exception as e:
-            print(f"✗ Fehler bei '{article.get('title', 'unbekannt')}': {e}")
-    
-    print(f"\n✓ {imported} Artikel erfolgreich importiert")
-    return imported
+        if json_file.endswith(('.ndjson', '.jsonl')):
+            records = iter_ndjson(f)
+        else:
+            records = iter_json_array(f)
+        return import_records(records, json_file, db, batch_size, resume)
 
-def import_from_csv(csv_file: str):
+def import_from_csv(csv_file: str, db: DatabaseManager = None,
+                    batch_size: int = DEFAULT_BATCH_SIZE, resume: bool = True) -> int:
     """
     Importiert Artikel aus CSV-Datei
-    
-    Erwartete Spalten: title, content, author, published, tags
+
+    Erwartete Spalten: title, content, author, published, tags (optional: created_at)
     """
-    db = DatabaseManager()
-    
-    with open(csv_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        imported = 0
-        
-        for row in reader:
-            try:
-                tags = row.get('tags', '').split(',') if row.get('tags') else None
-                tags = [t.strip() for t in tags] if tags else None
-                
-                published = row.get('published', '').lower() in ['true', '1', 'yes']
-                
-                article_id = db.add_article(
-                    title=row['title'],
-                    content=row['content'],
-                    author=row.get('author'),
-                    published=published,
-                    tags=tags
-                )
-                print(f"✓ Importiert: {row['title']} (ID: {article_id})")
-                imported += 1
-            except Exception as e:
-                print(f"✗ Fehler bei '{row.get('title', 'unbekannt')}': {e}")
-        
-        print(f"\n✓ {imported} Artikel erfolgreich importiert")
-        return imported
+    with open(csv_file, 'r', encoding='utf-8', newline='') as f:
+        return import_records(iter_csv(f), csv_file, db, batch_size, resume)
 
 def create_example_json():
     """Erstellt eine Beispiel-JSON-Datei"""
@@ -102,25 +277,34 @@ def create_example_json():
             "tags": ["tech", "innovation"]
         }
     ]
-    
+
     example_path = Path(__file__).parent.parent / "example_articles.json"
     with open(example_path, 'w', encoding='utf-8') as f:
         json.dump(examples, f, indent=2, ensure_ascii=False)
-    
+
     print(f"✓ Beispiel-Datei erstellt: {example_path}")
     return example_path
 
 def main():
     """Beispiel-Nutzung"""
-    if len(sys.argv) > 1:
-        file_path = sys.argv[1]
-        
-        if file_path.endswith('.json'):
-            import_from_json(file_path)
+    parser = argparse.ArgumentParser(description="Batch-Import von Artikeln aus JSON, NDJSON oder CSV")
+    parser.add_argument('file', nargs='?', help='Eingabedatei (.json, .ndjson, .jsonl, .csv)')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f'Artikel pro Transaktion (default: {DEFAULT_BATCH_SIZE})')
+    parser.add_argument('--restart', action='store_true',
+                        help='Vorhandenen Checkpoint ignorieren und von vorn beginnen')
+    args = parser.parse_args()
+
+    if args.file:
+        file_path = args.file
+        resume = not args.restart
+
+        if file_path.endswith(('.json', '.ndjson', '.jsonl')):
+            import_from_json(file_path, batch_size=args.batch_size, resume=resume)
         elif file_path.endswith('.csv'):
-            import_from_csv(file_path)
+            import_from_csv(file_path, batch_size=args.batch_size, resume=resume)
         else:
-            print("Unterstütztes Format: .json oder .csv")
+            print("Unterstütztes Format: .json, .ndjson, .jsonl oder .csv")
     else:
         print("Erstelle Beispiel-Datei...")
         example_file = create_example_json()
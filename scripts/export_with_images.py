@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+FakeDaily Export
+Exportiert alle Artikel als JSON und lädt zugehörige Bilder herunter
+
+Ersetzt die curl/jq-Schleifen aus export_with_images.sh:
+- Bilder werden parallel über Keep-Alive-Verbindungen geladen
+- Unveränderte Bilder (gleiche Größe bzw. gleicher SHA-256) werden übersprungen
+- image_mapping.json wird in einem Durchgang geschrieben
+- Verwaiste Bilder werden per Mengendifferenz gefunden und gelöscht
+
+Usage:
+    python scripts/export_with_images.py [server_url] [export_dir] [--workers N]
+
+Beispiele:
+    python scripts/export_with_images.py
+    python scripts/export_with_images.py http://stage:5001 my_export --workers 16
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+DEFAULT_WORKERS = 8
+CHUNK_SIZE = 64 * 1024
+
+# Eine Session (= Connection-Pool mit Keep-Alive) pro Worker-Thread
+_local = threading.local()
+
+
+def get_session(pool_size: int = DEFAULT_WORKERS) -> requests.Session:
+    """Liefert die Session des aktuellen Threads"""
+    session = getattr(_local, 'session', None)
+    if session is None:
+        session = requests.Session()
+        # Kurze Aussetzer des Servers (Neustart, Proxy) werden mit Backoff wiederholt
+        retries = Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retries)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        _local.session = session
+    return session
+
+
+def file_sha256(path: Path) -> str:
+    """Berechnet den SHA-256 einer Datei blockweise"""
+    sha256 = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def is_unchanged(path: Path, image: dict) -> bool:
+    """Prüft ob eine lokale Kopie dem Bild im Export entspricht
+
+    Größe zuerst (billig), Hash nur wenn die Größe passt. Ohne Metadaten
+    im Export (ältere Server) zählt wie bisher nur der Dateiname.
+    """
+    if not path.is_file():
+        return False
+
+    file_size = image.get('file_size')
+    if file_size is not None and path.stat().st_size != file_size:
+        return False
+
+    sha256 = image.get('sha256')
+    if sha256:
+        return file_sha256(path) == sha256
+
+    return True
+
+
+def plan_downloads(articles: list, server_url: str, images_dir: Path):
+    """Erstellt Mapping und Download-Liste in einem Durchgang über alle Artikel
+
+    Returns:
+        (mapping, downloads, stats) - mapping: {article_id: [filenames]},
+        downloads: Liste von (url, zielpfad, image), stats: cached/skipped Zähler
+    """
+    mapping = {}
+    downloads = []
+    planned = set()
+    stats = {'cached': 0, 'skipped': 0}
+
+    for article in articles:
+        images = article.get('images') or []
+        if not images:
+            continue
+
+        filenames = []
+        for image in images:
+            url = image.get('url', '')
+            if not url.startswith(server_url):
+                print(f"  ↷ Übersprungen (anderer Server): {url}")
+                stats['skipped'] += 1
+                continue
+
+            filename = os.path.basename(urlparse(url).path)
+            filenames.append(filename)
+
+            if filename in planned:
+                continue
+            planned.add(filename)
+
+            target = images_dir / filename
+            if is_unchanged(target, image):
+                stats['cached'] += 1
+            else:
+                downloads.append((url, target, image))
+
+        mapping[str(article['id'])] = filenames
+
+    return mapping, downloads, stats
+
+
+def download_image(url: str, target: Path, image: dict, timeout: float, pool_size: int) -> tuple:
+    """Lädt ein Bild herunter (atomar über temporäre Datei)
+
+    Passt der SHA-256 nicht zum Export (z.B. Datei auf dem Server neu
+    verarbeitet, Metadaten noch alt), wird einmal neu geladen. Weicht er
+    danach immer noch ab, wird die Datei des Servers mit Warnung übernommen.
+
+    Returns:
+        (Bytes, True wenn der Hash zum Export passt)
+    """
+    tmp_path = target.with_name(f".{target.name}.part")
+    expected = image.get('sha256')
+
+    try:
+        for attempt in range(2):
+            sha256 = hashlib.sha256()
+            size = 0
+            with get_session(pool_size).get(url, stream=True, timeout=timeout) as response:
+                response.raise_for_status()
+                with open(tmp_path, 'wb') as f:
+                    for chunk in response.iter_content(CHUNK_SIZE):
+                        f.write(chunk)
+                        sha256.update(chunk)
+                        size += len(chunk)
+
+            matches = not expected or sha256.hexdigest() == expected
+            if matches:
+                break
+            if attempt == 0:
+                print(f"  ⚠ SHA-256 weicht vom Export ab, lade erneut: {target.name}")
+            else:
+                print(f"  ⚠ SHA-256 weicht weiterhin ab, übernehme Datei des Servers: {target.name}")
+
+        os.replace(tmp_path, target)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+    return size, matches
+
+
+def download_all(downloads: list, workers: int, timeout: float) -> dict:
+    """Lädt alle geplanten Bilder parallel herunter"""
+    stats = {'downloaded': 0, 'failed': 0, 'mismatched': 0, 'bytes': 0}
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(download_image, url, target, image, timeout, workers): target.name
+            for url, target, image in downloads
+        }
+        for future in as_completed(futures):
+            filename = futures[future]
+            try:
+                size, matches = future.result()
+                stats['bytes'] += size
+                stats['downloaded'] += 1
+                if not matches:
+                    stats['mismatched'] += 1
+                print(f"  ✓ {filename}")
+            except Exception as e:
+                stats['failed'] += 1
+                print(f"  ✗ Fehler: {filename} ({e})")
+
+    return stats
+
+
+def remove_orphans(images_dir: Path, mapping: dict) -> list:
+    """Löscht Bilder im Export-Verzeichnis, die nicht mehr im Export vorkommen"""
+    expected = {filename for filenames in mapping.values() for filename in filenames}
+    present = {p.name for p in images_dir.iterdir() if p.is_file()}
+
+    orphans = sorted(present - expected)
+    for filename in orphans:
+        (images_dir / filename).unlink()
+        print(f"  🗑 Verwaistes Bild gelöscht: {filename}")
+
+    return orphans
+
+
+def run_export(server_url: str, export_dir: Path, prefix: str = '/cms',
+               workers: int = DEFAULT_WORKERS, timeout: float = 30) -> dict:
+    """Führt den kompletten Export aus und gibt eine Zusammenfassung zurück"""
+    server_url = server_url.rstrip('/')
+    images_dir = export_dir / 'images'
+    images_dir.mkdir(parents=True, exist_ok=True)
+
+    started = time.perf_counter()
+
+    # 1. JSON-Export holen
+    print("[1/2] Hole JSON-Export...")
+    response = get_session(workers).get(f"{server_url}{prefix}/admin/api/export/articles",
+                                        timeout=timeout)
+    response.raise_for_status()
+    (export_dir / 'articles.json').write_bytes(response.content)
+    articles = response.json().get('articles', [])
+    print(f"✓ {len(articles)} Artikel exportiert → {export_dir / 'articles.json'}")
+
+    # 2. Bilder
+    print("\n[2/2] Lade Bilder herunter...")
+    mapping, downloads, plan_stats = plan_downloads(articles, server_url, images_dir)
+
+    download_started = time.perf_counter()
+    download_stats = download_all(downloads, workers, timeout)
+    download_seconds = time.perf_counter() - download_started
+
+    with open(export_dir / 'image_mapping.json', 'w', encoding='utf-8') as f:
+        json.dump(mapping, f, indent=2, ensure_ascii=False)
+
+    orphans = remove_orphans(images_dir, mapping)
+
+    summary = {
+        'articles': len(articles),
+        'downloaded': download_stats['downloaded'],
+        'failed': download_stats['failed'],
+        'mismatched': download_stats['mismatched'],
+        'cached': plan_stats['cached'],
+        'skipped': plan_stats['skipped'],
+        'deleted': len(orphans),
+        'bytes': download_stats['bytes'],
+        'download_seconds': download_seconds,
+        'total_seconds': time.perf_counter() - started,
+    }
+    return summary
+
+
+def print_summary(summary: dict, export_dir: Path):
+    """Gibt Statistik und Durchsatz aus"""
+    seconds = max(summary['download_seconds'], 1e-9)
+    mb = summary['bytes'] / (1024 * 1024)
+
+    print("")
+    print(f"✓ {summary['downloaded']} Bilder heruntergeladen ({mb:.1f} MB)")
+    if summary['cached']:
+        print(f"↻ {summary['cached']} Bilder unverändert (Größe/Hash)")
+    if summary['deleted']:
+        print(f"🗑 {summary['deleted']} verwaiste Bilder gelöscht")
+    if summary['skipped']:
+        print(f"⚠ {summary['skipped']} Bilder übersprungen (anderer Server)")
+    if summary['mismatched']:
+        print(f"⚠ {summary['mismatched']} Bilder weichen vom SHA-256 im Export ab "
+              "(Metadaten auf dem Server neu einlesen: scripts/backfill_image_metadata.py --all)")
+    if summary['failed']:
+        print(f"✗ {summary['failed']} Downloads fehlgeschlagen")
+    if summary['downloaded']:
+        print(f"⏱ Durchsatz: {summary['downloaded'] / seconds:.1f} Bilder/s, {mb / seconds:.2f} MB/s")
+    print(f"⏱ Gesamtdauer: {summary['total_seconds']:.2f}s")
+
+    print("")
+    print("=== Export abgeschlossen ===")
+    print(f"Speicherort: {export_dir}")
+    print("")
+    print("Inhalt:")
+    print("  - articles.json (JSON-Daten)")
+    print(f"  - images/ ({sum(1 for _ in (export_dir / 'images').iterdir())} Bilder)")
+    print("  - image_mapping.json (Bild-Zuordnungen)")
+    print("")
+    print("Tipp: Zum Importieren verwende:")
+    print(f"  ./import_with_images.sh {export_dir} [server_url]")
+    print("")
+    print("Oder manuell:")
+    print("  curl -X POST http://other-server:5001/admin/api/import/articles \\")
+    print("    -H 'Content-Type: application/json' \\")
+    print(f"    -d @{export_dir / 'articles.json'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Exportiert Artikel und Bilder eines CMS-Servers")
+    parser.add_argument('server_url', nargs='?', default='http://localhost:5001',
+                        help='Server-URL (default: http://localhost:5001)')
+    parser.add_argument('export_dir', nargs='?',
+                        default=f"export_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                        help='Export-Verzeichnis (default: export_TIMESTAMP)')
+    parser.add_argument('--prefix', default='/cms',
+                        help='APP_PREFIX des Servers (default: /cms, leer für keinen)')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'Parallele Downloads (default: {DEFAULT_WORKERS})')
+    parser.add_argument('--timeout', type=float, default=30,
+                        help='Timeout pro Request in Sekunden (default: 30)')
+    args = parser.parse_args()
+
+    export_dir = Path(args.export_dir)
+
+    print("=== CMS Export ===")
+    print(f"Server: {args.server_url}")
+    print(f"Export-Verzeichnis: {export_dir}\n")
+
+    try:
+        summary = run_export(args.server_url, export_dir, prefix=args.prefix.rstrip('/'),
+                             workers=args.workers, timeout=args.timeout)
+    except requests.RequestException as e:
+        print(f"✗ Fehler beim Abrufen des JSON-Exports: {e}")
+        sys.exit(1)
+
+    print_summary(summary, export_dir)
+    if summary['failed']:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
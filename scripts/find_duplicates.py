@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Bericht über Beinahe-Duplikate in der Datenbank
+
+Findet Artikel, die are_similar_articles() als Duplikat werten würde
+(Titel >95% oder Content >90% ähnlich), ohne alle Paare zu vergleichen:
+MinHash-Sketches + LSH-Blocking liefern Kandidaten, nur diese werden exakt
+geprüft (siehe src/near_duplicates.py). Paare knapp über dem Threshold
+werden zu mindestens 95% gefunden, einzelne können fehlen. Ändert nichts an
+der Datenbank.
+
+Usage:
+    python scripts/find_duplicates.py                         # Bericht auf stdout
+    python scripts/find_duplicates.py --json duplikate.json   # zusätzlich als JSON
+    python scripts/find_duplicates.py --db /pfad/articles.db --limit 0
+"""
+import sys
+import json
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from db_manager import DatabaseManager
+from near_duplicates import MAX_BUCKET, find_duplicate_clusters
+from similarity import CONTENT_PREFIX, CONTENT_THRESHOLD, TITLE_THRESHOLD
+
+def iter_article_previews(db: DatabaseManager):
+    """Alle Artikel mit Titel, Content-Anfang und Bildanzahl (ohne vollen Content)"""
+    conn = db.get_connection()
+    try:
+        cursor = conn.execute("""
+            SELECT a.id, a.title, substr(a.content, 1, ?) AS content, a.published, a.created_at,
+                   (SELECT COUNT(*) FROM images i WHERE i.article_id = a.id) AS image_count
+            FROM articles a
+            ORDER BY a.id
+        """, (CONTENT_PREFIX,))
+        for row in cursor:
+            yield dict(row)
+    finally:
+        conn.close()
+
+def print_report(result: dict, limit: int):
+    stats = result['stats']
+    seconds = stats['seconds']
+    print(f"Artikel:           {stats['articles']}")
+    print(f"Kandidaten-Paare:  {stats['candidate_pairs']} von {stats['lsh_pairs']} aus LSH-Buckets "
+          f"(bestätigt: {stats['confirmed_pairs']})")
+    print(f"Cluster:           {stats['clusters']} mit {stats['duplicates']} Duplikaten "
+          f"(Trefferquote knapp über dem Threshold ≥ {stats['expected_recall']:.0%})")
+    if stats['skipped_buckets']:
+        print(f"⚠ {stats['skipped_buckets']} übergroße LSH-Buckets übersprungen (--max-bucket)")
+    print(f"Laufzeit:          {seconds['total']}s (Sketch {seconds['sketch']}s, "
+          f"Kandidaten {seconds['candidates']}s, Prüfung {seconds['confirm']}s)")
+
+    clusters = result['clusters'] if not limit else result['clusters'][:limit]
+    for number, cluster in enumerate(clusters, 1):
+        print(f"\nCluster {number} ({len(cluster['members'])} Artikel) → behalten: #{cluster['target']}")
+        for member in cluster['members']:
+            marker = '★' if member['id'] == cluster['target'] else ' '
+            print(f"  {marker} #{member['id']:<6} {member['created_at'] or '':<19}  "
+                  f"{'veröff.' if member['published'] else 'Entwurf':<7}  "
+                  f"{member['image_count'] or 0} Bild(er)  "
+                  f"Titel {member['title_similarity']:.0%} / Inhalt {member['content_similarity']:.0%}  "
+                  f"{member['title']}")
+
+    if limit and len(result['clusters']) > limit:
+        print(f"\n… {len(result['clusters']) - limit} weitere Cluster (--limit 0 zeigt alle)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Beinahe-Duplikate in der Datenbank finden (nur Bericht)")
+    parser.add_argument('--db', help='Pfad zur Datenbank (default: database/articles.db)')
+    parser.add_argument('--json', metavar='DATEI', help='Ergebnis zusätzlich als JSON schreiben')
+    parser.add_argument('--title-threshold', type=float, default=TITLE_THRESHOLD,
+                        help=f'Titel-Ähnlichkeit für Duplikate (default: {TITLE_THRESHOLD})')
+    parser.add_argument('--content-threshold', type=float, default=CONTENT_THRESHOLD,
+                        help=f'Content-Ähnlichkeit für Duplikate (default: {CONTENT_THRESHOLD})')
+    parser.add_argument('--max-bucket', type=int, default=MAX_BUCKET,
+                        help=f'LSH-Buckets mit mehr Artikeln überspringen (default: {MAX_BUCKET})')
+    parser.add_argument('--limit', type=int, default=50,
+                        help='Maximal ausgegebene Cluster, 0 = alle (default: 50)')
+    args = parser.parse_args()
+
+    db = DatabaseManager(args.db)
+    result = find_duplicate_clusters(iter_article_previews(db),
+                                     title_threshold=args.title_threshold,
+                                     content_threshold=args.content_threshold,
+                                     max_bucket=args.max_bucket)
+    print_report(result, args.limit)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+        print(f"\n✓ JSON geschrieben: {args.json}")
+
+if __name__ == "__main__":
+    main()
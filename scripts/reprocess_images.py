@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 """
 Verarbeitet alle Bilder in der Datenbank neu mit aktuellem Logo
+
+Die Dateien werden überschrieben; Maße, Größe, MIME-Typ und SHA-256 in der
+Tabelle images werden danach neu gelesen, damit Export und Archiv-Import
+die neuen Dateien nicht als abweichend ablehnen.
 """
 import sys
 from pathlib import Path
@@ -10,17 +14,19 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 from db_manager import DatabaseManager
 from image_processor import ImageProcessor
 
-def reprocess_all_images(logo_path: str):
+def reprocess_all_images(logo_path: str, db: DatabaseManager = None, base_dir: Path = None):
     """
     Verarbeitet alle Bilder neu mit Logo
     
     Args:
         logo_path: Pfad zum Logo
+        db: Datenbank (default: database/articles.db)
+        base_dir: Basis für die relativen Pfade in images.filepath (default: Projektordner)
     """
-    db = DatabaseManager()
+    db = db or DatabaseManager()
     processor = ImageProcessor(logo_path=logo_path)
     
-    base_dir = Path(__file__).parent.parent
+    base_dir = Path(base_dir) if base_dir else Path(__file__).parent.parent
     
     # Alle Bilder aus DB holen
     conn = db.get_connection()
@@ -60,6 +66,8 @@ def reprocess_all_images(logo_path: str):
                 margin=20,
                 circular=True
             )
+            # Gespeicherte Metadaten an die neue Datei anpassen
+            db.update_image_metadata(image_id, **ImageProcessor.read_metadata(str(full_path)))
             print(f"✓ Verarbeitet: {filepath} (Artikel {article_id})")
             processed += 1
         except Exception as e:
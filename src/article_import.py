@@ -0,0 +1,402 @@
+"""
+JSON-Import von Artikeln (POST /admin/api/import/articles), synchron oder als Job
+
+ArticleImporter enthält die Regeln des Imports (title_key, content_hash,
+Similarity Detection, neuerer updated_at gewinnt) und schreibt
+batchweise: eine Transaktion pro Batch statt eines Commits pro Artikel.
+Was mit jedem Artikel eines Batches passiert, wird vor der Transaktion
+entschieden; die Schreibsperre wird nur für die INSERTs/UPDATEs gehalten.
+
+Import-Jobs laufen in einem Hintergrund-Thread des Prozesses, der sie
+angenommen hat. Der Fortschritt steht in der Tabelle import_jobs und wird
+im selben Commit wie der jeweilige Batch aktualisiert, ist also von jedem
+Worker aus abfragbar.
+"""
+import json
+import logging
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from auto_tagger import add_auto_tags_if_empty
+from db_manager import title_key, content_hash
+from similarity import CONTENT_PREFIX, are_similar_articles
+
+IMPORT_BATCH_SIZE = 100
+
+IMPORT_JOBS_TABLE = """
+    CREATE TABLE IF NOT EXISTS import_jobs (
+        id TEXT PRIMARY KEY,
+        status TEXT NOT NULL DEFAULT 'queued',
+        total INTEGER NOT NULL DEFAULT 0,
+        processed INTEGER NOT NULL DEFAULT 0,
+        imported INTEGER NOT NULL DEFAULT 0,
+        updated INTEGER NOT NULL DEFAULT 0,
+        skipped INTEGER NOT NULL DEFAULT 0,
+        errors TEXT,
+        error TEXT,
+        pid INTEGER,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        started_at TIMESTAMP,
+        finished_at TIMESTAMP
+    )
+"""
+
+logger = logging.getLogger('fakedaily.app')
+
+
+class ArticleImporter:
+    """Importiert Artikel-Dicts (Format von /admin/api/export/articles)
+
+    Importiert einen Artikel nur wenn:
+    - Der Titel noch nicht in der DB ist (Vergleich über title_key) UND
+    - Kein Artikel mit exakt gleichem Inhalt existiert (content_hash) UND
+    - Kein ähnlicher Artikel existiert (Similarity Detection), ODER
+    - Der Titel/ähnlicher Artikel existiert, aber updated_at im Import neuer ist
+
+    Für die Similarity Detection werden Titel und Content-Anfang aller
+    Artikel einmal geladen und im Speicher nachgeführt (statt pro Artikel
+    die ganze Tabelle zu lesen).
+
+    Pro Batch wird zuerst ohne Transaktion geplant (Duplikate, Similarity,
+    Auto-Tagging) und danach in einer kurzen Transaktion geschrieben.
+    Artikel, die im selben Batch eingefügt werden sollen, stehen bis dahin
+    als Platzhalter (id None) im Speicher, damit spätere Artikel des Batches
+    sie als Duplikat erkennen.
+    """
+
+    def __init__(self, db, batch_size: int = IMPORT_BATCH_SIZE,
+                 progress: Callable[[Any, Dict[str, Any]], None] = None):
+        """
+        Args:
+            db: DatabaseManager
+            batch_size: Artikel pro Transaktion
+            progress: Callback (cursor, stats) nach jedem Batch, noch innerhalb
+                      der Transaktion des Batches
+        """
+        self.db = db
+        self.batch_size = batch_size
+        self.progress = progress
+
+        self.stats = {
+            'processed': 0,
+            'imported': 0,
+            'updated': 0,
+            'skipped': 0,
+            'errors': [],
+        }
+        self._articles = {}         # id -> Titel, Content-Anfang, Zeitstempel, Schlüssel
+        self._titles = {}           # title_key -> Artikel (kleinste ID gewinnt)
+        self._hashes = {}           # content_hash -> Artikel
+        self._pending = {}          # Platzhalter geplanter INSERTs des Batches
+        self._by_created = None     # Reihenfolge wie get_all_articles(), None = neu sortieren
+
+    def run(self, articles: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Importiert alle Artikel und gibt die Statistik zurück
+
+        Returns:
+            Statistik: processed, imported, updated, skipped, errors
+        """
+        conn = self.db.get_connection()
+        try:
+            cursor = conn.cursor()
+            self._load_existing(cursor)
+            for start in range(0, len(articles), self.batch_size):
+                batch = articles[start:start + self.batch_size]
+                steps = [step for step in map(self._plan_safely, batch) if step]
+                with conn:
+                    for step in steps:
+                        try:
+                            self._write(cursor, step)
+                        except Exception as e:
+                            self._error(step['data'], e)
+                            self._restore(cursor, step)
+                    self.stats['processed'] += len(batch)
+                    if self.progress:
+                        self.progress(cursor, self.stats)
+                self._discard_pending()
+        finally:
+            conn.close()
+
+        return self.stats
+
+    # ----- Bestand -----
+
+    def _load_existing(self, cursor):
+        cursor.execute(f"""
+            SELECT id, title, substr(content, 1, {CONTENT_PREFIX}) AS content,
+                   created_at, updated_at, title_key, content_hash
+            FROM articles
+            ORDER BY id
+        """)
+        for row in cursor.fetchall():
+            self._remember(dict(row))
+
+    def _remember(self, article: Dict[str, Any]):
+        if article['id'] is None:
+            self._pending[id(article)] = article
+        else:
+            self._articles[article['id']] = article
+        self._titles.setdefault(article['title_key'], article)
+        self._hashes.setdefault(article['content_hash'], article)
+        self._by_created = None
+
+    def _forget(self, article: Dict[str, Any]):
+        if self._titles.get(article['title_key']) is article:
+            del self._titles[article['title_key']]
+        if self._hashes.get(article['content_hash']) is article:
+            del self._hashes[article['content_hash']]
+
+    def _discard_pending(self):
+        """Platzhalter entfernen, deren INSERT fehlgeschlagen ist"""
+        for article in self._pending.values():
+            self._forget(article)
+        self._pending.clear()
+        self._by_created = None
+
+    def _reload(self, cursor, article_id: int, placeholder: Dict[str, Any] = None):
+        """Aktuellen Stand eines geschriebenen Artikels übernehmen (DB setzt Zeitstempel)"""
+        previous = self._articles.get(article_id)
+        if previous:
+            self._forget(previous)
+        if placeholder is not None:
+            self._forget(placeholder)
+            self._pending.pop(id(placeholder), None)
+        cursor.execute(f"""
+            SELECT id, title, substr(content, 1, {CONTENT_PREFIX}) AS content,
+                   created_at, updated_at, title_key, content_hash
+            FROM articles WHERE id = ?
+        """, (article_id,))
+        self._remember(dict(cursor.fetchone()))
+
+    def _find_similar(self, article_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        if self._by_created is None:
+            self._by_created = sorted([*self._articles.values(), *self._pending.values()],
+                                      key=lambda a: a['created_at'] or '', reverse=True)
+        for article in self._by_created:
+            if are_similar_articles(article_data, article):
+                logger.info(f"Similarity detected: '{article_data['title']}' ~ '{article['title']}' (using existing)")
+                return article
+        return None
+
+    # ----- Artikel -----
+
+    def _error(self, article_data: Dict[str, Any], error: Exception):
+        self.stats['errors'].append(f"Fehler bei '{article_data.get('title', 'unbekannt')}': {str(error)}")
+        self.stats['skipped'] += 1
+
+    def _plan_safely(self, article_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        try:
+            return self._plan(article_data)
+        except Exception as e:
+            self._error(article_data, e)
+            return None
+
+    def _plan(self, article_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Entscheidet ohne Datenbankzugriff, was mit einem Artikel passiert
+
+        Returns:
+            Schritt für _write ('insert' oder 'update') oder None (übersprungen)
+        """
+        title = article_data.get('title')
+        if not title:
+            self.stats['errors'].append('Artikel ohne Titel übersprungen')
+            self.stats['skipped'] += 1
+            return None
+
+        content = article_data.get('content', '')
+
+        # Prüfen ob Artikel mit diesem (normalisierten) Titel oder exakt
+        # gleichem Inhalt bereits existiert, sonst Similarity Detection
+        existing = (self._titles.get(title_key(title)) or
+                    self._hashes.get(content_hash(content)) or
+                    self._find_similar(article_data))
+
+        if existing:
+            import_updated = article_data.get('updated_at', article_data.get('created_at'))
+            existing_updated = existing.get('updated_at', existing.get('created_at'))
+
+            # Nur aktualisieren, wenn der Import neuer ist; ohne Zeitstempel überspringen
+            if not (import_updated and existing_updated and
+                    datetime.fromisoformat(import_updated) > datetime.fromisoformat(existing_updated)):
+                self.stats['skipped'] += 1
+                return None
+
+            # Auto-Tagging wenn keine Tags vorhanden
+            tags = add_auto_tags_if_empty(article_data.get('tags', []), title, content)
+            step = {'action': 'update', 'data': article_data, 'target': existing,
+                    'params': (title, title_key(title), article_data.get('content'),
+                               content_hash(article_data.get('content')), article_data.get('author'),
+                               article_data.get('published', False), json.dumps(tags))}
+            # Stand nach dem UPDATE vormerken (Zeitstempel setzt die DB, _reload korrigiert)
+            self._forget(existing)
+            existing.update(title=title, title_key=title_key(title), content=content[:CONTENT_PREFIX],
+                            content_hash=content_hash(content), updated_at=_now())
+            self._remember(existing)
+            return step
+
+        tags = add_auto_tags_if_empty(article_data.get('tags', []), title, content)
+        created_at = article_data.get('created_at')
+        placeholder = {'id': None, 'title': title, 'content': content[:CONTENT_PREFIX],
+                       'created_at': created_at or _now(), 'updated_at': created_at or _now(),
+                       'title_key': title_key(title), 'content_hash': content_hash(content)}
+        self._remember(placeholder)
+        return {'action': 'insert', 'data': article_data, 'target': placeholder,
+                'params': (title, title_key(title), content, content_hash(content), article_data.get('author'),
+                           article_data.get('published', False), json.dumps(tags) if tags else None,
+                           created_at, created_at)}
+
+    def _write(self, cursor, step: Dict[str, Any]):
+        """Führt einen geplanten Schritt aus (innerhalb der Batch-Transaktion)"""
+        target = step['target']
+        if step['action'] == 'insert':
+            cursor.execute("""
+                INSERT INTO articles (title, title_key, content, content_hash, author, published, tags,
+                                      created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP), COALESCE(?, CURRENT_TIMESTAMP))
+            """, step['params'])
+            # Spätere UPDATEs desselben Batches auf diesen Platzhalter brauchen die ID
+            target['id'] = cursor.lastrowid
+            self._reload(cursor, cursor.lastrowid, placeholder=target)
+            self.stats['imported'] += 1
+            return
+
+        if target['id'] is None:
+            raise ValueError('Ziel-Artikel wurde nicht eingefügt')
+        cursor.execute("""
+            UPDATE articles
+            SET title = ?, title_key = ?, content = ?, content_hash = ?, author = ?,
+                published = ?, tags = ?, updated_at = CURRENT_TIMESTAMP
+            WHERE id = ?
+        """, (*step['params'], target['id']))
+        self._reload(cursor, target['id'])
+        self.stats['updated'] += 1
+
+    def _restore(self, cursor, step: Dict[str, Any]):
+        """Vorgemerkten Stand nach einem fehlgeschlagenen Schritt verwerfen"""
+        target = step['target']
+        if step['action'] == 'update' and target['id'] is not None:
+            self._reload(cursor, target['id'])
+
+
+def _now() -> str:
+    """Zeitstempel wie CURRENT_TIMESTAMP in SQLite (UTC)"""
+    return datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+
+
+# ===== Import-Jobs =====
+
+# Ein Worker-Thread: Jobs eines Prozesses laufen nacheinander, damit sich zwei
+# Importe nicht gegenseitig Duplikate "übersehen" oder um Schreibsperren streiten
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='import-job')
+        return _executor
+
+
+def _process_alive(pid: Optional[int]) -> bool:
+    if not pid:
+        return False
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def start_import_job(db, articles: List[Dict[str, Any]], batch_size: int = IMPORT_BATCH_SIZE,
+                     on_done: Callable[[Dict[str, Any]], None] = None) -> str:
+    """Legt einen Import-Job an und startet ihn im Hintergrund
+
+    Args:
+        db: DatabaseManager
+        articles: Artikel-Dicts wie für ArticleImporter
+        batch_size: Artikel pro Transaktion
+        on_done: Callback mit dem Job-Status (get_import_job) nach Ende des Jobs
+
+    Returns:
+        Job-ID
+    """
+    job_id = uuid.uuid4().hex
+    conn = db.get_connection()
+    try:
+        with conn:
+            conn.execute("INSERT INTO import_jobs (id, status, total, pid) VALUES (?, 'queued', ?, ?)",
+                         (job_id, len(articles), os.getpid()))
+    finally:
+        conn.close()
+
+    _get_executor().submit(_run_import_job, db, job_id, articles, batch_size, on_done)
+    return job_id
+
+
+def _run_import_job(db, job_id: str, articles: List[Dict[str, Any]], batch_size: int,
+                    on_done: Callable[[Dict[str, Any]], None] = None):
+    def save_progress(cursor, stats):
+        cursor.execute("""
+            UPDATE import_jobs
+            SET processed = ?, imported = ?, updated = ?, skipped = ?, errors = ?
+            WHERE id = ?
+        """, (stats['processed'], stats['imported'], stats['updated'], stats['skipped'],
+              json.dumps(stats['errors'], ensure_ascii=False), job_id))
+
+    conn = db.get_connection()
+    try:
+        with conn:
+            conn.execute("UPDATE import_jobs SET status = 'running', started_at = CURRENT_TIMESTAMP WHERE id = ?",
+                         (job_id,))
+        try:
+            ArticleImporter(db, batch_size=batch_size, progress=save_progress).run(articles)
+            status, error = 'done', None
+        except Exception as e:
+            logger.exception(f"Import-Job {job_id} fehlgeschlagen")
+            status, error = 'failed', str(e)
+        with conn:
+            conn.execute("""
+                UPDATE import_jobs SET status = ?, error = ?, finished_at = CURRENT_TIMESTAMP WHERE id = ?
+            """, (status, error, job_id))
+    finally:
+        conn.close()
+
+    if on_done:
+        on_done(get_import_job(db, job_id))
+
+
+def get_import_job(db, job_id: str) -> Optional[Dict[str, Any]]:
+    """Status eines Import-Jobs oder None
+
+    Jobs, deren Prozess nicht mehr läuft (z.B. Neustart während des Imports),
+    werden als 'failed' gemeldet; bereits committete Batches bleiben importiert.
+    """
+    conn = db.get_connection()
+    try:
+        row = conn.execute("SELECT * FROM import_jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        if job['status'] in ('queued', 'running') and not _process_alive(job['pid']):
+            with conn:
+                conn.execute("""
+                    UPDATE import_jobs SET status = 'failed', error = ?, finished_at = CURRENT_TIMESTAMP
+                    WHERE id = ? AND status = ?
+                """, ('Prozess beendet, Import abgebrochen', job_id, job['status']))
+            job.update(status='failed', error='Prozess beendet, Import abgebrochen')
+    finally:
+        conn.close()
+
+    job['errors'] = json.loads(job['errors']) if job['errors'] else []
+    del job['pid']
+    return job
@@ -0,0 +1,93 @@
+"""
+Atom-Feed (RFC 4287) für veröffentlichte Artikel
+
+Der Feed wird als Text aus fertigen Fragmenten zusammengesetzt: das HTML der
+Artikel kommt bereits gerendert (und gecacht) von außen, hier wird nur noch
+escaped und verkettet. Zeitstempel aus SQLite (CURRENT_TIMESTAMP) sind UTC.
+"""
+import re
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Optional
+from xml.sax.saxutils import escape, quoteattr
+
+ATOM_NS = 'http://www.w3.org/2005/Atom'
+CONTENT_TYPE = 'application/atom+xml; charset=utf-8'
+
+# In XML 1.0 nicht erlaubte Steuerzeichen (z.B. aus WhatsApp-Kopien)
+_INVALID_XML = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]')
+
+
+def parse_timestamp(value: Any) -> Optional[datetime]:
+    """SQLite-Zeitstempel ('YYYY-MM-DD HH:MM:SS', UTC) als datetime mit Zeitzone"""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def atom_date(value: Any, default: datetime = None) -> str:
+    """Zeitstempel im Atom-Format (RFC 3339), z.B. '2026-01-16T08:30:00Z'"""
+    parsed = parse_timestamp(value) or default or datetime(1970, 1, 1, tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def _text(value: Any) -> str:
+    return escape(_INVALID_XML.sub('', str(value)))
+
+
+def _attr(value: Any) -> str:
+    return quoteattr(_INVALID_XML.sub('', str(value)))
+
+
+def render_entry(article: Dict[str, Any], url: str, content_html: str) -> str:
+    """Ein <entry> für einen Artikel
+
+    Args:
+        article: Artikel-Dict (title, author, created_at, updated_at, tags als Liste)
+        url: Absolute URL des Artikels (auch als Atom-ID)
+        content_html: Gerenderter Inhalt
+    """
+    parts = [
+        '<entry>',
+        f'<title>{_text(article["title"])}</title>',
+        f'<link rel="alternate" type="text/html" href={_attr(url)}/>',
+        f'<id>{_text(url)}</id>',
+        f'<published>{atom_date(article.get("created_at"))}</published>',
+        f'<updated>{atom_date(article.get("updated_at") or article.get("created_at"))}</updated>',
+    ]
+    if article.get('author'):
+        parts.append(f'<author><name>{_text(article["author"])}</name></author>')
+    for tag in article.get('tags') or []:
+        parts.append(f'<category term={_attr(tag)}/>')
+    parts.append(f'<content type="html">{_text(content_html)}</content>')
+    parts.append('</entry>')
+    return ''.join(parts)
+
+
+def render_feed(title: str, feed_url: str, site_url: str, updated: str, author: str,
+                entries: Iterable[str]) -> str:
+    """Vollständiges Atom-Dokument aus fertigen <entry>-Fragmenten
+
+    Args:
+        title: Titel des Feeds
+        feed_url: Absolute URL des Feeds (rel="self", auch als Atom-ID)
+        site_url: Absolute URL der zugehörigen HTML-Seite
+        updated: Stand des Feeds (atom_date)
+        author: Autor auf Feed-Ebene (gilt für Einträge ohne eigenen)
+        entries: Ergebnisse von render_entry, in Ausgabereihenfolge
+    """
+    return ''.join([
+        '<?xml version="1.0" encoding="utf-8"?>\n',
+        f'<feed xmlns="{ATOM_NS}">',
+        f'<title>{_text(title)}</title>',
+        f'<link rel="self" type="application/atom+xml" href={_attr(feed_url)}/>',
+        f'<link rel="alternate" type="text/html" href={_attr(site_url)}/>',
+        f'<id>{_text(feed_url)}</id>',
+        f'<updated>{updated}</updated>',
+        f'<author><name>{_text(author)}</name></author>',
+        *entries,
+        '</feed>\n',
+    ])
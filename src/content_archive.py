@@ -0,0 +1,484 @@
+"""
+Archiv-Export/-Import für den Umzug von Inhalten zwischen Instanzen
+
+Ein Archiv (tar oder zip) enthält:
+    manifest.json                 Format-Version und Zeitstempel
+    articles/000001.ndjson        Ein Artikel pro Zeile (inkl. Bild-Metadaten)
+    images/<filename>             Die Bilddateien der Artikel davor
+
+Artikel und Bilder werden seitenweise abwechselnd geschrieben. Export und
+Import laufen dadurch als Stream: Im Speicher liegt immer nur eine Seite
+Artikel bzw. ein Lese-/Schreibpuffer, nie das ganze Archiv.
+"""
+import hashlib
+import io
+import json
+import os
+import tarfile
+import tempfile
+import time
+import zipfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from werkzeug.utils import secure_filename
+
+from auto_tagger import add_auto_tags_if_empty
+from db_manager import title_key, content_hash
+from image_processor import ImageProcessor
+
+ARCHIVE_VERSION = 1
+ARCHIVE_FORMATS = ('tar', 'zip')
+CONTENT_TYPES = {
+    'tar': 'application/x-tar',
+    'zip': 'application/zip',
+}
+ARTICLES_PER_MEMBER = 500
+CHUNK_SIZE = 64 * 1024
+IMAGE_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp'}
+
+# Zip lässt sich nur mit Zentralverzeichnis (am Dateiende) lesen. Beim Import
+# wird es daher gespoolt: bis zu dieser Größe im RAM, darüber als Temp-Datei.
+ZIP_SPOOL_SIZE = 8 * 1024 * 1024
+
+# Felder, die pro Bild ins Archiv geschrieben werden
+IMAGE_FIELDS = ('filename', 'alt_text', 'caption', 'width', 'height',
+                'file_size', 'mime_type', 'sha256')
+
+
+def format_from_content_type(content_type: Optional[str]) -> Optional[str]:
+    """Ermittelt das Archivformat aus einem Content-Type ('tar', 'zip' oder None)"""
+    for fmt, mimetype in CONTENT_TYPES.items():
+        if content_type == mimetype:
+            return fmt
+    if content_type in ('application/x-zip-compressed',):
+        return 'zip'
+    if content_type in ('application/gzip', 'application/x-gzip', 'application/x-gtar'):
+        return 'tar'
+    return None
+
+
+# ===== Export =====
+
+class _TarStreamWriter:
+    """Schreibt tar-Einträge als Byte-Chunks (ohne seekbares Ziel)"""
+
+    def __init__(self):
+        self.offset = 0
+
+    def _emit(self, data: bytes) -> bytes:
+        self.offset += len(data)
+        return data
+
+    def add(self, name: str, size: int, chunks: Iterable[bytes], mtime: float) -> Iterator[bytes]:
+        info = tarfile.TarInfo(name)
+        info.size = size
+        info.mtime = int(mtime)
+        info.mode = 0o644
+        yield self._emit(info.tobuf(tarfile.PAX_FORMAT, 'utf-8', 'surrogateescape'))
+
+        written = 0
+        for chunk in chunks:
+            written += len(chunk)
+            yield self._emit(chunk)
+        if written != size:
+            raise IOError(f"{name}: Größe hat sich während des Exports geändert")
+
+        padding = (-size) % tarfile.BLOCKSIZE
+        if padding:
+            yield self._emit(tarfile.NUL * padding)
+
+    def close(self) -> Iterator[bytes]:
+        # Zwei leere Blöcke als Ende-Markierung, dann auf Record-Größe auffüllen
+        yield self._emit(tarfile.NUL * (tarfile.BLOCKSIZE * 2))
+        padding = (-self.offset) % tarfile.RECORDSIZE
+        if padding:
+            yield self._emit(tarfile.NUL * padding)
+
+
+class _ChunkBuffer(io.RawIOBase):
+    """Nicht-seekbares Schreibziel für zipfile; wird nach jedem Schritt geleert"""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class _ZipStreamWriter:
+    """Schreibt zip-Einträge als Byte-Chunks (Data-Descriptor statt Seek)"""
+
+    def __init__(self):
+        self.buffer = _ChunkBuffer()
+        self.zip = zipfile.ZipFile(self.buffer, 'w')
+
+    def add(self, name: str, size: int, chunks: Iterable[bytes], mtime: float) -> Iterator[bytes]:
+        info = zipfile.ZipInfo(name, date_time=time.localtime(mtime)[:6])
+        # Bilder sind bereits komprimiert, nur Text lohnt Deflate
+        info.compress_type = zipfile.ZIP_STORED if name.startswith('images/') else zipfile.ZIP_DEFLATED
+        info.external_attr = 0o644 << 16
+
+        with self.zip.open(info, 'w') as member:
+            for chunk in chunks:
+                member.write(chunk)
+                data = self.buffer.drain()
+                if data:
+                    yield data
+        yield self.buffer.drain()
+
+    def close(self) -> Iterator[bytes]:
+        self.zip.close()
+        yield self.buffer.drain()
+
+
+def _read_file_chunks(path: Path) -> Iterator[bytes]:
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            yield chunk
+
+
+def _file_sha256(path: Path) -> str:
+    sha256 = hashlib.sha256()
+    for chunk in _read_file_chunks(path):
+        sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def iter_archive(db, upload_folder, fmt: str = 'tar',
+                 batch_size: int = ARTICLES_PER_MEMBER) -> Iterator[bytes]:
+    """Erzeugt ein Export-Archiv als Stream von Byte-Chunks
+
+    Args:
+        db: DatabaseManager
+        upload_folder: Verzeichnis mit den Bilddateien (media/images)
+        fmt: 'tar' oder 'zip'
+        batch_size: Artikel pro NDJSON-Eintrag
+
+    Yields:
+        Archiv-Bytes (direkt als Response-Body verwendbar)
+    """
+    if fmt not in ARCHIVE_FORMATS:
+        raise ValueError(f"Unbekanntes Archivformat: {fmt}")
+
+    writer = _TarStreamWriter() if fmt == 'tar' else _ZipStreamWriter()
+    upload_folder = Path(upload_folder)
+    now = time.time()
+
+    manifest = json.dumps({
+        'version': ARCHIVE_VERSION,
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'articles_per_member': batch_size,
+    }, ensure_ascii=False).encode('utf-8')
+    yield from writer.add('manifest.json', len(manifest), [manifest], now)
+
+    for page, articles in enumerate(db.iter_articles_with_images(batch_size), start=1):
+        lines = []
+        image_files = []
+        for article in articles:
+            images = [{field: img.get(field) for field in IMAGE_FIELDS}
+                      for img in article.pop('images')]
+            article['images'] = images
+            lines.append(json.dumps(article, ensure_ascii=False))
+            image_files.extend(img['filename'] for img in images)
+
+        ndjson = ('\n'.join(lines) + '\n').encode('utf-8')
+        yield from writer.add(f'articles/{page:06d}.ndjson', len(ndjson), [ndjson], now)
+
+        for filename in dict.fromkeys(image_files):
+            path = upload_folder / filename
+            if not path.is_file():
+                continue
+            stat = path.stat()
+            yield from writer.add(f'images/{filename}', stat.st_size,
+                                  _read_file_chunks(path), stat.st_mtime)
+
+    yield from writer.close()
+
+
+# ===== Import =====
+
+class ArchiveImporter:
+    """Importiert ein Archiv aus einem Stream in die Datenbank
+
+    Artikel werden über den normalisierten Titel (title_key) zugeordnet
+    (wie beim JSON-Import):
+    Neue Artikel werden eingefügt, bestehende nur aktualisiert wenn der
+    Import neuer ist. Bilder, deren Dateiname bereits in der DB steht,
+    werden übersprungen, wenn der SHA-256 übereinstimmt; weicht er ab (z.B.
+    neu verarbeitet), wird die Datei ersetzt und die Metadaten aktualisiert.
+
+    Jede NDJSON-Seite und jede Gruppe von Bildern wird in einer eigenen
+    Transaktion geschrieben (statt einem Commit pro Artikel).
+    """
+
+    def __init__(self, db, upload_folder, allowed_extensions=IMAGE_EXTENSIONS,
+                 batch_size: int = ARTICLES_PER_MEMBER):
+        self.db = db
+        self.upload_folder = Path(upload_folder)
+        self.allowed_extensions = allowed_extensions
+        self.batch_size = batch_size
+
+        self.stats = {
+            'imported': 0,
+            'updated': 0,
+            'skipped': 0,
+            'images': 0,
+            'images_skipped': 0,
+            'images_replaced': 0,
+            'errors': [],
+        }
+        self._conn = None
+        self._titles = {}           # title_key -> (id, updated_at)
+        self._known_files = {}      # Dateiname -> sha256 des bestehenden Eintrags in images
+        self._pending_images = {}   # Dateiname -> (Ziel-Artikel-ID, Metadaten) der aktuellen Seite
+        self._image_rows = []       # Noch nicht geschriebene images-Zeilen
+        self._image_updates = []    # Noch nicht geschriebene Metadaten ersetzter Bilder
+
+    # ----- Ablauf -----
+
+    def import_stream(self, stream, fmt: str = 'tar') -> Dict[str, Any]:
+        """Liest ein Archiv aus einem (nicht seekbaren) Stream und importiert es
+
+        Args:
+            stream: Datei-ähnliches Objekt mit read()
+            fmt: 'tar' (auch gzip-komprimiert) oder 'zip'
+
+        Returns:
+            Statistik: imported, updated, skipped, images, images_skipped,
+            images_replaced, errors
+
+        Raises:
+            ValueError: Unbekanntes Format oder ungültiges Archiv
+        """
+        if fmt not in ARCHIVE_FORMATS:
+            raise ValueError(f"Unbekanntes Archivformat: {fmt}")
+
+        self.upload_folder.mkdir(parents=True, exist_ok=True)
+        self._conn = self.db.get_connection()
+        try:
+            self._load_existing()
+            if fmt == 'tar':
+                self._import_tar(stream)
+            else:
+                self._import_zip(stream)
+            self._flush_images()
+        finally:
+            self._conn.close()
+            self._conn = None
+
+        return self.stats
+
+    def _import_tar(self, stream):
+        try:
+            with tarfile.open(fileobj=stream, mode='r|*') as archive:
+                for member in archive:
+                    if member.isfile():
+                        self._handle_member(member.name, archive.extractfile(member))
+        except tarfile.TarError as e:
+            raise ValueError(f"Ungültiges tar-Archiv: {e}") from e
+
+    def _import_zip(self, stream):
+        with tempfile.SpooledTemporaryFile(max_size=ZIP_SPOOL_SIZE) as spool:
+            for chunk in iter(lambda: stream.read(CHUNK_SIZE), b''):
+                spool.write(chunk)
+            spool.seek(0)
+            try:
+                with zipfile.ZipFile(spool) as archive:
+                    for info in archive.infolist():
+                        if not info.is_dir():
+                            with archive.open(info) as member:
+                                self._handle_member(info.filename, member)
+            except zipfile.BadZipFile as e:
+                raise ValueError(f"Ungültiges zip-Archiv: {e}") from e
+
+    def _handle_member(self, name: str, fileobj):
+        if name == 'manifest.json':
+            manifest = json.load(fileobj)
+            if manifest.get('version', 0) > ARCHIVE_VERSION:
+                raise ValueError(f"Archiv-Version {manifest.get('version')} wird nicht unterstützt")
+        elif name.startswith('articles/') and name.endswith('.ndjson'):
+            # Bilder der vorherigen Seite sind durch, neue Seite beginnt
+            self._flush_images()
+            self._pending_images.clear()
+            self._import_articles(
+                json.loads(line.decode('utf-8'))
+                for line in fileobj
+                if line.strip()
+            )
+        elif name.startswith('images/'):
+            self._import_image(name[len('images/'):], fileobj)
+
+    # ----- Artikel -----
+
+    def _load_existing(self):
+        for key, article in self.db.get_title_key_map().items():
+            self._titles[key] = (article['id'], article['updated_at'] or article['created_at'])
+        cursor = self._conn.cursor()
+        cursor.execute("SELECT filename, sha256 FROM images")
+        self._known_files = {row['filename']: row['sha256'] for row in cursor.fetchall()}
+
+    def _import_articles(self, articles: Iterable[Dict[str, Any]]):
+        cursor = self._conn.cursor()
+        with self._conn:
+            for article_data in articles:
+                try:
+                    article_id = self._import_article(cursor, article_data)
+                except Exception as e:
+                    self.stats['errors'].append(
+                        f"Fehler bei '{article_data.get('title', 'unbekannt')}': {str(e)}")
+                    self.stats['skipped'] += 1
+                    continue
+
+                if article_id is None:
+                    continue
+                for image in article_data.get('images') or []:
+                    if image.get('filename'):
+                        self._pending_images[image['filename']] = (article_id, image)
+
+    def _import_article(self, cursor, article_data: Dict[str, Any]) -> Optional[int]:
+        """Fügt einen Artikel ein bzw. aktualisiert ihn; gibt die Ziel-ID zurück"""
+        title = article_data.get('title')
+        if not title:
+            self.stats['errors'].append('Artikel ohne Titel übersprungen')
+            self.stats['skipped'] += 1
+            return None
+
+        content = article_data.get('content', '')
+        tags = add_auto_tags_if_empty(article_data.get('tags', []), title, content)
+        import_updated = article_data.get('updated_at') or article_data.get('created_at')
+
+        key = title_key(title)
+        existing = self._titles.get(key)
+        if existing:
+            existing_id, existing_updated = existing
+            if (import_updated and existing_updated and
+                    datetime.fromisoformat(import_updated) > datetime.fromisoformat(existing_updated)):
+                # Zeitstempel der Quelle übernehmen, damit ein erneuter Import nichts ändert
+                cursor.execute("""
+                    UPDATE articles
+                    SET content = ?, content_hash = ?, author = ?, published = ?, tags = ?, updated_at = ?
+                    WHERE id = ?
+                """, (content, content_hash(content), article_data.get('author'),
+                      article_data.get('published', False), json.dumps(tags),
+                      import_updated, existing_id))
+                self._titles[key] = (existing_id, import_updated)
+                self.stats['updated'] += 1
+            else:
+                self.stats['skipped'] += 1
+            return existing_id
+
+        created_at = article_data.get('created_at')
+        cursor.execute("""
+            INSERT INTO articles (title, title_key, content, content_hash, author, published, tags,
+                                  created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP), COALESCE(?, ?, CURRENT_TIMESTAMP))
+        """, (title, key, content, content_hash(content), article_data.get('author'),
+              article_data.get('published', False), json.dumps(tags) if tags else None,
+              created_at, article_data.get('updated_at'), created_at))
+        article_id = cursor.lastrowid
+        self._titles[key] = (article_id, import_updated)
+        self.stats['imported'] += 1
+        return article_id
+
+    # ----- Bilder -----
+
+    def _import_image(self, name: str, fileobj):
+        pending = self._pending_images.pop(name, None)
+        filename = secure_filename(name)
+
+        if (pending is None or filename != name
+                or filename.rsplit('.', 1)[-1].lower() not in self.allowed_extensions):
+            self.stats['images_skipped'] += 1
+            return
+
+        article_id, image = pending
+        target = self.upload_folder / filename
+        known = filename in self._known_files
+        stored_sha256 = self._known_files.get(filename)
+        if known and stored_sha256 is None and target.exists():
+            # Alter Eintrag ohne Metadaten: mit der Datei auf der Platte vergleichen
+            stored_sha256 = _file_sha256(target)
+        if known and image.get('sha256') and image['sha256'] == stored_sha256:
+            self.stats['images_skipped'] += 1
+            return
+        tmp_path = self.upload_folder / f".import-{os.getpid()}-{filename}"
+
+        try:
+            sha256 = hashlib.sha256()
+            file_size = 0
+            with open(tmp_path, 'wb') as f:
+                for chunk in iter(lambda: fileobj.read(CHUNK_SIZE), b''):
+                    f.write(chunk)
+                    sha256.update(chunk)
+                    file_size += len(chunk)
+
+            if image.get('sha256') and image['sha256'] != sha256.hexdigest():
+                raise ValueError("SHA-256 stimmt nicht mit dem Archiv überein")
+            if known and sha256.hexdigest() == stored_sha256:
+                # Archiv ohne Hash, Inhalt aber unverändert
+                self.stats['images_skipped'] += 1
+                return
+
+            metadata = {
+                'width': image.get('width'),
+                'height': image.get('height'),
+                'mime_type': image.get('mime_type'),
+            }
+            if not metadata['width'] or not metadata['mime_type']:
+                header = ImageProcessor.read_metadata(str(tmp_path))
+                metadata = {key: header[key] for key in metadata}
+
+            os.replace(tmp_path, target)
+        except Exception as e:
+            self.stats['errors'].append(f"Fehler bei Bild '{filename}': {str(e)}")
+            self.stats['images_skipped'] += 1
+            return
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+        self._known_files[filename] = sha256.hexdigest()
+        if known:
+            self._image_updates.append((
+                metadata['width'], metadata['height'], file_size,
+                metadata['mime_type'], sha256.hexdigest(), filename
+            ))
+        else:
+            self._image_rows.append((
+                article_id, filename, f"media/images/{filename}",
+                image.get('alt_text'), image.get('caption'),
+                metadata['width'], metadata['height'], file_size,
+                metadata['mime_type'], sha256.hexdigest()
+            ))
+        if len(self._image_rows) + len(self._image_updates) >= self.batch_size:
+            self._flush_images()
+
+    def _flush_images(self):
+        if not self._image_rows and not self._image_updates:
+            return
+        with self._conn:
+            self._conn.executemany("""
+                INSERT INTO images (article_id, filename, filepath, alt_text, caption,
+                                    width, height, file_size, mime_type, sha256)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, self._image_rows)
+            self._conn.executemany("""
+                UPDATE images SET width = ?, height = ?, file_size = ?, mime_type = ?, sha256 = ?
+                WHERE filename = ?
+            """, self._image_updates)
+        self.stats['images'] += len(self._image_rows)
+        self.stats['images_replaced'] += len(self._image_updates)
+        self._image_rows = []
+        self._image_updates = []
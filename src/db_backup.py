@@ -0,0 +1,235 @@
+"""
+Online-Backups der Datenbank und inkrementelle Backups der Bilder
+
+Ein Backup ist ein Verzeichnis unter dem Backup-Ordner:
+    backup_20260101_030000/
+        articles.db     Konsistenter Snapshot (SQLite-Backup-API, seitenweise)
+        images/         Alle Bilder; unveränderte als Hardlink auf das vorige Backup
+        images.json     Manifest: relativer Pfad -> [Bytes, mtime_ns]
+        export.json     JSON-Export aus dem Snapshot (als Stream geschrieben)
+        backup.json     Zusammenfassung, wird zuletzt geschrieben
+
+Die App kann währenddessen weiter schreiben: der Snapshot kopiert jeweils
+nur einige Seiten pro Schritt und gibt die Sperre dazwischen frei (im
+WAL-Modus blockieren Leser Schreiber ohnehin nicht). Ein Bild wird nur
+kopiert, wenn Größe oder Änderungszeit vom Manifest des vorigen Backups
+abweichen; sonst teilt es sich per Hardlink die Datei mit dem vorigen Backup.
+Jedes Backup ist so vollständig, belegt aber nur für neue und geänderte
+Bilder zusätzlichen Platz. Backups entstehen in einem .partial-Verzeichnis
+und werden erst nach backup.json umbenannt; abgebrochene Backups dienen
+daher nie als Basis.
+"""
+import json
+import os
+import shutil
+import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import quote
+
+from db_manager import DatabaseManager
+
+BACKUP_PREFIX = 'backup_'
+PARTIAL_SUFFIX = '.partial'
+SUMMARY_FILE = 'backup.json'
+MANIFEST_FILE = 'images.json'
+DEFAULT_PAGES = 1024  # Seiten pro Schritt (bei 4 KiB-Seiten 4 MiB)
+
+
+def snapshot_database(source_path, target_path, pages: int = DEFAULT_PAGES, sleep: float = 0.0,
+                      progress: Callable[[int, int], None] = None) -> Dict[str, Any]:
+    """Kopiert die Datenbank im laufenden Betrieb in eine einzelne Datei
+
+    Args:
+        source_path: Live-Datenbank
+        target_path: Ziel-Datei (darf noch nicht existieren)
+        pages: Seiten pro Schritt, <= 0 kopiert alles in einem Schritt
+        sleep: Pause zwischen den Schritten in Sekunden (Luft für Schreiber)
+        progress: Callback (kopierte Seiten, Seiten gesamt) nach jedem Schritt
+
+    Returns:
+        Dict mit pages, bytes und seconds
+
+    Raises:
+        RuntimeError: wenn der Snapshot die Integritätsprüfung nicht besteht
+    """
+    start = time.perf_counter()
+    total_pages = 0
+
+    def on_step(status, remaining, total):
+        nonlocal total_pages
+        total_pages = total
+        if progress:
+            progress(total - remaining, total)
+
+    source = sqlite3.connect(f"file:{quote(str(source_path))}?mode=ro", uri=True)
+    target = sqlite3.connect(target_path)
+    try:
+        source.backup(target, pages=pages if pages > 0 else -1, progress=on_step, sleep=sleep)
+        # Der Snapshot übernimmt den WAL-Modus; zurück auf eine einzelne Datei
+        target.execute("PRAGMA journal_mode = DELETE")
+        check = target.execute("PRAGMA quick_check").fetchone()[0]
+    finally:
+        target.close()
+        source.close()
+
+    if check != 'ok':
+        raise RuntimeError(f"Snapshot {target_path} ist beschädigt: {check}")
+
+    return {
+        'pages': total_pages,
+        'bytes': Path(target_path).stat().st_size,
+        'seconds': round(time.perf_counter() - start, 3),
+    }
+
+
+def list_backups(root) -> List[Path]:
+    """Abgeschlossene Backups im Backup-Ordner, das älteste zuerst"""
+    root = Path(root)
+    if not root.is_dir():
+        return []
+    return sorted(path for path in root.iterdir()
+                  if path.is_dir() and path.name.startswith(BACKUP_PREFIX) and (path / SUMMARY_FILE).exists())
+
+
+def _load_manifest(backup_dir: Optional[Path]) -> Dict[str, List[int]]:
+    if backup_dir is None or not (backup_dir / MANIFEST_FILE).exists():
+        return {}
+    return json.loads((backup_dir / MANIFEST_FILE).read_text(encoding='utf-8'))
+
+
+def backup_images(images_dir, target_dir, previous_dir=None) -> Dict[str, Any]:
+    """Sichert alle Dateien aus images_dir nach target_dir/images
+
+    Unveränderte Dateien (gleiche Größe und mtime wie im Manifest von
+    previous_dir) werden verlinkt statt kopiert. Klappt der Hardlink nicht
+    (anderes Dateisystem), wird kopiert.
+
+    Returns:
+        Dict mit files, linked, copied, bytes_copied und seconds
+    """
+    start = time.perf_counter()
+    images_dir = Path(images_dir)
+    target_dir = Path(target_dir)
+    previous_dir = Path(previous_dir) if previous_dir else None
+    previous = _load_manifest(previous_dir)
+
+    manifest = {}
+    linked = copied = bytes_copied = 0
+    files = sorted(path for path in images_dir.rglob('*') if path.is_file()) if images_dir.is_dir() else []
+    for path in files:
+        relative = path.relative_to(images_dir).as_posix()
+        stat = path.stat()
+        entry = [stat.st_size, stat.st_mtime_ns]
+        manifest[relative] = entry
+
+        destination = target_dir / 'images' / relative
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        if previous.get(relative) == entry:
+            try:
+                os.link(previous_dir / 'images' / relative, destination)
+                linked += 1
+                continue
+            except OSError:
+                pass
+        shutil.copy2(path, destination)
+        copied += 1
+        bytes_copied += stat.st_size
+
+    (target_dir / MANIFEST_FILE).write_text(json.dumps(manifest, ensure_ascii=False), encoding='utf-8')
+    return {
+        'files': len(files),
+        'linked': linked,
+        'copied': copied,
+        'bytes_copied': bytes_copied,
+        'seconds': round(time.perf_counter() - start, 3),
+    }
+
+
+def write_export(db_path, target_path, backup_date: str) -> Dict[str, Any]:
+    """Schreibt alle Artikel inkl. Bilder als JSON, seitenweise und ohne Query pro Artikel
+
+    Format wie GET /admin/api/export/articles (ohne Bild-URLs), ein Artikel pro Zeile.
+
+    Returns:
+        Dict mit count und seconds
+    """
+    start = time.perf_counter()
+    db = DatabaseManager(str(db_path), read_only=True)
+    count = 0
+    with open(target_path, 'w', encoding='utf-8') as f:
+        f.write('{"success": true, "backup_type": "complete", '
+                f'"backup_date": {json.dumps(backup_date)}, "articles": [')
+        for page in db.iter_articles_with_images():
+            for article in page:
+                f.write(',\n' if count else '\n')
+                json.dump(article, f, ensure_ascii=False)
+                count += 1
+        f.write(f'\n], "count": {count}}}\n')
+    return {'count': count, 'seconds': round(time.perf_counter() - start, 3)}
+
+
+def prune_backups(root, keep: int) -> List[Path]:
+    """Löscht alle bis auf die keep neuesten Backups (Hardlinks bleiben in den übrigen gültig)"""
+    backups = list_backups(root)
+    removed = backups[:-keep] if keep > 0 else []
+    for path in removed:
+        shutil.rmtree(path)
+    return removed
+
+
+def create_backup(root, db_path, images_dir, pages: int = DEFAULT_PAGES, sleep: float = 0.0,
+                  export: bool = True, keep: int = 0,
+                  progress: Callable[[int, int], None] = None) -> Dict[str, Any]:
+    """Erstellt ein vollständiges Backup unter root (siehe Modul-Docstring)
+
+    Args:
+        root: Backup-Ordner
+        db_path: Live-Datenbank
+        images_dir: Bild-Ordner (media/images)
+        pages, sleep, progress: siehe snapshot_database
+        export: export.json erzeugen
+        keep: Danach nur die keep neuesten Backups behalten (0 = alle)
+
+    Returns:
+        Zusammenfassung (auch als backup.json im Backup gespeichert) mit path
+    """
+    start = time.perf_counter()
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    backups = list_backups(root)
+    previous = backups[-1] if backups else None
+
+    now = datetime.now()
+    name = f"{BACKUP_PREFIX}{now.strftime('%Y%m%d_%H%M%S')}"
+    suffix = 1
+    while (root / name).exists() or (root / (name + PARTIAL_SUFFIX)).exists():
+        suffix += 1
+        name = f"{BACKUP_PREFIX}{now.strftime('%Y%m%d_%H%M%S')}_{suffix}"
+    partial = root / (name + PARTIAL_SUFFIX)
+    partial.mkdir()
+
+    try:
+        summary = {
+            'created': now.isoformat(timespec='seconds'),
+            'previous': previous.name if previous else None,
+            'database': snapshot_database(db_path, partial / 'articles.db', pages=pages, sleep=sleep,
+                                          progress=progress),
+            'images': backup_images(images_dir, partial, previous),
+        }
+        if export:
+            summary['export'] = write_export(partial / 'articles.db', partial / 'export.json',
+                                             summary['created'])
+        summary['seconds'] = round(time.perf_counter() - start, 3)
+        (partial / SUMMARY_FILE).write_text(json.dumps(summary, indent=2, ensure_ascii=False) + '\n',
+                                            encoding='utf-8')
+        partial.rename(root / name)
+    except BaseException:
+        shutil.rmtree(partial, ignore_errors=True)
+        raise
+
+    summary['path'] = str(root / name)
+    summary['removed'] = [path.name for path in prune_backups(root, keep)]
+    return summary
@@ -2,23 +2,350 @@
 Database Manager für CMS
 Verwaltet Artikel und Bilder
 """
+import re
+import hashlib
 import sqlite3
 import json
+import time
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Iterable, Callable, Tuple, NamedTuple
+from urllib.parse import quote
+
+_WHITESPACE = re.compile(r'\s+')
+
+# Lese-Verbindungen (DatabaseManager.reader): Schreibzugriffe zusätzlich per
+# query_only gesperrt, größerer Page-Cache (negativ = KiB, SQLite-Default 2 MiB)
+# und Memory-Mapping, damit Seiten aus dem Page-Cache des Betriebssystems kommen
+# (der bleibt erhalten, obwohl jede Verbindung nur einen Aufruf lang lebt)
+READER_PRAGMAS = """
+    PRAGMA query_only = ON;
+    PRAGMA cache_size = -16384;
+    PRAGMA mmap_size = 268435456;
+"""
+
+def strip_formatting(text: str) -> str:
+    """Entfernt WhatsApp- und Markdown-Formatierung
+    
+    Gleiche Regeln wie remove_formatting() in whatsapp_import_helper/import_history_articles.py.
+    """
+    if not text:
+        return ''
+    
+    # Markdown-Formatierung
+    text = re.sub(r'\*\*([^\*]+)\*\*', r'\1', text)  # Markdown fett
+    text = re.sub(r'~~([^~]+)~~', r'\1', text)  # Markdown durchgestrichen
+    
+    # WhatsApp-Formatierung
+    text = re.sub(r'\*([^\*]+)\*', r'\1', text)  # WhatsApp fett
+    text = re.sub(r'_([^_]+)_', r'\1', text)  # WhatsApp kursiv
+    text = re.sub(r'~([^~]+)~', r'\1', text)  # WhatsApp durchgestrichen
+    
+    return text.strip()
+
+def title_key(title: str) -> str:
+    """Normalisierter Titel-Schlüssel für Duplikat-Prüfungen (articles.title_key)
+    
+    Formatierung entfernt, Groß-/Kleinschreibung und Leerraum vereinheitlicht:
+    '*Kickl  gewinnt*' und 'kickl gewinnt' ergeben denselben Schlüssel.
+    """
+    return _WHITESPACE.sub(' ', strip_formatting(title)).strip().casefold()
+
+def content_hash(content: str) -> str:
+    """Fingerprint des normalisierten Inhalts für exakte Duplikate (articles.content_hash)
+    
+    SHA-256 über den Inhalt mit denselben Regeln wie title_key: Artikel, die sich
+    nur in Formatierung, Groß-/Kleinschreibung oder Leerraum unterscheiden,
+    bekommen denselben Hash.
+    """
+    normalized = _WHITESPACE.sub(' ', strip_formatting(content)).strip().casefold()
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+# ===== Tag-Statistik =====
+# tag_stats hält pro Tag die Anzahl Artikel (gesamt und veröffentlicht). SQL-Trigger
+# auf articles halten sie aktuell, egal über welchen Weg geschrieben wird
+# (DatabaseManager, Importe, SQL-Skripte). Tags stehen als JSON-Array in
+# articles.tags, ältere Artikel als Komma-Liste ('Politik, Satire'); beides wird
+# hier wie beim Lesen in Python in eine Liste umgewandelt. Groß-/Kleinschreibung
+# zählt wie bei get_articles_by_tag nicht: tag_key = str.lower() des Tags über die
+# SQL-Funktion unicode_lower (SQLites lower() faltet nur ASCII, 'Österreich' und
+# 'österreich' wären zwei Tags). Schreibende Verbindungen brauchen die Funktion
+# daher (register_sql_functions; DatabaseManager und init_database erledigen das).
+
+def _unicode_lower(value):
+    """lower() für SQL wie str.lower() in Python (auch Umlaute)"""
+    return value.lower() if isinstance(value, str) else value
+
+def register_sql_functions(conn: sqlite3.Connection) -> sqlite3.Connection:
+    """Registriert die von den Tag-Triggern benötigten SQL-Funktionen auf conn"""
+    conn.create_function('unicode_lower', 1, _unicode_lower, deterministic=True)
+    return conn
+
+def _tag_list_sql(column: str) -> str:
+    """SQL-Ausdruck: Tags der Spalte als JSON-Array (auch für alte Komma-Listen)"""
+    as_json = f"""'["' || replace({column}, ',', '","') || '"]'"""
+    return (f"CASE WHEN json_valid({column}) AND json_type({column}) = 'array' THEN {column} "
+            f"WHEN json_valid({as_json}) THEN {as_json} ELSE '[]' END")
+
+def _tag_stats_delta_sql(row: str, sign: int) -> str:
+    """Zählt die Tags von row ('NEW' oder 'OLD') in tag_stats hinzu (+1) bzw. ab (-1)"""
+    return f"""
+        INSERT INTO tag_stats (tag_key, tag, total, published)
+        SELECT unicode_lower(trim(value)), trim(value), {sign}, {sign} * (CASE WHEN {row}.published THEN 1 ELSE 0 END)
+        FROM json_each({_tag_list_sql(f'{row}.tags')})
+        WHERE trim(value) != ''
+        GROUP BY unicode_lower(trim(value))
+        ON CONFLICT(tag_key) DO UPDATE SET total = total + excluded.total,
+                                           published = published + excluded.published;"""
+
+TAG_STATS_SCHEMA = f"""
+    CREATE TABLE IF NOT EXISTS tag_stats (
+        tag_key TEXT PRIMARY KEY,
+        tag TEXT NOT NULL,
+        total INTEGER NOT NULL DEFAULT 0,
+        published INTEGER NOT NULL DEFAULT 0
+    );
+
+    CREATE TRIGGER IF NOT EXISTS tag_stats_insert AFTER INSERT ON articles
+    BEGIN
+        {_tag_stats_delta_sql('NEW', 1)}
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS tag_stats_update AFTER UPDATE OF tags, published ON articles
+    WHEN OLD.tags IS NOT NEW.tags OR OLD.published IS NOT NEW.published
+    BEGIN
+        {_tag_stats_delta_sql('OLD', -1)}
+        {_tag_stats_delta_sql('NEW', 1)}
+        DELETE FROM tag_stats WHERE total <= 0;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS tag_stats_delete AFTER DELETE ON articles
+    BEGIN
+        {_tag_stats_delta_sql('OLD', -1)}
+        DELETE FROM tag_stats WHERE total <= 0;
+    END;
+"""
+
+# Baut tag_stats komplett neu auf (Migration bestehender Datenbanken)
+REBUILD_TAG_STATS = f"""
+    DELETE FROM tag_stats;
+    INSERT INTO tag_stats (tag_key, tag, total, published)
+    SELECT tag_key, MIN(tag), COUNT(*), SUM(published)
+    FROM (
+        SELECT unicode_lower(trim(j.value)) AS tag_key, trim(j.value) AS tag,
+               CASE WHEN a.published THEN 1 ELSE 0 END AS published
+        FROM articles a, json_each({_tag_list_sql('a.tags')}) j
+        WHERE trim(j.value) != ''
+        GROUP BY a.id, unicode_lower(trim(j.value))
+    )
+    GROUP BY tag_key;
+"""
+
+# ===== Feed-Stand =====
+# feed_state zählt Änderungen an veröffentlichten Artikeln (Veröffentlichen,
+# Bearbeiten, Zurückziehen, Löschen). Die Feeds (/reader/feed.xml) prüfen pro
+# Request nur diese eine Zeile: gleiche Version = gleicher Feed. Wie bei
+# tag_stats per Trigger, damit auch Importe und SQL-Skripte den Feed erneuern.
+# Änderungen an Entwürfen lassen die Version unverändert.
+
+_FEED_STATE_BUMP = "UPDATE feed_state SET version = version + 1, changed_at = CURRENT_TIMESTAMP WHERE id = 1;"
+
+FEED_STATE_SCHEMA = f"""
+    CREATE TABLE IF NOT EXISTS feed_state (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        version INTEGER NOT NULL DEFAULT 0,
+        changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    INSERT OR IGNORE INTO feed_state (id) VALUES (1);
+
+    CREATE TRIGGER IF NOT EXISTS feed_state_insert AFTER INSERT ON articles
+    WHEN NEW.published
+    BEGIN
+        {_FEED_STATE_BUMP}
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS feed_state_update AFTER UPDATE ON articles
+    WHEN OLD.published OR NEW.published
+    BEGIN
+        {_FEED_STATE_BUMP}
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS feed_state_delete AFTER DELETE ON articles
+    WHEN OLD.published
+    BEGIN
+        {_FEED_STATE_BUMP}
+    END;
+"""
+
+# ===== Query-Beobachter (Metriken, Slow-Query-Log) =====
+
+class QueryEvent(NamedTuple):
+    """Ein ausgeführtes Statement, wie es die Query-Beobachter erhalten"""
+    sql: str
+    parameters: Any         # None bei executemany/executescript
+    seconds: float          # execute() bis alle Zeilen gelesen sind
+    rows: Optional[int]     # gelesene bzw. geänderte Zeilen, None wenn unbekannt
+    database: str           # Pfad der Datenbank
+
+_query_observers: List[Callable[[QueryEvent], None]] = []
+
+def add_query_observer(callback: Callable[[QueryEvent], None]):
+    """Registriert einen Callback, der für jedes Statement ein QueryEvent erhält
+
+    Gemessen wird die Zeit von execute() bis alle Zeilen gelesen sind (oder
+    der Cursor geschlossen/verworfen wird), einmal pro Statement.
+    """
+    if callback not in _query_observers:
+        _query_observers.append(callback)
+
+def remove_query_observer(callback: Callable[[QueryEvent], None]):
+    """Entfernt einen mit add_query_observer registrierten Callback"""
+    if callback in _query_observers:
+        _query_observers.remove(callback)
+
+
+class _ObservedCursor(sqlite3.Cursor):
+    """Cursor, der Laufzeit und Zeilenzahl jedes Statements an die Query-Beobachter meldet"""
+
+    _statement = None  # [sql, parameter, Sekunden, Zeilen] bis alle Zeilen gelesen sind
+
+    def _run(self, method, sql, parameters, reported_parameters):
+        self._report()
+        start = time.perf_counter()
+        try:
+            return method(sql, parameters) if parameters is not None else method(sql)
+        finally:
+            self._statement = [sql, reported_parameters, time.perf_counter() - start, 0]
+            if self.description is None:  # Kein SELECT: Statement ist fertig
+                self._statement[3] = self.rowcount if self.rowcount >= 0 else None
+                self._report()
+
+    def _fetch(self, method, *args):
+        start = time.perf_counter()
+        rows = method(*args)
+        if self._statement is not None:
+            self._statement[2] += time.perf_counter() - start
+        return rows
+
+    def _count(self, rows: int):
+        if self._statement is not None:
+            self._statement[3] += rows
+
+    def _report(self):
+        if self._statement is None:
+            return
+        sql, parameters, seconds, rows = self._statement
+        self._statement = None
+        event = QueryEvent(sql, parameters, seconds, rows, self.connection.database)
+        for callback in list(_query_observers):
+            callback(event)
+
+    def execute(self, sql, parameters=()):
+        return self._run(super().execute, sql, parameters, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self._run(super().executemany, sql, seq_of_parameters, None)
+
+    def executescript(self, sql_script):
+        return self._run(super().executescript, sql_script, None, None)
+
+    def fetchone(self):
+        row = self._fetch(super().fetchone)
+        if row is None:
+            self._report()
+        else:
+            self._count(1)
+        return row
+
+    def fetchmany(self, size=None):
+        size = self.arraysize if size is None else size
+        rows = self._fetch(super().fetchmany, size)
+        self._count(len(rows))
+        if len(rows) < size:
+            self._report()
+        return rows
+
+    def fetchall(self):
+        rows = self._fetch(super().fetchall)
+        self._count(len(rows))
+        self._report()
+        return rows
+
+    def __next__(self):
+        try:
+            row = self._fetch(super().__next__)
+        except StopIteration:
+            self._report()
+            raise
+        self._count(1)
+        return row
+
+    def close(self):
+        self._report()
+        super().close()
+
+    def __del__(self):
+        self._report()
+
+
+class _ObservedConnection(sqlite3.Connection):
+    """Verbindung, deren Cursor (auch bei conn.execute) _ObservedCursor sind"""
+
+    def __init__(self, database, *args, **kwargs):
+        super().__init__(database, *args, **kwargs)
+        self.database = str(database)
+
+    def cursor(self, factory=_ObservedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def executescript(self, sql_script):
+        return self.cursor().executescript(sql_script)
+
 
 class DatabaseManager:
     """Verwaltet alle Datenbank-Operationen"""
     
-    def __init__(self, db_path: str = None):
+    def __init__(self, db_path: str = None, read_only: bool = False):
+        """
+        Args:
+            db_path: Pfad zur SQLite-Datei
+            read_only: Verbindungen nur lesend öffnen (mode=ro), Schreibversuche
+                       schlagen mit sqlite3.OperationalError fehl
+        """
         if db_path is None:
             db_path = Path(__file__).parent.parent / "database" / "articles.db"
         self.db_path = db_path
+        self.read_only = read_only
+        self._reader = None
+    
+    @property
+    def reader(self) -> 'DatabaseManager':
+        """Nur lesender DatabaseManager für dieselbe Datenbank (z.B. für die Reader-Routen)"""
+        if self.read_only:
+            return self
+        if self._reader is None:
+            self._reader = DatabaseManager(self.db_path, read_only=True)
+        return self._reader
     
     def get_connection(self):
-        """Erstellt eine neue DB-Verbindung"""
-        conn = sqlite3.connect(self.db_path)
+        """Erstellt eine neue DB-Verbindung (mit Zeitmessung, falls Query-Beobachter registriert sind)"""
+        factory = _ObservedConnection if _query_observers else sqlite3.Connection
+        if self.read_only:
+            conn = sqlite3.connect(f"file:{quote(str(self.db_path))}?mode=ro", uri=True, factory=factory)
+            # Über die Basisklasse, damit die PRAGMAs nicht als Queries gezählt werden
+            sqlite3.Connection.executescript(conn, READER_PRAGMAS)
+            if factory is _ObservedConnection:
+                conn.database = str(self.db_path)  # Pfad statt URI (für EXPLAIN QUERY PLAN)
+        else:
+            conn = sqlite3.connect(self.db_path, factory=factory)
+        register_sql_functions(conn)
         conn.row_factory = sqlite3.Row  # Ermöglicht dict-ähnlichen Zugriff
         return conn
     
@@ -45,15 +372,16 @@ class DatabaseManager:
         if created_at:
             # Mit custom created_at Timestamp
             cursor.execute("""
-                INSERT INTO articles (title, content, author, published, tags, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (title, content, author, published, tags_json, created_at, created_at))
+                INSERT INTO articles (title, title_key, content, content_hash, author, published, tags, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (title, title_key(title), content, content_hash(content), author, published, tags_json,
+                  created_at, created_at))
         else:
             # Standardverhalten: DB setzt automatisch Timestamps
             cursor.execute("""
-                INSERT INTO articles (title, content, author, published, tags)
-                VALUES (?, ?, ?, ?, ?)
-            """, (title, content, author, published, tags_json))
+                INSERT INTO articles (title, title_key, content, content_hash, author, published, tags)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (title, title_key(title), content, content_hash(content), author, published, tags_json))
         
         article_id = cursor.lastrowid
         conn.commit()
@@ -61,6 +389,93 @@ class DatabaseManager:
         
         return article_id
     
+    def bulk_add_articles(self, articles: Iterable[Dict[str, Any]], batch_size: int = 1000,
+                          progress: Callable[[int], None] = None,
+                          on_error: Callable[[Dict[str, Any], Exception], None] = None) -> int:
+        """Fügt viele Artikel in wenigen Transaktionen ein
+
+        Pro Batch ein executemany und ein Commit (statt Verbindung + Commit pro
+        Artikel wie bei add_article). Die Eingabe wird nur batchweise gelesen,
+        Generatoren werden also nicht komplett in den Speicher geladen.
+
+        Ohne on_error bricht der erste fehlerhafte Artikel ab: nur sein Batch
+        wird zurückgerollt, alle vorherigen Batches sind bereits committet.
+        Mit on_error werden fehlerhafte Artikel übersprungen und gemeldet;
+        schlägt das executemany eines Batches fehl, wird dieser Batch Zeile
+        für Zeile wiederholt, damit der Rest des Batches trotzdem eingefügt wird.
+
+        Args:
+            articles: Iterable von Dicts mit title, content und optional
+                      author, published, tags, created_at (wie add_article)
+            batch_size: Artikel pro Transaktion
+            progress: Callback nach jedem Commit mit der Anzahl bisher eingefügter Artikel
+            on_error: Callback (Artikel, Exception) für übersprungene Artikel
+
+        Returns:
+            Anzahl eingefügter Artikel
+        """
+        iterator = iter(articles)
+        inserted = 0
+
+        def to_row(article):
+            return (
+                article['title'],
+                title_key(article['title']),
+                article['content'],
+                content_hash(article['content']),
+                article.get('author'),
+                article.get('published', False),
+                json.dumps(article['tags']) if article.get('tags') else None,
+                article.get('created_at'),
+                article.get('created_at'),
+            )
+
+        insert = """
+            INSERT INTO articles (title, title_key, content, content_hash, author, published, tags,
+                                  created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP), COALESCE(?, CURRENT_TIMESTAMP))
+        """
+
+        conn = self.get_connection()
+        try:
+            while True:
+                batch = list(islice(iterator, batch_size))
+                if not batch:
+                    break
+
+                if on_error is None:
+                    articles_and_rows = [(article, to_row(article)) for article in batch]
+                else:
+                    articles_and_rows = []
+                    for article in batch:
+                        try:
+                            articles_and_rows.append((article, to_row(article)))
+                        except Exception as e:
+                            on_error(article, e)
+
+                try:
+                    with conn:
+                        conn.executemany(insert, [row for _, row in articles_and_rows])
+                    inserted += len(articles_and_rows)
+                except sqlite3.Error:
+                    if on_error is None:
+                        raise
+                    # Einzeln wiederholen: nur die fehlerhaften Zeilen fallen heraus
+                    with conn:
+                        for article, row in articles_and_rows:
+                            try:
+                                conn.execute(insert, row)
+                                inserted += 1
+                            except sqlite3.Error as e:
+                                on_error(article, e)
+
+                if progress:
+                    progress(inserted)
+        finally:
+            conn.close()
+
+        return inserted
+
     def get_article(self, article_id: int) -> Optional[Dict[str, Any]]:
         """Holt einen einzelnen Artikel"""
         conn = self.get_connection()
@@ -144,6 +559,195 @@ class DatabaseManager:
         
         return articles
     
+    def get_tag_stats(self, published_only: bool = False) -> List[Dict[str, Any]]:
+        """Alle Tags mit Anzahl Artikel (aus tag_stats, ohne Artikel zu lesen)
+
+        Args:
+            published_only: Nur Tags veröffentlichter Artikel, sortiert nach deren Anzahl
+
+        Returns:
+            Liste von Dicts mit tag, total und published, häufigste zuerst
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        if published_only:
+            cursor.execute("""
+                SELECT tag, total, published FROM tag_stats
+                WHERE published > 0 ORDER BY published DESC, tag_key
+            """)
+        else:
+            cursor.execute("SELECT tag, total, published FROM tag_stats ORDER BY total DESC, tag_key")
+
+        rows = cursor.fetchall()
+        conn.close()
+
+        return [dict(row) for row in rows]
+
+    def get_feed_state(self) -> Tuple[int, Optional[str]]:
+        """Aktueller Feed-Stand (version, changed_at) aus feed_state
+
+        Die Version steigt bei jeder Änderung an veröffentlichten Artikeln.
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT version, changed_at FROM feed_state WHERE id = 1")
+        row = cursor.fetchone()
+        conn.close()
+        return (row['version'], row['changed_at']) if row else (0, None)
+
+    def get_feed_articles(self, limit: int, tag: str = None) -> List[Dict[str, Any]]:
+        """Die neuesten veröffentlichten Artikel (nach created_at) für Feeds
+
+        Args:
+            limit: Höchstens so viele Artikel
+            tag: Nur Artikel mit diesem Tag (ohne Groß-/Kleinschreibung)
+
+        Returns:
+            Liste von Artikel-Dicts, neueste zuerst
+        """
+        conditions = ["published = 1"]
+        params = []
+        if tag:
+            conditions.append(
+                f"EXISTS (SELECT 1 FROM json_each({_tag_list_sql('tags')}) "
+                f"WHERE unicode_lower(trim(value)) = unicode_lower(trim(?)))"
+            )
+            params.append(tag)
+        params.append(limit)
+
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute(
+            f"SELECT * FROM articles WHERE {' AND '.join(conditions)} ORDER BY created_at DESC, id DESC LIMIT ?",
+            params
+        )
+        rows = cursor.fetchall()
+        conn.close()
+
+        articles = []
+        for row in rows:
+            article = dict(row)
+            if article.get('tags'):
+                try:
+                    article['tags'] = json.loads(article['tags'])
+                except (json.JSONDecodeError, TypeError):
+                    article['tags'] = [tag.strip() for tag in article['tags'].split(',') if tag.strip()]
+            else:
+                article['tags'] = []
+            articles.append(article)
+        return articles
+
+    def iter_articles_with_images(self, batch_size: int = 500) -> Iterator[List[Dict[str, Any]]]:
+        """Liefert alle Artikel inkl. Bilder seitenweise (nach ID sortiert)
+
+        Pro Seite zwei Queries (Artikel + Bilder per IN), statt einer
+        Bild-Query pro Artikel. Speicherbedarf bleibt auf eine Seite begrenzt.
+
+        Args:
+            batch_size: Artikel pro Seite
+
+        Yields:
+            Liste von Artikel-Dicts mit zusätzlichem Key 'images'
+        """
+        last_id = 0
+        while True:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+
+            cursor.execute(
+                "SELECT * FROM articles WHERE id > ? ORDER BY id LIMIT ?",
+                (last_id, batch_size)
+            )
+            articles = [dict(row) for row in cursor.fetchall()]
+            if not articles:
+                conn.close()
+                return
+
+            ids = [article['id'] for article in articles]
+            placeholders = ', '.join('?' * len(ids))
+            cursor.execute(
+                f"SELECT * FROM images WHERE article_id IN ({placeholders}) ORDER BY id",
+                ids
+            )
+            images_by_article = {}
+            for row in cursor.fetchall():
+                images_by_article.setdefault(row['article_id'], []).append(dict(row))
+            conn.close()
+
+            for article in articles:
+                if article.get('tags'):
+                    try:
+                        article['tags'] = json.loads(article['tags'])
+                    except (json.JSONDecodeError, TypeError):
+                        article['tags'] = [tag.strip() for tag in article['tags'].split(',') if tag.strip()]
+                else:
+                    article['tags'] = []
+                article['images'] = images_by_article.get(article['id'], [])
+
+            yield articles
+            last_id = ids[-1]
+
+    def get_article_versions(self, article_ids: List[int] = None, created_from: str = None,
+                             created_to: str = None, published_only: bool = False) -> List[Tuple[int, str]]:
+        """Liefert (id, updated_at) ausgewählter Artikel, ohne Inhalte zu laden
+
+        Args:
+            article_ids: Nur diese Artikel, in dieser Reihenfolge (unbekannte IDs fehlen)
+            created_from: Erstellt ab diesem Tag ('YYYY-MM-DD', inklusive)
+            created_to: Erstellt bis zu diesem Tag ('YYYY-MM-DD', inklusive)
+            published_only: Nur veröffentlichte Artikel
+
+        Returns:
+            Liste von (id, updated_at); ohne article_ids nach created_at sortiert
+        """
+        conditions = []
+        params = []
+        if article_ids is not None:
+            if not article_ids:
+                return []
+            conditions.append(f"id IN ({', '.join('?' * len(article_ids))})")
+            params.extend(article_ids)
+        if created_from:
+            conditions.append("created_at >= ?")
+            params.append(created_from)
+        if created_to:
+            conditions.append("created_at < date(?, '+1 day')")
+            params.append(created_to)
+        if published_only:
+            conditions.append("published = 1")
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute(f"SELECT id, updated_at FROM articles {where} ORDER BY created_at, id", params)
+        versions = [(row['id'], row['updated_at']) for row in cursor.fetchall()]
+        conn.close()
+
+        if article_ids is not None:
+            found = dict(versions)
+            versions = [(article_id, found[article_id]) for article_id in dict.fromkeys(article_ids)
+                        if article_id in found]
+        return versions
+
+    def get_articles_by_ids(self, article_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Holt mehrere Artikel mit einer Query (ohne Tags zu parsen)
+
+        Returns:
+            Dict id -> Artikel; unbekannte IDs fehlen
+        """
+        if not article_ids:
+            return {}
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute(
+            f"SELECT * FROM articles WHERE id IN ({', '.join('?' * len(article_ids))})",
+            list(article_ids)
+        )
+        articles = {row['id']: dict(row) for row in cursor.fetchall()}
+        conn.close()
+        return articles
+
     def update_article(self, article_id: int, **kwargs) -> bool:
         """Aktualisiert einen Artikel"""
         allowed_fields = ['title', 'content', 'author', 'published', 'tags', 'created_at']
@@ -169,6 +773,12 @@ class DatabaseManager:
                         continue  # Leerer Wert wird ignoriert
                 updates.append(f"{key} = ?")
                 values.append(value)
+                if key == 'title':
+                    updates.append("title_key = ?")
+                    values.append(title_key(value))
+                elif key == 'content':
+                    updates.append("content_hash = ?")
+                    values.append(content_hash(value))
         
         if not updates:
             return False
@@ -211,15 +821,31 @@ class DatabaseManager:
     # ===== Bild-Operationen =====
     
     def add_image(self, article_id: int, filename: str, filepath: str,
-                 alt_text: str = None, caption: str = None) -> int:
-        """Fügt ein Bild hinzu"""
+                 alt_text: str = None, caption: str = None,
+                 width: int = None, height: int = None, file_size: int = None,
+                 mime_type: str = None, sha256: str = None) -> int:
+        """Fügt ein Bild hinzu
+        
+        Args:
+            article_id: Zugehöriger Artikel
+            filename: Dateiname
+            filepath: Relativer Pfad (z.B. 'media/images/bild.jpg')
+            alt_text: Alternativtext (optional)
+            caption: Bildunterschrift (optional)
+            width, height: Bildgröße in Pixeln (optional)
+            file_size: Dateigröße in Bytes (optional)
+            mime_type: MIME-Typ, z.B. 'image/jpeg' (optional)
+            sha256: SHA-256 Hash der Datei (optional)
+        """
         conn = self.get_connection()
         cursor = conn.cursor()
         
         cursor.execute("""
-            INSERT INTO images (article_id, filename, filepath, alt_text, caption)
-            VALUES (?, ?, ?, ?, ?)
-        """, (article_id, filename, filepath, alt_text, caption))
+            INSERT INTO images (article_id, filename, filepath, alt_text, caption,
+                                width, height, file_size, mime_type, sha256)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (article_id, filename, filepath, alt_text, caption,
+              width, height, file_size, mime_type, sha256))
         
         image_id = cursor.lastrowid
         conn.commit()
@@ -238,6 +864,25 @@ class DatabaseManager:
         
         return [dict(row) for row in rows]
     
+    def update_image_metadata(self, image_id: int, width: int = None, height: int = None,
+                              file_size: int = None, mime_type: str = None,
+                              sha256: str = None) -> bool:
+        """Aktualisiert die Metadaten eines Bildes (z.B. beim Backfill)"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+            UPDATE images
+            SET width = ?, height = ?, file_size = ?, mime_type = ?, sha256 = ?
+            WHERE id = ?
+        """, (width, height, file_size, mime_type, sha256, image_id))
+        success = cursor.rowcount > 0
+        
+        conn.commit()
+        conn.close()
+        
+        return success
+    
     def delete_image(self, image_id: int) -> bool:
         """Löscht ein Bild aus der DB"""
         conn = self.get_connection()
@@ -284,6 +929,62 @@ class DatabaseManager:
         
         return articles
     
+    def _load_duplicate_keys(self) -> List[Dict[str, Any]]:
+        """Lädt id, title, title_key, content_hash und Zeitstempel aller Artikel (nach ID)
+        
+        Fehlende Schlüssel (z.B. per SQL-Skript eingefügte Zeilen) werden hier
+        nachberechnet; den Inhalt lädt die Query nur für diese Zeilen.
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+            SELECT id, title, title_key, content_hash, created_at, updated_at,
+                   CASE WHEN content_hash IS NULL THEN content END AS content
+            FROM articles ORDER BY id
+        """)
+        rows = cursor.fetchall()
+        conn.close()
+        
+        articles = []
+        for row in rows:
+            article = dict(row)
+            content = article.pop('content')
+            if article['title_key'] is None:
+                article['title_key'] = title_key(article['title'])
+            if article['content_hash'] is None:
+                article['content_hash'] = content_hash(content)
+            articles.append(article)
+        
+        return articles
+    
+    def get_title_key_map(self) -> Dict[str, Dict[str, Any]]:
+        """Lädt alle Titel-Schlüssel einmalig für Duplikat-Prüfungen (z.B. pro Import-Request)
+        
+        Returns:
+            Dict title_key -> {id, title, title_key, content_hash, created_at, updated_at}.
+            Bei mehreren Artikeln mit gleichem Schlüssel gewinnt die kleinste ID.
+        """
+        key_map = {}
+        for article in self._load_duplicate_keys():
+            key_map.setdefault(article['title_key'], article)
+        return key_map
+    
+    def get_duplicate_key_maps(self) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """Wie get_title_key_map, liefert zusätzlich die Map content_hash -> Artikel
+        
+        Beide Maps aus einer Query; gleiche Regel (kleinste ID gewinnt).
+        
+        Returns:
+            (title_map, hash_map)
+        """
+        title_map = {}
+        hash_map = {}
+        for article in self._load_duplicate_keys():
+            title_map.setdefault(article['title_key'], article)
+            hash_map.setdefault(article['content_hash'], article)
+        return title_map, hash_map
+    
     def get_article_by_title(self, title: str) -> Optional[Dict[str, Any]]:
         """Holt einen Artikel nach exaktem Titel"""
         conn = self.get_connection()
@@ -3,9 +3,18 @@
 Bildverarbeitung für CMS
 Fügt Logo/Wasserzeichen zu Bildern hinzu
 """
+import hashlib
 from PIL import Image
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Dict, Any
+
+# Beim Verkleinern wird zuerst grob reduziert, danach mit LANCZOS auf die
+# Zielgröße skaliert:
+# - JPEG: Draft-Modus, libjpeg dekodiert direkt mit 1/2, 1/4 oder 1/8
+#   (nächste Zweierpotenz, die noch mindestens so groß wie das Ziel ist)
+# - andere Formate: reduce() um ganzzahlige Faktoren, solange das
+#   Zwischenbild mindestens REDUCING_GAP-mal größer als das Ziel bleibt
+REDUCING_GAP = 2.0
 
 class ImageProcessor:
     """Verarbeitet Bilder und fügt Wasserzeichen hinzu"""
@@ -190,10 +199,7 @@ class ImageProcessor:
         Returns:
             Pfad zum skalierten Bild
         """
-        image = Image.open(image_path)
-        
-        if max_width or max_height:
-            image.thumbnail((max_width or 10000, max_height or 10000), Image.LANCZOS)
+        image = self._open_downscaled(image_path, max_width, max_height)
         
         if output_path is None:
             output_path = image_path
@@ -217,11 +223,100 @@ class ImageProcessor:
         Returns:
             Pfad zum Thumbnail
         """
-        image = Image.open(image_path)
-        image.thumbnail(size, Image.LANCZOS)
+        image = self._open_downscaled(image_path, size[0], size[1])
         image.save(output_path, quality=85, optimize=True)
         
         return output_path
+    
+    @staticmethod
+    def _fit_size(image_size: Tuple[int, int],
+                  max_width: Optional[int],
+                  max_height: Optional[int]) -> Optional[Tuple[int, int]]:
+        """
+        Berechnet die Zielgröße unter Beibehaltung des Seitenverhältnisses
+        
+        Returns:
+            (Breite, Höhe) oder None wenn nicht verkleinert werden muss
+        """
+        width, height = image_size
+        scale = 1.0
+        if max_width:
+            scale = min(scale, max_width / width)
+        if max_height:
+            scale = min(scale, max_height / height)
+        
+        if scale >= 1.0:
+            return None  # Kein Upscaling
+        
+        return (max(1, round(width * scale)), max(1, round(height * scale)))
+    
+    def _open_downscaled(self,
+                         image_path: str,
+                         max_width: Optional[int],
+                         max_height: Optional[int]) -> Image.Image:
+        """
+        Öffnet ein Bild und verkleinert es auf die maximale Größe
+        
+        JPEGs werden per Draft-Modus gleich in reduzierter Auflösung
+        dekodiert (nächste Zweierpotenz, die nicht kleiner als das Ziel ist),
+        andere Formate per reduce() vorverkleinert. Erst der letzte Schritt
+        läuft mit LANCZOS.
+        
+        Args:
+            image_path: Pfad zum Originalbild
+            max_width: Maximale Breite (None = beliebig)
+            max_height: Maximale Höhe (None = beliebig)
+        
+        Returns:
+            PIL Image (unverändert, wenn bereits klein genug)
+        """
+        image = Image.open(image_path)
+        
+        target = self._fit_size(image.size, max_width, max_height)
+        if target is None:
+            return image
+        
+        # Draft muss vor dem Laden der Pixeldaten passieren; liefert für
+        # JPEG den tatsächlich dekodierten Ausschnitt (box) zurück
+        box = None
+        draft = image.draft(None, target)
+        if draft is not None:
+            box = draft[1]
+        
+        return image.resize(target, Image.LANCZOS, box=box, reducing_gap=REDUCING_GAP)
+    
+    @staticmethod
+    def read_metadata(image_path: str) -> Dict[str, Any]:
+        """
+        Liest Metadaten eines Bildes ohne es vollständig zu dekodieren
+        
+        Pillow liest beim Öffnen nur den Header, die Pixeldaten werden
+        erst bei Bedarf geladen. Der Hash wird blockweise berechnet.
+        
+        Args:
+            image_path: Pfad zum Bild
+        
+        Returns:
+            Dict mit width, height, file_size, mime_type, sha256
+        """
+        path = Path(image_path)
+        
+        with Image.open(path) as image:
+            width, height = image.size
+            mime_type = Image.MIME.get(image.format)
+        
+        sha256 = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(64 * 1024), b''):
+                sha256.update(chunk)
+        
+        return {
+            'width': width,
+            'height': height,
+            'file_size': path.stat().st_size,
+            'mime_type': mime_type,
+            'sha256': sha256.hexdigest()
+        }
 
 
 def main():
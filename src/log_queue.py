@@ -0,0 +1,159 @@
+"""
+Nicht-blockierendes Logging über eine Queue
+
+QueueLogging ersetzt die Handler der übergebenen Logger durch QueueHandler.
+Der Request-Thread legt den Eintrag nur noch in eine begrenzte Queue; ein
+Hintergrund-Thread (QueueListener) schreibt ihn mit den ursprünglichen
+Handlern (Datei, Konsole). Rotation oder langsame Platten um Mitternacht
+verzögern damit keine Requests mehr.
+
+- Begrenzte Queue: ist sie voll, wird der Eintrag verworfen statt den
+  Request warten zu lassen. Verworfene Einträge werden gezählt und mit dem
+  nächsten geschriebenen Eintrag als Warnung gemeldet.
+- stop() schreibt alle noch wartenden Einträge und flusht die Handler
+  (per atexit beim Beenden).
+- Nach einem fork() (z.B. Gunicorn-Worker bei preload_app) läuft der
+  Listener-Thread im Kind nicht mehr; restart() startet ihn mit einer neuen
+  Queue neu, registriert per os.register_at_fork.
+
+Der Inhalt der Einträge ändert sich nicht: Nachricht und Extras (z.B. die
+bereits anonymisierte remote_addr) werden im Request-Thread festgehalten,
+formatiert wird im Hintergrund mit den bisherigen Formattern.
+"""
+import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Iterable, List
+
+QUEUE_SIZE = 10000
+
+
+class _RoutingQueueHandler(QueueHandler):
+    """QueueHandler eines Loggers: merkt sich, welche Handler den Eintrag schreiben"""
+
+    def __init__(self, log_queue, route: str, owner: 'QueueLogging'):
+        super().__init__(log_queue)
+        self.route = route
+        self.owner = owner
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = super().prepare(record)
+        record.log_route = self.route
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.owner._count_dropped()
+
+
+class _RoutingListener(QueueListener):
+    """QueueListener, der jeden Eintrag an die Handler seines Loggers gibt"""
+
+    def __init__(self, log_queue, owner: 'QueueLogging'):
+        super().__init__(log_queue)
+        self.owner = owner
+
+    def enqueue_sentinel(self):
+        # Blockierend: auch bei voller Queue muss stop() den Thread erreichen
+        self.queue.put(self._sentinel)
+
+    def handle(self, record: logging.LogRecord):
+        handlers = self.owner.routes.get(getattr(record, 'log_route', None), ())
+        dropped = self.owner._take_dropped()
+        if dropped:
+            notice = logging.makeLogRecord({
+                'name': record.name, 'levelno': logging.WARNING, 'levelname': 'WARNING',
+                'msg': f"{dropped} Log-Einträge verworfen (Log-Queue voll)",
+                'remote_addr': 'unknown',
+            })
+            self._emit(handlers, notice)
+        self._emit(handlers, record)
+
+    @staticmethod
+    def _emit(handlers, record):
+        for handler in handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+class QueueLogging:
+    """Schreibt die Einträge der übergebenen Logger in einem Hintergrund-Thread"""
+
+    def __init__(self, loggers: Iterable[logging.Logger], queue_size: int = QUEUE_SIZE):
+        """
+        Args:
+            loggers: Logger, deren Handler in den Hintergrund verlegt werden
+            queue_size: Maximale Anzahl wartender Einträge
+        """
+        self.queue_size = queue_size
+        self.queue = queue.Queue(queue_size)
+        self.routes: Dict[str, List[logging.Handler]] = {}
+        self.dropped = 0
+        self._reported_dropped = 0
+        self._lock = threading.Lock()
+        self._running = False
+        self._queue_handlers: List[_RoutingQueueHandler] = []
+
+        for logger in loggers:
+            # Ein früherer QueueHandler (z.B. Modul doppelt importiert) wird ersetzt
+            handlers = [h for h in logger.handlers if not isinstance(h, _RoutingQueueHandler)]
+            self.routes[logger.name] = handlers
+            for handler in list(logger.handlers):
+                logger.removeHandler(handler)
+            queue_handler = _RoutingQueueHandler(self.queue, logger.name, self)
+            logger.addHandler(queue_handler)
+            self._queue_handlers.append(queue_handler)
+
+        self.listener = _RoutingListener(self.queue, self)
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._after_fork)
+
+    def start(self):
+        """Startet den Schreib-Thread"""
+        if not self._running:
+            self.listener.start()
+            self._running = True
+
+    def stop(self):
+        """Schreibt alle wartenden Einträge, beendet den Thread und flusht die Handler"""
+        if self._running:
+            self.listener.stop()
+            self._running = False
+        for handlers in self.routes.values():
+            for handler in handlers:
+                try:
+                    handler.flush()
+                except (OSError, ValueError):
+                    pass  # Stream bereits geschlossen (z.B. stderr beim Beenden)
+
+    def restart(self):
+        """Neue Queue und neuer Schreib-Thread (im Kindprozess nach fork)
+
+        Der Thread des Elternprozesses existiert im Kind nicht; Einträge, die
+        beim fork noch in der Queue lagen, schreibt der Elternprozess.
+        """
+        self._lock = threading.Lock()
+        self.queue = queue.Queue(self.queue_size)
+        for queue_handler in self._queue_handlers:
+            queue_handler.queue = self.queue
+        self.listener = _RoutingListener(self.queue, self)
+        self._running = False
+        self.start()
+
+    def _after_fork(self):
+        if self._running:
+            self.restart()
+
+    def _count_dropped(self):
+        with self._lock:
+            self.dropped += 1
+
+    def _take_dropped(self) -> int:
+        with self._lock:
+            new = self.dropped - self._reported_dropped
+            self._reported_dropped = self.dropped
+            return new
@@ -0,0 +1,70 @@
+"""
+Tägliche Log-Rotation für mehrere Prozesse auf derselben Datei
+
+Unter Gunicorn hat jeder Worker eigene Handler für logs/security.log,
+app.log und requests.log. Mit dem normalen TimedRotatingFileHandler rotiert
+um Mitternacht jeder Worker selbst: der erste benennt die Datei in
+security.log.YYYY-MM-DD um, jeder weitere löscht diese Datei (os.remove)
+und benennt die inzwischen neue, fast leere Datei darauf um - der Vortag
+wäre verloren (DSGVO: 30 Tage Aufbewahrung).
+
+SharedTimedRotatingFileHandler rotiert unter einer Dateisperre
+(<datei>.lock, fcntl.flock) genau einmal: Wer die Sperre bekommt, prüft, ob
+die Datei noch die ist, in die er schreibt (gleiche Inode). Wenn ja, rotiert
+er; wenn nein, hat ein anderer Prozess schon rotiert, und er öffnet nur die
+neue Datei. Geschrieben wird im Append-Modus mit einem write() pro Eintrag
+(StreamHandler flusht nach jedem Eintrag), gleichzeitige Einträge mehrerer
+Prozesse überschreiben sich daher nicht.
+
+Ohne fcntl (Windows, nur Entwicklung) verhält sich der Handler wie
+TimedRotatingFileHandler.
+"""
+import os
+import time
+from logging.handlers import TimedRotatingFileHandler
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - nur unter Windows
+    fcntl = None
+
+
+class SharedTimedRotatingFileHandler(TimedRotatingFileHandler):
+    """TimedRotatingFileHandler, bei dem nur ein Prozess pro Intervall rotiert"""
+
+    def doRollover(self):
+        if fcntl is None:
+            super().doRollover()
+            return
+
+        with open(self.baseFilename + '.lock', 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                if self._rotated_elsewhere():
+                    self._reopen()
+                else:
+                    super().doRollover()
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _rotated_elsewhere(self) -> bool:
+        """True, wenn die Datei unter baseFilename nicht mehr die geöffnete ist"""
+        if self.stream is None:
+            self.stream = self._open()
+            return False
+        try:
+            current = os.stat(self.baseFilename)
+        except FileNotFoundError:
+            return True
+        opened = os.fstat(self.stream.fileno())
+        return (current.st_dev, current.st_ino) != (opened.st_dev, opened.st_ino)
+
+    def _reopen(self):
+        """Schreibt ab jetzt in die von einem anderen Prozess neu angelegte Datei"""
+        self.stream.close()
+        self.stream = self._open()
+        current_time = int(time.time())
+        rollover_at = self.computeRollover(current_time)
+        while rollover_at <= current_time:
+            rollover_at += self.interval
+        self.rolloverAt = rollover_at
@@ -0,0 +1,240 @@
+"""
+Metriken im Prometheus-Textformat (ohne externe Abhängigkeiten)
+
+Counter, Histogramme und Gauges werden in einer MetricsRegistry gesammelt
+und von render() im Exposition-Format 0.0.4 ausgegeben (GET /metrics).
+Werte, die ohnehin anderswo gezählt werden (z.B. Cache-Treffer), können
+statt über inc()/set() per Callback beim Abruf gelesen werden.
+
+Die Werte gelten pro Prozess: bei mehreren Gunicorn-Workern liefert jeder
+Worker seine eigenen Zahlen.
+
+Zusätzlich gibt es Zähler pro Request (RequestStats), die im aktuellen
+Thread geführt werden, damit z.B. der Query-Beobachter des
+DatabaseManager DB-Queries dem laufenden Request zuordnen kann.
+"""
+import math
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Standard-Buckets von Prometheus-Clients (Sekunden)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)) + '}'
+
+
+class _Metric:
+    metric_type = None
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 callback: Callable[[], Dict[LabelValues, float]] = None):
+        """
+        Args:
+            name: Metrik-Name (z.B. 'fakedaily_http_requests_total')
+            documentation: Text für # HELP
+            labelnames: Namen der Labels
+            callback: Liefert beim Abruf {Label-Werte: Wert} statt gespeicherter Werte
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.callback = callback
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name}: Labels {sorted(labels)} statt {sorted(self.labelnames)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> Iterator[Tuple[str, Sequence[str], Sequence[str], float]]:
+        """(Name, Label-Namen, Label-Werte, Wert) aller Zeitreihen"""
+        if self.callback:
+            values = self.callback()
+        else:
+            with self._lock:
+                values = dict(self._values)
+        for key, value in sorted(values.items()):
+            yield self.name, self.labelnames, key, value
+
+    def render(self) -> List[str]:
+        lines = [f'# HELP {self.name} {_escape(self.documentation)}',
+                 f'# TYPE {self.name} {self.metric_type}']
+        for name, labelnames, labelvalues, value in self.samples():
+            lines.append(f'{name}{_format_labels(labelnames, labelvalues)} {_format_value(value)}')
+        return lines
+
+
+class Counter(_Metric):
+    """Monoton steigender Zähler"""
+
+    metric_type = 'counter'
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    """Momentanwert"""
+
+    metric_type = 'gauge'
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    """Verteilung von Messwerten in kumulativen Buckets (plus _sum und _count)"""
+
+    metric_type = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    entry[0][i] += 1
+                    break
+            entry[1] += value
+            entry[2] += 1
+
+    def samples(self) -> Iterator[Tuple[str, Sequence[str], Sequence[str], float]]:
+        with self._lock:
+            values = {key: (list(counts), total, count) for key, (counts, total, count) in self._values.items()}
+        bucket_labels = self.labelnames + ('le',)
+        for key, (counts, total, count) in sorted(values.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                yield f'{self.name}_bucket', bucket_labels, key + (_format_value(bound),), cumulative
+            yield f'{self.name}_bucket', bucket_labels, key + ('+Inf',), count
+            yield f'{self.name}_sum', self.labelnames, key, total
+            yield f'{self.name}_count', self.labelnames, key, count
+
+
+class MetricsRegistry:
+    """Sammlung von Metriken, Ausgabe im Prometheus-Textformat"""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if any(existing.name == metric.name for existing in self._metrics):
+                raise ValueError(f"Metrik {metric.name} ist bereits registriert")
+            self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                callback: Callable[[], Dict[LabelValues, float]] = None) -> Counter:
+        return self.register(Counter(name, documentation, labelnames, callback))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+              callback: Callable[[], Dict[LabelValues, float]] = None) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames, callback))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics)
+        return '\n'.join(line for metric in metrics for line in metric.render()) + '\n'
+
+
+class CacheStats:
+    """Threadsichere Treffer-/Fehlschlag-Zähler für Caches ohne eigene Zählung"""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def hit(self):
+        with self._lock:
+            self.hits += 1
+
+    def miss(self):
+        with self._lock:
+            self.misses += 1
+
+
+# ===== Zähler pro Request =====
+
+class RequestStats:
+    """Messwerte des laufenden Requests"""
+
+    __slots__ = ('start', 'db_queries', 'db_seconds', 'markdown_seconds')
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.db_queries = 0
+        self.db_seconds = 0.0
+        self.markdown_seconds = 0.0
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.start
+
+
+_current = threading.local()
+
+
+def begin_request() -> RequestStats:
+    """Startet die Messung eines Requests im aktuellen Thread"""
+    stats = _current.stats = RequestStats()
+    return stats
+
+
+def current_request() -> Optional[RequestStats]:
+    """Messwerte des Requests im aktuellen Thread oder None (z.B. Hintergrund-Jobs)"""
+    return getattr(_current, 'stats', None)
+
+
+def end_request(stats: RequestStats):
+    """Beendet die Messung (nur falls stats noch der aktuelle Request ist)"""
+    if getattr(_current, 'stats', None) is stats:
+        _current.stats = None
+
+
+def count_query(event):
+    """Query-Beobachter für den DatabaseManager: zählt die Query (QueryEvent) zum laufenden Request"""
+    stats = current_request()
+    if stats is not None:
+        stats.db_queries += 1
+        stats.db_seconds += event.seconds
@@ -0,0 +1,244 @@
+"""
+Korpusweite Suche nach Beinahe-Duplikaten (z.B. Reste aus WhatsApp-Re-Importen)
+
+Statt alle Paare mit are_similar_articles() zu vergleichen (O(n²)):
+
+1. Sketch: Shingles pro Artikel (Zeichen-4-Gramme des Titels, Zeichen-6-Gramme
+   der ersten 500 Zeichen Inhalt), daraus je eine MinHash-Signatur (32 bzw.
+   64 Fächer) per One-Permutation-Hashing (ein Hash pro Shingle statt einer pro Permutation)
+2. Blocking: LSH-Bänder der Signatur; nur Artikel, die in mindestens einem
+   Band übereinstimmen, werden Kandidaten. Kandidaten, deren Signaturen
+   insgesamt kaum übereinstimmen (geschätzte Jaccard-Ähnlichkeit unter
+   MIN_SKETCH_SIMILARITY in Titel und Inhalt), fallen vor der teuren Prüfung
+   heraus - das sind v.a. Titel, die nur häufige Wörter teilen
+3. Bestätigung: Kandidaten-Paare mit are_similar_articles() und den
+   dokumentierten Thresholds (Titel 95%, Content 90%)
+4. Cluster: Zusammenhangskomponenten der bestätigten Paare (Union-Find),
+   pro Cluster ein Vorschlag, welcher Artikel behalten wird
+
+Schritt 2 ist probabilistisch. Bänder und Zeilen sind so gewählt, dass auch
+Paare knapp über dem Content-Threshold (ratio() 0,90-0,92, Änderungen über
+den Text verstreut) zu mindestens 95% Kandidaten werden (tests/
+test_near_duplicates.py misst das); Wort-3-Gramme kamen dort nur auf etwa
+55-85%, weil jedes geänderte Wort drei Shingles kostet. Die übrigen knappen
+Fälle können fehlen (EXPECTED_RECALL, steht auch in den stats). Alles, was
+gemeldet wird, hat die exakte Prüfung aus Schritt 3 bestanden.
+"""
+import re
+import time
+import zlib
+from array import array
+from collections import defaultdict
+from itertools import combinations
+from operator import eq
+from typing import Any, Dict, Iterable, List, Tuple
+
+from db_manager import strip_formatting
+from similarity import CONTENT_PREFIX, CONTENT_THRESHOLD, TITLE_THRESHOLD, are_similar_articles, similarity
+
+TITLE_BINS = 32           # Länge der MinHash-Signaturen (Zweierpotenz); Titel sind kurz,
+CONTENT_BINS = 64         # mehr Fächer würden dort v.a. Kollisionen über häufige Wörter bringen
+ROWS = 4                  # LSH: Fächer pro Band (Bänder = Fächer / ROWS)
+MAX_BUCKET = 1000         # Größere Buckets (z.B. gemeinsame Textbausteine) werden übersprungen
+MIN_SKETCH_SIMILARITY = 0.4
+TITLE_NGRAM = 4
+CONTENT_NGRAM = 6
+EXPECTED_RECALL = 0.95    # Mindestanteil gefundener Paare knapp über dem Threshold
+
+_WORD = re.compile(r'\w+')
+_EMPTY = 1 << 32          # größer als jeder 32-Bit-Hash
+
+
+def title_shingles(title: str) -> set:
+    """Zeichen-4-Gramme des Titels ohne Formatierung, kleingeschrieben"""
+    text = ' '.join(_WORD.findall(strip_formatting(title).lower()))
+    if len(text) <= TITLE_NGRAM:
+        return {text} if text else set()
+    return {text[i:i + TITLE_NGRAM] for i in range(len(text) - TITLE_NGRAM + 1)}
+
+
+def content_shingles(content: str) -> set:
+    """Zeichen-6-Gramme der ersten 500 Zeichen (derselbe Ausschnitt wie beim Vergleich)
+
+    Zeichen- statt Wort-Shingles: ein geändertes Wort verändert nur die
+    n-Gramme, die es berühren, die Jaccard-Ähnlichkeit folgt ratio() daher
+    deutlich enger.
+    """
+    text = ' '.join(_WORD.findall(strip_formatting(content[:CONTENT_PREFIX]).lower()))
+    if len(text) <= CONTENT_NGRAM:
+        return {text} if text else set()
+    return {text[i:i + CONTENT_NGRAM] for i in range(len(text) - CONTENT_NGRAM + 1)}
+
+
+def minhash_sketch(shingles: Iterable[str], size: int = CONTENT_BINS) -> Tuple[int, ...]:
+    """MinHash-Signatur per One-Permutation-Hashing mit Verdichtung
+
+    Jeder Shingle wird einmal gehasht (crc32); die unteren Bits wählen das
+    Fach, der Rest ist der Wert, pro Fach zählt das Minimum. Leere Fächer
+    übernehmen den Wert des nächsten belegten Fachs plus Abstand, damit die
+    Wahrscheinlichkeit gleicher Fächer weiter der Jaccard-Ähnlichkeit folgt.
+    """
+    bins = [_EMPTY] * size
+    mask = size - 1
+    bin_bits = size.bit_length() - 1
+    for shingle in shingles:
+        h = zlib.crc32(shingle.encode('utf-8'))
+        index = h & mask
+        value = h >> bin_bits
+        if value < bins[index]:
+            bins[index] = value
+
+    if _EMPTY in bins:
+        if all(value == _EMPTY for value in bins):
+            return ()
+        filled = list(bins)
+        for index in range(size):
+            distance = 0
+            while filled[(index + distance) % size] == _EMPTY:
+                distance += 1
+            bins[index] = filled[(index + distance) % size] + distance * _EMPTY
+    return tuple(bins)
+
+
+def sketch_similarity(a, b) -> float:
+    """Anteil gleicher Fächer = Schätzung der Jaccard-Ähnlichkeit der Shingles"""
+    if not a or not b:
+        return 0.0
+    return sum(map(eq, a, b)) / len(a)
+
+
+class _UnionFind:
+    def __init__(self):
+        self.parent = {}
+
+    def find(self, item):
+        parent = self.parent.setdefault(item, item)
+        if parent != item:
+            parent = self.parent[item] = self.find(parent)
+        return parent
+
+    def union(self, a, b):
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            self.parent[max(root_a, root_b)] = min(root_a, root_b)
+
+
+def _merge_target(members: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Vorschlag zum Behalten: veröffentlicht, meiste Bilder, ältester, kleinste ID"""
+    return min(members, key=lambda a: (not a.get('published'), -(a.get('image_count') or 0),
+                                       a.get('created_at') or '', a['id']))
+
+
+def find_duplicate_clusters(articles: Iterable[Dict[str, Any]],
+                            title_threshold: float = TITLE_THRESHOLD,
+                            content_threshold: float = CONTENT_THRESHOLD,
+                            max_bucket: int = MAX_BUCKET) -> Dict[str, Any]:
+    """
+    Sucht Cluster von Beinahe-Duplikaten
+
+    Args:
+        articles: Dicts mit id, title, content (die ersten 500 Zeichen genügen)
+                  und optional published, created_at, image_count
+        title_threshold: wie are_similar_articles()
+        content_threshold: wie are_similar_articles()
+        max_bucket: LSH-Buckets mit mehr Artikeln werden übersprungen
+
+    Returns:
+        {'clusters': [...], 'stats': {...}}; jeder Cluster hat 'target' (ID
+        zum Behalten), 'duplicates' (IDs) und 'members' (Artikel ohne content)
+    """
+    timings = {}
+    started = time.perf_counter()
+
+    # 1. Sketches
+    by_id = {}
+    sketches = {}
+    for article in articles:
+        by_id[article['id']] = article
+        sketches[article['id']] = (
+            array('Q', minhash_sketch(title_shingles(article.get('title') or ''), TITLE_BINS)),
+            array('Q', minhash_sketch(content_shingles(article.get('content') or ''))),
+        )
+    timings['sketch'] = time.perf_counter() - started
+
+    # 2. Blocking Band für Band (hält immer nur die Buckets eines Bands im Speicher);
+    # Paare werden sofort gegen die ganze Signatur geprüft statt erst gesammelt
+    step = time.perf_counter()
+    candidates = set()
+    lsh_pairs = 0
+    skipped_buckets = 0
+    for field in (0, 1):
+        for band in range((TITLE_BINS, CONTENT_BINS)[field] // ROWS):
+            buckets = defaultdict(list)
+            for article_id, pair in sketches.items():
+                if pair[field]:
+                    buckets[pair[field][band * ROWS:(band + 1) * ROWS].tobytes()].append(article_id)
+
+            for ids in buckets.values():
+                if len(ids) < 2:
+                    continue
+                if len(ids) > max_bucket:
+                    skipped_buckets += 1
+                    continue
+                for older, newer in combinations(sorted(ids), 2):
+                    lsh_pairs += 1
+                    if (older, newer) not in candidates and any(
+                            sketch_similarity(a, b) >= MIN_SKETCH_SIMILARITY
+                            for a, b in zip(sketches[older], sketches[newer])):
+                        candidates.add((older, newer))
+    del sketches
+    timings['candidates'] = time.perf_counter() - step
+
+    # 3. Bestätigung mit den bestehenden Thresholds; der spätere Artikel
+    # gilt als "neu" (wie beim Import gegen den bestehenden)
+    step = time.perf_counter()
+    union_find = _UnionFind()
+    confirmed = 0
+    for older, newer in sorted(candidates):
+        if are_similar_articles(by_id[newer], by_id[older],
+                                title_threshold=title_threshold,
+                                content_threshold=content_threshold):
+            union_find.union(older, newer)
+            confirmed += 1
+    timings['confirm'] = time.perf_counter() - step
+
+    # 4. Cluster
+    groups = defaultdict(list)
+    for article_id in list(union_find.parent):
+        groups[union_find.find(article_id)].append(by_id[article_id])
+
+    clusters = []
+    for members in groups.values():
+        members.sort(key=lambda a: a['id'])
+        target = _merge_target(members)
+        clusters.append({
+            'target': target['id'],
+            'duplicates': [a['id'] for a in members if a['id'] != target['id']],
+            'members': [
+                {
+                    **{key: value for key, value in article.items() if key != 'content'},
+                    'title_similarity': round(similarity(article.get('title') or '',
+                                                         target.get('title') or ''), 3),
+                    'content_similarity': round(similarity((article.get('content') or '')[:CONTENT_PREFIX],
+                                                           (target.get('content') or '')[:CONTENT_PREFIX]), 3),
+                }
+                for article in members
+            ],
+        })
+    clusters.sort(key=lambda c: (-len(c['members']), c['target']))
+
+    timings['total'] = time.perf_counter() - started
+    return {
+        'clusters': clusters,
+        'stats': {
+            'articles': len(by_id),
+            'lsh_pairs': lsh_pairs,
+            'candidate_pairs': len(candidates),
+            'confirmed_pairs': confirmed,
+            'clusters': len(clusters),
+            'duplicates': sum(len(c['duplicates']) for c in clusters),
+            'skipped_buckets': skipped_buckets,
+            'expected_recall': EXPECTED_RECALL,
+            'seconds': {key: round(value, 2) for key, value in timings.items()},
+        },
+    }
@@ -0,0 +1,159 @@
+"""
+Query-Statistik und Slow-Query-Log für den DatabaseManager
+
+QueryStats ist ein Query-Beobachter (db_manager.add_query_observer): jedes
+Statement wird normalisiert (Literale und IN-Listen durch ? ersetzt,
+Leerraum vereinheitlicht) und pro normalisiertem SQL aggregiert: Anzahl,
+Gesamt-/Maximaldauer, gelesene bzw. geänderte Zeilen.
+
+Der EXPLAIN QUERY PLAN wird beim ersten Auftreten jedes normalisierten SQL
+einmal ermittelt (eigene, nur lesende Verbindung) und in der Statistik
+angezeigt; 'SCAN articles' zeigt dort fehlende Indizes. Statements ab
+SLOW_QUERY_MS werden mit diesem Plan geloggt - ohne Parameter, damit keine
+Suchbegriffe o.ä. im Log landen.
+
+Usage:
+    stats = QueryStats(threshold_ms=100)
+    add_query_observer(stats.observe)
+    stats.snapshot(sort='total', limit=20)
+"""
+import logging
+import re
+import sqlite3
+import threading
+import time
+from urllib.parse import quote
+from typing import Any, Dict, List, Optional
+
+SLOW_QUERY_MS = 100.0
+MAX_STATEMENTS = 500
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r'\s+')
+_EXPLAINABLE = re.compile(r'^\s*(?:WITH|SELECT|INSERT|UPDATE|DELETE|REPLACE)\b', re.IGNORECASE)
+
+SORT_KEYS = {
+    'total': lambda entry: entry['total_ms'],
+    'avg': lambda entry: entry['avg_ms'],
+    'max': lambda entry: entry['max_ms'],
+    'count': lambda entry: entry['count'],
+    'rows': lambda entry: entry['rows'],
+    'slow': lambda entry: entry['slow'],
+}
+
+
+def normalize_sql(sql: str) -> str:
+    """SQL ohne Literale und mit einheitlichem Leerraum
+
+    "SELECT * FROM articles WHERE id IN (?, ?, ?) LIMIT 20" wird zu
+    "SELECT * FROM articles WHERE id IN (...) LIMIT ?".
+    """
+    sql = _STRING.sub('?', sql)
+    sql = _NUMBER.sub('?', sql)
+    sql = _IN_LIST.sub('(...)', sql)
+    return _WHITESPACE.sub(' ', sql).strip().rstrip(';')
+
+
+def explain_query_plan(database: str, sql: str, parameters: Any) -> Optional[List[str]]:
+    """EXPLAIN QUERY PLAN eines Statements als Zeilen ('SEARCH articles USING ...')
+
+    Returns:
+        Plan-Zeilen, eingerückt nach Verschachtelung, oder None wenn nicht
+        ermittelbar (Skript, executemany, Datenbank nicht erreichbar)
+    """
+    if not _EXPLAINABLE.match(sql) or (parameters is None and '?' in sql):
+        return None
+    try:
+        conn = sqlite3.connect(f"file:{quote(database)}?mode=ro", uri=True)
+    except sqlite3.Error:
+        return None
+    try:
+        rows = conn.execute(f"EXPLAIN QUERY PLAN {sql}", parameters or ()).fetchall()
+    except sqlite3.Error:
+        return None
+    finally:
+        conn.close()
+
+    depth = {0: -1}
+    plan = []
+    for node_id, parent_id, _, detail in rows:
+        depth[node_id] = depth.get(parent_id, -1) + 1
+        plan.append('  ' * depth[node_id] + detail)
+    return plan
+
+
+class QueryStats:
+    """Aggregierte Statistik pro normalisiertem SQL plus Slow-Query-Log"""
+
+    def __init__(self, threshold_ms: float = SLOW_QUERY_MS, logger: logging.Logger = None,
+                 max_statements: int = MAX_STATEMENTS):
+        """
+        Args:
+            threshold_ms: Statements ab dieser Dauer werden mit Plan geloggt (0 = alle)
+            logger: Ziel des Slow-Query-Logs (default: fakedaily.app.db)
+            max_statements: Maximal gespeicherte Statements; bei Überlauf fällt
+                            das mit der kleinsten Gesamtdauer heraus
+        """
+        self.threshold_ms = threshold_ms
+        self.logger = logger or logging.getLogger('fakedaily.app.db')
+        self.max_statements = max_statements
+        self.started = time.time()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, event):
+        """Query-Beobachter: erfasst ein QueryEvent des DatabaseManager"""
+        sql = normalize_sql(event.sql)
+        ms = event.seconds * 1000
+        slow = ms >= self.threshold_ms
+
+        with self._lock:
+            known = sql in self._entries
+        # Plan außerhalb des Locks: neue Statements warten nicht aufeinander
+        plan = None if known else explain_query_plan(event.database, event.sql, event.parameters)
+
+        with self._lock:
+            entry = self._entries.get(sql)
+            if entry is None:
+                if len(self._entries) >= self.max_statements:
+                    del self._entries[min(self._entries, key=lambda key: self._entries[key]['total_ms'])]
+                entry = self._entries[sql] = {
+                    'sql': sql, 'count': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'rows': 0, 'slow': 0,
+                    'plan': plan,
+                }
+            entry['count'] += 1
+            entry['total_ms'] += ms
+            entry['max_ms'] = max(entry['max_ms'], ms)
+            entry['rows'] += event.rows or 0
+            if slow:
+                entry['slow'] += 1
+            plan = entry['plan']
+
+        if not slow:
+            return
+
+        plan_text = '\n'.join(plan) if plan else '(kein Plan)'
+        self.logger.warning(
+            f"Slow Query: {ms:.1f} ms, {event.rows if event.rows is not None else '?'} Zeilen: {sql}\n{plan_text}")
+
+    def snapshot(self, sort: str = 'total', limit: int = 50) -> List[Dict[str, Any]]:
+        """Aggregierte Statements, sortiert absteigend nach sort (siehe SORT_KEYS)"""
+        with self._lock:
+            entries = [dict(entry) for entry in self._entries.values()]
+        for entry in entries:
+            entry['avg_ms'] = entry['total_ms'] / entry['count']
+            entry['avg_rows'] = entry['rows'] / entry['count']
+            entry['total_ms'] = round(entry['total_ms'], 3)
+            entry['max_ms'] = round(entry['max_ms'], 3)
+            entry['avg_ms'] = round(entry['avg_ms'], 3)
+            entry['avg_rows'] = round(entry['avg_rows'], 1)
+        entries.sort(key=SORT_KEYS[sort], reverse=True)
+        return entries[:limit]
+
+    def reset(self):
+        """Verwirft alle gesammelten Werte"""
+        with self._lock:
+            self._entries.clear()
+            self.started = time.time()
@@ -0,0 +1,204 @@
+"""
+Ähnlichkeitserkennung für die Artikel-Deduplizierung
+
+Alle Metriken haben dieselbe Schnittstelle:
+- score(a, b): Ähnlichkeit 0.0 - 1.0
+- is_similar(a, b, threshold): score(a, b) > threshold, bricht aber ab,
+  sobald eine billige obere Schranke zeigt, dass der Threshold nicht
+  erreichbar ist
+
+Metriken:
+- 'sequence' (Standard): difflib.SequenceMatcher.ratio() wie bisher, mit
+  Längen-Schranke und real_quick_ratio()/quick_ratio() als Vorfilter.
+  Die Schranken sind echte obere Schranken von ratio(), die Entscheidungen
+  sind also identisch mit dem vollständigen Vergleich.
+- 'ngram': Jaccard-Ähnlichkeit der Zeichen-Trigramme
+- 'token_set': Token-Set-Ratio (Wortmengen, unabhängig von der Reihenfolge)
+
+Die Thresholds in docs/Aehnlichkeitserkennung.md gelten für 'sequence'.
+"""
+import re
+from difflib import SequenceMatcher
+from typing import Dict, FrozenSet
+
+TITLE_THRESHOLD = 0.95
+CONTENT_THRESHOLD = 0.90
+CONTENT_PREFIX = 500  # Content-Vergleich nur über die ersten Zeichen
+
+_TOKEN = re.compile(r'\w+')
+
+
+def _length_bound(a: str, b: str) -> float:
+    """Obere Schranke von ratio() allein aus den Längen (= real_quick_ratio())"""
+    total = len(a) + len(b)
+    return 2.0 * min(len(a), len(b)) / total if total else 1.0
+
+
+class SequenceMetric:
+    """SequenceMatcher.ratio() auf kleingeschriebenen Strings (bisheriges Verhalten)"""
+
+    name = 'sequence'
+
+    def score(self, a: str, b: str) -> float:
+        return SequenceMatcher(None, a.lower(), b.lower()).ratio()
+
+    def is_similar(self, a: str, b: str, threshold: float) -> bool:
+        a = a.lower()
+        b = b.lower()
+        if a == b:
+            return 1.0 > threshold
+
+        # Schranken aufsteigend nach Kosten: Längen O(1), quick_ratio O(n),
+        # erst dann ratio() (quadratisch im schlechtesten Fall)
+        if _length_bound(a, b) <= threshold:
+            return False
+        matcher = SequenceMatcher(None, a, b)
+        if matcher.quick_ratio() <= threshold:
+            return False
+        return matcher.ratio() > threshold
+
+
+class NgramMetric:
+    """Jaccard-Ähnlichkeit der Zeichen-n-Gramme (Standard: Trigramme)"""
+
+    name = 'ngram'
+
+    def __init__(self, n: int = 3):
+        self.n = n
+
+    def ngrams(self, text: str) -> FrozenSet[str]:
+        text = text.lower()
+        if len(text) <= self.n:
+            return frozenset([text]) if text else frozenset()
+        return frozenset(text[i:i + self.n] for i in range(len(text) - self.n + 1))
+
+    def _jaccard(self, grams_a: FrozenSet[str], grams_b: FrozenSet[str]) -> float:
+        union = len(grams_a | grams_b)
+        return len(grams_a & grams_b) / union if union else 1.0
+
+    def score(self, a: str, b: str) -> float:
+        return self._jaccard(self.ngrams(a), self.ngrams(b))
+
+    def is_similar(self, a: str, b: str, threshold: float) -> bool:
+        grams_a = self.ngrams(a)
+        grams_b = self.ngrams(b)
+        # |A ∩ B| / |A ∪ B| <= min / max
+        smaller, larger = sorted((len(grams_a), len(grams_b)))
+        if larger and smaller / larger <= threshold:
+            return False
+        return self._jaccard(grams_a, grams_b) > threshold
+
+
+class TokenSetMetric:
+    """Token-Set-Ratio: vergleicht gemeinsame Wörter mit den jeweiligen Resten
+
+    Wortreihenfolge und doppelte Wörter spielen keine Rolle; ist eine Wortmenge
+    in der anderen enthalten, ist die Ähnlichkeit 1.0.
+    """
+
+    name = 'token_set'
+
+    def __init__(self):
+        self._sequence = SequenceMetric()
+
+    def _pairs(self, a: str, b: str):
+        """Liefert (festes Ergebnis, None) oder (None, zu vergleichende String-Paare)"""
+        tokens_a = set(_TOKEN.findall(a.lower()))
+        tokens_b = set(_TOKEN.findall(b.lower()))
+        if not tokens_a or not tokens_b:
+            return (1.0 if tokens_a == tokens_b else 0.0), None
+
+        common = ' '.join(sorted(tokens_a & tokens_b))
+        rest_a = ' '.join(sorted(tokens_a - tokens_b))
+        rest_b = ' '.join(sorted(tokens_b - tokens_a))
+        if common and (not rest_a or not rest_b):
+            return 1.0, None
+
+        combined_a = f"{common} {rest_a}".strip()
+        combined_b = f"{common} {rest_b}".strip()
+        return None, [(common, combined_a), (common, combined_b), (combined_a, combined_b)]
+
+    def score(self, a: str, b: str) -> float:
+        fixed, pairs = self._pairs(a, b)
+        if fixed is not None:
+            return fixed
+        return max(self._sequence.score(x, y) for x, y in pairs)
+
+    def is_similar(self, a: str, b: str, threshold: float) -> bool:
+        fixed, pairs = self._pairs(a, b)
+        if fixed is not None:
+            return fixed > threshold
+        # Ein Paar über dem Threshold genügt
+        return any(self._sequence.is_similar(x, y, threshold) for x, y in pairs)
+
+
+METRICS: Dict[str, object] = {
+    metric.name: metric
+    for metric in (SequenceMetric(), NgramMetric(), TokenSetMetric())
+}
+
+
+def get_metric(name: str = 'sequence'):
+    """Liefert die Metrik zum Namen (ValueError bei unbekanntem Namen)"""
+    try:
+        return METRICS[name]
+    except KeyError:
+        raise ValueError(f"Unbekannte Ähnlichkeits-Metrik: {name} (erlaubt: {', '.join(METRICS)})")
+
+
+def similarity(a: str, b: str, metric: str = 'sequence') -> float:
+    """
+    Calculate similarity ratio between two strings.
+
+    Default metric uses SequenceMatcher (Longest Common Subsequence):
+    ratio = 2.0 × M / T
+    where M = matching characters, T = total length
+
+    Args:
+        a: First string
+        b: Second string
+        metric: 'sequence', 'ngram' or 'token_set'
+
+    Returns:
+        float: Similarity ratio between 0.0 (completely different) and 1.0 (identical)
+    """
+    return get_metric(metric).score(a, b)
+
+
+def is_similar(a: str, b: str, threshold: float, metric: str = 'sequence') -> bool:
+    """similarity(a, b, metric) > threshold, mit vorzeitigem Abbruch über obere Schranken"""
+    return get_metric(metric).is_similar(a, b, threshold)
+
+
+def are_similar_articles(new_article: dict, existing_article: dict,
+                         title_threshold: float = TITLE_THRESHOLD,
+                         content_threshold: float = CONTENT_THRESHOLD,
+                         metric: str = 'sequence') -> bool:
+    """
+    Check if two articles are similar based on similarity thresholds.
+
+    Thresholds (documented in docs/Aehnlichkeitserkennung.md):
+    - Title: 95% similarity = duplicate
+    - Content: 90% similarity = duplicate (first 500 chars)
+
+    Args:
+        new_article: New article dict with 'title' and 'content'
+        existing_article: Existing article dict with 'title' and 'content'
+        title_threshold: Minimum title similarity (default: 0.95)
+        content_threshold: Minimum content similarity (default: 0.90)
+        metric: Similarity metric (default: 'sequence')
+
+    Returns:
+        bool: True if articles are considered similar/duplicates
+    """
+    engine = get_metric(metric)
+
+    # If titles are very similar, consider as duplicate
+    if engine.is_similar(new_article.get('title', ''), existing_article.get('title', ''),
+                         title_threshold):
+        return True
+
+    # Check content similarity (first 500 chars)
+    content1 = new_article.get('content', '')[:CONTENT_PREFIX]
+    content2 = existing_article.get('content', '')[:CONTENT_PREFIX]
+    return engine.is_similar(content1, content2, content_threshold)
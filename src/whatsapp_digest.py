@@ -0,0 +1,108 @@
+"""
+WhatsApp-Digest: mehrere Artikel als ein WhatsApp-Text
+
+Die formatierten Texte (WhatsAppFormatter.format_article) werden pro
+(Artikel-ID, updated_at) zwischengespeichert. Jede Änderung am Artikel
+setzt updated_at neu und erzeugt damit einen neuen Schlüssel; alte
+Einträge fallen nach dem LRU-Prinzip heraus.
+
+Für einen Digest wird zuerst nur (id, updated_at) der Auswahl gelesen.
+Vollständige Artikel werden ausschließlich für Cache-Fehlschläge geladen
+(eine Query pro Batch) und formatiert.
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
+
+from whatsapp_formatter import WhatsAppFormatter
+
+CACHE_SIZE = 2000
+DIGEST_BATCH_SIZE = 200
+DIGEST_SEPARATOR = '\n\n━━━━━━━━━━\n\n'
+
+
+class TextCache:
+    """Threadsicherer LRU-Cache für fertig formatierte Texte"""
+
+    def __init__(self, max_entries: int = CACHE_SIZE):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[str]:
+        with self._lock:
+            text = self._entries.get(key)
+            if text is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return text
+
+    def put(self, key: Hashable, text: str):
+        with self._lock:
+            self._entries[key] = text
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _format(cache: TextCache, article: Dict[str, Any]) -> str:
+    text = WhatsAppFormatter.format_article(
+        title=article['title'],
+        content=article['content'],
+        author=article.get('author')
+    )
+    cache.put((article['id'], article.get('updated_at')), text)
+    return text
+
+
+def format_cached(cache: TextCache, article: Dict[str, Any]) -> str:
+    """WhatsApp-Text eines Artikels aus dem Cache bzw. neu formatiert"""
+    text = cache.get((article['id'], article.get('updated_at')))
+    return text if text is not None else _format(cache, article)
+
+
+def iter_digest(db, versions: List[Tuple[int, str]], cache: TextCache,
+                separator: str = DIGEST_SEPARATOR,
+                batch_size: int = DIGEST_BATCH_SIZE) -> Iterator[str]:
+    """Erzeugt einen Digest als Stream
+
+    Args:
+        db: DatabaseManager
+        versions: (id, updated_at) in Ausgabereihenfolge (DatabaseManager.get_article_versions)
+        cache: Cache der formatierten Texte
+        separator: Text zwischen zwei Artikeln
+        batch_size: Artikel pro Nachlade-Query
+
+    Yields:
+        Formatierte Texte und Trenner
+    """
+    first = True
+    for start in range(0, len(versions), batch_size):
+        batch = versions[start:start + batch_size]
+        texts = {article_id: cache.get((article_id, updated_at)) for article_id, updated_at in batch}
+
+        missing = [article_id for article_id, text in texts.items() if text is None]
+        for article_id, article in db.get_articles_by_ids(missing).items():
+            texts[article_id] = _format(cache, article)
+
+        for article_id, _ in batch:
+            text = texts.get(article_id)
+            if text is None:
+                continue  # zwischenzeitlich gelöscht
+            if not first:
+                yield separator
+            first = False
+            yield text
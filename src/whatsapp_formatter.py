@@ -4,6 +4,29 @@ Konvertiert Markdown zu WhatsApp-Formatierung
 """
 import re
 
+_BOLD = '⚡BOLD⚡'  # Platzhalter, damit Bold-Marker nicht als Kursiv-Marker gelesen werden
+
+# Vorkompilierte Muster, Reihenfolge wie in convert(). Muster, die mit einem
+# festen Zeichen beginnen, sucht re deutlich schneller als solche mit ^ oder
+# Lookbehind am Anfang; "#(?<![^\n]#)" ist daher "^#" (Zeilenanfang) und
+# "\*(?<!⚡\*)(?<!\*\*)" ist "(?<![⚡\*])\*" mit dem Stern vorne.
+_HEADING = re.compile(r'#(?<![^\n]#)#{1,5}\s+(.+)$', re.MULTILINE)
+_HEADING_1 = re.compile(r'#(?<![^\n]#)\s+(.+)$', re.MULTILINE)
+_HEADING_LEVELS = [re.compile(rf'^{"#" * level}\s+(.+)$', re.MULTILINE) for level in range(6, 1, -1)]
+# Überschrift, deren Whitespace (\s+) über das Zeilenende reichen kann
+_HEADING_ACROSS_LINES = re.compile(r'#(?<![^\n]#)#{0,5}[^\S\n]*\n')
+_BOLD_STARS = re.compile(r'\*\*(.+?)\*\*')
+_BOLD_UNDERSCORES = re.compile(r'__(.+?)__')
+_ITALIC_STAR = re.compile(r'\*(?<!⚡\*)(?<!\*\*)(?!\*)(.+?)(?<!\*)\*(?![⚡\*])')
+_STRIKE = re.compile(r'~~(.+?)~~')
+_INLINE_CODE = re.compile(r'`([^`]+)`')
+_CODE_BLOCK = re.compile(r'```\w*\n(.*?)```', re.DOTALL)
+_LINK = re.compile(r'\[([^\]]+)\]\(([^\)]+)\)')
+_IMAGE = re.compile(r'!\[([^\]]*)\]\([^\)]+\)')
+_LIST_ITEM = re.compile(r'^[\-\*]\s+', re.MULTILINE)
+_BLANK_LINES = re.compile(r'\n{3,}')
+
+
 class WhatsAppFormatter:
     """Konvertiert Markdown zu WhatsApp-Formatierung"""
     
@@ -18,6 +41,11 @@ class WhatsAppFormatter:
         - ~durchgestrichen~
         - ```code```
         
+        Jeder Schritt ist ein vorkompiliertes Muster und wird übersprungen,
+        wenn das Zeichen, mit dem es beginnt, im Text nicht vorkommt. Die
+        Ausgabe ist identisch mit der früheren Version (ein re.sub pro
+        Überschriften-Ebene, siehe tests/test_whatsapp_formatter.py).
+        
         Args:
             markdown_text: Markdown-Text
             
@@ -27,48 +55,58 @@ class WhatsAppFormatter:
         text = markdown_text
         
         # Überschriften (# bis ######) - Temporär mit Platzhalter ersetzen
-        text = re.sub(r'^######\s+(.+)$', r'⚡BOLD⚡\1⚡BOLD⚡', text, flags=re.MULTILINE)
-        text = re.sub(r'^#####\s+(.+)$', r'⚡BOLD⚡\1⚡BOLD⚡', text, flags=re.MULTILINE)
-        text = re.sub(r'^####\s+(.+)$', r'⚡BOLD⚡\1⚡BOLD⚡', text, flags=re.MULTILINE)
-        text = re.sub(r'^###\s+(.+)$', r'⚡BOLD⚡\1⚡BOLD⚡', text, flags=re.MULTILINE)
-        text = re.sub(r'^##\s+(.+)$', r'⚡BOLD⚡\1⚡BOLD⚡', text, flags=re.MULTILINE)
-        text = re.sub(r'^#\s+(.+)$', r'⚡BOLD⚡\1⚡BOLD⚡\n', text, flags=re.MULTILINE)
+        if '#' in text:
+            if _HEADING_ACROSS_LINES.search(text):
+                # Selten: "##" + Zeilenumbruch. Dann hängt das Ergebnis von der
+                # Reihenfolge der Ebenen ab, also eine Ebene nach der anderen
+                for pattern in _HEADING_LEVELS:
+                    text = pattern.sub(rf'{_BOLD}\1{_BOLD}', text)
+            else:
+                text = _HEADING.sub(rf'{_BOLD}\1{_BOLD}', text)
+            text = _HEADING_1.sub(rf'{_BOLD}\1{_BOLD}\n', text)
         
         # Fett: **text** oder __text__ → Temporärer Platzhalter
-        text = re.sub(r'\*\*(.+?)\*\*', r'⚡BOLD⚡\1⚡BOLD⚡', text)
-        text = re.sub(r'__(.+?)__', r'⚡BOLD⚡\1⚡BOLD⚡', text)
+        if '**' in text:
+            text = _BOLD_STARS.sub(rf'{_BOLD}\1{_BOLD}', text)
+        if '__' in text:
+            text = _BOLD_UNDERSCORES.sub(rf'{_BOLD}\1{_BOLD}', text)
         
-        # Kursiv: *text* oder _text_ → _text_
-        # Jetzt können wir sicher * durch _ ersetzen, da alle Bold-Marker geschützt sind
-        text = re.sub(r'(?<![⚡\*])\*(?!\*)(.+?)(?<!\*)\*(?![⚡\*])', r'_\1_', text)
-        text = re.sub(r'(?<!_)_(?!_)(.+?)(?<!_)_(?!_)', r'_\1_', text)
+        # Kursiv: *text* → _text_ (alle Bold-Marker sind geschützt);
+        # _text_ ist schon WhatsApp-Kursiv und bleibt unverändert
+        if '*' in text:
+            text = _ITALIC_STAR.sub(r'_\1_', text)
         
         # Platzhalter durch WhatsApp-Bold ersetzen
-        text = text.replace('⚡BOLD⚡', '*')
+        text = text.replace(_BOLD, '*')
         
         # Durchgestrichen: ~~text~~ → ~text~
-        text = re.sub(r'~~(.+?)~~', r'~\1~', text)
+        if '~~' in text:
+            text = _STRIKE.sub(r'~\1~', text)
         
-        # Code inline: `code` → ```code```
-        text = re.sub(r'`([^`]+)`', r'```\1```', text)
-        
-        # Code-Blöcke: ```lang\ncode\n``` → ```code```
-        text = re.sub(r'```\w*\n(.*?)```', r'```\1```', text, flags=re.DOTALL)
-        
-        # Links: [text](url) → text: url
-        text = re.sub(r'\[([^\]]+)\]\(([^\)]+)\)', r'\1: \2', text)
+        if '`' in text:
+            # Code inline: `code` → ```code```
+            text = _INLINE_CODE.sub(r'```\1```', text)
+            
+            # Code-Blöcke: ```lang\ncode\n``` → ```code```
+            text = _CODE_BLOCK.sub(r'```\1```', text)
         
-        # Bilder entfernen (werden separat behandelt): ![alt](url)
-        text = re.sub(r'!\[([^\]]*)\]\([^\)]+\)', r'', text)
+        if '](' in text:
+            # Links: [text](url) → text: url
+            text = _LINK.sub(r'\1: \2', text)
+            
+            # Bilder entfernen (werden separat behandelt): ![alt](url)
+            text = _IMAGE.sub('', text)
         
         # Listen: - item oder * item → • item
-        text = re.sub(r'^[\-\*]\s+', r'• ', text, flags=re.MULTILINE)
+        if '-' in text or '*' in text:
+            text = _LIST_ITEM.sub('• ', text)
         
         # Nummerierte Listen beibehalten
         # 1. item bleibt 1. item
         
         # Mehrfache Leerzeilen reduzieren
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        if '\n\n\n' in text:
+            text = _BLANK_LINES.sub('\n\n', text)
         
         return text.strip()
     
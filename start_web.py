@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 """
-Startet den CMS Web-Server
+Startet den CMS Web-Server (Flask-Entwicklungsserver)
+
+Für den Produktivbetrieb (mehrere Worker, Keep-Alive, Worker-Recycling):
+    gunicorn -c gunicorn.conf.py 'web.app:create_app()'
 """
 import sys
 from pathlib import Path
@@ -9,7 +12,9 @@ from pathlib import Path
 web_dir = Path(__file__).parent / "web"
 sys.path.insert(0, str(web_dir))
 
-from app import app
+from app import create_app
+
+app = create_app()
 
 if __name__ == '__main__':
     import os
@@ -185,6 +185,32 @@ class TestUploadAPI:
         data = response.json()
         assert data['uploaded'] == 2
     
+    def test_upload_images_stores_metadata_in_export(self, test_article_data, test_image_file):
+        """Test: Hochgeladenes Bild erscheint im Export mit Metadaten"""
+        requests.post(
+            f"{API_BASE}/import/articles",
+            json={'articles': [test_article_data]}
+        )
+        
+        export_response = requests.get(f"{API_BASE}/export/articles")
+        articles = export_response.json()['articles']
+        article_id = next(a['id'] for a in articles if a['title'] == test_article_data['title'])
+        self.created_article_ids.append(article_id)
+        
+        with open(test_image_file, 'rb') as f:
+            files = {'images': ('meta.jpg', f, 'image/jpeg')}
+            requests.post(f"{API_BASE}/upload/images/{article_id}", files=files)
+        
+        export_response = requests.get(f"{API_BASE}/export/articles")
+        article = next(a for a in export_response.json()['articles'] if a['id'] == article_id)
+        image = article['images'][0]
+        
+        assert image['width'] == 100
+        assert image['height'] == 100
+        assert image['mime_type'] == 'image/jpeg'
+        assert image['file_size'] > 0
+        assert len(image['sha256']) == 64
+    
     def test_upload_images_endpoint_nonexistent_article(self, test_image_file):
         """Test: Upload für nicht existierenden Artikel"""
         with open(test_image_file, 'rb') as f:
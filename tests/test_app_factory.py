@@ -0,0 +1,130 @@
+"""
+Unit Tests for the application factory and lazy startup (create_app in web/app.py)
+Each test imports the app in a fresh interpreter, so module-level state of other tests does not interfere
+"""
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+BASE_DIR = Path(__file__).parent.parent
+
+
+@pytest.fixture
+def workdir():
+    path = Path(tempfile.mkdtemp())
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def run_app_script(code: str, workdir: Path) -> dict:
+    """Führt code nach 'import web.app as web_app' aus; code gibt ein Dict per print(json.dumps(...)) aus"""
+    env = dict(os.environ, DB_PATH=str(workdir / 'env' / 'articles.db'), LOG_DIR=str(workdir / 'env-logs'))
+    script = f"import json, sys\nsys.path.insert(0, {str(BASE_DIR)!r})\nimport web.app as web_app\n{code}"
+    result = subprocess.run([sys.executable, '-c', script], env=env, cwd=str(workdir),
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class TestLazyStartup:
+    """Tests for deferred initialization"""
+
+    def test_import_has_no_side_effects(self, workdir):
+        """Test: importing creates neither database nor log files and attaches no log handlers"""
+        result = run_app_script(
+            "import logging\n"
+            "print(json.dumps({'db': web_app.DB_PATH.exists(), 'logs': web_app.LOG_DIR.exists(),\n"
+            "    'handlers': len(logging.getLogger('fakedaily.app').handlers), 'queue': web_app.log_queue is None}))",
+            workdir)
+
+        assert result == {'db': False, 'logs': False, 'handlers': 0, 'queue': True}
+
+    def test_first_request_starts_app(self, workdir):
+        """Test: without create_app() the first request runs the startup hooks"""
+        result = run_app_script(
+            "status = web_app.app.test_client().get('/health').status_code\n"
+            "print(json.dumps({'status': status, 'db': web_app.DB_PATH.exists(),\n"
+            "    'log': (web_app.LOG_DIR / 'app.log').exists()}))",
+            workdir)
+
+        assert result == {'status': 200, 'db': True, 'log': True}
+
+
+class TestCreateApp:
+    """Tests for create_app(config)"""
+
+    def test_config_overrides_paths(self, workdir):
+        """Test: DB_PATH, LOG_DIR and SLOW_QUERY_MS from config are used, the env defaults stay untouched"""
+        db_path = workdir / 'factory' / 'articles.db'
+        log_dir = workdir / 'factory-logs'
+        result = run_app_script(
+            f"app = web_app.create_app({{'DB_PATH': {str(db_path)!r}, 'LOG_DIR': {str(log_dir)!r},\n"
+            f"    'SLOW_QUERY_MS': 5}})\n"
+            "client = app.test_client()\n"
+            "client.post('/admin/api/import/articles', json={'articles': [{'title': 'Factory', 'content': 'Text'}]})\n"
+            "print(json.dumps({'db_path': str(web_app.db.db_path), 'threshold': web_app.query_stats.threshold_ms,\n"
+            "    'env_db': web_app.DB_PATH.exists(), 'titles': [a['title'] for a in web_app.db.get_all_articles()]}))",
+            workdir)
+
+        assert result == {'db_path': str(db_path), 'threshold': 5.0, 'env_db': False, 'titles': ['Factory']}
+        assert (log_dir / 'security.log').exists()
+
+    def test_startup_timings(self, workdir):
+        """Test: import, hook and ready times are measured, logged and exported as metric"""
+        result = run_app_script(
+            "app = web_app.create_app()\n"
+            "metrics = app.test_client().get('/metrics').get_data(as_text=True)\n"
+            "web_app.log_queue.stop()  # schreibt die wartenden Einträge\n"
+            "log = (web_app.LOG_DIR / 'app.log').read_text(encoding='utf-8')\n"
+            "print(json.dumps({'timings': web_app.startup_timings,\n"
+            "    'metric': 'fakedaily_startup_seconds{phase=\"ready\"}' in metrics,\n"
+            "    'logged': 'FakeDaily bereit nach' in log}))",
+            workdir)
+
+        timings = result['timings']
+        assert set(timings) == {'import', 'database', 'logging', 'media', 'warmup', 'startup', 'ready'}
+        assert timings['ready'] == pytest.approx(timings['import'] + timings['startup'])
+        assert timings['startup'] >= timings['database'] + timings['logging'] + timings['media'] + timings['warmup']
+        assert result['metric'] is True
+        assert result['logged'] is True
+
+    def test_idempotent_and_config_after_start_rejected(self, workdir):
+        """Test: repeated create_app() starts once; changing config after the start raises"""
+        result = run_app_script(
+            "first = web_app.create_app()\n"
+            "queue = web_app.log_queue\n"
+            "second = web_app.create_app()\n"
+            "try:\n"
+            "    web_app.create_app({'DB_PATH': 'anders.db'})\n"
+            "    error = None\n"
+            "except RuntimeError as e:\n"
+            "    error = str(e)\n"
+            "print(json.dumps({'same': first is second and queue is web_app.log_queue, 'error': error}))",
+            workdir)
+
+        assert result['same'] is True
+        assert 'bereits gestartet' in result['error']
+
+    def test_database_hook_enables_wal_for_readers(self, workdir):
+        """Test: the database is switched to WAL, reader routes answer while a write transaction is open"""
+        result = run_app_script(
+            "import sqlite3\n"
+            "app = web_app.create_app()\n"
+            "client = app.test_client()\n"
+            "client.post('/admin/api/import/articles', json={'articles': [{'title': 'WAL', 'content': 'Text',\n"
+            "    'published': True}]})\n"
+            "writer = sqlite3.connect(web_app.DB_PATH, timeout=0)\n"
+            "mode = writer.execute('PRAGMA journal_mode').fetchone()[0]\n"
+            "writer.execute('BEGIN EXCLUSIVE')\n"
+            "status = client.get('/reader/').status_code\n"
+            "writer.rollback()\n"
+            "print(json.dumps({'mode': mode, 'status': status, 'read_only': web_app.db.reader.read_only}))",
+            workdir)
+
+        assert result == {'mode': 'wal', 'status': 200, 'read_only': True}
@@ -0,0 +1,242 @@
+"""
+Unit Tests for the JSON import (src/article_import.py)
+Tests batched transactions, duplicate rules and asynchronous import jobs with status endpoint
+"""
+import hashlib
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import article_import
+import web.app as web_app
+from web.app import app, APP_PREFIX, init_database
+from article_import import ArticleImporter, get_import_job
+from db_manager import DatabaseManager
+
+
+def make_articles(count):
+    """Artikel, die sich weder im Titel noch im Inhalt ähneln"""
+    def text(i, words):
+        return ' '.join(hashlib.md5(f"{i}-{n}".encode()).hexdigest()[:8] for n in range(words))
+
+    return [{'title': text(i, 3), 'content': text(i, 40), 'tags': ['Satire'],
+             'created_at': '2026-01-10 10:00:00', 'updated_at': '2026-01-10T10:00:00'}
+            for i in range(count)]
+
+
+class TestArticleImporter:
+    """Tests for ArticleImporter"""
+
+    @pytest.fixture(autouse=True)
+    def setup_db(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        init_database(self.test_dir / 'articles.db')
+        self.db = DatabaseManager(str(self.test_dir / 'articles.db'))
+        yield
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_one_progress_call_per_batch(self):
+        """Test: progress runs once per batch with growing counters"""
+        calls = []
+        importer = ArticleImporter(self.db, batch_size=4,
+                                   progress=lambda cursor, stats: calls.append(stats['processed']))
+
+        stats = importer.run(make_articles(10))
+
+        assert calls == [4, 8, 10]
+        assert stats['imported'] == 10
+        assert len(self.db.get_all_articles()) == 10
+
+    def test_batches_are_committed(self):
+        """Test: rows of a batch are visible to other connections once progress is reported"""
+        seen = []
+
+        def progress(cursor, stats):
+            conn = self.db.get_connection()
+            seen.append(conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0])
+            conn.close()
+
+        ArticleImporter(self.db, batch_size=3, progress=progress).run(make_articles(6))
+
+        # progress läuft noch in der Transaktion des Batches: andere sehen den vorigen Stand
+        assert seen == [0, 3]
+        assert len(self.db.get_all_articles()) == 6
+
+    def test_similar_article_within_request_is_updated(self):
+        """Test: a fuzzy duplicate of an article from an earlier batch updates it"""
+        content = "Der Chefredakteur dementiert alles, was er gestern gesagt hat. " * 5
+        stats = ArticleImporter(self.db, batch_size=1).run([
+            {'title': 'Chefredakteur dementiert', 'content': content,
+             'created_at': '2026-01-01 10:00:00'},
+            {'title': 'Völlig anderer Titel', 'content': content + ' Nachtrag',
+             'updated_at': '2030-01-01T10:00:00'},
+        ])
+
+        assert stats['imported'] == 1
+        assert stats['updated'] == 1
+        [article] = self.db.get_all_articles()
+        assert article['title'] == 'Völlig anderer Titel'
+
+    def test_similarity_runs_without_write_lock(self, monkeypatch):
+        """Test: duplicate and similarity checks of a batch run before its transaction"""
+        writes = []
+
+        def similar(article, existing):
+            conn = sqlite3.connect(self.db.db_path, timeout=0)
+            try:
+                with conn:
+                    conn.execute("CREATE TABLE IF NOT EXISTS probe (x)")
+                writes.append(True)
+            except sqlite3.OperationalError:
+                writes.append(False)
+            finally:
+                conn.close()
+            return False
+
+        monkeypatch.setattr(article_import, 'are_similar_articles', similar)
+        stats = ArticleImporter(self.db, batch_size=10).run(make_articles(4))
+
+        assert stats['imported'] == 4
+        assert writes and all(writes)
+
+    def test_duplicates_within_one_batch(self):
+        """Test: later articles of a batch see planned inserts, a newer duplicate updates the new row"""
+        stats = ArticleImporter(self.db).run([
+            {'title': 'Neu im Batch', 'content': 'Erste Fassung', 'created_at': '2026-01-01 10:00:00'},
+            {'title': 'Neu im Batch', 'content': 'Alte Kopie', 'updated_at': '2025-01-01T10:00:00'},
+            {'title': 'neu im batch!', 'content': 'Zweite Fassung', 'updated_at': '2030-01-01T10:00:00'},
+        ])
+
+        assert (stats['imported'], stats['updated'], stats['skipped']) == (1, 1, 1)
+        [article] = self.db.get_all_articles()
+        assert article['content'] == 'Zweite Fassung'
+
+    def test_errors_do_not_abort_batch(self):
+        """Test: invalid articles are skipped with an error, the rest of the batch is committed"""
+        stats = ArticleImporter(self.db).run([
+            {'title': '', 'content': 'ohne Titel'},
+            {'title': 'Kaputt', 'content': 'Alt', 'created_at': '2026-01-01 10:00:00'},
+            {'title': 'kaputt', 'content': 'Neu', 'updated_at': 'kein Datum'},
+            {'title': 'Gut', 'content': 'Inhalt'},
+        ])
+
+        assert stats['imported'] == 2
+        assert stats['skipped'] == 2
+        assert len(stats['errors']) == 2
+        assert len(self.db.get_all_articles()) == 2
+
+
+class TestImportJobsEndpoint:
+    """Tests for async /admin/api/import/articles and /admin/api/import/jobs/<id>"""
+
+    @pytest.fixture(autouse=True)
+    def setup_app(self, monkeypatch):
+        self.test_dir = Path(tempfile.mkdtemp())
+        init_database(self.test_dir / 'articles.db')
+        self.db = DatabaseManager(str(self.test_dir / 'articles.db'))
+
+        monkeypatch.setattr(web_app, 'db', self.db)
+        self.client = app.test_client()
+
+        yield
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def wait_for_job(self, status_url, timeout=10):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            job = self.client.get(status_url).json
+            if job['status'] in ('done', 'failed'):
+                return job
+            time.sleep(0.02)
+        raise AssertionError("Import-Job wurde nicht fertig")
+
+    def test_async_import_returns_job_and_completes(self):
+        """Test: ?async=1 answers 202 with a job id, the job imports everything in the background"""
+        response = self.client.post(f"{APP_PREFIX}/admin/api/import/articles?async=1",
+                                    json={'articles': make_articles(120)})
+
+        assert response.status_code == 202
+        assert response.json['status'] == 'queued'
+        assert response.json['total'] == 120
+        assert response.json['status_url'] == f"{APP_PREFIX}/admin/api/import/jobs/{response.json['job_id']}"
+
+        job = self.wait_for_job(response.json['status_url'])
+        assert job['status'] == 'done'
+        assert job['processed'] == 120
+        assert job['imported'] == 120
+        assert job['errors'] == []
+        assert job['finished_at']
+        assert len(self.db.get_all_articles()) == 120
+
+    def test_async_flag_in_body_and_reimport_skips(self):
+        """Test: "async": true in the body works too; a second import of the same data only skips"""
+        payload = {'articles': make_articles(5), 'async': True}
+        first = self.client.post(f"{APP_PREFIX}/admin/api/import/articles", json=payload)
+        self.wait_for_job(first.json['status_url'])
+
+        second = self.client.post(f"{APP_PREFIX}/admin/api/import/articles", json=payload)
+        job = self.wait_for_job(second.json['status_url'])
+
+        assert job['imported'] == 0
+        assert job['skipped'] == 5
+        assert len(self.db.get_all_articles()) == 5
+
+    def test_progress_is_visible_while_running(self, monkeypatch):
+        """Test: counters in the status endpoint grow batch by batch"""
+        observed = []
+        original = article_import.ArticleImporter._plan
+
+        def slow_plan(importer, article_data):
+            time.sleep(0.005)
+            return original(importer, article_data)
+
+        monkeypatch.setattr(article_import.ArticleImporter, '_plan', slow_plan)
+        job_id = article_import.start_import_job(self.db, make_articles(60), batch_size=10)
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            job = get_import_job(self.db, job_id)
+            observed.append(job['processed'])
+            if job['status'] == 'done':
+                break
+            time.sleep(0.01)
+
+        assert observed == sorted(observed)
+        assert set(observed) <= {0, 10, 20, 30, 40, 50, 60}
+        assert len(set(observed)) > 2
+
+    def test_sync_import_unchanged(self):
+        """Test: without async the endpoint still returns the counts directly"""
+        response = self.client.post(f"{APP_PREFIX}/admin/api/import/articles",
+                                    json={'articles': make_articles(3)})
+
+        assert response.status_code == 200
+        assert response.json['imported'] == 3
+        assert 'job_id' not in response.json
+
+    def test_unknown_job(self):
+        """Test: unknown job ids return 404"""
+        response = self.client.get(f"{APP_PREFIX}/admin/api/import/jobs/gibtsnicht")
+        assert response.status_code == 404
+        assert response.json['success'] is False
+
+    def test_job_of_dead_process_is_failed(self, monkeypatch):
+        """Test: a running job whose process is gone is reported as failed"""
+        conn = self.db.get_connection()
+        with conn:
+            conn.execute("INSERT INTO import_jobs (id, status, total, pid) VALUES ('alt', 'running', 5, 999999)")
+        conn.close()
+        monkeypatch.setattr(article_import, '_process_alive', lambda pid: False)
+
+        job = self.client.get(f"{APP_PREFIX}/admin/api/import/jobs/alt").json
+
+        assert job['status'] == 'failed'
+        assert 'abgebrochen' in job['error']
+        assert get_import_job(self.db, 'alt')['status'] == 'failed'
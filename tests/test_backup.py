@@ -0,0 +1,166 @@
+"""
+Unit Tests for online backups (src/db_backup.py, scripts/backup.py)
+Tests the paged database snapshot under concurrent writes, hard-linked image backups, the streamed JSON export and retention
+"""
+import json
+import os
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from web.app import init_database
+from db_backup import (backup_images, create_backup, list_backups, snapshot_database, write_export,
+                       PARTIAL_SUFFIX)
+from db_manager import DatabaseManager, add_query_observer, remove_query_observer, register_sql_functions
+
+SCRIPT = Path(__file__).parent.parent / "scripts" / "backup.py"
+
+
+class BackupTestBase:
+    """Live database with 30 articles (every third with an image) and an image folder"""
+
+    @pytest.fixture(autouse=True)
+    def setup_files(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.db_path = self.test_dir / 'articles.db'
+        self.images_dir = self.test_dir / 'images'
+        self.root = self.test_dir / 'backups'
+        init_database(self.db_path)
+        self.db = DatabaseManager(str(self.db_path))
+        self.images_dir.mkdir()
+        for i in range(30):
+            article_id = self.db.add_article(f"Artikel {i}", f"Inhalt {i} " * 50, published=True, tags=['Politik'])
+            if i % 3 == 0:
+                filename = f"bild_{i}.jpg"
+                (self.images_dir / filename).write_bytes(os.urandom(2048))
+                self.db.add_image(article_id, filename, f"media/images/{filename}")
+        yield
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+
+class TestSnapshot(BackupTestBase):
+    """Tests for snapshot_database"""
+
+    def test_snapshot_while_write_transaction_open(self):
+        """Test: the snapshot holds all commits but not an open transaction, and is a single file"""
+        writer = register_sql_functions(sqlite3.connect(self.db_path, timeout=0))
+        writer.execute("BEGIN IMMEDIATE")
+        writer.execute("INSERT INTO articles (title, content) VALUES ('Offen', 'Inhalt')")
+        steps = []
+        try:
+            result = snapshot_database(self.db_path, self.test_dir / 'snapshot.db', pages=2,
+                                       progress=lambda done, total: steps.append((done, total)))
+        finally:
+            writer.rollback()
+            writer.close()
+
+        snapshot = sqlite3.connect(self.test_dir / 'snapshot.db')
+        titles = [row[0] for row in snapshot.execute("SELECT title FROM articles")]
+        mode = snapshot.execute("PRAGMA journal_mode").fetchone()[0]
+        snapshot.close()
+
+        assert len(titles) == 30 and 'Offen' not in titles
+        assert mode == 'delete'
+        assert len(steps) > 1 and steps[-1][0] == steps[-1][1] == result['pages']
+        assert result['bytes'] == (self.test_dir / 'snapshot.db').stat().st_size
+
+    def test_missing_source(self):
+        """Test: a missing database raises instead of backing up an empty file"""
+        with pytest.raises(sqlite3.OperationalError):
+            snapshot_database(self.test_dir / 'fehlt.db', self.test_dir / 'snapshot.db')
+
+        assert not (self.test_dir / 'fehlt.db').exists()
+
+
+class TestImages(BackupTestBase):
+    """Tests for backup_images"""
+
+    def test_incremental_links_unchanged(self):
+        """Test: unchanged images are hard links to the previous backup, changed/new are copied, deleted are gone"""
+        first = self.test_dir / 'first'
+        second = self.test_dir / 'second'
+        first_result = backup_images(self.images_dir, first)
+
+        (self.images_dir / 'bild_0.jpg').write_bytes(os.urandom(4096))
+        (self.images_dir / 'neu.jpg').write_bytes(os.urandom(100))
+        (self.images_dir / 'bild_3.jpg').unlink()
+        second_result = backup_images(self.images_dir, second, previous_dir=first)
+
+        assert first_result['copied'] == 10 and first_result['linked'] == 0
+        assert second_result['linked'] == 8
+        assert second_result['copied'] == 2
+        assert second_result['bytes_copied'] == 4096 + 100
+        assert (second / 'images' / 'bild_6.jpg').stat().st_ino == (first / 'images' / 'bild_6.jpg').stat().st_ino
+        assert (second / 'images' / 'bild_0.jpg').read_bytes() == (self.images_dir / 'bild_0.jpg').read_bytes()
+        assert not (second / 'images' / 'bild_3.jpg').exists()
+        assert set(json.loads((second / 'images.json').read_text())) == \
+            {path.name for path in self.images_dir.iterdir()}
+
+
+class TestExport(BackupTestBase):
+    """Tests for write_export"""
+
+    def test_streamed_export_without_query_per_article(self):
+        """Test: the export is valid JSON with images per article and needs a constant number of queries"""
+        queries = []
+        add_query_observer(queries.append)
+        try:
+            result = write_export(self.db_path, self.test_dir / 'export.json', '2026-01-01T03:00:00')
+        finally:
+            remove_query_observer(queries.append)
+
+        data = json.loads((self.test_dir / 'export.json').read_text(encoding='utf-8'))
+
+        assert result['count'] == data['count'] == len(data['articles']) == 30
+        assert data['backup_date'] == '2026-01-01T03:00:00'
+        assert data['articles'][0]['tags'] == ['Politik']
+        assert [image['filename'] for image in data['articles'][0]['images']] == ['bild_0.jpg']
+        assert data['articles'][1]['images'] == []
+        assert len(queries) <= 3
+
+
+class TestCreateBackup(BackupTestBase):
+    """Tests for create_backup and the CLI"""
+
+    def test_second_backup_builds_on_first_and_prunes(self):
+        """Test: the next backup uses the newest complete one as base, keep removes older ones"""
+        first = create_backup(self.root, self.db_path, self.images_dir)
+        (self.root / ('backup_99999999_000000' + PARTIAL_SUFFIX)).mkdir()  # abgebrochenes Backup
+        self.db.add_article("Neu", "Inhalt")
+        second = create_backup(self.root, self.db_path, self.images_dir, keep=1)
+
+        assert first['previous'] is None
+        assert second['previous'] == Path(first['path']).name
+        assert second['images']['linked'] == 10
+        assert second['export']['count'] == 31
+        assert second['removed'] == [Path(first['path']).name]
+        assert list_backups(self.root) == [Path(second['path'])]
+        summary = json.loads((Path(second['path']) / 'backup.json').read_text(encoding='utf-8'))
+        assert summary['database']['pages'] > 0
+
+    def test_failed_backup_leaves_nothing(self):
+        """Test: if the snapshot fails, no partial directory remains"""
+        with pytest.raises(sqlite3.OperationalError):
+            create_backup(self.root, self.test_dir / 'fehlt.db', self.images_dir)
+
+        assert list(self.root.iterdir()) == []
+
+    def test_cli(self):
+        """Test: scripts/backup.py writes a backup and an archive"""
+        result = subprocess.run(
+            [sys.executable, str(SCRIPT), '--db', str(self.db_path), '--images', str(self.images_dir),
+             '--target', str(self.root), '--archive'],
+            capture_output=True, text=True, timeout=60)
+
+        assert result.returncode == 0, result.stderr
+        [backup] = list_backups(self.root)
+        assert (self.root / (backup.name + '.tar.gz')).exists()
+        assert 'erstes Backup' in result.stdout
@@ -0,0 +1,211 @@
+"""
+Unit Tests for scripts/batch_import.py
+Tests streaming JSON/CSV readers, bulk import and checkpoint resume
+"""
+import io
+import json
+import pytest
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import batch_import
+from db_manager import DatabaseManager
+
+
+class TestJsonStreaming:
+    """Tests for iter_json_array()"""
+
+    def test_reads_all_elements_with_small_chunks(self):
+        """Test: elements spanning chunk boundaries are parsed correctly"""
+        articles = [{"title": f"Artikel {i}", "content": "Ä" * (i * 7)} for i in range(20)]
+        f = io.StringIO(json.dumps(articles, ensure_ascii=False, indent=2))
+
+        assert list(batch_import.iter_json_array(f, chunk_size=5)) == articles
+
+    def test_numbers_at_chunk_boundary(self):
+        """Test: literals cut by the buffer end are not split"""
+        f = io.StringIO("[1, 23456, 7]")
+        assert list(batch_import.iter_json_array(f, chunk_size=6)) == [1, 23456, 7]
+
+    def test_empty_array(self):
+        """Test: empty array yields nothing"""
+        assert list(batch_import.iter_json_array(io.StringIO(" [ ] "))) == []
+
+    def test_rejects_non_array(self):
+        """Test: top-level objects are rejected"""
+        with pytest.raises(ValueError):
+            list(batch_import.iter_json_array(io.StringIO('{"articles": []}')))
+
+    def test_rejects_truncated_file(self):
+        """Test: unterminated arrays raise instead of silently stopping"""
+        with pytest.raises(ValueError):
+            list(batch_import.iter_json_array(io.StringIO('[{"title": "a"}, {"tit')))
+
+
+class TestBatchImport:
+    """Tests for import_from_json() / import_from_csv() with checkpoints"""
+
+    @pytest.fixture(autouse=True)
+    def setup_test_db(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.db = DatabaseManager(str(self.test_dir / 'test_articles.db'))
+        conn = self.db.get_connection()
+        conn.execute("""
+            CREATE TABLE articles (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT NOT NULL,
+                content TEXT NOT NULL,
+                author TEXT,
+                published BOOLEAN DEFAULT 0,
+                tags TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                title_key TEXT,
+                content_hash TEXT
+            )
+        """)
+        conn.commit()
+        conn.close()
+        yield
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def write_json(self, articles, name='articles.json'):
+        path = self.test_dir / name
+        path.write_text(json.dumps(articles, ensure_ascii=False), encoding='utf-8')
+        return str(path)
+
+    def titles(self):
+        return [a['title'] for a in sorted(self.db.get_all_articles(), key=lambda a: a['id'])]
+
+    def test_import_from_json(self):
+        """Test: JSON import inserts all valid articles and removes the checkpoint"""
+        path = self.write_json([{"title": f"A{i}", "content": f"C{i}", "tags": ["t"]} for i in range(5)])
+
+        assert batch_import.import_from_json(path, db=self.db, batch_size=2) == 5
+        assert self.titles() == [f"A{i}" for i in range(5)]
+        assert not batch_import.checkpoint_path(path).exists()
+
+    def test_import_from_ndjson(self):
+        """Test: NDJSON files are read line by line"""
+        path = self.test_dir / 'articles.ndjson'
+        path.write_text('{"title": "N1", "content": "C1"}\n\n{"title": "N2", "content": "C2"}\n')
+
+        assert batch_import.import_from_json(str(path), db=self.db) == 2
+
+    def test_import_from_csv(self):
+        """Test: CSV import parses tags and published flag"""
+        path = self.test_dir / 'articles.csv'
+        path.write_text('title,content,author,published,tags\n'
+                        'CSV 1,Inhalt 1,Autor,true,"a, b"\n'
+                        'CSV 2,Inhalt 2,,no,\n', encoding='utf-8')
+
+        assert batch_import.import_from_csv(str(path), db=self.db) == 2
+        first = self.db.get_article_by_title('CSV 1')
+        assert first['tags'] == ['a', 'b']
+        assert first['published'] == 1
+        assert self.db.get_article_by_title('CSV 2')['published'] == 0
+
+    def test_invalid_records_are_skipped(self):
+        """Test: records without title/content are skipped, the rest is imported"""
+        path = self.write_json([{"title": "OK 1", "content": "C1"}, {"title": "Ohne Inhalt"},
+                                {"content": "Ohne Titel"}, {"title": "OK 2", "content": "C2"}])
+
+        assert batch_import.import_from_json(path, db=self.db, batch_size=1) == 2
+        assert self.titles() == ["OK 1", "OK 2"]
+
+    @pytest.mark.parametrize('batch_size', [1, 2, 10])
+    def test_malformed_records_do_not_abort(self, batch_size):
+        """Test: non-text title/content and rows failing on insert are skipped, the checkpoint moves past them"""
+        path = self.write_json([{"title": "a", "content": "x"}, {"title": "b", "content": 123},
+                                {"title": ["c"], "content": "z"}, {"title": "c", "content": "y"},
+                                {"title": "d", "content": "w", "published": {"kaputt": 1}},
+                                {"title": "e", "content": "v"}])
+
+        assert batch_import.import_from_json(path, db=self.db, batch_size=batch_size) == 3
+        assert self.titles() == ["a", "c", "e"]
+        assert not batch_import.checkpoint_path(path).exists()
+
+    def test_failed_insert_advances_checkpoint(self, monkeypatch):
+        """Test: a batch with a failing row is retried row by row and its checkpoint is written"""
+        path = self.write_json([{"title": "a", "content": "x"}, {"title": "b", "content": "y",
+                                "published": {"kaputt": 1}}, {"title": "c", "content": "z"}])
+        checkpoints = []
+        original = batch_import.save_checkpoint
+        monkeypatch.setattr(batch_import, 'save_checkpoint',
+                            lambda input_file, records: (checkpoints.append(records), original(input_file, records)))
+
+        assert batch_import.import_from_json(path, db=self.db, batch_size=2) == 2
+        assert checkpoints == [2, 3]
+
+    def test_resume_from_checkpoint_after_failure(self, monkeypatch):
+        """Test: after a crash the next run continues after the last committed batch"""
+        path = self.write_json([{"title": f"A{i}", "content": f"C{i}"} for i in range(10)])
+
+        original = DatabaseManager.bulk_add_articles
+
+        def crash_after_two_batches(db, articles, batch_size, progress, **kwargs):
+            def limited():
+                for i, article in enumerate(articles):
+                    if i == 4:
+                        raise RuntimeError("Absturz")
+                    yield article
+            return original(db, limited(), batch_size=batch_size, progress=progress, **kwargs)
+
+        monkeypatch.setattr(DatabaseManager, 'bulk_add_articles', crash_after_two_batches)
+        with pytest.raises(RuntimeError):
+            batch_import.import_from_json(path, db=self.db, batch_size=2)
+        monkeypatch.undo()
+
+        assert self.titles() == ["A0", "A1", "A2", "A3"]
+        assert batch_import.load_checkpoint(path) == 4
+
+        assert batch_import.import_from_json(path, db=self.db, batch_size=2) == 6
+        assert self.titles() == [f"A{i}" for i in range(10)]
+        assert not batch_import.checkpoint_path(path).exists()
+
+    def test_checkpoint_counts_skipped_records(self):
+        """Test: checkpoint position includes invalid records so resume stays aligned"""
+        path = self.write_json([{"title": "A0", "content": "C0"}, {"title": "ungültig"},
+                                {"title": "A2", "content": "C2"}])
+        batch_import.save_checkpoint(path, 2)
+
+        assert batch_import.import_from_json(path, db=self.db) == 1
+        assert self.titles() == ["A2"]
+
+    def test_restart_ignores_checkpoint(self):
+        """Test: resume=False starts from the beginning"""
+        path = self.write_json([{"title": f"A{i}", "content": f"C{i}"} for i in range(3)])
+        batch_import.save_checkpoint(path, 2)
+
+        assert batch_import.import_from_json(path, db=self.db, resume=False) == 3
+
+    def test_stale_checkpoint_is_ignored(self):
+        """Test: a checkpoint written for a different file version is not used"""
+        path = self.write_json([{"title": "A0", "content": "C0"}])
+        batch_import.save_checkpoint(path, 1)
+        self.write_json([{"title": "B0", "content": "B0"}, {"title": "B1", "content": "B1"}])
+
+        assert batch_import.import_from_json(path, db=self.db) == 2
+
+    def test_exact_duplicates_are_skipped(self):
+        """Test: content already in the DB or earlier in the file is not inserted again"""
+        self.db.add_article("Bestehend", "*Gleicher*  Inhalt")
+        path = self.write_json([{"title": "Neu 1", "content": "gleicher inhalt"},
+                                {"title": "Neu 2", "content": "Anderer Inhalt"},
+                                {"title": "Neu 3", "content": "Anderer Inhalt"}])
+
+        assert batch_import.import_from_json(path, db=self.db) == 1
+        assert self.titles() == ["Bestehend", "Neu 2"]
+
+    def test_reimport_inserts_nothing(self):
+        """Test: importing the same file twice leaves the second run without inserts"""
+        path = self.write_json([{"title": f"A{i}", "content": f"C{i}"} for i in range(5)])
+        batch_import.import_from_json(path, db=self.db)
+
+        assert batch_import.import_from_json(path, db=self.db) == 0
+        assert len(self.titles()) == 5
@@ -0,0 +1,112 @@
+"""
+Unit Tests for the benchmark suite (benchmarks/corpus.py, benchmarks/run_benchmarks.py)
+Tests the synthetic corpus, the JSON result format and the comparison with a baseline
+"""
+import copy
+import shutil
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "benchmarks"))
+
+from auto_tagger import TAG_RULES
+from corpus import build_database, generate_articles
+from run_benchmarks import RESULT_VERSION, compare, run
+
+
+@pytest.fixture
+def workdir():
+    path = Path(tempfile.mkdtemp())
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def result(**medians):
+    return {
+        'version': RESULT_VERSION,
+        'corpus': {'articles': 10, 'images': 2, 'seed': 1},
+        'results': {name: {'median_ms': ms} for name, ms in medians.items()},
+    }
+
+
+class TestCorpus:
+    """Tests for the synthetic corpus generator"""
+
+    def test_same_seed_same_corpus(self):
+        """Test: the corpus is reproducible and depends on the seed"""
+        assert generate_articles(20, seed=7) == generate_articles(20, seed=7)
+        assert generate_articles(20, seed=7) != generate_articles(20, seed=8)
+
+    def test_articles_look_like_editor_content(self):
+        """Test: articles contain Markdown, known tags and a mix of published states"""
+        articles = generate_articles(100, seed=1)
+
+        assert all('## ' in article['content'] for article in articles)
+        assert any('![' in article['content'] for article in articles)
+        assert {tag for article in articles for tag in article['tags']} & set(TAG_RULES)
+        assert {article['published'] for article in articles} == {True, False}
+
+    def test_build_database(self, workdir):
+        """Test: the database holds all articles and images pointing to existing files"""
+        db_path, image_paths = build_database(workdir, generate_articles(50, seed=1), images=3, seed=1)
+
+        conn = sqlite3.connect(db_path)
+        article_count = conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+        filepaths = {row[0] for row in conn.execute("SELECT filepath FROM images")}
+        conn.close()
+
+        assert article_count == 50
+        assert len(image_paths) == 3 and all(path.exists() for path in image_paths)
+        assert filepaths and all((workdir / filepath).exists() for filepath in filepaths)
+
+
+class TestCompare:
+    """Tests for the baseline comparison"""
+
+    def test_statuses(self):
+        """Test: slower and faster beyond the tolerance, new and missing cases are reported"""
+        baseline = result(a=10.0, b=10.0, c=10.0, gone=1.0)
+        current = result(a=12.0, b=13.0, c=7.0, new=1.0)
+
+        rows = {row['name']: row for row in compare(current, baseline, tolerance=0.25)}
+
+        assert rows['a']['status'] == 'ok'
+        assert rows['b']['status'] == 'langsamer'
+        assert rows['b']['ratio'] == 1.3
+        assert rows['c']['status'] == 'schneller'
+        assert rows['new']['status'] == 'neu'
+        assert rows['gone']['status'] == 'fehlt'
+
+    def test_different_corpus_is_rejected(self):
+        """Test: baselines of another corpus or format are not compared"""
+        baseline = result(a=1.0)
+        other_corpus = copy.deepcopy(baseline)
+        other_corpus['corpus']['articles'] = 20
+        other_version = dict(baseline, version=RESULT_VERSION + 1)
+
+        with pytest.raises(ValueError):
+            compare(result(a=1.0), other_corpus)
+        with pytest.raises(ValueError):
+            compare(result(a=1.0), other_version)
+
+
+class TestRun:
+    """Tests for a complete (tiny) benchmark run"""
+
+    def test_result_format(self):
+        """Test: filtered cases are measured and the result compares cleanly with itself"""
+        results = run(articles_count=20, images=2, seed=1, repeat=1, only=['db.', 'whatsapp'])
+
+        assert results['version'] == RESULT_VERSION
+        assert results['corpus'] == {'articles': 20, 'images': 2, 'seed': 1}
+        assert 'db.search_articles' in results['results']
+        assert 'whatsapp.convert' in results['results']
+        assert 'image.add_watermark' not in results['results']
+        entry = results['results']['db.search_articles']
+        assert entry['ops'] == 4 and entry['repeat'] == 1 and entry['median_ms'] > 0
+        assert all(row['status'] == 'ok' for row in compare(results, results))
@@ -0,0 +1,310 @@
+"""
+Unit Tests for archive export/import (src/content_archive.py)
+Tests tar/zip round trips, merge rules, image handling, the API endpoints
+and title_key/content_hash matching in the JSON import
+"""
+import io
+import json
+import pytest
+import shutil
+import sys
+import tarfile
+import tempfile
+import zipfile
+from pathlib import Path
+from PIL import Image
+
+# Add parent directory to path to import from src/ and web/app.py
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import article_import
+import web.app as web_app
+from web.app import app, APP_PREFIX, init_database
+from db_manager import DatabaseManager
+from content_archive import ArchiveImporter, iter_archive
+
+
+def create_instance(base: Path):
+    """Legt DB + Bildverzeichnis einer Instanz (z.B. Stage oder Prod) an"""
+    base.mkdir()
+    init_database(base / 'articles.db')
+    db = DatabaseManager(str(base / 'articles.db'))
+    images = base / 'images'
+    images.mkdir()
+    return db, images
+
+
+def add_article_with_image(db, images_dir, title, created_at='2026-01-10 10:00:00', color='red'):
+    article_id = db.add_article(title, f"Inhalt von {title}", author='Redaktion',
+                                published=True, tags=['Satire'], created_at=created_at)
+    filename = f"{article_id}_{title.replace(' ', '_')}.jpg"
+    Image.new('RGB', (64, 48), color=color).save(images_dir / filename)
+    db.add_image(article_id, filename, f"media/images/{filename}", alt_text=f"Bild {title}",
+                 **web_app.ImageProcessor.read_metadata(str(images_dir / filename)))
+    return article_id, filename
+
+
+def build_archive(db, images_dir, fmt='tar', batch_size=2):
+    return b''.join(iter_archive(db, images_dir, fmt, batch_size=batch_size))
+
+
+class TestContentArchive:
+    """Tests for iter_archive() and ArchiveImporter"""
+
+    @pytest.fixture(autouse=True)
+    def setup_instances(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.source_db, self.source_images = create_instance(self.test_dir / 'stage')
+        self.target_db, self.target_images = create_instance(self.test_dir / 'prod')
+
+        self.filenames = []
+        for i in range(5):
+            _, filename = add_article_with_image(self.source_db, self.source_images, f"Artikel {i}")
+            self.filenames.append(filename)
+
+        yield
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def import_archive(self, data, fmt='tar'):
+        importer = ArchiveImporter(self.target_db, self.target_images, batch_size=2)
+        return importer.import_stream(io.BytesIO(data), fmt)
+
+    def test_tar_layout_interleaves_articles_and_images(self):
+        """Test: each NDJSON page is followed by the images of its articles"""
+        names = tarfile.open(fileobj=io.BytesIO(build_archive(self.source_db, self.source_images))).getnames()
+
+        assert names[0] == 'manifest.json'
+        assert names[1] == 'articles/000001.ndjson'
+        assert names[2:4] == [f"images/{f}" for f in self.filenames[:2]]
+        assert names[4] == 'articles/000002.ndjson'
+        assert len([n for n in names if n.startswith('images/')]) == 5
+
+    def test_zip_archive_is_valid(self):
+        """Test: streamed zip passes CRC checks and contains all members"""
+        archive = zipfile.ZipFile(io.BytesIO(build_archive(self.source_db, self.source_images, 'zip')))
+
+        assert archive.testzip() is None
+        ndjson = archive.read('articles/000001.ndjson').decode('utf-8').splitlines()
+        assert json.loads(ndjson[0])['title'] == 'Artikel 0'
+        assert json.loads(ndjson[0])['images'][0]['alt_text'] == 'Bild Artikel 0'
+
+    @pytest.mark.parametrize('fmt', ['tar', 'zip'])
+    def test_round_trip(self, fmt):
+        """Test: export + import copies articles, timestamps, tags and images"""
+        stats = self.import_archive(build_archive(self.source_db, self.source_images, fmt), fmt)
+
+        assert stats['imported'] == 5
+        assert stats['images'] == 5
+        assert stats['errors'] == []
+
+        article = self.target_db.get_article_by_title('Artikel 3')
+        assert article['created_at'] == '2026-01-10 10:00:00'
+        assert article['tags'] == ['Satire']
+        images = self.target_db.get_images_for_article(article['id'])
+        assert len(images) == 1
+        assert images[0]['alt_text'] == 'Bild Artikel 3'
+        assert images[0]['width'] == 64
+        assert (self.target_images / images[0]['filename']).read_bytes() == \
+            (self.source_images / images[0]['filename']).read_bytes()
+
+    def test_reimport_is_idempotent(self):
+        """Test: importing the same archive twice changes nothing"""
+        data = build_archive(self.source_db, self.source_images)
+        self.import_archive(data)
+
+        stats = self.import_archive(data)
+
+        assert stats['imported'] == 0
+        assert stats['updated'] == 0
+        assert stats['skipped'] == 5
+        assert stats['images'] == 0
+        assert len(self.target_db.get_all_articles()) == 5
+
+    def test_newer_article_updates_existing(self):
+        """Test: an existing article is updated only when the archive is newer"""
+        self.target_db.add_article('Artikel 1', 'Alt', created_at='2026-01-01 08:00:00')
+        self.target_db.add_article('Artikel 2', 'Neuer', created_at='2026-02-01 08:00:00')
+
+        stats = self.import_archive(build_archive(self.source_db, self.source_images))
+
+        assert stats['imported'] == 3
+        assert stats['updated'] == 1
+        assert stats['skipped'] == 1
+        assert self.target_db.get_article_by_title('Artikel 1')['content'] == 'Inhalt von Artikel 1'
+        assert self.target_db.get_article_by_title('Artikel 2')['content'] == 'Neuer'
+
+    def test_image_hash_mismatch_is_rejected(self):
+        """Test: an image whose content does not match its hash is not imported"""
+        conn = self.source_db.get_connection()
+        conn.execute("UPDATE images SET sha256 = ? WHERE filename = ?", ('0' * 64, self.filenames[0]))
+        conn.commit()
+        conn.close()
+
+        stats = self.import_archive(build_archive(self.source_db, self.source_images))
+
+        assert stats['images'] == 4
+        assert len(stats['errors']) == 1
+        assert not (self.target_images / self.filenames[0]).exists()
+
+    def test_changed_image_replaces_existing_file(self):
+        """Test: a known filename with a different SHA-256 replaces the file and its metadata"""
+        data = build_archive(self.source_db, self.source_images)
+        self.import_archive(data)
+        Image.new('RGB', (80, 40), color='green').save(self.source_images / self.filenames[0])
+        metadata = web_app.ImageProcessor.read_metadata(str(self.source_images / self.filenames[0]))
+        self.source_db.update_image_metadata(self.source_db.get_images_for_article(1)[0]['id'], **metadata)
+
+        stats = self.import_archive(build_archive(self.source_db, self.source_images))
+
+        assert stats['images'] == 0
+        assert stats['images_replaced'] == 1
+        assert stats['images_skipped'] == 4
+        assert (self.target_images / self.filenames[0]).read_bytes() == \
+            (self.source_images / self.filenames[0]).read_bytes()
+        [replaced] = self.target_db.get_images_for_article(1)
+        assert replaced['sha256'] == metadata['sha256']
+        assert (replaced['width'], replaced['height'], replaced['file_size']) == (80, 40, metadata['file_size'])
+
+    def test_legacy_row_without_hash_is_compared_with_file(self):
+        """Test: for image rows without sha256 the file on disk decides whether it is replaced"""
+        self.import_archive(build_archive(self.source_db, self.source_images))
+        conn = self.target_db.get_connection()
+        conn.execute("UPDATE images SET sha256 = NULL")
+        conn.commit()
+        conn.close()
+
+        stats = self.import_archive(build_archive(self.source_db, self.source_images))
+
+        assert stats['images_replaced'] == 0
+        assert stats['images_skipped'] == 5
+
+    def test_missing_image_file_is_skipped_on_export(self):
+        """Test: image rows without a file on disk do not break the export"""
+        (self.source_images / self.filenames[0]).unlink()
+
+        stats = self.import_archive(build_archive(self.source_db, self.source_images))
+
+        assert stats['imported'] == 5
+        assert stats['images'] == 4
+
+    def test_invalid_archive_raises_value_error(self):
+        """Test: garbage input is reported as ValueError"""
+        with pytest.raises(ValueError):
+            self.import_archive(b'kein archiv' * 100, 'zip')
+        with pytest.raises(ValueError):
+            self.import_archive(b'kein archiv' * 100, 'tar')
+
+
+class TestArchiveEndpoints:
+    """Tests for /admin/api/export/archive and /admin/api/import/archive"""
+
+    @pytest.fixture(autouse=True)
+    def setup_app(self, monkeypatch):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.db, self.images = create_instance(self.test_dir / 'instance')
+        add_article_with_image(self.db, self.images, 'Endpoint Artikel')
+
+        monkeypatch.setattr(web_app, 'db', self.db)
+        monkeypatch.setitem(app.config, 'UPLOAD_FOLDER', self.images)
+        self.client = app.test_client()
+
+        yield
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_export_streams_tar(self):
+        """Test: GET export/archive returns a streamed tar attachment"""
+        response = self.client.get(f"{APP_PREFIX}/admin/api/export/archive")
+
+        assert response.status_code == 200
+        assert response.mimetype == 'application/x-tar'
+        assert response.is_streamed
+        assert 'attachment' in response.headers['Content-Disposition']
+        names = tarfile.open(fileobj=io.BytesIO(response.get_data())).getnames()
+        assert 'manifest.json' in names
+
+    def test_export_unknown_format(self):
+        """Test: unknown formats are rejected with 400"""
+        response = self.client.get(f"{APP_PREFIX}/admin/api/export/archive?format=rar")
+        assert response.status_code == 400
+
+    def test_import_endpoint_round_trip(self):
+        """Test: POST import/archive imports a zip exported by the same API"""
+        data = self.client.get(f"{APP_PREFIX}/admin/api/export/archive?format=zip").get_data()
+        conn = self.db.get_connection()
+        conn.execute("DELETE FROM images")
+        conn.execute("DELETE FROM articles")
+        conn.commit()
+        conn.close()
+        for path in self.images.iterdir():
+            path.unlink()
+
+        response = self.client.post(f"{APP_PREFIX}/admin/api/import/archive",
+                                    data=data, content_type='application/zip')
+
+        assert response.status_code == 200
+        assert response.json['imported'] == 1
+        assert response.json['images'] == 1
+        assert len(list(self.images.iterdir())) == 1
+
+    def test_import_invalid_archive(self):
+        """Test: POST with a broken archive returns 400"""
+        response = self.client.post(f"{APP_PREFIX}/admin/api/import/archive",
+                                    data=b'kaputt', content_type='application/x-tar')
+        assert response.status_code == 400
+        assert response.json['success'] is False
+
+
+class TestImportArticlesEndpoint:
+    """Tests for /admin/api/import/articles duplicate matching"""
+
+    @pytest.fixture(autouse=True)
+    def setup_app(self, monkeypatch):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.db, self.images = create_instance(self.test_dir / 'instance')
+        self.db.add_article('Kickl gewinnt', 'Alter Inhalt', created_at='2026-01-10 10:00:00')
+
+        monkeypatch.setattr(web_app, 'db', self.db)
+        self.client = app.test_client()
+
+        yield
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def post(self, articles):
+        response = self.client.post(f"{APP_PREFIX}/admin/api/import/articles", json={'articles': articles})
+        assert response.status_code == 200
+        return response.json
+
+    def test_formatting_variant_matches_existing_title(self):
+        """Test: a title differing only in formatting/case updates the existing article"""
+        result = self.post([{'title': '*KICKL  gewinnt*', 'content': 'Neuer Inhalt',
+                             'updated_at': '2026-02-01T10:00:00'}])
+
+        assert result['imported'] == 0
+        assert result['updated'] == 1
+        articles = self.db.get_all_articles()
+        assert len(articles) == 1
+        assert articles[0]['content'] == 'Neuer Inhalt'
+
+    def test_duplicates_within_one_request(self):
+        """Test: articles added earlier in the same request are found by title"""
+        result = self.post([
+            {'title': 'Neu', 'content': 'Eins', 'updated_at': '2026-01-01T10:00:00'},
+            {'title': 'neu', 'content': 'Zwei', 'updated_at': '2026-01-01T09:00:00'},
+        ])
+
+        assert result['imported'] == 1
+        assert result['skipped'] == 1
+
+    def test_exact_content_duplicate_skips_similarity(self, monkeypatch):
+        """Test: identical content under a new title is matched by hash, without fuzzy comparison"""
+        def fail(*args, **kwargs):
+            raise AssertionError("Similarity Detection sollte nicht laufen")
+        monkeypatch.setattr(article_import, 'are_similar_articles', fail)
+
+        result = self.post([{'title': 'Ganz anderer Titel', 'content': 'alter  inhalt',
+                             'updated_at': '2026-01-01T10:00:00'}])
+
+        assert result['errors'] == []
+        assert result['skipped'] == 1
+        assert len(self.db.get_all_articles()) == 1
@@ -3,6 +3,7 @@ Unit Tests for DatabaseManager
 Tests all database operations with isolated test database
 """
 import pytest
+import sqlite3
 import tempfile
 import shutil
 import sys
@@ -12,7 +13,7 @@ from datetime import datetime
 # Add parent directory to path to import from src/
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.db_manager import DatabaseManager
+from src.db_manager import DatabaseManager, title_key, content_hash
 
 
 class TestDatabaseManager:
@@ -42,7 +43,9 @@ class TestDatabaseManager:
                 published BOOLEAN DEFAULT 0,
                 tags TEXT,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                title_key TEXT,
+                content_hash TEXT
             )
         """)
         
@@ -55,6 +58,11 @@ class TestDatabaseManager:
                 alt_text TEXT,
                 caption TEXT,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                width INTEGER,
+                height INTEGER,
+                file_size INTEGER,
+                mime_type TEXT,
+                sha256 TEXT,
                 FOREIGN KEY (article_id) REFERENCES articles(id) ON DELETE CASCADE
             )
         """)
@@ -324,6 +332,51 @@ class TestDatabaseManager:
         assert images[0]['filename'] == "test.jpg"
         assert images[0]['alt_text'] == "Test Image"
     
+    def test_add_image_with_metadata(self):
+        """Test: add_image stores width, height, size, mime type and hash"""
+        article_id = self.db.add_article("Article", "Content")
+        
+        self.db.add_image(
+            article_id, "meta.jpg", "media/images/meta.jpg",
+            width=800, height=600, file_size=12345,
+            mime_type="image/jpeg", sha256="ab" * 32
+        )
+        
+        image = self.db.get_images_for_article(article_id)[0]
+        assert image['width'] == 800
+        assert image['height'] == 600
+        assert image['file_size'] == 12345
+        assert image['mime_type'] == "image/jpeg"
+        assert image['sha256'] == "ab" * 32
+    
+    def test_add_image_without_metadata_stores_null(self):
+        """Test: add_image without metadata leaves metadata columns empty"""
+        article_id = self.db.add_article("Article", "Content")
+        self.db.add_image(article_id, "plain.jpg", "path.jpg")
+        
+        image = self.db.get_images_for_article(article_id)[0]
+        assert image['width'] is None
+        assert image['sha256'] is None
+    
+    def test_update_image_metadata(self):
+        """Test: update_image_metadata fills metadata of existing image"""
+        article_id = self.db.add_article("Article", "Content")
+        image_id = self.db.add_image(article_id, "old.jpg", "path.jpg")
+        
+        success = self.db.update_image_metadata(
+            image_id, width=100, height=50, file_size=999,
+            mime_type="image/png", sha256="cd" * 32
+        )
+        
+        assert success is True
+        image = self.db.get_images_for_article(article_id)[0]
+        assert (image['width'], image['height']) == (100, 50)
+        assert image['mime_type'] == "image/png"
+    
+    def test_update_image_metadata_nonexistent(self):
+        """Test: update_image_metadata returns False for nonexistent image"""
+        assert self.db.update_image_metadata(99999, width=1, height=1) is False
+    
     def test_get_images_for_article_empty(self):
         """Test: get_images_for_article returns empty list when no images"""
         article_id = self.db.add_article("Article", "Content")
@@ -342,7 +395,151 @@ class TestDatabaseManager:
         assert len(images) == 3
         filenames = {img['filename'] for img in images}
         assert filenames == {"img1.jpg", "img2.jpg", "img3.jpg"}
-    
+
+    def test_bulk_add_articles(self):
+        """Test: bulk_add_articles inserts all articles with the add_article semantics"""
+        articles = [
+            {"title": "Bulk 1", "content": "Content 1", "author": "A", "published": True,
+             "tags": ["x", "y"], "created_at": "2025-01-01 10:00:00"},
+            {"title": "Bulk 2", "content": "Content 2"},
+        ]
+
+        assert self.db.bulk_add_articles(articles) == 2
+
+        first = self.db.get_article_by_title("Bulk 1")
+        assert first['author'] == "A"
+        assert first['published'] == 1
+        assert first['tags'] == ["x", "y"]
+        assert first['created_at'] == "2025-01-01 10:00:00"
+        assert first['updated_at'] == "2025-01-01 10:00:00"
+
+        second = self.db.get_article_by_title("Bulk 2")
+        assert second['published'] == 0
+        assert second['tags'] is None
+        assert second['created_at'] is not None
+
+    def test_bulk_add_articles_batches_and_progress(self):
+        """Test: bulk_add_articles consumes a generator in batches and reports progress"""
+        progress = []
+        articles = ({"title": f"Bulk {i}", "content": "C"} for i in range(7))
+
+        inserted = self.db.bulk_add_articles(articles, batch_size=3, progress=progress.append)
+
+        assert inserted == 7
+        assert progress == [3, 6, 7]
+        assert len(self.db.get_all_articles()) == 7
+
+    def test_bulk_add_articles_failed_batch_rolls_back(self):
+        """Test: a failing batch is rolled back, earlier batches stay committed"""
+        articles = [{"title": f"Bulk {i}", "content": "C"} for i in range(4)]
+        articles.append({"title": "Kaputt"})  # content fehlt
+
+        with pytest.raises(KeyError):
+            self.db.bulk_add_articles(articles, batch_size=3)
+
+        titles = {a['title'] for a in self.db.get_all_articles()}
+        assert titles == {"Bulk 0", "Bulk 1", "Bulk 2"}
+
+    def test_bulk_add_articles_on_error_skips_bad_rows(self):
+        """Test: with on_error, bad articles are reported and the rest of their batch is inserted"""
+        errors = []
+        articles = [{"title": "Bulk 0", "content": "C"}, {"title": "Kaputt"},
+                    {"title": "Bulk 2", "content": "C", "published": {"kein": "Wert"}},
+                    {"title": "Bulk 3", "content": "C"}]
+
+        inserted = self.db.bulk_add_articles(articles, batch_size=4,
+                                             on_error=lambda article, e: errors.append(article['title']))
+
+        assert inserted == 2
+        assert errors == ["Kaputt", "Bulk 2"]
+        assert {a['title'] for a in self.db.get_all_articles()} == {"Bulk 0", "Bulk 3"}
+
+    def test_iter_articles_with_images(self):
+        """Test: iter_articles_with_images pages by id and attaches images"""
+        ids = [self.db.add_article(f"Article {i}", "Content", tags=["Tag"]) for i in range(5)]
+        self.db.add_image(ids[0], "a.jpg", "a.jpg")
+        self.db.add_image(ids[0], "b.jpg", "b.jpg")
+        self.db.add_image(ids[4], "c.jpg", "c.jpg")
+
+        pages = list(self.db.iter_articles_with_images(batch_size=2))
+
+        assert [len(page) for page in pages] == [2, 2, 1]
+        articles = [article for page in pages for article in page]
+        assert [a['id'] for a in articles] == ids
+        assert [img['filename'] for img in articles[0]['images']] == ["a.jpg", "b.jpg"]
+        assert articles[1]['images'] == []
+        assert articles[4]['images'][0]['filename'] == "c.jpg"
+        assert articles[0]['tags'] == ["Tag"]
+
+    def test_iter_articles_with_images_empty(self):
+        """Test: iter_articles_with_images yields nothing for empty database"""
+        assert list(self.db.iter_articles_with_images()) == []
+
+    # ===== Title Key Tests =====
+
+    def test_title_key_normalizes_formatting(self):
+        """Test: title_key ignores WhatsApp formatting, case and whitespace"""
+        assert title_key("*Kickl  gewinnt*") == title_key("kickl gewinnt ")
+        assert title_key("_Straße_") == title_key("STRASSE")
+        assert title_key("Kickl gewinnt") != title_key("Kickl verliert")
+
+    def test_add_and_update_article_set_title_key(self):
+        """Test: add_article, bulk_add_articles and update_article keep title_key current"""
+        article_id = self.db.add_article("*Neuer* Titel", "Content")
+        self.db.bulk_add_articles([{"title": "Bulk Titel", "content": "C"}])
+        assert self.db.get_article(article_id)['title_key'] == "neuer titel"
+        assert self.db.get_article_by_title("Bulk Titel")['title_key'] == "bulk titel"
+
+        self.db.update_article(article_id, title="Anderer Titel")
+        assert self.db.get_article(article_id)['title_key'] == "anderer titel"
+
+    def test_content_hash_normalizes_formatting(self):
+        """Test: content_hash ignores formatting, case and whitespace but not wording"""
+        assert content_hash("*Breaking*  News\n\nText") == content_hash("breaking news text")
+        assert content_hash("Breaking News") != content_hash("Breaking News!")
+        assert len(content_hash("")) == 64
+
+    def test_add_and_update_article_set_content_hash(self):
+        """Test: add_article, bulk_add_articles and update_article keep content_hash current"""
+        article_id = self.db.add_article("Titel", "Inhalt")
+        self.db.bulk_add_articles([{"title": "Bulk", "content": "Bulk Inhalt"}])
+        assert self.db.get_article(article_id)['content_hash'] == content_hash("Inhalt")
+        assert self.db.get_article_by_title("Bulk")['content_hash'] == content_hash("Bulk Inhalt")
+
+        self.db.update_article(article_id, content="Neuer Inhalt")
+        assert self.db.get_article(article_id)['content_hash'] == content_hash("Neuer Inhalt")
+
+    def test_get_title_key_map(self):
+        """Test: get_title_key_map prefers the lowest id and fills missing keys"""
+        first = self.db.add_article("Doppelt", "Content 1")
+        self.db.add_article("DOPPELT", "Content 2")
+        conn = self.db.get_connection()
+        conn.execute("INSERT INTO articles (title, content) VALUES ('Ohne  Schlüssel', 'C')")
+        conn.commit()
+        conn.close()
+
+        title_map = self.db.get_title_key_map()
+
+        assert set(title_map) == {"doppelt", "ohne schlüssel"}
+        assert title_map["doppelt"]['id'] == first
+        assert title_map["ohne schlüssel"]['title'] == "Ohne  Schlüssel"
+
+    def test_get_duplicate_key_maps(self):
+        """Test: get_duplicate_key_maps returns title and hash maps, filling missing hashes"""
+        first = self.db.add_article("Eins", "Gleich")
+        self.db.add_article("Zwei", "gleich")
+        conn = self.db.get_connection()
+        conn.execute("INSERT INTO articles (title, content) VALUES ('Drei', 'Ohne Hash')")
+        conn.commit()
+        conn.close()
+
+        title_map, hash_map = self.db.get_duplicate_key_maps()
+
+        assert set(title_map) == {"eins", "zwei", "drei"}
+        assert hash_map[content_hash("Gleich")]['id'] == first
+        assert hash_map[content_hash("Ohne Hash")]['title'] == "Drei"
+        assert 'content' not in title_map["drei"]
+
     def test_delete_image(self):
         """Test: delete_image removes image record"""
         article_id = self.db.add_article("Article", "Content")
@@ -404,6 +601,67 @@ class TestDatabaseManager:
         article = self.db.get_article(article_id)
         assert set(article['tags']) == {'tag-with-dash', 'tag_with_underscore'}
 
+    
+    # ===== Read-only Tests =====
+    
+    def test_reader_is_cached_read_only_manager(self):
+        """Test: reader returns one read-only manager for the same file"""
+        reader = self.db.reader
+        
+        assert reader is self.db.reader
+        assert reader.read_only is True
+        assert reader.reader is reader
+        assert reader.db_path == self.db.db_path
+    
+    def test_reader_sees_writes(self):
+        """Test: reader reads articles and images committed by the writer"""
+        article_id = self.db.add_article("Gelesen", "Inhalt", published=True, tags=['Politik'])
+        self.db.add_image(article_id, "img.jpg", "path.jpg")
+        
+        assert self.db.reader.get_article(article_id)['title'] == "Gelesen"
+        assert [a['id'] for a in self.db.reader.get_articles_by_tag('Politik', published_only=True)] == [article_id]
+        assert len(self.db.reader.get_images_for_article(article_id)) == 1
+    
+    def test_reader_rejects_writes(self):
+        """Test: writes through the reader raise and leave the database unchanged"""
+        article_id = self.db.add_article("Original", "Inhalt")
+        
+        with pytest.raises(sqlite3.OperationalError):
+            self.db.reader.add_article("Neu", "Inhalt")
+        with pytest.raises(sqlite3.OperationalError):
+            self.db.reader.update_article(article_id, title="Geändert")
+        with pytest.raises(sqlite3.OperationalError):
+            self.db.reader.delete_article(article_id)
+        
+        assert [a['title'] for a in self.db.get_all_articles()] == ["Original"]
+    
+    def test_reader_does_not_create_missing_database(self):
+        """Test: opening a missing file read-only fails instead of creating an empty database"""
+        missing = Path(self.test_dir) / 'fehlt.db'
+        
+        with pytest.raises(sqlite3.OperationalError):
+            DatabaseManager(str(missing), read_only=True).get_all_articles()
+        assert not missing.exists()
+    
+    def test_reader_not_blocked_by_open_write_transaction(self):
+        """Test: in WAL mode the reader sees the last commit while a write transaction is open"""
+        conn = sqlite3.connect(self.test_db_path)
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.close()
+        self.db.add_article("Committed", "Inhalt", published=True)
+        
+        writer = sqlite3.connect(self.test_db_path, timeout=0)
+        try:
+            writer.execute("BEGIN EXCLUSIVE")  # ohne WAL sperrt das auch Leser
+            writer.execute("INSERT INTO articles (title, content, published) VALUES ('Offen', 'Inhalt', 1)")
+            
+            titles = [a['title'] for a in self.db.reader.get_all_articles(published_only=True)]
+        finally:
+            writer.rollback()
+            writer.close()
+        
+        assert titles == ["Committed"]
+
 
 if __name__ == '__main__':
     print("DatabaseManager Unit Tests")
@@ -0,0 +1,221 @@
+"""
+Unit Tests for scripts/export_with_images.py
+Tests download planning, change detection, orphan cleanup and a full
+export run against a local HTTP server
+"""
+import hashlib
+import json
+import pytest
+import shutil
+import sys
+import tempfile
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import export_with_images as exporter
+
+
+class FlakyHandler(SimpleHTTPRequestHandler):
+    """Statischer Server, der für einzelne Pfade zuerst mit 503 antwortet"""
+    failures = {}  # Pfad -> Anzahl 503-Antworten vor der Datei
+
+    def do_GET(self):
+        if self.failures.get(self.path, 0) > 0:
+            self.failures[self.path] -= 1
+            self.send_error(503)
+            return
+        super().do_GET()
+
+    def log_message(self, *args):
+        pass
+
+
+def image_entry(url, data):
+    """Export-Eintrag wie von /admin/api/export/articles"""
+    return {
+        'url': url,
+        'file_size': len(data),
+        'sha256': hashlib.sha256(data).hexdigest(),
+    }
+
+
+class TestExportPlanning:
+    """Tests for is_unchanged(), plan_downloads() and remove_orphans()"""
+
+    @pytest.fixture(autouse=True)
+    def setup_images_dir(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.images_dir = self.test_dir / 'images'
+        self.images_dir.mkdir()
+        yield
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_is_unchanged_missing_file(self):
+        """Test: missing local copy is never unchanged"""
+        assert not exporter.is_unchanged(self.images_dir / 'a.jpg', {})
+
+    def test_is_unchanged_matching_hash(self):
+        """Test: same size and hash counts as unchanged"""
+        (self.images_dir / 'a.jpg').write_bytes(b'abc')
+        assert exporter.is_unchanged(self.images_dir / 'a.jpg', image_entry('', b'abc'))
+
+    def test_is_unchanged_size_mismatch(self):
+        """Test: different size is detected without hashing"""
+        (self.images_dir / 'a.jpg').write_bytes(b'abcd')
+        assert not exporter.is_unchanged(self.images_dir / 'a.jpg', image_entry('', b'abc'))
+
+    def test_is_unchanged_hash_mismatch(self):
+        """Test: same size but different content is detected"""
+        (self.images_dir / 'a.jpg').write_bytes(b'xyz')
+        assert not exporter.is_unchanged(self.images_dir / 'a.jpg', image_entry('', b'abc'))
+
+    def test_is_unchanged_without_metadata(self):
+        """Test: exports without metadata fall back to the filename"""
+        (self.images_dir / 'a.jpg').write_bytes(b'xyz')
+        assert exporter.is_unchanged(self.images_dir / 'a.jpg', {'url': ''})
+
+    def test_plan_downloads(self):
+        """Test: mapping, downloads, cache hits and foreign servers in one pass"""
+        server = 'http://localhost:5001'
+        (self.images_dir / 'cached.jpg').write_bytes(b'cached')
+        articles = [
+            {'id': 1, 'images': [
+                image_entry(f'{server}/cms/media/images/new.jpg', b'new'),
+                image_entry(f'{server}/cms/media/images/cached.jpg', b'cached'),
+            ]},
+            {'id': 2, 'images': [
+                image_entry('http://elsewhere/img.jpg', b'x'),
+                image_entry(f'{server}/cms/media/images/new.jpg', b'new'),
+            ]},
+            {'id': 3, 'images': []},
+        ]
+
+        mapping, downloads, stats = exporter.plan_downloads(articles, server, self.images_dir)
+
+        assert mapping == {'1': ['new.jpg', 'cached.jpg'], '2': ['new.jpg']}
+        assert [target.name for _, target, _ in downloads] == ['new.jpg']
+        assert stats == {'cached': 1, 'skipped': 1}
+
+    def test_remove_orphans(self):
+        """Test: files not referenced by the mapping are deleted"""
+        for name in ('keep.jpg', 'old.jpg', 'older.png'):
+            (self.images_dir / name).write_bytes(b'x')
+
+        orphans = exporter.remove_orphans(self.images_dir, {'1': ['keep.jpg']})
+
+        assert orphans == ['old.jpg', 'older.png']
+        assert [p.name for p in self.images_dir.iterdir()] == ['keep.jpg']
+
+
+class TestExportRun:
+    """Tests for run_export() against a local HTTP server"""
+
+    @pytest.fixture(autouse=True)
+    def setup_server(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.server_root = self.test_dir / 'server'
+        self.export_dir = self.test_dir / 'export'
+        media_dir = self.server_root / 'cms' / 'media' / 'images'
+        media_dir.mkdir(parents=True)
+
+        FlakyHandler.failures = self.failures = {}
+        handler = partial(FlakyHandler, directory=str(self.server_root))
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        self.server_url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+        self.images = {}
+        for i in range(5):
+            data = f'image-{i}'.encode() * 100
+            (media_dir / f'img{i}.jpg').write_bytes(data)
+            self.images[f'img{i}.jpg'] = data
+
+        yield
+
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def write_export(self, articles):
+        """Legt die Export-JSON dort ab, wo der Client sie abruft"""
+        export_path = self.server_root / 'cms' / 'admin' / 'api' / 'export' / 'articles'
+        export_path.parent.mkdir(parents=True, exist_ok=True)
+        export_path.write_text(json.dumps({'count': len(articles), 'articles': articles}))
+
+    def article(self, article_id, *filenames):
+        return {'id': article_id, 'images': [
+            image_entry(f"{self.server_url}/cms/media/images/{name}", self.images[name])
+            for name in filenames
+        ]}
+
+    def test_run_export_downloads_and_is_incremental(self):
+        """Test: first run downloads everything, second run only changes"""
+        self.write_export([self.article(1, 'img0.jpg', 'img1.jpg'),
+                           self.article(2, 'img2.jpg', 'img3.jpg', 'img4.jpg')])
+
+        summary = exporter.run_export(self.server_url, self.export_dir, workers=4)
+
+        assert summary['downloaded'] == 5
+        assert summary['failed'] == 0
+        assert summary['bytes'] == sum(len(d) for d in self.images.values())
+        for name, data in self.images.items():
+            assert (self.export_dir / 'images' / name).read_bytes() == data
+        mapping = json.loads((self.export_dir / 'image_mapping.json').read_text())
+        assert mapping == {'1': ['img0.jpg', 'img1.jpg'],
+                           '2': ['img2.jpg', 'img3.jpg', 'img4.jpg']}
+        assert json.loads((self.export_dir / 'articles.json').read_text())['count'] == 2
+
+        # Zweiter Lauf: img4 entfernt, img0 lokal beschädigt
+        self.write_export([self.article(1, 'img0.jpg', 'img1.jpg'),
+                           self.article(2, 'img2.jpg', 'img3.jpg')])
+        (self.export_dir / 'images' / 'img0.jpg').write_bytes(b'corrupt')
+
+        summary = exporter.run_export(self.server_url, self.export_dir, workers=4)
+
+        assert summary['downloaded'] == 1
+        assert summary['cached'] == 3
+        assert summary['deleted'] == 1
+        assert not (self.export_dir / 'images' / 'img4.jpg').exists()
+        assert (self.export_dir / 'images' / 'img0.jpg').read_bytes() == self.images['img0.jpg']
+
+    def test_run_export_warns_on_hash_mismatch(self, capsys):
+        """Test: a hash mismatch is retried once, then the server's file is kept with a warning"""
+        article = self.article(1, 'img0.jpg')
+        article['images'][0]['sha256'] = '0' * 64
+        self.write_export([article])
+
+        summary = exporter.run_export(self.server_url, self.export_dir, workers=2)
+
+        assert summary['failed'] == 0
+        assert summary['downloaded'] == 1
+        assert summary['mismatched'] == 1
+        assert (self.export_dir / 'images' / 'img0.jpg').read_bytes() == self.images['img0.jpg']
+        assert [p.name for p in (self.export_dir / 'images').iterdir()] == ['img0.jpg']
+        assert capsys.readouterr().out.count('SHA-256 weicht') == 2
+
+    def test_run_export_retries_server_errors(self):
+        """Test: 503 answers from the server are retried with backoff instead of failing the image"""
+        self.write_export([self.article(1, 'img0.jpg', 'img1.jpg')])
+        self.failures['/cms/media/images/img0.jpg'] = 2
+        self.failures['/cms/admin/api/export/articles'] = 1
+
+        summary = exporter.run_export(self.server_url, self.export_dir, workers=2)
+
+        assert summary['failed'] == 0
+        assert summary['downloaded'] == 2
+        assert (self.export_dir / 'images' / 'img0.jpg').read_bytes() == self.images['img0.jpg']
+        assert self.failures == {'/cms/media/images/img0.jpg': 0, '/cms/admin/api/export/articles': 0}
+
+    def test_run_export_missing_image(self):
+        """Test: HTTP errors are counted as failed downloads"""
+        article = self.article(1, 'img0.jpg')
+        article['images'][0]['url'] = f"{self.server_url}/cms/media/images/missing.jpg"
+        self.write_export([article])
+
+        summary = exporter.run_export(self.server_url, self.export_dir, workers=2)
+
+        assert summary['failed'] == 1
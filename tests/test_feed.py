@@ -0,0 +1,190 @@
+"""
+Unit Tests for the Atom feeds (/reader/feed.xml, src/atom_feed.py, feed_state triggers)
+Tests the feed content, per-tag feeds, conditional GET and cache invalidation on publish/edit
+"""
+import shutil
+import sqlite3
+import sys
+import tempfile
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import web.app as web_app
+from web.app import app, APP_PREFIX, init_database
+from db_manager import DatabaseManager, add_query_observer, remove_query_observer, register_sql_functions
+from atom_feed import atom_date, render_entry
+
+ATOM = '{http://www.w3.org/2005/Atom}'
+
+
+@pytest.fixture
+def db():
+    test_dir = Path(tempfile.mkdtemp())
+    init_database(test_dir / 'articles.db')
+    yield DatabaseManager(str(test_dir / 'articles.db'))
+    shutil.rmtree(test_dir, ignore_errors=True)
+
+
+class TestAtomFeed:
+    """Tests for the helpers in atom_feed.py"""
+
+    def test_atom_date(self):
+        """Test: SQLite timestamps become RFC 3339 in UTC"""
+        assert atom_date('2026-01-16 08:30:00') == '2026-01-16T08:30:00Z'
+        assert atom_date('2026-01-16T10:30:00+02:00') == '2026-01-16T08:30:00Z'
+        assert atom_date('kein Datum') == '1970-01-01T00:00:00Z'
+
+    def test_entry_escapes_text_and_html(self):
+        """Test: title, tags and HTML content are escaped, control characters are dropped"""
+        entry = render_entry({'title': 'A & B <live>\x07', 'author': 'Redaktion', 'tags': ['"Zitat"'],
+                              'created_at': '2026-01-16 08:30:00', 'updated_at': None},
+                             'http://localhost/reader/article/1', '<p>Text &amp; mehr</p>')
+        element = ET.fromstring(f'<feed xmlns="http://www.w3.org/2005/Atom">{entry}</feed>')[0]
+
+        assert element.find(f'{ATOM}title').text == 'A & B <live>'
+        assert element.find(f'{ATOM}content').text == '<p>Text &amp; mehr</p>'
+        assert element.find(f'{ATOM}category').get('term') == '"Zitat"'
+        assert element.find(f'{ATOM}updated').text == '2026-01-16T08:30:00Z'
+
+
+class TestFeedState:
+    """Tests for the feed_state triggers"""
+
+    def test_version_changes_only_for_published(self, db):
+        """Test: publishing, editing and deleting published articles bump the version, drafts do not"""
+        versions = [db.get_feed_state()[0]]
+        draft = db.add_article("Entwurf", "Text")
+        db.update_article(draft, content="Geändert")
+        versions.append(db.get_feed_state()[0])
+        db.update_article(draft, published=True)
+        versions.append(db.get_feed_state()[0])
+        db.update_article(draft, title="Neuer Titel")
+        versions.append(db.get_feed_state()[0])
+        db.delete_article(draft)
+        versions.append(db.get_feed_state()[0])
+
+        assert versions == [0, 0, 1, 2, 3]
+
+    def test_feed_articles_newest_first_by_tag(self, db):
+        """Test: get_feed_articles returns the newest published articles, optionally per tag (also comma tags)"""
+        conn = register_sql_functions(sqlite3.connect(db.db_path))
+        conn.execute("INSERT INTO articles (title, content, tags, published, created_at) "
+                      "VALUES ('Alt', 'x', 'Politik, Wien', 1, '2026-01-01 10:00:00')")
+        conn.commit()
+        conn.close()
+        db.add_article("Neu", "x", published=True, tags=['politik'])
+        db.add_article("Entwurf", "x", tags=['Politik'])
+        db.add_article("Anderes", "x", published=True, tags=['Satire'])
+
+        assert [a['title'] for a in db.get_feed_articles(10, tag='POLITIK')] == ['Neu', 'Alt']
+        assert [a['title'] for a in db.get_feed_articles(2)] == ['Anderes', 'Neu']
+        assert db.get_feed_articles(10, tag='Wien')[0]['tags'] == ['Politik', 'Wien']
+
+
+class TestFeedEndpoint:
+    """Tests for /reader/feed.xml and /reader/tag/<tag>/feed.xml"""
+
+    @pytest.fixture(autouse=True)
+    def setup_app(self, db, monkeypatch):
+        self.db = db
+        self.first = db.add_article("Erster", "**Fett** & mehr", author="Anna", published=True, tags=['Politik'])
+        self.second = db.add_article("Zweiter", "Text", published=True, tags=['Satire'])
+        db.add_article("Entwurf", "Geheim", tags=['Politik'])
+        monkeypatch.setattr(web_app, 'db', db)
+        web_app.feed_cache.clear()
+        web_app.markdown_cache.clear()
+        self.client = app.test_client()
+        self.queries = []
+        add_query_observer(self.queries.append)
+        yield
+        remove_query_observer(self.queries.append)
+
+    def get_feed(self, path='/reader/feed.xml', **headers):
+        self.queries.clear()
+        return self.client.get(f"{APP_PREFIX}{path}", headers=headers)
+
+    def entries(self, response):
+        feed = ET.fromstring(response.data)
+        return {entry.find(f'{ATOM}title').text: entry for entry in feed.findall(f'{ATOM}entry')}
+
+    def test_site_feed(self):
+        """Test: the feed is valid Atom with published articles only, absolute links and rendered HTML"""
+        response = self.get_feed()
+        entries = self.entries(response)
+
+        assert response.status_code == 200
+        assert response.mimetype == 'application/atom+xml'
+        assert set(entries) == {'Erster', 'Zweiter'}
+        first = entries['Erster']
+        assert first.find(f'{ATOM}link').get('href') == f"http://localhost{APP_PREFIX}/reader/article/{self.first}"
+        assert '<strong>Fett</strong> &amp; mehr' in first.find(f'{ATOM}content').text
+        assert first.find(f'{ATOM}author/{ATOM}name').text == 'Anna'
+        assert response.cache_control.max_age == web_app.FEED_CACHE_SECONDS
+        assert response.headers['ETag'] and response.headers['Last-Modified']
+
+    def test_tag_feed(self):
+        """Test: the tag feed only has articles with that tag and links to the tag page"""
+        response = self.get_feed('/reader/tag/politik/feed.xml')
+        feed = ET.fromstring(response.data)
+
+        assert set(self.entries(response)) == {'Erster'}
+        assert feed.find(f'{ATOM}title').text.endswith('politik')
+        assert feed.find(f"{ATOM}link[@rel='self']").get('href').endswith('/reader/tag/politik/feed.xml')
+
+    def test_conditional_get(self):
+        """Test: a known ETag gets 304 without body after a single query"""
+        etag = self.get_feed().headers['ETag']
+        response = self.get_feed(**{'If-None-Match': etag})
+
+        assert response.status_code == 304
+        assert response.data == b''
+        assert len(self.queries) == 1
+        assert 'feed_state' in self.queries[0].sql
+
+    def test_cached_until_published_change(self):
+        """Test: repeated requests come from the cache, a draft edit keeps it, publishing rebuilds it"""
+        first = self.get_feed()
+        again = self.get_feed()
+        assert again.data == first.data
+        assert len(self.queries) == 1
+
+        draft = self.db.add_article("Noch ein Entwurf", "Text")
+        self.db.update_article(draft, content="Geändert")
+        assert self.get_feed(**{'If-None-Match': first.headers['ETag']}).status_code == 304
+
+        rendered_before = web_app.markdown_cache.misses
+        self.db.update_article(draft, published=True)
+        response = self.get_feed(**{'If-None-Match': first.headers['ETag']})
+
+        assert response.status_code == 200
+        assert response.headers['ETag'] != first.headers['ETag']
+        assert 'Noch ein Entwurf' in self.entries(response)
+        assert web_app.markdown_cache.misses == rendered_before + 1  # nur der neue Artikel
+
+    def test_edit_and_unpublish(self):
+        """Test: editing a published article updates its entry, unpublishing removes it"""
+        self.get_feed()
+        self.db.update_article(self.first, content="Korrigiert")
+        assert self.entries(self.get_feed())['Erster'].find(f'{ATOM}content').text == '<p>Korrigiert</p>'
+
+        self.db.update_article(self.second, published=False)
+        assert set(self.entries(self.get_feed())) == {'Erster'}
+
+    def test_empty_feed(self):
+        """Test: without published articles the feed is still valid Atom"""
+        response = self.get_feed('/reader/tag/Unbekannt/feed.xml')
+
+        assert response.status_code == 200
+        assert self.entries(response) == {}
+
+    def test_reader_pages_link_feed(self):
+        """Test: reader pages announce the feed, tag pages also the tag feed"""
+        html = self.client.get(f"{APP_PREFIX}/reader/tag/Politik").get_data(as_text=True)
+
+        assert f'href="{APP_PREFIX}/reader/feed.xml"' in html
+        assert f'href="{APP_PREFIX}/reader/tag/Politik/feed.xml"' in html
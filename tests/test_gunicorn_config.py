@@ -0,0 +1,67 @@
+"""
+Unit Tests for the production server configuration (gunicorn.conf.py)
+Tests defaults and overrides from environment variables
+"""
+import runpy
+from pathlib import Path
+
+import pytest
+
+CONFIG = Path(__file__).parent.parent / "gunicorn.conf.py"
+
+VARIABLES = ['HOST', 'PORT', 'GUNICORN_WORKERS', 'GUNICORN_THREADS', 'GUNICORN_PRELOAD', 'GUNICORN_KEEPALIVE',
+             'GUNICORN_MAX_REQUESTS', 'GUNICORN_MAX_REQUESTS_JITTER', 'GUNICORN_TIMEOUT',
+             'GUNICORN_GRACEFUL_TIMEOUT', 'GUNICORN_LOG_LEVEL']
+
+
+@pytest.fixture
+def load_config(monkeypatch):
+    for name in VARIABLES:
+        monkeypatch.delenv(name, raising=False)
+
+    def load(**env):
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        return runpy.run_path(str(CONFIG))
+
+    return load
+
+
+class TestGunicornConfig:
+    """Tests for gunicorn.conf.py"""
+
+    def test_defaults(self, load_config):
+        """Test: production defaults - preload, threads, keep-alive, recycling, no access log"""
+        config = load_config()
+
+        assert config['bind'] == '0.0.0.0:5001'
+        assert 1 <= config['workers'] <= 8
+        assert config['threads'] == 4
+        assert config['preload_app'] is True
+        assert config['keepalive'] == 5
+        assert config['max_requests'] == 1000
+        assert config['max_requests_jitter'] == 100
+        assert config['graceful_timeout'] == 30
+        assert config['accesslog'] is None
+
+    def test_environment_overrides(self, load_config):
+        """Test: every setting can be changed via environment variables"""
+        config = load_config(HOST='127.0.0.1', PORT='8000', GUNICORN_WORKERS='3', GUNICORN_THREADS='1',
+                             GUNICORN_PRELOAD='false', GUNICORN_KEEPALIVE='30', GUNICORN_MAX_REQUESTS='0',
+                             GUNICORN_TIMEOUT='120', GUNICORN_LOG_LEVEL='warning')
+
+        assert config['bind'] == '127.0.0.1:8000'
+        assert config['workers'] == 3
+        assert config['threads'] == 1
+        assert config['preload_app'] is False
+        assert config['keepalive'] == 30
+        assert config['max_requests'] == 0
+        assert config['timeout'] == 120
+        assert config['loglevel'] == 'warning'
+
+    def test_empty_values_use_defaults(self, load_config):
+        """Test: empty variables (e.g. "GUNICORN_WORKERS=" in compose) fall back to the default"""
+        config = load_config(GUNICORN_THREADS='', GUNICORN_PRELOAD=' ')
+
+        assert config['threads'] == 4
+        assert config['preload_app'] is True
@@ -149,6 +149,113 @@ class TestImageProcessor:
         )
         assert Path(output_square).exists()
     
+    # ===== resize_image() / create_thumbnail() Tests =====
+    
+    def test_resize_image_max_width_keeps_aspect_ratio(self):
+        """Test: resize_image with only max_width keeps aspect ratio"""
+        output_path = str(self.test_images_dir / 'resized.jpg')
+        
+        self.processor.resize_image(
+            str(self.test_images_dir / 'test_image.jpg'),
+            output_path=output_path,
+            max_width=400
+        )
+        
+        with Image.open(output_path) as img:
+            assert img.size == (400, 300)
+    
+    def test_resize_image_max_height(self):
+        """Test: resize_image with only max_height"""
+        output_path = str(self.test_images_dir / 'resized.jpg')
+        
+        self.processor.resize_image(
+            str(self.test_images_dir / 'test_image.jpg'),
+            output_path=output_path,
+            max_height=150
+        )
+        
+        with Image.open(output_path) as img:
+            assert img.size == (200, 150)
+    
+    def test_resize_image_no_upscale(self):
+        """Test: resize_image never enlarges small images"""
+        output_path = str(self.test_images_dir / 'resized.jpg')
+        
+        self.processor.resize_image(
+            str(self.test_images_dir / 'test_image.jpg'),
+            output_path=output_path,
+            max_width=2000,
+            max_height=2000
+        )
+        
+        with Image.open(output_path) as img:
+            assert img.size == (800, 600)
+    
+    def test_resize_large_jpeg_uses_draft_mode(self):
+        """Test: large JPEG is decoded at reduced scale and still hits exact target size"""
+        self.create_test_image('large.jpg', (4000, 3000), 'RGB')
+        large_path = str(self.test_images_dir / 'large.jpg')
+        
+        result = self.processor._open_downscaled(large_path, 300, 300)
+        
+        assert result.size == (300, 225)
+        
+        # Draft dekodiert mit der nächsten Zweierpotenz, die >= Ziel bleibt (1/8)
+        with Image.open(large_path) as img:
+            img.draft(None, (300, 225))
+            assert img.size == (500, 375)
+    
+    def test_create_thumbnail_default_size(self):
+        """Test: create_thumbnail fits into 300x300 box"""
+        output_path = str(self.test_images_dir / 'thumb.jpg')
+        
+        self.processor.create_thumbnail(str(self.test_images_dir / 'test_image.jpg'), output_path)
+        
+        with Image.open(output_path) as img:
+            assert img.size == (300, 225)
+    
+    def test_create_thumbnail_png_with_alpha(self):
+        """Test: create_thumbnail on RGBA PNG keeps alpha channel"""
+        output_path = str(self.test_images_dir / 'thumb.png')
+        
+        self.processor.create_thumbnail(
+            str(self.test_images_dir / 'test_logo.png'), output_path, size=(50, 50)
+        )
+        
+        with Image.open(output_path) as img:
+            assert img.size == (50, 50)
+            assert img.mode == 'RGBA'
+    
+    # ===== read_metadata() Tests =====
+    
+    def test_read_metadata_jpeg(self):
+        """Test: read_metadata returns dimensions, size, mime type and hash"""
+        import hashlib
+        image_path = self.test_images_dir / 'test_image.jpg'
+        
+        metadata = ImageProcessor.read_metadata(str(image_path))
+        
+        assert metadata['width'] == 800
+        assert metadata['height'] == 600
+        assert metadata['file_size'] == image_path.stat().st_size
+        assert metadata['mime_type'] == 'image/jpeg'
+        assert metadata['sha256'] == hashlib.sha256(image_path.read_bytes()).hexdigest()
+    
+    def test_read_metadata_png(self):
+        """Test: read_metadata detects PNG mime type"""
+        metadata = ImageProcessor.read_metadata(str(self.test_images_dir / 'test_logo.png'))
+        
+        assert metadata['mime_type'] == 'image/png'
+        assert (metadata['width'], metadata['height']) == (200, 200)
+    
+    def test_read_metadata_invalid_file_raises(self):
+        """Test: read_metadata on a non-image file raises error"""
+        broken = self.test_images_dir / 'broken.jpg'
+        broken.write_bytes(b'not an image')
+        
+        with pytest.raises(Exception):
+            ImageProcessor.read_metadata(str(broken))
+    
     # ===== Edge Cases & Error Handling =====
     
     def test_add_watermark_nonexistent_image(self):
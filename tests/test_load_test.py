@@ -0,0 +1,140 @@
+"""
+Unit Tests for the load-testing harness (benchmarks/load_test.py)
+Tests traffic mix parsing, percentiles, per-route summaries, concurrent Markdown rendering and a short run under Gunicorn
+"""
+import random
+import shutil
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "benchmarks"))
+
+import web.app as web_app
+from corpus import build_database, generate_articles, markdown_article
+from load_test import build_routes, free_port, parse_mix, percentile, run_clients, start_server, summarize
+
+
+class TestParseMix:
+    """Tests for parse_mix"""
+
+    def test_weights(self):
+        """Test: weights are parsed, a route without weight counts 1"""
+        assert parse_mix('reader_index=25, search=2.5,tag') == {'reader_index': 25.0, 'search': 2.5, 'tag': 1.0}
+
+    @pytest.mark.parametrize('mix', ['search=viel', 'search=-1', 'search=0'])
+    def test_invalid(self, mix):
+        """Test: non-numeric, negative and all-zero weights are rejected"""
+        with pytest.raises(ValueError):
+            parse_mix(mix)
+
+
+class TestSummary:
+    """Tests for percentile and summarize"""
+
+    def test_nearest_rank_percentile(self):
+        """Test: percentiles use nearest rank, an empty list gives None"""
+        values = list(range(1, 101))
+        assert percentile(values, 50) == 50
+        assert percentile(values, 95) == 95
+        assert percentile(values, 99) == 99
+        assert percentile([7], 99) == 7
+        assert percentile([], 50) is None
+
+    def test_per_route_and_total(self):
+        """Test: requests per second, error rate and status breakdown per route and in total"""
+        samples = {
+            'search': [(0.010, 200), (0.020, 200), (0.030, 500), (0.040, 0)],
+            'tag': [(0.005, 200)],
+        }
+
+        summary = summarize(samples, elapsed=2.0)
+
+        assert summary['search']['requests'] == 4
+        assert summary['search']['rps'] == 2.0
+        assert summary['search']['errors'] == 2
+        assert summary['search']['error_rate'] == 0.5
+        assert summary['search']['statuses'] == {'0': 1, '200': 2, '500': 1}
+        assert summary['search']['p50_ms'] == 20.0
+        assert summary['search']['p99_ms'] == 40.0
+        assert summary['total']['requests'] == 5
+        assert summary['total']['errors'] == 2
+
+
+class TestRoutes:
+    """Tests for the generated traffic"""
+
+    def test_requests_use_corpus(self):
+        """Test: articles and tags are published ones, import bodies have unique titles"""
+        articles = generate_articles(30, seed=3)
+        routes = build_routes(articles, seed=3)
+        rng = random.Random(1)
+
+        method, path, _ = routes['reader_article'](rng)
+        article_id = int(path.rsplit('/', 1)[1])
+        first = routes['import'](rng)[2]
+        second = routes['import'](rng)[2]
+
+        assert method == 'GET'
+        assert articles[article_id - 1]['published']
+        assert routes['import'](rng)[0] == 'POST'
+        assert first != second
+
+
+class TestConcurrentRendering:
+    """Tests for render_markdown with concurrent requests (Gunicorn --threads)"""
+
+    def test_parallel_rendering_matches_sequential(self):
+        """Test: rendering from several threads gives the same HTML as one after another"""
+        rng = random.Random(5)
+        texts = [markdown_article(rng) for _ in range(40)]
+        expected = [web_app.render_markdown(text) for text in texts]
+        results = {}
+        errors = []
+
+        def render(number):
+            try:
+                results[number] = [web_app.render_markdown(text) for text in texts]
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=render, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert all(result == expected for result in results.values())
+
+
+class TestGunicornRun:
+    """Tests for a short load test against Gunicorn"""
+
+    def test_short_run(self):
+        """Test: the app starts on a seeded temporary DB and serves the traffic mix without errors"""
+        pytest.importorskip('gunicorn')
+        workdir = Path(tempfile.mkdtemp())
+        articles = generate_articles(20, seed=1)
+        db_path, _ = build_database(workdir, articles, images=1, seed=1)
+        log_dir = workdir / 'logs'
+        log_dir.mkdir()
+        port = free_port()
+        server = start_server(port, db_path, log_dir, workers=1, threads=2, prefix='')
+        try:
+            samples, elapsed = run_clients(port, '', build_routes(articles, seed=1),
+                                           parse_mix('reader_index=1,reader_article=1,search=1,tag=1'),
+                                           clients=2, duration=1.0, warmup=0.0, seed=1)
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+            shutil.rmtree(workdir, ignore_errors=True)
+
+        summary = summarize(samples, elapsed)
+        assert summary['total']['requests'] > 0
+        assert summary['total']['errors'] == 0
@@ -0,0 +1,170 @@
+"""
+Unit Tests for queue-based logging (src/log_queue.py)
+Tests background writing, bounded queue with drop counting, flush on stop and the app's loggers
+"""
+import logging
+import sys
+import threading
+import time
+import uuid
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import web.app as web_app
+from log_queue import QueueLogging
+
+
+class ListHandler(logging.Handler):
+    """Sammelt formatierte Einträge und den schreibenden Thread"""
+
+    def __init__(self, block: threading.Event = None):
+        super().__init__()
+        self.lines = []
+        self.threads = set()
+        self.block = block
+        self.setFormatter(logging.Formatter('%(levelname)s [%(remote_addr)s] %(message)s'))
+
+    def emit(self, record):
+        if self.block is not None:
+            self.block.wait(5)
+        self.threads.add(threading.current_thread().name)
+        self.lines.append(self.format(record))
+
+
+@pytest.fixture
+def make_logger():
+    created = []
+
+    def factory(handler, queue_size=100):
+        logger = logging.getLogger(f"fakedaily.test.{uuid.uuid4().hex}")
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        logger.addHandler(handler)
+        logging_queue = QueueLogging([logger], queue_size=queue_size)
+        created.append(logging_queue)
+        return logger, logging_queue
+
+    yield factory
+    for logging_queue in created:
+        logging_queue.stop()
+
+
+class TestQueueLogging:
+    """Tests for QueueLogging"""
+
+    def test_written_in_background_with_original_format(self, make_logger):
+        """Test: records keep message and extras, the original handler runs in another thread"""
+        handler = ListHandler()
+        logger, logging_queue = make_logger(handler)
+        logging_queue.start()
+
+        logger.info("Artikel %s gespeichert", 42, extra={'remote_addr': '10.0.0.0'})
+        logging_queue.stop()
+
+        assert handler.lines == ['INFO [10.0.0.0] Artikel 42 gespeichert']
+        assert threading.current_thread().name not in handler.threads
+        assert logger.handlers != [handler]
+
+    def test_slow_handler_does_not_block_caller(self, make_logger):
+        """Test: logging returns immediately while the handler is stalled (e.g. rotation)"""
+        stalled = threading.Event()
+        handler = ListHandler(block=stalled)
+        logger, logging_queue = make_logger(handler)
+        logging_queue.start()
+
+        start = time.perf_counter()
+        for i in range(20):
+            logger.info("Eintrag %d", i, extra={'remote_addr': 'unknown'})
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.5
+        assert handler.lines == []
+        stalled.set()
+        logging_queue.stop()
+        assert len(handler.lines) == 20
+
+    def test_full_queue_drops_and_reports(self, make_logger):
+        """Test: a full queue drops records, counts them and reports the loss once"""
+        stalled = threading.Event()
+        handler = ListHandler(block=stalled)
+        logger, logging_queue = make_logger(handler, queue_size=5)
+        logging_queue.start()
+
+        logger.info("erster", extra={'remote_addr': 'unknown'})
+        time.sleep(0.1)  # Listener hängt im ersten Eintrag, die Queue ist leer
+        for i in range(10):
+            logger.info("Eintrag %d", i, extra={'remote_addr': 'unknown'})
+        stalled.set()
+        logging_queue.stop()
+
+        assert logging_queue.dropped == 5
+        assert handler.lines.count('WARNING [unknown] 5 Log-Einträge verworfen (Log-Queue voll)') == 1
+        assert len(handler.lines) == 1 + 5 + 1
+
+    def test_exception_text_is_kept(self, make_logger):
+        """Test: tracebacks are rendered in the calling thread and written once"""
+        handler = ListHandler()
+        logger, logging_queue = make_logger(handler)
+        logging_queue.start()
+
+        try:
+            raise ValueError("kaputt")
+        except ValueError:
+            logger.exception("Fehler", extra={'remote_addr': 'unknown'})
+        logging_queue.stop()
+
+        [line] = handler.lines
+        assert line.startswith('ERROR [unknown] Fehler\nTraceback')
+        assert line.count('ValueError: kaputt') == 1
+
+    def test_restart_uses_new_queue(self, make_logger):
+        """Test: after restart (as in a forked worker) records are written again"""
+        handler = ListHandler()
+        logger, logging_queue = make_logger(handler)
+        logging_queue.start()
+        old_queue = logging_queue.queue
+
+        logging_queue.restart()
+        logger.info("nach fork", extra={'remote_addr': 'unknown'})
+        logging_queue.stop()
+
+        assert logging_queue.queue is not old_queue
+        assert handler.lines == ['INFO [unknown] nach fork']
+
+
+def active_queue(name):
+    """QueueLogging, das die Einträge eines Loggers schreibt"""
+    [queue_handler] = logging.getLogger(name).handlers
+    return queue_handler.owner
+
+
+class TestAppLoggers:
+    """Tests for the queue setup of the app's loggers"""
+
+    @pytest.fixture(autouse=True)
+    def started_app(self):
+        web_app.create_app()
+
+    def test_app_loggers_only_enqueue(self):
+        """Test: security, app and request loggers hand records to the queue"""
+        for name in ('fakedaily.security', 'fakedaily.app', 'fakedaily.requests'):
+            handlers = logging.getLogger(name).handlers
+            assert [type(handler).__name__ for handler in handlers] == ['_RoutingQueueHandler']
+            assert active_queue(name).routes[name]
+
+    def test_security_event_keeps_anonymized_ip(self, monkeypatch):
+        """Test: log_security_event still writes the anonymized IP"""
+        handler = ListHandler()
+        monkeypatch.setitem(active_queue('fakedaily.security').routes, 'fakedaily.security', [handler])
+
+        with web_app.app.test_request_context(environ_base={'REMOTE_ADDR': '192.168.1.100'}):
+            web_app.log_security_event("Artikel gelöscht: ID=7", level=logging.WARNING)
+
+        deadline = time.monotonic() + 5
+        while not handler.lines and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert handler.lines == ['WARNING [192.168.1.0] Artikel gelöscht: ID=7']
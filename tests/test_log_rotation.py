@@ -0,0 +1,83 @@
+"""
+Unit Tests for log rotation with several processes on one file (src/log_rotation.py)
+Tests that two handlers on a shared file rotate it exactly once without losing entries
+"""
+import logging
+import shutil
+import tempfile
+import sys
+import time
+from logging.handlers import TimedRotatingFileHandler
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from log_rotation import SharedTimedRotatingFileHandler
+
+
+def record(message):
+    return logging.makeLogRecord({'msg': message, 'levelno': logging.INFO, 'levelname': 'INFO'})
+
+
+class TestSharedRotation:
+    """Two handlers (like two Gunicorn workers) on the same security.log"""
+
+    @pytest.fixture(autouse=True)
+    def setup_dir(self):
+        self.log_dir = Path(tempfile.mkdtemp())
+        self.log_file = self.log_dir / 'security.log'
+        self.handlers = []
+        yield
+        for handler in self.handlers:
+            handler.close()
+        shutil.rmtree(self.log_dir, ignore_errors=True)
+
+    def make_handlers(self, handler_class):
+        for _ in range(2):
+            handler = handler_class(self.log_file, when='midnight', backupCount=30, encoding='utf-8')
+            handler.setFormatter(logging.Formatter('%(message)s'))
+            self.handlers.append(handler)
+        return self.handlers
+
+    def midnight(self, first, second):
+        """Schreibt vor und nach Mitternacht mit beiden Handlern, liefert die rotierten Dateien"""
+        first.emit(record('vorher 1'))
+        second.emit(record('vorher 2'))
+        for handler in (first, second):
+            handler.rolloverAt = int(time.time()) - 1
+        first.emit(record('nachher 1'))
+        second.emit(record('nachher 2'))
+        return sorted(path for path in self.log_dir.iterdir() if path.name.startswith('security.log.')
+                      and not path.name.endswith('.lock'))
+
+    def test_two_handlers_rotate_once(self):
+        """Test: the first handler rotates, the second only reopens; no entry is lost"""
+        first, second = self.make_handlers(SharedTimedRotatingFileHandler)
+        rotated = self.midnight(first, second)
+
+        assert len(rotated) == 1
+        assert rotated[0].read_text(encoding='utf-8').splitlines() == ['vorher 1', 'vorher 2']
+        assert self.log_file.read_text(encoding='utf-8').splitlines() == ['nachher 1', 'nachher 2']
+        assert second.rolloverAt > time.time()
+
+    def test_plain_handler_loses_previous_day(self):
+        """Test: with TimedRotatingFileHandler the second rollover deletes the day the first one rotated"""
+        first, second = self.make_handlers(TimedRotatingFileHandler)
+        rotated = self.midnight(first, second)
+
+        assert 'vorher' not in rotated[0].read_text(encoding='utf-8')
+
+    def test_next_day_rotates_again(self):
+        """Test: after reopening, the second handler rotates normally on the following day"""
+        first, second = self.make_handlers(SharedTimedRotatingFileHandler)
+        self.midnight(first, second)
+        first.close()
+
+        second.rolloverAt = int(time.time()) - 1
+        second.rolloverAt -= second.interval  # Vortag bereits rotiert -> Datei des Tages davor
+        second.emit(record('übermorgen'))
+
+        assert len([path for path in self.log_dir.iterdir() if not path.name.endswith('.lock')]) == 3
+        assert self.log_file.read_text(encoding='utf-8').splitlines() == ['übermorgen']
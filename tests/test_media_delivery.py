@@ -0,0 +1,142 @@
+"""
+Unit Tests for image delivery (send_media in web/app.py)
+Tests the Flask, X-Accel-Redirect and X-Sendfile modes, path checks and cache headers (long only for versioned URLs)
+"""
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import web.app as web_app
+from web.app import app, APP_PREFIX
+
+YEAR = 365 * 24 * 3600
+IMAGE = '7_20260101_120000_foto.jpg'
+
+
+class TestMediaDelivery:
+    """Tests for /media/images and /media/thumbs in all delivery modes"""
+
+    @pytest.fixture(autouse=True)
+    def setup_media(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.upload_dir = self.test_dir / 'images'
+        self.thumb_dir = self.test_dir / 'thumbs'
+        self.upload_dir.mkdir()
+        Image.new('RGB', (800, 600), color='blue').save(self.upload_dir / '7_20260101_120000_foto.jpg')
+
+        web_app.create_app()
+        old = {key: app.config[key] for key in ('UPLOAD_FOLDER', 'THUMBNAIL_FOLDER', 'MEDIA_DELIVERY',
+                                                'MEDIA_ACCEL_PREFIX', 'MEDIA_CACHE_SECONDS',
+                                                'MEDIA_SHORT_CACHE_SECONDS', 'USE_X_SENDFILE')}
+        app.config['UPLOAD_FOLDER'] = self.upload_dir
+        app.config['THUMBNAIL_FOLDER'] = self.thumb_dir
+        self.client = app.test_client()
+        yield
+        app.config.update(old)
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def use_mode(self, mode):
+        app.config['MEDIA_DELIVERY'] = mode
+        web_app._start_media()
+
+    def test_flask_mode_sends_file_with_cache_headers(self):
+        """Test: the default mode sends the bytes itself; a versioned URL gets a one-year immutable Cache-Control"""
+        self.use_mode('flask')
+        response = self.client.get(f"{APP_PREFIX}/media/images/{IMAGE}?v=0123abcd")
+
+        assert response.status_code == 200
+        assert response.data == (self.upload_dir / IMAGE).read_bytes()
+        assert response.cache_control.max_age == YEAR
+        assert response.cache_control.public is True
+        assert response.cache_control.immutable is True
+        assert 'X-Accel-Redirect' not in response.headers
+
+    @pytest.mark.parametrize('mode', ['flask', 'x-accel'])
+    def test_unversioned_short_cache(self, mode):
+        """Test: images without ?v= are only cached briefly and never immutable"""
+        self.use_mode(mode)
+        response = self.client.get(f"{APP_PREFIX}/media/images/{IMAGE}")
+
+        assert response.cache_control.max_age == app.config['MEDIA_SHORT_CACHE_SECONDS'] == 300
+        assert response.cache_control.immutable is False
+
+    def test_thumbnail_and_fallback_short_cache(self):
+        """Test: thumbnails and the original served when no thumbnail can be made are not immutable"""
+        self.use_mode('flask')
+        thumbnail = self.client.get(f"{APP_PREFIX}/media/thumbs/300/{IMAGE}?v=0123abcd")
+        (self.upload_dir / 'kaputt.jpg').write_bytes(b'kein Bild')
+        fallback = self.client.get(f"{APP_PREFIX}/media/thumbs/300/kaputt.jpg")
+
+        for response in (thumbnail, fallback):
+            assert response.status_code == 200
+            assert response.cache_control.max_age == 300
+            assert response.cache_control.immutable is False
+        assert fallback.data == b'kein Bild'
+
+    def test_image_url_is_versioned(self):
+        """Test: image_url adds the start of the stored SHA-256, without hash it stays plain"""
+        with app.test_request_context():
+            assert web_app.image_url({'filename': IMAGE, 'sha256': 'ab' * 32}) == \
+                f"{APP_PREFIX}/media/images/{IMAGE}?v={'ab' * 8}"
+            assert web_app.image_url({'filename': IMAGE, 'sha256': None}) == f"{APP_PREFIX}/media/images/{IMAGE}"
+
+    def test_x_accel_image(self):
+        """Test: x-accel answers with an empty body and the internal location, cache headers stay"""
+        self.use_mode('x-accel')
+        response = self.client.get(f"{APP_PREFIX}/media/images/{IMAGE}?v=0123abcd")
+
+        assert response.status_code == 200
+        assert response.data == b''
+        assert response.headers['X-Accel-Redirect'] == '/_media/images/7_20260101_120000_foto.jpg'
+        assert response.mimetype == 'image/jpeg'
+        assert response.cache_control.max_age == YEAR
+        assert response.cache_control.immutable is True
+
+    def test_x_accel_thumbnail_is_generated_first(self):
+        """Test: the thumbnail is created by the app, then handed to nginx under thumbs/<size>/"""
+        self.use_mode('x-accel')
+        app.config['MEDIA_ACCEL_PREFIX'] = '/intern/media'
+        response = self.client.get(f"{APP_PREFIX}/media/thumbs/300/7_20260101_120000_foto.jpg")
+
+        assert response.status_code == 200
+        assert response.headers['X-Accel-Redirect'] == '/intern/media/thumbs/300/7_20260101_120000_foto.jpg'
+        assert (self.thumb_dir / '300' / '7_20260101_120000_foto.jpg').exists()
+
+    @pytest.mark.parametrize('filename', ['fehlt.jpg', '../thumbs/x.jpg', '..%2F..%2Fetc%2Fpasswd'])
+    def test_x_accel_checks_path(self, filename):
+        """Test: missing files and paths outside the folder are 404 before anything is handed to nginx"""
+        self.use_mode('x-accel')
+        response = self.client.get(f"{APP_PREFIX}/media/images/{filename}")
+
+        assert response.status_code == 404
+        assert 'X-Accel-Redirect' not in response.headers
+
+    def test_x_sendfile(self):
+        """Test: x-sendfile passes the absolute path to the web server instead of the bytes"""
+        self.use_mode('x-sendfile')
+        response = self.client.get(f"{APP_PREFIX}/media/images/{IMAGE}?v=0123abcd")
+
+        assert response.status_code == 200
+        assert response.headers['X-Sendfile'] == str(self.upload_dir / '7_20260101_120000_foto.jpg')
+        assert response.cache_control.immutable is True
+
+    def test_cache_disabled(self):
+        """Test: MEDIA_CACHE_SECONDS=0 drops the long-lived cache headers"""
+        self.use_mode('x-accel')
+        app.config['MEDIA_CACHE_SECONDS'] = 0
+        response = self.client.get(f"{APP_PREFIX}/media/images/{IMAGE}?v=0123abcd")
+
+        assert response.cache_control.immutable is False
+        assert not response.cache_control.max_age
+
+    def test_unknown_mode_rejected(self):
+        """Test: an unknown MEDIA_DELIVERY value fails at startup"""
+        app.config['MEDIA_DELIVERY'] = 'nginx'
+        with pytest.raises(ValueError, match='MEDIA_DELIVERY'):
+            web_app._start_media()
@@ -0,0 +1,206 @@
+"""
+Unit Tests for request metrics (src/metrics.py, /metrics)
+Tests the Prometheus text format, the DatabaseManager query observer and per-request metrics
+"""
+import re
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import web.app as web_app
+from web.app import app, APP_PREFIX, init_database
+from db_manager import DatabaseManager, add_query_observer, remove_query_observer
+from metrics import MetricsRegistry
+from whatsapp_digest import TextCache
+
+
+def sample(text, name, **labels):
+    """Wert einer Zeitreihe aus der Textausgabe (None wenn nicht vorhanden)"""
+    label_text = ','.join(f'{key}="{value}"' for key, value in labels.items())
+    pattern = re.escape(f"{name}{{{label_text}}}" if labels else name) + r' (\S+)$'
+    match = re.search(pattern, text, re.MULTILINE)
+    return float(match.group(1)) if match else None
+
+
+@pytest.fixture
+def db():
+    test_dir = Path(tempfile.mkdtemp())
+    init_database(test_dir / 'articles.db')
+    manager = DatabaseManager(str(test_dir / 'articles.db'))
+    for i in range(3):
+        manager.add_article(f"Artikel {i}", f"**Fett** und *kursiv* Nummer {i}", published=True)
+    yield manager
+    shutil.rmtree(test_dir, ignore_errors=True)
+
+
+class TestMetricsRegistry:
+    """Tests for MetricsRegistry rendering"""
+
+    def test_counter_and_gauge_callback(self):
+        """Test: counters with labels and callback gauges in exposition format"""
+        registry = MetricsRegistry()
+        counter = registry.counter('requests_total', 'Anzahl', ['path'])
+        registry.gauge('ratio', 'Quote', ['cache'], callback=lambda: {('a',): 0.25})
+        counter.inc(path='/x')
+        counter.inc(2, path='/x')
+        counter.inc(path='a"b\\c')
+
+        text = registry.render()
+
+        assert '# HELP requests_total Anzahl\n# TYPE requests_total counter\n' in text
+        assert 'requests_total{path="/x"} 3\n' in text
+        assert 'requests_total{path="a\\"b\\\\c"} 1\n' in text
+        assert '# TYPE ratio gauge\nratio{cache="a"} 0.25\n' in text
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test: buckets count cumulatively, +Inf, _sum and _count match"""
+        registry = MetricsRegistry()
+        histogram = registry.histogram('latency_seconds', 'Dauer', ['route'], buckets=(0.1, 1))
+        for value in (0.05, 0.5, 0.5, 3):
+            histogram.observe(value, route='x')
+
+        text = registry.render()
+
+        assert sample(text, 'latency_seconds_bucket', route='x', le='0.1') == 1
+        assert sample(text, 'latency_seconds_bucket', route='x', le='1') == 3
+        assert sample(text, 'latency_seconds_bucket', route='x', le='+Inf') == 4
+        assert sample(text, 'latency_seconds_sum', route='x') == 4.05
+        assert sample(text, 'latency_seconds_count', route='x') == 4
+
+    def test_label_and_name_errors(self):
+        """Test: wrong label names and duplicate metric names are rejected"""
+        registry = MetricsRegistry()
+        counter = registry.counter('a_total', 'A', ['x'])
+
+        with pytest.raises(ValueError):
+            counter.inc(y='1')
+        with pytest.raises(ValueError):
+            registry.counter('a_total', 'A')
+
+
+class TestQueryObserver:
+    """Tests for DatabaseManager query observers"""
+
+    @pytest.fixture
+    def queries(self):
+        seen = []
+
+        def observer(event):
+            seen.append((' '.join(event.sql.split()), event.parameters))
+            assert event.seconds >= 0
+
+        add_query_observer(observer)
+        yield seen
+        remove_query_observer(observer)
+
+    def test_one_report_per_statement(self, db, queries):
+        """Test: every statement is reported once, however its rows are read"""
+        db.get_all_articles()
+        db.get_article(1)
+        conn = db.get_connection()
+        list(conn.execute("SELECT id FROM articles"))
+        conn.execute("SELECT id FROM articles").fetchone()
+        conn.executemany("UPDATE articles SET author = ? WHERE id = ?", [('A', 1), ('B', 2)])
+        conn.close()
+
+        statements = [sql for sql, _ in queries]
+        assert statements[0].startswith('SELECT * FROM articles')
+        assert statements[1:] == [
+            'SELECT * FROM articles WHERE id = ?',
+            'SELECT id FROM articles',
+            'SELECT id FROM articles',
+            'UPDATE articles SET author = ? WHERE id = ?',
+        ]
+        assert queries[1][1] == (1,)
+        assert queries[-1][1] is None
+
+    def test_removed_observer_is_not_called(self, db, queries):
+        """Test: a removed observer gets no further reports"""
+        calls = []
+        observer = lambda event: calls.append(event.sql)
+        add_query_observer(observer)
+        db.get_article(1)
+        remove_query_observer(observer)
+        db.get_article(1)
+
+        assert len(calls) == 1
+        assert len(queries) == 2
+
+
+class TestMetricsEndpoint:
+    """Tests for request metrics and /metrics"""
+
+    @pytest.fixture(autouse=True)
+    def setup_app(self, db, monkeypatch):
+        self.db = db
+        monkeypatch.setattr(web_app, 'db', db)
+        monkeypatch.setattr(web_app, 'whatsapp_cache', TextCache())
+        self.client = app.test_client()
+
+    def metrics(self):
+        response = self.client.get('/metrics')
+        assert response.status_code == 200
+        assert response.headers['Content-Type'] == 'text/plain; version=0.0.4; charset=utf-8'
+        return response.get_data(as_text=True)
+
+    def test_request_latency_and_db_queries(self):
+        """Test: latency, status and DB queries of a request appear per endpoint"""
+        before = self.metrics()
+        count_before = sample(before, 'fakedaily_db_queries_per_request_count', endpoint='reader_index') or 0
+        sum_before = sample(before, 'fakedaily_db_queries_per_request_sum', endpoint='reader_index') or 0
+        requests_before = sample(before, 'fakedaily_http_requests_total',
+                                 method='GET', endpoint='reader_index', status='200') or 0
+
+        assert self.client.get(f"{APP_PREFIX}/reader/").status_code == 200
+        text = self.metrics()
+
+        assert sample(text, 'fakedaily_http_requests_total',
+                      method='GET', endpoint='reader_index', status='200') == requests_before + 1
+        assert sample(text, 'fakedaily_http_request_duration_seconds_count',
+                      method='GET', endpoint='reader_index') >= 1
+        assert sample(text, 'fakedaily_db_queries_per_request_count', endpoint='reader_index') == count_before + 1
+        assert sample(text, 'fakedaily_db_queries_per_request_sum', endpoint='reader_index') == sum_before + 1
+        assert sample(text, 'fakedaily_markdown_seconds_per_request_count', endpoint='reader_index') >= 1
+
+    def test_unmatched_routes_share_one_label(self):
+        """Test: 404s for unknown paths do not create one time series per path"""
+        # Fehlerseiten sind WSGI-Iteratoren: gemessen wird beim Schließen
+        self.client.get('/gibt/es/nicht').close()
+        self.client.get('/auch/nicht').close()
+
+        text = self.metrics()
+
+        assert sample(text, 'fakedaily_http_requests_total', method='GET', endpoint='unmatched', status='404') >= 2
+        assert '/gibt/es/nicht' not in text
+
+    def test_streamed_response_is_recorded_on_close(self):
+        """Test: streamed responses are measured when the body has been sent"""
+        url = f"{APP_PREFIX}/admin/api/export/whatsapp?ids=1,2,3"
+        labels = dict(method='GET', endpoint='export_whatsapp_digest', status='200')
+        before = sample(self.metrics(), 'fakedaily_http_requests_total', **labels) or 0
+
+        response = self.client.get(url)
+        response.get_data()
+        assert (sample(self.metrics(), 'fakedaily_http_requests_total', **labels) or 0) == before
+        response.close()
+
+        text = self.metrics()
+        assert sample(text, 'fakedaily_http_requests_total', **labels) == before + 1
+
+    def test_cache_hit_ratio(self):
+        """Test: WhatsApp cache hits and misses are exposed with their ratio"""
+        url = f"{APP_PREFIX}/admin/api/export/whatsapp?ids=1,2"
+        self.client.get(url).close()
+        self.client.get(url).close()
+
+        text = self.metrics()
+
+        assert sample(text, 'fakedaily_cache_hits_total', cache='whatsapp') == 2
+        assert sample(text, 'fakedaily_cache_misses_total', cache='whatsapp') == 2
+        assert sample(text, 'fakedaily_cache_hit_ratio', cache='whatsapp') == 0.5
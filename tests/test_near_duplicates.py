@@ -0,0 +1,250 @@
+"""
+Unit Tests for near-duplicate clustering (src/near_duplicates.py, scripts/find_duplicates.py)
+Tests sketches, LSH candidates against brute force, recall at the threshold, merge targets and the CLI report
+"""
+import json
+import random
+import shutil
+import sys
+import tempfile
+from difflib import SequenceMatcher
+from itertools import combinations
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import find_duplicates
+from db_manager import DatabaseManager
+from near_duplicates import (CONTENT_BINS, EXPECTED_RECALL, TITLE_BINS, content_shingles,
+                             find_duplicate_clusters, minhash_sketch, sketch_similarity, title_shingles)
+from similarity import CONTENT_PREFIX, CONTENT_THRESHOLD, are_similar_articles
+
+WORDS = ['Kickl', 'Bundeskanzler', 'Wien', 'Reform', 'Budget', 'Pensionen', 'Steuer', 'Wahl',
+         'Brüssel', 'Kommission', 'Trump', 'Grönland', 'Zölle', 'Börse', 'Inflation', 'Gemeinde',
+         'Bürgermeister', 'Landtag', 'Steiermark', 'Chefredakteur', 'Satire', 'Umfrage']
+
+
+def make_corpus(seed=1, size=300):
+    """Zufällige Artikel, jeder zehnte ist eine Variante eines früheren"""
+    rng = random.Random(seed)
+
+    def text(count):
+        return ' '.join(f"{rng.choice(WORDS)}{rng.randint(1, 999)}" for _ in range(count))
+
+    articles = []
+    for article_id in range(1, size + 1):
+        if articles and article_id % 10 == 0:
+            original = rng.choice(articles)
+            variant = {'title': original['title'].replace(' ', ' 🎭 ', 1),
+                       'content': original['content'] + ' Nachtrag.'}
+            if rng.random() < 0.5:
+                variant['title'] = text(6)  # nur der Inhalt ist gleich
+        else:
+            variant = {'title': text(6), 'content': text(80)}
+        articles.append({'id': article_id, 'published': 0, 'created_at': None, **variant})
+    return articles
+
+
+def at_threshold_pairs(seed=1, count=100):
+    """Paare, deren Inhalt gerade noch als Duplikat gilt (ratio() 0,90-0,92, Änderungen verstreut)"""
+    rng = random.Random(seed)
+    syllables = ['ber', 'gen', 'lan', 'der', 'sch', 'ung', 'tra', 'mei', 'ste', 'kon',
+                 'rei', 'wal', 'zeit', 'bur', 'ein', 'al', 'ver', 'mo', 'ka', 'li']
+    vocabulary = [''.join(rng.choice(syllables) for _ in range(rng.randint(1, 4))) for _ in range(3000)]
+
+    def text(count):
+        return ' '.join(rng.choice(vocabulary) for _ in range(count))
+
+    def edit(words):
+        i = rng.randrange(len(words))
+        kind = rng.randrange(4)
+        if kind == 0:
+            words[i] = rng.choice(vocabulary)
+        elif kind == 1:  # Tippfehler
+            j = rng.randrange(len(words[i]) + 1)
+            words[i] = words[i][:j] + rng.choice('aeinrst') + words[i][j + 1:]
+        elif kind == 2:
+            words.insert(i, rng.choice(vocabulary))
+        elif len(words) > 1:
+            del words[i]
+
+    pairs = []
+    while len(pairs) < count:
+        original = {'id': 1, 'title': text(6), 'content': text(100)[:CONTENT_PREFIX]}
+        words = original['content'].split(' ')
+        variant = None
+        while True:
+            edit(words)
+            candidate = {'id': 2, 'title': text(6), 'content': ' '.join(words)}
+            if not are_similar_articles(candidate, original):
+                break
+            variant = candidate
+        if variant and SequenceMatcher(None, variant['content'][:CONTENT_PREFIX].lower(),
+                                       original['content'].lower()).ratio() <= CONTENT_THRESHOLD + 0.02:
+            pairs.append([original, variant])
+    return pairs
+
+
+def brute_force_pairs(articles):
+    return {
+        (older['id'], newer['id'])
+        for older, newer in combinations(articles, 2)
+        if are_similar_articles(newer, older)
+    }
+
+
+class TestSketches:
+    """Tests for shingles and MinHash sketches"""
+
+    def test_shingles_ignore_formatting_and_case(self):
+        """Test: formatting and case do not change the shingles"""
+        assert title_shingles("*Kickl* GEWINNT") == title_shingles("kickl gewinnt")
+        assert content_shingles("Eins _zwei_ drei") == {"eins z", "ins zw", "ns zwe", "s zwei", " zwei ",
+                                                          "zwei d", "wei dr", "ei dre", "i drei"}
+        assert title_shingles("") == set()
+
+    def test_identical_shingles_give_identical_sketch(self):
+        """Test: sketches are deterministic and have the configured length"""
+        sketch = minhash_sketch(content_shingles("Der Bundeskanzler kündigt heute eine Reform an"))
+        assert sketch == minhash_sketch(content_shingles("der bundeskanzler kündigt heute eine reform an"))
+        assert len(sketch) == CONTENT_BINS
+        assert len(minhash_sketch(title_shingles("Kickl gewinnt"), TITLE_BINS)) == TITLE_BINS
+        assert sketch_similarity(sketch, sketch) == 1.0
+
+    def test_empty_input_has_no_sketch(self):
+        """Test: articles without text get no sketch and never match"""
+        assert minhash_sketch(set()) == ()
+        assert sketch_similarity((), minhash_sketch({"a"})) == 0.0
+
+    def test_sketch_similarity_estimates_jaccard(self):
+        """Test: sketch agreement follows the Jaccard similarity of the shingles"""
+        base = {f"shingle {i}" for i in range(200)}
+        similar = set(list(base)[:180]) | {f"neu {i}" for i in range(20)}
+        different = {f"anders {i}" for i in range(200)}
+
+        assert sketch_similarity(minhash_sketch(base), minhash_sketch(similar)) > 0.6
+        assert sketch_similarity(minhash_sketch(base), minhash_sketch(different)) < 0.2
+
+
+class TestFindDuplicateClusters:
+    """Tests for find_duplicate_clusters()"""
+
+    def test_matches_brute_force(self):
+        """Test: confirmed pairs equal the O(n²) are_similar_articles() result"""
+        articles = make_corpus()
+        expected = brute_force_pairs(articles)
+
+        result = find_duplicate_clusters(articles)
+
+        assert expected
+        assert result['stats']['confirmed_pairs'] == len(expected)
+        clustered = {article_id for c in result['clusters'] for article_id in [c['target'], *c['duplicates']]}
+        assert clustered == {article_id for pair in expected for article_id in pair}
+        assert result['stats']['candidate_pairs'] < len(articles) * 5
+
+    def test_recall_at_threshold(self):
+        """Test: at least EXPECTED_RECALL of the pairs just above the content threshold are found"""
+        pairs = at_threshold_pairs()
+
+        found = sum(find_duplicate_clusters(pair)['stats']['confirmed_pairs'] for pair in pairs)
+
+        assert found / len(pairs) >= EXPECTED_RECALL
+        assert find_duplicate_clusters(pairs[0])['stats']['expected_recall'] == EXPECTED_RECALL
+
+    def test_merge_target_prefers_published_then_images(self):
+        """Test: the suggested target is published, has the most images, then is the oldest"""
+        content = "Gleicher Inhalt über die Reform in Wien " * 10
+        articles = [
+            {'id': 1, 'title': 'Reform A', 'content': content, 'published': 0, 'image_count': 3},
+            {'id': 2, 'title': 'Reform B', 'content': content, 'published': 1, 'image_count': 0},
+            {'id': 3, 'title': 'Reform C', 'content': content, 'published': 1, 'image_count': 2},
+        ]
+
+        [cluster] = find_duplicate_clusters(articles)['clusters']
+
+        assert cluster['target'] == 3
+        assert cluster['duplicates'] == [1, 2]
+        assert all('content' not in member for member in cluster['members'])
+
+    def test_no_duplicates(self):
+        """Test: unrelated articles produce no clusters"""
+        articles = [a for a in make_corpus(size=50) if a['id'] % 10]
+        assert find_duplicate_clusters(articles)['clusters'] == []
+
+    def test_custom_threshold(self):
+        """Test: thresholds are passed through to are_similar_articles()"""
+        articles = [{'id': 1, 'title': 'Reform in Wien', 'content': 'A b c'},
+                    {'id': 2, 'title': 'Reform in Wien!!', 'content': 'X y z'}]
+        assert len(find_duplicate_clusters(articles)['clusters']) == 0
+        assert len(find_duplicate_clusters(articles, title_threshold=0.9)['clusters']) == 1
+
+
+class TestFindDuplicatesCli:
+    """Tests for scripts/find_duplicates.py"""
+
+    @pytest.fixture(autouse=True)
+    def setup_db(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.db_path = self.test_dir / 'articles.db'
+        self.db = DatabaseManager(str(self.db_path))
+        conn = self.db.get_connection()
+        conn.executescript("""
+            CREATE TABLE articles (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT NOT NULL,
+                content TEXT NOT NULL,
+                author TEXT,
+                published BOOLEAN DEFAULT 0,
+                tags TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                title_key TEXT,
+                content_hash TEXT
+            );
+            CREATE TABLE images (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                article_id INTEGER,
+                filename TEXT NOT NULL,
+                filepath TEXT NOT NULL,
+                alt_text TEXT,
+                caption TEXT,
+                uploaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                width INTEGER,
+                height INTEGER,
+                file_size INTEGER,
+                mime_type TEXT,
+                sha256 TEXT
+            );
+        """)
+        conn.close()
+        yield
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_report_and_json(self, monkeypatch, capsys):
+        """Test: CLI reads previews from the DB, prints clusters and writes JSON"""
+        content = "Der Chefredakteur dementiert alles. " * 30
+        first = self.db.add_article("Chefredakteur dementiert", content, published=True)
+        second = self.db.add_article("Chefredakteur 🎭 dementiert", content + " Update")
+        self.db.add_image(second, "a.jpg", "a.jpg")
+        self.db.add_article("Etwas ganz anderes", "Wetterbericht für Graz " * 20)
+        json_path = self.test_dir / 'report.json'
+
+        monkeypatch.setattr(sys, 'argv', ['find_duplicates.py', '--db', str(self.db_path),
+                                          '--json', str(json_path)])
+        find_duplicates.main()
+
+        output = capsys.readouterr().out
+        assert "Cluster:           1 mit 1 Duplikaten (Trefferquote knapp über dem Threshold ≥ 95%)" in output
+        assert f"→ behalten: #{first}" in output
+        report = json.loads(json_path.read_text(encoding='utf-8'))
+        assert report['clusters'][0]['duplicates'] == [second]
+        assert report['clusters'][0]['members'][1]['image_count'] == 1
+
+    def test_previews_truncate_content(self):
+        """Test: only the compared prefix of the content is loaded"""
+        self.db.add_article("Lang", "x" * 5000)
+        [preview] = find_duplicates.iter_article_previews(self.db)
+        assert len(preview['content']) == 500
@@ -0,0 +1,171 @@
+"""
+Unit Tests for query statistics and the slow-query log (src/query_stats.py)
+Tests SQL normalization, EXPLAIN QUERY PLAN, aggregation via the DatabaseManager and /admin/api/stats/queries
+"""
+import logging
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import web.app as web_app
+from web.app import app, APP_PREFIX, init_database
+from db_manager import DatabaseManager, add_query_observer, remove_query_observer
+from query_stats import QueryStats, explain_query_plan, normalize_sql
+
+
+@pytest.fixture
+def db():
+    test_dir = Path(tempfile.mkdtemp())
+    init_database(test_dir / 'articles.db')
+    manager = DatabaseManager(str(test_dir / 'articles.db'))
+    for i in range(5):
+        manager.add_article(f"Artikel {i}", f"Inhalt {i}", published=i % 2 == 0)
+    yield manager
+    shutil.rmtree(test_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def stats():
+    collector = QueryStats(threshold_ms=10_000)
+    add_query_observer(collector.observe)
+    yield collector
+    remove_query_observer(collector.observe)
+
+
+class TestNormalizeSql:
+    """Tests for normalize_sql"""
+
+    @pytest.mark.parametrize('sql, expected', [
+        ("SELECT *\n  FROM articles\n  WHERE id = 42;", "SELECT * FROM articles WHERE id = ?"),
+        ("SELECT * FROM articles WHERE title = 'O''Brien'", "SELECT * FROM articles WHERE title = ?"),
+        ("SELECT * FROM articles WHERE id IN (?, ?,?)", "SELECT * FROM articles WHERE id IN (...)"),
+        ("SELECT substr(content, 1, 200) FROM t1 LIMIT -1", "SELECT substr(content, ?, ?) FROM t1 LIMIT ?"),
+    ])
+    def test_literals_and_whitespace(self, sql, expected):
+        """Test: literals, IN lists and whitespace are normalized, identifiers stay"""
+        assert normalize_sql(sql) == expected
+
+
+class TestExplainQueryPlan:
+    """Tests for explain_query_plan"""
+
+    def test_index_and_scan(self, db):
+        """Test: the plan shows index use and full scans"""
+        by_key = explain_query_plan(db.db_path, "SELECT id FROM articles WHERE title_key = ?", ('x',))
+        by_author = explain_query_plan(db.db_path, "SELECT id FROM articles WHERE author = ?", ('x',))
+
+        assert by_key[0].startswith('SEARCH articles USING') and 'idx_articles_title_key' in by_key[0]
+        assert by_author == ['SCAN articles']
+
+    def test_unexplainable_statements(self, db):
+        """Test: scripts, statements without parameters and broken SQL give None"""
+        assert explain_query_plan(db.db_path, "CREATE TABLE x (a)", ()) is None
+        assert explain_query_plan(db.db_path, "UPDATE articles SET author = ?", None) is None
+        assert explain_query_plan(db.db_path, "SELECT * FROM gibtsnicht", ()) is None
+
+
+class TestQueryStats:
+    """Tests for QueryStats as DatabaseManager query observer"""
+
+    def test_aggregates_per_normalized_statement(self, db, stats):
+        """Test: executions with different literals share one entry with counts and rows"""
+        conn = db.get_connection()
+        for limit in (1, 3):
+            conn.execute(f"SELECT id FROM articles ORDER BY id LIMIT {limit}").fetchall()
+        with conn:
+            conn.execute("UPDATE articles SET author = 'Redaktion' WHERE published = 1")
+        conn.close()
+
+        entries = {entry['sql']: entry for entry in stats.snapshot()}
+        select = entries['SELECT id FROM articles ORDER BY id LIMIT ?']
+        update = entries['UPDATE articles SET author = ? WHERE published = ?']
+
+        assert select['count'] == 2
+        assert select['rows'] == 4
+        assert select['avg_rows'] == 2.0
+        assert select['plan'] == ['SCAN articles']
+        assert update['rows'] == 3
+        assert update['slow'] == 0
+
+    def test_sort_limit_and_reset(self, db, stats):
+        """Test: snapshot sorts descending and limits, reset empties the statistics"""
+        for _ in range(3):
+            db.get_article(1)
+        db.get_all_articles()
+
+        [top] = stats.snapshot(sort='count', limit=1)
+        assert top['sql'] == 'SELECT * FROM articles WHERE id = ?'
+        assert top['count'] == 3
+
+        stats.reset()
+        assert stats.snapshot() == []
+
+    def test_slow_query_is_logged_with_plan(self, db, caplog):
+        """Test: statements above the threshold are logged with plan, without parameters"""
+        collector = QueryStats(threshold_ms=0)
+        add_query_observer(collector.observe)
+        try:
+            with caplog.at_level(logging.WARNING, logger='fakedaily.app.db'):
+                db.search_articles('Geheimer Suchbegriff')
+        finally:
+            remove_query_observer(collector.observe)
+
+        [record] = [r for r in caplog.records if r.name == 'fakedaily.app.db']
+        assert record.getMessage().startswith('Slow Query: ')
+        assert 'SCAN articles' in record.getMessage()
+        assert 'Geheimer' not in record.getMessage()
+        assert collector.snapshot()[0]['slow'] == 1
+
+    def test_statement_limit(self, db):
+        """Test: beyond max_statements the entry with the least total time is dropped"""
+        collector = QueryStats(max_statements=2)
+        for sql, ms in [("SELECT a FROM t", 5), ("SELECT b FROM t", 1), ("SELECT c FROM t", 3)]:
+            collector.observe(type('Event', (), {'sql': sql, 'parameters': None, 'seconds': ms / 1000,
+                                                 'rows': 0, 'database': db.db_path}))
+
+        assert [entry['sql'] for entry in collector.snapshot()] == ["SELECT a FROM t", "SELECT c FROM t"]
+
+
+class TestQueryStatsEndpoint:
+    """Tests for /admin/api/stats/queries"""
+
+    @pytest.fixture(autouse=True)
+    def setup_app(self, db, monkeypatch):
+        monkeypatch.setattr(web_app, 'db', db)
+        self.client = app.test_client()
+        self.url = f"{APP_PREFIX}/admin/api/stats/queries"
+
+    def test_lists_statements_of_requests(self):
+        """Test: statements run by requests show up with their plan"""
+        self.client.delete(self.url)
+        self.client.get(f"{APP_PREFIX}/reader/")
+
+        response = self.client.get(self.url)
+
+        assert response.status_code == 200
+        assert response.json['slow_query_ms'] == web_app.query_stats.threshold_ms
+        [entry] = [e for e in response.json['queries'] if 'WHERE published = ?' in e['sql']]
+        assert entry['count'] == 1
+        assert entry['rows'] == 3
+        assert entry['plan']
+
+    def test_delete_resets(self):
+        """Test: DELETE empties the statistics"""
+        self.client.get(f"{APP_PREFIX}/reader/")
+        assert self.client.delete(self.url).json['success'] is True
+
+        assert self.client.get(self.url).json['queries'] == []
+
+    @pytest.mark.parametrize('query', ['sort=name', 'limit=viele'])
+    def test_invalid_parameters(self, query):
+        """Test: unknown sort keys and non-numeric limits return 400"""
+        response = self.client.get(f"{self.url}?{query}")
+
+        assert response.status_code == 400
+        assert response.json['success'] is False
@@ -0,0 +1,53 @@
+"""
+Unit Tests for scripts/reprocess_images.py
+Tests that rewritten images get fresh metadata (size, hash) in the database
+"""
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import reprocess_images
+from db_manager import DatabaseManager
+from image_processor import ImageProcessor
+from web.app import init_database
+
+
+class TestReprocessImages:
+    """Tests for reprocess_all_images()"""
+
+    @pytest.fixture(autouse=True)
+    def setup_files(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        init_database(self.test_dir / 'articles.db')
+        self.db = DatabaseManager(str(self.test_dir / 'articles.db'))
+        (self.test_dir / 'media' / 'images').mkdir(parents=True)
+        self.logo = self.test_dir / 'logo.png'
+        Image.new('RGBA', (100, 100), color=(255, 0, 0, 255)).save(self.logo)
+        yield
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_metadata_refreshed(self):
+        """Test: after the watermark is applied, file_size and sha256 match the new file"""
+        image_path = self.test_dir / 'media' / 'images' / '1_bild.jpg'
+        Image.new('RGB', (800, 600), color='blue').save(image_path)
+        article_id = self.db.add_article("Artikel", "Text")
+        image_id = self.db.add_image(article_id, '1_bild.jpg', 'media/images/1_bild.jpg',
+                                     **ImageProcessor.read_metadata(str(image_path)))
+        before = self.db.get_images_for_article(article_id)[0]['sha256']
+
+        reprocess_images.reprocess_all_images(str(self.logo), db=self.db, base_dir=self.test_dir)
+
+        [image] = self.db.get_images_for_article(article_id)
+        current = ImageProcessor.read_metadata(str(image_path))
+        assert image['id'] == image_id
+        assert image['sha256'] == current['sha256'] != before
+        assert image['file_size'] == current['file_size']
+        assert (image['width'], image['height']) == (800, 600)
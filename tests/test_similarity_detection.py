@@ -6,15 +6,16 @@ Testet die SequenceMatcher-basierte Duplikaterkennung:
 - Title similarity (95% threshold)
 - Content similarity (90% threshold)
 - Integration mit Import API
+- Similarity-Engine (src/similarity.py): Vorfilter und alternative Metriken
 """
 
 import pytest
 import sys
 from pathlib import Path
 
-# Import from web app
-sys.path.insert(0, str(Path(__file__).parent.parent / "web"))
-from app import similarity, are_similar_articles
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from similarity import similarity, are_similar_articles
+import similarity as similarity_engine
 
 
 class TestSimilarityDetection:
@@ -257,5 +258,96 @@ class TestImportDuplicateScenarios:
         assert are_similar_articles(new_article, existing_article) is False
 
 
+def legacy_similarity(a, b):
+    """Bisherige Implementierung aus web/app.py als Referenz"""
+    from difflib import SequenceMatcher
+    return SequenceMatcher(None, a.lower(), b.lower()).ratio()
+
+
+def mutate(rng, text):
+    """Erzeugt eine Variante mit wenigen Zeichen-Änderungen"""
+    chars = list(text)
+    for _ in range(rng.randint(0, 4)):
+        pos = rng.randrange(len(chars) + 1)
+        op = rng.choice(['insert', 'delete', 'replace'])
+        if op == 'insert' or not chars:
+            chars.insert(pos, rng.choice('abcdeäöü 🎭!'))
+        elif op == 'delete':
+            del chars[min(pos, len(chars) - 1)]
+        else:
+            chars[min(pos, len(chars) - 1)] = rng.choice('xyzß')
+    return ''.join(chars)
+
+
+class TestSimilarityEngine:
+    """Tests für src/similarity.py (Vorfilter, Metriken)"""
+
+    def test_is_similar_matches_full_ratio(self):
+        """Test: Early-Exit-Entscheidungen sind identisch mit ratio() > threshold"""
+        import random
+        rng = random.Random(42)
+        words = ['Kickl', 'Bundeskanzler', 'Wien', 'Reform', 'Satire', 'Fake', 'Daily', 'Österreich']
+        for _ in range(2000):
+            a = ' '.join(rng.choice(words) for _ in range(rng.randint(0, rng.choice([12, 60]))))
+            b = mutate(rng, a) if rng.random() < 0.7 else ' '.join(rng.sample(words, 4))
+            for threshold in (0.70, 0.90, 0.95):
+                assert similarity_engine.is_similar(a, b, threshold) == \
+                    (legacy_similarity(a, b) > threshold), (a, b, threshold)
+
+    def test_similarity_matches_legacy(self):
+        """Test: similarity() liefert exakt den bisherigen Wert"""
+        pairs = [("Fake Daily – Die Wahrheit", "Fake Daily 🎭 – Die Wahrheit"), ("", ""), ("A", "")]
+        for a, b in pairs:
+            assert similarity(a, b) == legacy_similarity(a, b)
+
+    def test_length_bound_skips_sequence_matcher(self, monkeypatch):
+        """Test: Bei sehr unterschiedlichen Längen wird SequenceMatcher nicht gebraucht"""
+        def fail(*args, **kwargs):
+            raise AssertionError("SequenceMatcher sollte nicht laufen")
+        monkeypatch.setattr(similarity_engine, 'SequenceMatcher', fail)
+
+        assert similarity_engine.is_similar("Kurz", "Ein deutlich längerer Titel", 0.95) is False
+        assert similarity_engine.is_similar("Gleich", "GLEICH", 0.95) is True
+
+    def test_quick_ratio_skips_full_ratio(self, monkeypatch):
+        """Test: quick_ratio() verwirft Paare mit gleicher Länge, aber anderen Zeichen"""
+        from difflib import SequenceMatcher
+        def fail(self):
+            raise AssertionError("ratio() sollte nicht laufen")
+        monkeypatch.setattr(SequenceMatcher, 'ratio', fail)
+
+        assert similarity_engine.is_similar("abcdefgh", "stuvwxyz", 0.9) is False
+
+    def test_ngram_metric(self):
+        """Test: n-Gramm-Jaccard erkennt Varianten und verwirft Fremdes"""
+        a = "Kickl gewinnt die Wahl in Österreich"
+        assert similarity(a, a, metric='ngram') == 1.0
+        assert similarity_engine.is_similar(a, a + "!", 0.9, metric='ngram') is True
+        assert similarity_engine.is_similar(a, "Trump kauft Grönland", 0.3, metric='ngram') is False
+        assert similarity("", "", metric='ngram') == 1.0
+
+    def test_token_set_metric(self):
+        """Test: Token-Set ignoriert Wortreihenfolge und enthaltene Wortmengen"""
+        assert similarity("Wien Kickl Reform", "reform kickl wien", metric='token_set') == 1.0
+        assert similarity("Kickl Reform", "Kickl Reform in Wien", metric='token_set') == 1.0
+        score = similarity("Kickl Reform Wien", "Kickl Steuer Graz", metric='token_set')
+        assert 0.0 < score < 1.0
+        for threshold in (0.5, 0.9):
+            assert similarity_engine.is_similar("Kickl Reform Wien", "Kickl Steuer Graz", threshold,
+                                                metric='token_set') == (score > threshold)
+
+    def test_are_similar_articles_with_metric(self):
+        """Test: are_similar_articles akzeptiert alternative Metriken"""
+        article1 = {'title': 'Reform Kickl Wien', 'content': 'A'}
+        article2 = {'title': 'Wien: Kickl Reform', 'content': 'B'}
+        assert are_similar_articles(article1, article2) is False
+        assert are_similar_articles(article1, article2, metric='token_set') is True
+
+    def test_unknown_metric(self):
+        """Test: Unbekannte Metrik wird abgelehnt"""
+        with pytest.raises(ValueError):
+            similarity("a", "b", metric='levenshtein')
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -0,0 +1,197 @@
+"""
+Unit Tests for materialized tag statistics (tag_stats triggers in src/db_manager.py)
+Tests the triggers for all write paths, legacy comma tags, the migration in init_database and the /reader/tags endpoints
+"""
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import web.app as web_app
+from web.app import app, APP_PREFIX, init_database
+from db_manager import DatabaseManager, REBUILD_TAG_STATS, register_sql_functions
+
+
+@pytest.fixture
+def db():
+    test_dir = Path(tempfile.mkdtemp())
+    init_database(test_dir / 'articles.db')
+    yield DatabaseManager(str(test_dir / 'articles.db'))
+    shutil.rmtree(test_dir, ignore_errors=True)
+
+
+def counts(db, published_only=False):
+    return {tag['tag']: (tag['total'], tag['published']) for tag in db.get_tag_stats(published_only)}
+
+
+class TestTagStatsTriggers:
+    """Tests for keeping tag_stats current"""
+
+    def test_add_update_delete(self, db):
+        """Test: adding, publishing, retagging and deleting articles adjust the counts"""
+        first = db.add_article("Eins", "Text", published=True, tags=['Politik', 'Wien'])
+        second = db.add_article("Zwei", "Text", tags=['Politik'])
+        assert counts(db) == {'Politik': (2, 1), 'Wien': (1, 1)}
+
+        db.update_article(second, published=True)
+        assert counts(db) == {'Politik': (2, 2), 'Wien': (1, 1)}
+
+        db.update_article(first, tags=['Wien', 'Satire'])
+        assert counts(db) == {'Politik': (1, 1), 'Wien': (1, 1), 'Satire': (1, 1)}
+
+        db.delete_article(second)
+        assert counts(db) == {'Wien': (1, 1), 'Satire': (1, 1)}
+
+    def test_case_insensitive_and_once_per_article(self, db):
+        """Test: tags differing only in case are one tag, repeated tags in an article count once"""
+        db.add_article("Eins", "Text", tags=['Wien', 'WIEN', ' wien '])
+        db.add_article("Zwei", "Text", tags=['wien'])
+
+        assert counts(db) == {'Wien': (2, 0)}
+
+    def test_case_insensitive_beyond_ascii(self, db):
+        """Test: tags differing only in the case of umlauts are one tag, like on the tag page"""
+        db.add_article("Eins", "Text", published=True, tags=['Österreich'])
+        db.add_article("Zwei", "Text", published=True, tags=['österreich'])
+
+        assert counts(db) == {'Österreich': (2, 2)}
+        assert len(db.get_articles_by_tag('Österreich', published_only=True)) == 2
+        assert len(db.get_feed_articles(10, tag='ÖSTERREICH')) == 2
+
+    def test_published_only_order(self, db):
+        """Test: published_only drops draft-only tags and sorts by published count"""
+        db.add_article("Eins", "Text", published=True, tags=['Satire'])
+        db.add_article("Zwei", "Text", published=True, tags=['Politik', 'Satire'])
+        db.add_article("Drei", "Text", tags=['Politik', 'Entwurf'])
+
+        assert [tag['tag'] for tag in db.get_tag_stats(published_only=True)] == ['Satire', 'Politik']
+        assert [tag['tag'] for tag in db.get_tag_stats()] == ['Politik', 'Satire', 'Entwurf']
+
+    def test_sql_and_bulk_writes(self, db):
+        """Test: raw SQL with legacy comma tags, invalid values and bulk imports are counted too"""
+        conn = register_sql_functions(sqlite3.connect(db.db_path))
+        conn.execute("INSERT INTO articles (title, content, tags, published) VALUES ('Alt', 'x', 'Politik, Satire', 1)")
+        conn.execute("INSERT INTO articles (title, content, tags, published) VALUES ('Kaputt', 'x', '\"[', 1)")
+        conn.commit()
+        conn.close()
+        db.bulk_add_articles([{'title': f"Bulk {i}", 'content': 'x', 'tags': ['Satire']} for i in range(3)])
+
+        assert counts(db) == {'Politik': (1, 1), 'Satire': (4, 1)}
+
+    def test_triggers_match_rebuild(self, db):
+        """Test: after random writes the trigger-maintained counts equal a full rebuild"""
+        rng = random.Random(3)
+        names = ['Politik', 'politik', 'Wien', 'Satire', 'Börse', 'EU']
+        ids = []
+        for _ in range(200):
+            action = rng.random()
+            if action < 0.5 or not ids:
+                ids.append(db.add_article("T", "x", published=rng.random() < 0.5,
+                                          tags=rng.sample(names, rng.randint(0, 3))))
+            elif action < 0.85:
+                db.update_article(rng.choice(ids), published=rng.random() < 0.5,
+                                  tags=rng.sample(names, rng.randint(0, 3)))
+            else:
+                db.delete_article(ids.pop(rng.randrange(len(ids))))
+        maintained = {tag['tag'].lower(): (tag['total'], tag['published']) for tag in db.get_tag_stats()}
+
+        conn = register_sql_functions(sqlite3.connect(db.db_path))
+        conn.executescript(REBUILD_TAG_STATS)
+        conn.close()
+        rebuilt = {tag['tag'].lower(): (tag['total'], tag['published']) for tag in db.get_tag_stats()}
+
+        assert maintained == rebuilt
+
+    def test_init_database_migrates_existing_articles(self, db):
+        """Test: on a database without tag_stats, init_database fills it from all articles"""
+        db.add_article("Eins", "Text", published=True, tags=['Politik'])
+        conn = sqlite3.connect(db.db_path)
+        conn.executescript("DROP TABLE tag_stats; DROP TRIGGER tag_stats_insert; "
+                           "DROP TRIGGER tag_stats_update; DROP TRIGGER tag_stats_delete;")
+        conn.execute("INSERT INTO articles (title, content, tags) VALUES ('Alt', 'x', 'Wien')")
+        conn.commit()
+        conn.close()
+
+        init_database(db.db_path)
+        init_database(db.db_path)  # zweiter Start zählt nicht doppelt
+
+        assert counts(db) == {'Politik': (1, 1), 'Wien': (1, 0)}
+
+    def test_init_database_replaces_ascii_triggers(self, db):
+        """Test: triggers of older versions (SQL lower(), ASCII only) are replaced and the counts rebuilt"""
+        conn = sqlite3.connect(db.db_path)
+        sql = conn.execute("SELECT group_concat(sql, ';') || ';' FROM sqlite_master "
+                           "WHERE type = 'trigger' AND name LIKE 'tag_stats_%'").fetchone()[0]
+        conn.executescript("DROP TRIGGER tag_stats_insert; DROP TRIGGER tag_stats_update; "
+                           "DROP TRIGGER tag_stats_delete;" + sql.replace('unicode_lower(', 'lower('))
+        conn.execute("INSERT INTO articles (title, content, tags) VALUES ('Eins', 'x', 'Österreich')")
+        conn.execute("INSERT INTO articles (title, content, tags) VALUES ('Zwei', 'x', 'österreich')")
+        conn.commit()
+        conn.close()
+        assert len(counts(db)) == 2
+
+        init_database(db.db_path)
+        db.add_article("Drei", "Text", tags=['ÖSTERREICH'])
+
+        assert counts(db) == {'Österreich': (3, 0)}
+
+
+class TestTagEndpoints:
+    """Tests for /reader/tags, /reader/api/tags and /admin/api/stats/tags"""
+
+    @pytest.fixture(autouse=True)
+    def setup_app(self, db, monkeypatch):
+        db.add_article("Eins", "Text", published=True, tags=['Politik', 'Satire'])
+        db.add_article("Zwei", "Text", published=True, tags=['Politik'])
+        db.add_article("Entwurf", "Text", tags=['Geheim'])
+        self.db = db
+        monkeypatch.setattr(web_app, 'db', db)
+        self.client = app.test_client()
+
+    def test_reader_page_lists_published_tags(self):
+        """Test: the tag page links published tags with counts and hides draft-only tags"""
+        response = self.client.get(f"{APP_PREFIX}/reader/tags")
+        html = response.get_data(as_text=True)
+
+        assert response.status_code == 200
+        assert f'href="{APP_PREFIX}/reader/tag/Politik"' in html
+        assert 'tag-level-5' in html
+        assert 'Geheim' not in html
+
+    def test_json_endpoint_cached(self):
+        """Test: the JSON has counts and URLs, is cacheable and answers 304 for a matching ETag"""
+        response = self.client.get(f"{APP_PREFIX}/reader/api/tags")
+
+        assert response.status_code == 200
+        assert response.json['count'] == 2
+        assert response.json['tags'][0] == {'tag': 'Politik', 'count': 2, 'level': 5,
+                                            'url': f"{APP_PREFIX}/reader/tag/Politik"}
+        assert response.cache_control.public is True
+        assert response.cache_control.max_age == web_app.TAG_CACHE_SECONDS
+        assert response.headers['ETag']
+
+        again = self.client.get(f"{APP_PREFIX}/reader/api/tags",
+                                headers={'If-None-Match': response.headers['ETag']})
+        assert again.status_code == 304
+        assert again.data == b''
+
+        self.db.add_article("Drei", "Text", published=True, tags=['Wien'])
+        changed = self.client.get(f"{APP_PREFIX}/reader/api/tags",
+                                  headers={'If-None-Match': response.headers['ETag']})
+        assert changed.status_code == 200
+        assert changed.json['count'] == 3
+
+    def test_admin_stats_include_drafts(self):
+        """Test: the admin endpoint returns total and published counts for all tags"""
+        response = self.client.get(f"{APP_PREFIX}/admin/api/stats/tags")
+
+        assert response.status_code == 200
+        assert {tag['tag']: (tag['total'], tag['published']) for tag in response.json['tags']} == \
+            {'Politik': (2, 2), 'Satire': (1, 1), 'Geheim': (1, 0)}
@@ -0,0 +1,141 @@
+"""
+Unit Tests for the on-demand thumbnail endpoint
+Tests generation, disk cache, size allowlist and per-key locking
+"""
+import os
+import pytest
+import tempfile
+import shutil
+import threading
+import time
+import sys
+from pathlib import Path
+from PIL import Image
+
+# Add parent directory to path to import from web/app.py
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import web.app as web_app
+from web.app import app, ensure_thumbnail, APP_PREFIX
+
+
+class TestThumbnails:
+    """Tests for ensure_thumbnail() and /media/thumbs/<size>/<filename>"""
+
+    @pytest.fixture(autouse=True)
+    def setup_media_dirs(self):
+        """Point upload and thumbnail folders to a temporary directory"""
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.upload_dir = self.test_dir / 'images'
+        self.thumb_dir = self.test_dir / 'thumbs'
+        self.upload_dir.mkdir()
+
+        Image.new('RGB', (1200, 800), color='green').save(self.upload_dir / 'photo.jpg')
+
+        old_upload = app.config['UPLOAD_FOLDER']
+        old_thumbs = app.config['THUMBNAIL_FOLDER']
+        app.config['UPLOAD_FOLDER'] = self.upload_dir
+        app.config['THUMBNAIL_FOLDER'] = self.thumb_dir
+        self.client = app.test_client()
+
+        yield
+
+        app.config['UPLOAD_FOLDER'] = old_upload
+        app.config['THUMBNAIL_FOLDER'] = old_thumbs
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_ensure_thumbnail_creates_cached_file(self):
+        """Test: ensure_thumbnail writes a downscaled image into the cache"""
+        thumb = ensure_thumbnail('photo.jpg', 300)
+
+        assert thumb == self.thumb_dir / '300' / 'photo.jpg'
+        assert thumb.exists()
+        with Image.open(thumb) as img:
+            assert max(img.size) == 300
+            assert img.size == (300, 200)
+
+    def test_ensure_thumbnail_reuses_cache(self):
+        """Test: second call does not regenerate the thumbnail"""
+        thumb = ensure_thumbnail('photo.jpg', 150)
+        mtime = thumb.stat().st_mtime_ns
+
+        assert ensure_thumbnail('photo.jpg', 150).stat().st_mtime_ns == mtime
+
+    def test_ensure_thumbnail_regenerates_when_original_newer(self):
+        """Test: a newer original invalidates the cached thumbnail"""
+        thumb = ensure_thumbnail('photo.jpg', 150)
+
+        # Original überschreiben und als neuer markieren
+        Image.new('RGB', (600, 600), color='red').save(self.upload_dir / 'photo.jpg')
+        future = thumb.stat().st_mtime + 10
+        os.utime(self.upload_dir / 'photo.jpg', (future, future))
+
+        ensure_thumbnail('photo.jpg', 150)
+        with Image.open(thumb) as img:
+            assert img.size == (150, 150)
+
+    def test_ensure_thumbnail_rejects_unknown_size(self):
+        """Test: sizes outside the allowlist are rejected"""
+        assert ensure_thumbnail('photo.jpg', 123) is None
+        assert not self.thumb_dir.exists()
+
+    def test_ensure_thumbnail_missing_original(self):
+        """Test: missing original returns None"""
+        assert ensure_thumbnail('missing.jpg', 300) is None
+
+    def test_ensure_thumbnail_rejects_path_traversal(self):
+        """Test: path traversal outside the upload folder is rejected"""
+        assert ensure_thumbnail('../images/photo.jpg', 300) is None
+        assert ensure_thumbnail('../../etc/passwd', 300) is None
+
+    def test_concurrent_requests_generate_once(self, monkeypatch):
+        """Test: concurrent first requests for the same key generate only once"""
+        calls = []
+        original = web_app.ImageProcessor.create_thumbnail
+
+        def slow_create_thumbnail(processor, *args, **kwargs):
+            calls.append(1)
+            time.sleep(0.05)
+            return original(processor, *args, **kwargs)
+
+        monkeypatch.setattr(web_app.ImageProcessor, 'create_thumbnail', slow_create_thumbnail)
+
+        threads = [threading.Thread(target=ensure_thumbnail, args=('photo.jpg', 600))
+                   for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert (self.thumb_dir / '600' / 'photo.jpg').exists()
+
+    def test_thumbnail_locks_do_not_grow(self):
+        """Test: generating many thumbnails reuses the fixed set of striped locks"""
+        locks = list(web_app._thumbnail_locks)
+        for i in range(100):
+            Image.new('RGB', (20, 20), color='blue').save(self.upload_dir / f'bild_{i}.jpg')
+            ensure_thumbnail(f'bild_{i}.jpg', 150)
+
+        assert web_app._thumbnail_locks == locks
+        assert len(locks) == web_app.THUMBNAIL_LOCK_STRIPES
+        assert web_app._thumbnail_lock((150, 'bild_1.jpg')) is web_app._thumbnail_lock((150, 'bild_1.jpg'))
+        assert not any(lock.locked() for lock in locks)
+
+    def test_thumbnail_route_serves_image(self):
+        """Test: GET /media/thumbs/<size>/<filename> returns the thumbnail"""
+        response = self.client.get(f"{APP_PREFIX}/media/thumbs/150/photo.jpg")
+
+        assert response.status_code == 200
+        assert response.mimetype == 'image/jpeg'
+        response.close()
+
+    def test_thumbnail_route_unknown_size_404(self):
+        """Test: GET with a size outside the allowlist returns 404"""
+        response = self.client.get(f"{APP_PREFIX}/media/thumbs/999/photo.jpg")
+        assert response.status_code == 404
+
+    def test_thumbnail_route_missing_image_404(self):
+        """Test: GET for a nonexistent image returns 404"""
+        response = self.client.get(f"{APP_PREFIX}/media/thumbs/150/missing.jpg")
+        assert response.status_code == 404
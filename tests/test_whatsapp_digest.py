@@ -0,0 +1,191 @@
+"""
+Unit Tests for the WhatsApp digest (src/whatsapp_digest.py)
+Tests the per-article text cache, digest order and separators and /admin/api/export/whatsapp
+"""
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import web.app as web_app
+from web.app import app, APP_PREFIX, init_database
+from db_manager import DatabaseManager
+from whatsapp_digest import DIGEST_SEPARATOR, TextCache, format_cached, iter_digest
+from whatsapp_formatter import WhatsAppFormatter
+
+
+@pytest.fixture
+def db():
+    test_dir = Path(tempfile.mkdtemp())
+    init_database(test_dir / 'articles.db')
+    manager = DatabaseManager(str(test_dir / 'articles.db'))
+    conn = manager.get_connection()
+    with conn:
+        for day, title, published in [(15, 'Erster', 1), (16, 'Zweiter', 0), (16, 'Dritter', 1), (17, 'Vierter', 1)]:
+            conn.execute("""
+                INSERT INTO articles (title, content, author, created_at, updated_at, published)
+                VALUES (?, ?, 'Redaktion', ?, ?, ?)
+            """, (title, f"**{title}** Artikel", f"2026-01-{day} 12:00:00", f"2026-01-{day} 12:00:00", published))
+    conn.close()
+    yield manager
+    shutil.rmtree(test_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def format_calls(monkeypatch):
+    """Zählt die Aufrufe von WhatsAppFormatter.format_article"""
+    calls = []
+    original = WhatsAppFormatter.format_article
+
+    def counting(title, content, author=None):
+        calls.append(title)
+        return original(title=title, content=content, author=author)
+
+    monkeypatch.setattr(WhatsAppFormatter, 'format_article', staticmethod(counting))
+    return calls
+
+
+def expected_text(db, article_id):
+    article = db.get_article(article_id)
+    return WhatsAppFormatter.format_article(article['title'], article['content'], article['author'])
+
+
+class TestTextCache:
+    """Tests for TextCache"""
+
+    def test_lru_eviction_and_counters(self):
+        """Test: the least recently used entry is evicted, hits and misses are counted"""
+        cache = TextCache(max_entries=2)
+        cache.put('a', 'A')
+        cache.put('b', 'B')
+        assert cache.get('a') == 'A'
+
+        cache.put('c', 'C')
+
+        assert cache.get('b') is None
+        assert cache.get('a') == 'A'
+        assert cache.get('c') == 'C'
+        assert len(cache) == 2
+        assert (cache.hits, cache.misses) == (3, 1)
+
+    def test_format_cached_uses_updated_at(self, db, format_calls):
+        """Test: a changed updated_at formats the article again"""
+        cache = TextCache()
+        article = db.get_article(1)
+
+        first = format_cached(cache, article)
+        assert format_cached(cache, article) == first
+        assert format_calls == ['Erster']
+
+        article.update(content='Neu', updated_at='2026-02-01 08:00:00')
+        assert format_cached(cache, article) != first
+        assert format_calls == ['Erster', 'Erster']
+
+
+class TestIterDigest:
+    """Tests for DatabaseManager.get_article_versions and iter_digest"""
+
+    def test_ids_keep_order_with_separators(self, db):
+        """Test: the digest follows the given ids, unknown and repeated ids are dropped"""
+        versions = db.get_article_versions(article_ids=[3, 99, 1, 3])
+        digest = ''.join(iter_digest(db, versions, TextCache()))
+
+        assert [article_id for article_id, _ in versions] == [3, 1]
+        assert digest == expected_text(db, 3) + DIGEST_SEPARATOR + expected_text(db, 1)
+
+    def test_date_range_is_inclusive(self, db):
+        """Test: from/to select by creation day, both days included, chronologically"""
+        versions = db.get_article_versions(created_from='2026-01-16', created_to='2026-01-17')
+        assert [article_id for article_id, _ in versions] == [2, 3, 4]
+
+        published = db.get_article_versions(created_from='2026-01-16', created_to='2026-01-16',
+                                            published_only=True)
+        assert [article_id for article_id, _ in published] == [3]
+
+    def test_second_digest_is_served_from_cache(self, db, format_calls, monkeypatch):
+        """Test: an unchanged selection neither formats nor loads articles again"""
+        cache = TextCache()
+        versions = db.get_article_versions(created_from='2026-01-15', created_to='2026-01-17')
+        first = ''.join(iter_digest(db, versions, cache, batch_size=2))
+        assert len(format_calls) == 4
+
+        loaded = []
+        original = db.get_articles_by_ids
+        monkeypatch.setattr(db, 'get_articles_by_ids', lambda ids: loaded.append(list(ids)) or original(ids))
+        second = ''.join(iter_digest(db, versions, cache, batch_size=2))
+
+        assert second == first
+        assert len(format_calls) == 4
+        assert loaded == [[], []]
+
+    def test_updated_article_is_formatted_again(self, db, format_calls):
+        """Test: only the edited article is formatted again, with its new content"""
+        cache = TextCache()
+        ''.join(iter_digest(db, db.get_article_versions(article_ids=[1, 2]), cache))
+
+        db.update_article(2, content='Ganz *neuer* Inhalt')
+        conn = db.get_connection()
+        with conn:
+            conn.execute("UPDATE articles SET updated_at = '2026-02-01 08:00:00' WHERE id = 2")
+        conn.close()
+        digest = ''.join(iter_digest(db, db.get_article_versions(article_ids=[1, 2]), cache))
+
+        assert format_calls == ['Erster', 'Zweiter', 'Zweiter']
+        assert digest.endswith(expected_text(db, 2))
+        assert '_neuer_' in digest
+
+    def test_deleted_article_is_skipped(self, db):
+        """Test: an article deleted after the selection is left out without a stray separator"""
+        versions = db.get_article_versions(article_ids=[1, 2])
+        db.delete_article(2)
+
+        assert ''.join(iter_digest(db, versions, TextCache())) == expected_text(db, 1)
+
+
+class TestDigestEndpoint:
+    """Tests for /admin/api/export/whatsapp"""
+
+    @pytest.fixture(autouse=True)
+    def setup_app(self, db, monkeypatch):
+        self.db = db
+        monkeypatch.setattr(web_app, 'db', db)
+        monkeypatch.setattr(web_app, 'whatsapp_cache', TextCache())
+        self.client = app.test_client()
+
+    def test_digest_by_ids(self):
+        """Test: ?ids= streams the texts as plain text"""
+        response = self.client.get(f"{APP_PREFIX}/admin/api/export/whatsapp?ids=4,2")
+
+        assert response.status_code == 200
+        assert response.mimetype == 'text/plain'
+        assert response.headers['X-Article-Count'] == '2'
+        assert response.get_data(as_text=True) == (
+            expected_text(self.db, 4) + DIGEST_SEPARATOR + expected_text(self.db, 2))
+
+    def test_digest_by_day_with_separator(self):
+        """Test: ?from= without to selects a single day, separator is configurable"""
+        response = self.client.get(f"{APP_PREFIX}/admin/api/export/whatsapp",
+                                   query_string={'from': '2026-01-16', 'separator': '\n---\n'})
+
+        assert response.get_data(as_text=True) == (
+            expected_text(self.db, 2) + '\n---\n' + expected_text(self.db, 3))
+
+    def test_single_export_shares_cache(self):
+        """Test: the single-article export fills the cache used by the digest"""
+        self.client.get(f"{APP_PREFIX}/admin/article/1/whatsapp")
+        self.client.get(f"{APP_PREFIX}/admin/api/export/whatsapp?ids=1")
+
+        assert web_app.whatsapp_cache.hits == 1
+
+    @pytest.mark.parametrize('query', ['', 'ids=1,x', 'from=16.01.2026', 'from=2026-01-15&to=morgen'])
+    def test_invalid_parameters(self, query):
+        """Test: missing or malformed parameters return 400"""
+        response = self.client.get(f"{APP_PREFIX}/admin/api/export/whatsapp?{query}")
+
+        assert response.status_code == 400
+        assert response.json['success'] is False
@@ -3,6 +3,8 @@ Unit Tests for WhatsAppFormatter
 Tests Markdown to WhatsApp conversion
 """
 import pytest
+import random
+import re
 import sys
 from pathlib import Path
 
@@ -12,6 +14,41 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.whatsapp_formatter import WhatsAppFormatter
 
 
+def legacy_convert(markdown_text: str) -> str:
+    """Bisherige Implementierung von WhatsAppFormatter.convert (Referenz)"""
+    text = markdown_text
+    text = re.sub(r'^######\s+(.+)$', r'⚡BOLD⚡\1⚡BOLD⚡', text, flags=re.MULTILINE)
+    text = re.sub(r'^#####\s+(.+)$', r'⚡BOLD⚡\1⚡BOLD⚡', text, flags=re.MULTILINE)
+    text = re.sub(r'^####\s+(.+)$', r'⚡BOLD⚡\1⚡BOLD⚡', text, flags=re.MULTILINE)
+    text = re.sub(r'^###\s+(.+)$', r'⚡BOLD⚡\1⚡BOLD⚡', text, flags=re.MULTILINE)
+    text = re.sub(r'^##\s+(.+)$', r'⚡BOLD⚡\1⚡BOLD⚡', text, flags=re.MULTILINE)
+    text = re.sub(r'^#\s+(.+)$', r'⚡BOLD⚡\1⚡BOLD⚡\n', text, flags=re.MULTILINE)
+    text = re.sub(r'\*\*(.+?)\*\*', r'⚡BOLD⚡\1⚡BOLD⚡', text)
+    text = re.sub(r'__(.+?)__', r'⚡BOLD⚡\1⚡BOLD⚡', text)
+    text = re.sub(r'(?<![⚡\*])\*(?!\*)(.+?)(?<!\*)\*(?![⚡\*])', r'_\1_', text)
+    text = re.sub(r'(?<!_)_(?!_)(.+?)(?<!_)_(?!_)', r'_\1_', text)
+    text = text.replace('⚡BOLD⚡', '*')
+    text = re.sub(r'~~(.+?)~~', r'~\1~', text)
+    text = re.sub(r'`([^`]+)`', r'```\1```', text)
+    text = re.sub(r'```\w*\n(.*?)```', r'```\1```', text, flags=re.DOTALL)
+    text = re.sub(r'\[([^\]]+)\]\(([^\)]+)\)', r'\1: \2', text)
+    text = re.sub(r'!\[([^\]]*)\]\([^\)]+\)', r'', text)
+    text = re.sub(r'^[\-\*]\s+', r'• ', text, flags=re.MULTILINE)
+    text = re.sub(r'\n{3,}', '\n\n', text)
+    return text.strip()
+
+
+# Bausteine für zufällige Eingaben: Markdown-Marker, Whitespace, Platzhalter-Teile
+FRAGMENTS = ['#', '##', '###', '####', '#####', '######', '#######', ' ', '  ', '\t', '\r', '\x0b',
+             '\n', '\n\n', '\n\n\n', '*', '**', '***', '_', '__', '~', '~~', '`', '```', '```python\n',
+             '[', ']', '(', ')', '](', '![', '- ', '* ', '1. ', '⚡', '⚡BOLD⚡', 'BOLD', ':',
+             'Wort', 'Kickl', 'äöü', '👋', 'https://example.com']
+
+
+def random_markdown(rng: random.Random, max_fragments: int = 30) -> str:
+    return ''.join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, max_fragments)))
+
+
 class TestWhatsAppFormatter:
     """Unit tests for WhatsAppFormatter class"""
     
@@ -256,6 +293,44 @@ class TestWhatsAppFormatter:
         assert '\n' in result or '  ' in result
 
 
+
+class TestConvertMatchesLegacy:
+    """Property tests: convert() produces exactly the output of the previous implementation"""
+
+    @pytest.mark.parametrize('text', [
+        "# Überschrift\n\nDies ist **fett** und _kursiv_ und *auch kursiv*.\n\n## Abschnitt\n\n- Eins\n* Zwei",
+        "Hier ist ein [Link](https://example.com) und `Code` und ~~weg~~.",
+        "```python\nprint('Hello')\n```\n\n\n\nEnde",
+        "![Bild](bild.jpg) und ![](leer.jpg)",
+        "***fett und kursiv*** __unter__strichen__",
+        "####### sieben\n###### sechs\n#ohne Leerzeichen",
+        "#\n## Überschrift über zwei Zeilen",
+        "##\t\n\n# x\n### y",
+        "Text mit ⚡BOLD⚡ Platzhalter ⚡*Sternen*⚡",
+        "",
+        "   nur Leerzeichen   ",
+    ])
+    def test_known_edge_cases(self, text):
+        """Test: hand-picked cases incl. headings whose whitespace spans line breaks"""
+        assert WhatsAppFormatter.convert(text) == legacy_convert(text)
+
+    @pytest.mark.parametrize('seed', range(5))
+    def test_random_markdown(self, seed):
+        """Test: random combinations of markers give identical output"""
+        rng = random.Random(seed)
+        for _ in range(2000):
+            text = random_markdown(rng)
+            assert WhatsAppFormatter.convert(text) == legacy_convert(text), repr(text)
+
+    def test_random_articles(self):
+        """Test: longer article-like texts give identical output"""
+        rng = random.Random(42)
+        for _ in range(200):
+            text = '\n'.join(random_markdown(rng, 12) + ' Text ' + random_markdown(rng, 6)
+                              for _ in range(rng.randint(1, 40)))
+            assert WhatsAppFormatter.convert(text) == legacy_convert(text), repr(text)
+
+
 if __name__ == '__main__':
     print("WhatsAppFormatter Unit Tests")
     print("-" * 70)
@@ -3,39 +3,71 @@ Flask Web Interface für FakeDaily
 """
 import os
 import sys
+import atexit
+import hashlib
 import logging
-from logging.handlers import TimedRotatingFileHandler
+import math
+import mimetypes
+import threading
+import time
 from pathlib import Path
 from datetime import datetime
+from urllib.parse import quote
 import sqlite3
-from difflib import SequenceMatcher
+
+# Beginn des Imports (Messung Import bis bereit, siehe startup())
+_IMPORT_STARTED = time.perf_counter()
 
 # Pfad zum src-Ordner hinzufügen
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, send_from_directory
+from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, send_from_directory, abort, Response, g
 from werkzeug.middleware.proxy_fix import ProxyFix
 from werkzeug.utils import secure_filename
+from werkzeug.security import safe_join
+from werkzeug.http import is_resource_modified
 import markdown
 
-from db_manager import DatabaseManager
+from db_manager import DatabaseManager, title_key, content_hash, add_query_observer, register_sql_functions, \
+    TAG_STATS_SCHEMA, REBUILD_TAG_STATS, FEED_STATE_SCHEMA
 from image_processor import ImageProcessor
-from whatsapp_formatter import WhatsAppFormatter
+from whatsapp_digest import DIGEST_SEPARATOR, TextCache, format_cached, iter_digest
+from atom_feed import CONTENT_TYPE as FEED_CONTENT_TYPE, atom_date, parse_timestamp, render_entry, render_feed
 from auto_tagger import add_auto_tags_if_empty
+from article_import import IMPORT_JOBS_TABLE, ArticleImporter, get_import_job, start_import_job
+from content_archive import ARCHIVE_FORMATS, CONTENT_TYPES, ArchiveImporter, format_from_content_type, iter_archive
+from log_queue import QueueLogging
+from log_rotation import SharedTimedRotatingFileHandler
+from query_stats import SLOW_QUERY_MS, SORT_KEYS, QueryStats
+from metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, CacheStats, MetricsRegistry, begin_request, count_query, current_request, end_request
 
 # ===== Database Initialization =====
 BASE_DIR = Path(__file__).parent.parent
-DB_PATH = BASE_DIR / "database" / "articles.db"
-
-def init_database():
+# DB_PATH/LOG_DIR überschreibbar, z.B. für Lasttests gegen eine temporäre Datenbank
+DB_PATH = Path(os.environ.get('DB_PATH', BASE_DIR / "database" / "articles.db"))
+
+def _ensure_columns(cursor, table, columns):
+    """Ergänzt fehlende Spalten in bestehenden Datenbanken (einfache Migration)"""
+    cursor.execute(f"PRAGMA table_info({table})")
+    existing = {row[1] for row in cursor.fetchall()}
+    for name, definition in columns:
+        if name not in existing:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN {name} {definition}")
+
+def init_database(db_path=None):
     """Erstellt die Datenbank und Tabellen wenn sie nicht existieren"""
+    db_path = Path(db_path or DB_PATH)
     # Sicherstellen, dass der database-Ordner existiert
-    DB_PATH.parent.mkdir(exist_ok=True)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
     
     # Verbindung zur Datenbank
-    conn = sqlite3.connect(DB_PATH)
+    conn = register_sql_functions(sqlite3.connect(db_path))
     cursor = conn.cursor()
     
+    # WAL: Leser (Reader-Routen, andere Worker) blockieren den Schreiber nicht
+    # und umgekehrt; die Einstellung wird in der Datei gespeichert
+    cursor.execute("PRAGMA journal_mode = WAL")
+    
     # Articles Tabelle
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS articles (
@@ -46,7 +78,9 @@ def init_database():
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             published BOOLEAN DEFAULT 0,
-            tags TEXT
+            tags TEXT,
+            title_key TEXT,
+            content_hash TEXT
         )
     """)
     
@@ -60,78 +94,144 @@ def init_database():
             alt_text TEXT,
             caption TEXT,
             uploaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            width INTEGER,
+            height INTEGER,
+            file_size INTEGER,
+            mime_type TEXT,
+            sha256 TEXT,
             FOREIGN KEY (article_id) REFERENCES articles(id) ON DELETE CASCADE
         )
     """)
     
+    # Bild-Metadaten für bestehende Datenbanken nachrüsten
+    _ensure_columns(cursor, 'images', [
+        ('width', 'INTEGER'),
+        ('height', 'INTEGER'),
+        ('file_size', 'INTEGER'),
+        ('mime_type', 'TEXT'),
+        ('sha256', 'TEXT'),
+    ])
+    
+    # Normalisierter Titel-Schlüssel und Inhalts-Fingerprint für Duplikat-Prüfungen beim Import
+    _ensure_columns(cursor, 'articles', [
+        ('title_key', 'TEXT'),
+        ('content_hash', 'TEXT'),
+    ])
+    
     # Index für schnellere Suche
     cursor.execute("""
         CREATE INDEX IF NOT EXISTS idx_articles_published 
         ON articles(published)
     """)
     
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_articles_title_key 
+        ON articles(title_key)
+    """)
+    
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_articles_content_hash 
+        ON articles(content_hash)
+    """)
+    
+    # Fehlende Schlüssel nachtragen (bestehende DBs, Import per SQL-Skript)
+    cursor.execute("SELECT id, title FROM articles WHERE title_key IS NULL")
+    missing_keys = [(title_key(title), article_id) for article_id, title in cursor.fetchall()]
+    if missing_keys:
+        cursor.executemany("UPDATE articles SET title_key = ? WHERE id = ?", missing_keys)
+    
+    cursor.execute("SELECT id, content FROM articles WHERE content_hash IS NULL")
+    missing_hashes = [(content_hash(content), article_id) for article_id, content in cursor.fetchall()]
+    if missing_hashes:
+        cursor.executemany("UPDATE articles SET content_hash = ? WHERE id = ?", missing_hashes)
+    
     cursor.execute("""
         CREATE INDEX IF NOT EXISTS idx_images_article 
         ON images(article_id)
     """)
     
+    # Status der asynchronen JSON-Importe
+    cursor.execute(IMPORT_JOBS_TABLE)
+    
+    # Tag-Statistik (per Trigger aktuell gehalten); bei neuer Tabelle einmal aus allen Artikeln füllen.
+    # Trigger älterer Versionen (SQL-lower(), nur ASCII) werden ersetzt und die Zählung neu aufgebaut
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tag_stats'")
+    tag_stats_missing = cursor.fetchone() is None
+    cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = 'tag_stats_insert'")
+    row = cursor.fetchone()
+    tag_triggers_outdated = row is not None and 'unicode_lower' not in row[0]
+    conn.commit()
+    if tag_triggers_outdated:
+        cursor.executescript("DROP TRIGGER tag_stats_insert; DROP TRIGGER tag_stats_update; "
+                             "DROP TRIGGER tag_stats_delete;")
+    cursor.executescript(TAG_STATS_SCHEMA)
+    if tag_stats_missing or tag_triggers_outdated:
+        cursor.executescript(REBUILD_TAG_STATS)
+    
+    # Feed-Stand (per Trigger bei jeder Änderung an veröffentlichten Artikeln erhöht)
+    cursor.executescript(FEED_STATE_SCHEMA)
+    
     conn.commit()
     conn.close()
     
-    print(f"✓ Datenbank bereit: {DB_PATH}")
-
-# DB beim Import initialisieren
-init_database()
+    print(f"✓ Datenbank bereit: {db_path}")
 
 # ===== Logging Setup =====
-LOG_DIR = BASE_DIR / 'logs'
-LOG_DIR.mkdir(exist_ok=True)
+# Logger werden beim Import angelegt, ihre Handler (Dateien, Konsole) erst
+# beim Start (setup_logging, siehe startup())
+LOG_DIR = Path(os.environ.get('LOG_DIR', BASE_DIR / 'logs'))
 
 # Security Logger für sicherheitsrelevante Events
 security_logger = logging.getLogger('fakedaily.security')
 security_logger.setLevel(logging.INFO)
 
-# Timed Rotating File Handler für Security-Log (DSGVO: 30 Tage Aufbewahrung)
-security_handler = TimedRotatingFileHandler(
-    LOG_DIR / 'security.log',
-    when='midnight',      # Rotation um Mitternacht
-    interval=1,           # Täglich
-    backupCount=30,       # 30 Tage Aufbewahrung (DSGVO-konform)
-    encoding='utf-8'
-)
-security_handler.setLevel(logging.INFO)
-security_formatter = logging.Formatter(
-    '%(asctime)s - %(name)s - %(levelname)s - [%(remote_addr)s] %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
-security_handler.setFormatter(security_formatter)
-security_logger.addHandler(security_handler)
-
 # App Logger für allgemeine Events
 app_logger = logging.getLogger('fakedaily.app')
 app_logger.setLevel(logging.INFO)
 
-# Timed Rotating File Handler für App-Log (DSGVO: 30 Tage Aufbewahrung)
-app_handler = TimedRotatingFileHandler(
-    LOG_DIR / 'app.log',
-    when='midnight',      # Rotation um Mitternacht
-    interval=1,           # Täglich
-    backupCount=30,       # 30 Tage Aufbewahrung (DSGVO-konform)
-    encoding='utf-8'
-)
-app_handler.setLevel(logging.INFO)
-app_formatter = logging.Formatter(
-    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
-app_handler.setFormatter(app_formatter)
-app_logger.addHandler(app_handler)
-
-# Console Handler für Development
-console_handler = logging.StreamHandler()
-console_handler.setLevel(logging.INFO)
-console_handler.setFormatter(app_formatter)
-app_logger.addHandler(console_handler)
+def setup_logging(log_dir):
+    """Legt die Handler für Security- und App-Log an"""
+    log_dir = Path(log_dir)
+    log_dir.mkdir(parents=True, exist_ok=True)
+    
+    # Täglich rotierendes Security-Log (DSGVO: 30 Tage Aufbewahrung); rotiert wird
+    # auch bei mehreren Gunicorn-Workern nur einmal (siehe src/log_rotation.py)
+    security_handler = SharedTimedRotatingFileHandler(
+        log_dir / 'security.log',
+        when='midnight',      # Rotation um Mitternacht
+        interval=1,           # Täglich
+        backupCount=30,       # 30 Tage Aufbewahrung (DSGVO-konform)
+        encoding='utf-8'
+    )
+    security_handler.setLevel(logging.INFO)
+    security_formatter = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - [%(remote_addr)s] %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    security_handler.setFormatter(security_formatter)
+    security_logger.addHandler(security_handler)
+    
+    # Timed Rotating File Handler für App-Log (DSGVO: 30 Tage Aufbewahrung)
+    app_handler = SharedTimedRotatingFileHandler(
+        log_dir / 'app.log',
+        when='midnight',      # Rotation um Mitternacht
+        interval=1,           # Täglich
+        backupCount=30,       # 30 Tage Aufbewahrung (DSGVO-konform)
+        encoding='utf-8'
+    )
+    app_handler.setLevel(logging.INFO)
+    app_formatter = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    app_handler.setFormatter(app_formatter)
+    app_logger.addHandler(app_handler)
+    
+    # Console Handler für Development
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.INFO)
+    console_handler.setFormatter(app_formatter)
+    app_logger.addHandler(console_handler)
 
 def anonymize_ip(ip_address):
     """Anonymisiert IP-Adresse gemäß DSGVO (letztes Oktett auf 0)"""
@@ -193,13 +293,30 @@ class GDPRRequestLogger:
         werkzeug_logger = logging.getLogger('werkzeug')
         werkzeug_logger.setLevel(logging.WARNING)  # Nur Warnings/Errors
         
-        # Custom Request Logger
+        # Custom Request Logger (Handler: setup_handlers beim Start)
         self.request_logger = logging.getLogger('fakedaily.requests')
         self.request_logger.setLevel(logging.INFO)
         
-        # Handler für Request-Log
-        request_handler = TimedRotatingFileHandler(
-            LOG_DIR / 'requests.log',
+        # Hook into Flask's request cycle
+        @app.after_request
+        def log_request(response):
+            # Skip health checks und Metrik-Abrufe (zu viel Noise)
+            if request.path in ('/health', '/metrics'):
+                return response
+            
+            # Anonymisierte IP
+            anonymized_ip = anonymize_ip(request.remote_addr)
+            
+            # Log-Format ähnlich zu Werkzeug, aber mit anonymisierter IP
+            self.request_logger.info(
+                f'{anonymized_ip} - - "{request.method} {request.path} {request.environ.get("SERVER_PROTOCOL")}" {response.status_code} -'
+            )
+            return response
+    
+    def setup_handlers(self, log_dir):
+        """Legt Datei- und Konsolen-Handler für das Request-Log an"""
+        request_handler = SharedTimedRotatingFileHandler(
+            Path(log_dir) / 'requests.log',
             when='midnight',
             interval=1,
             backupCount=30,
@@ -218,22 +335,72 @@ class GDPRRequestLogger:
         console_handler.setLevel(logging.INFO)
         console_handler.setFormatter(request_formatter)
         self.request_logger.addHandler(console_handler)
+
+# Metriken pro Request (GET /metrics)
+class RequestMetrics:
+    """Misst Latenz, DB-Queries und Markdown-Renderzeit pro Endpoint
+    
+    Die DB-Zeit kommt vom Query-Beobachter des DatabaseManager, die
+    Markdown-Zeit von render_markdown(). Gestreamte Antworten werden erst
+    gemessen, wenn der Server den Body vollständig gesendet hat.
+    """
+    
+    QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
+    FAST_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+    
+    def __init__(self, app, registry):
+        self.registry = registry
+        self.request_duration = registry.histogram(
+            'fakedaily_http_request_duration_seconds', 'Dauer der Requests pro Endpoint', ['method', 'endpoint'])
+        self.requests = registry.counter(
+            'fakedaily_http_requests_total', 'Requests pro Endpoint und Status', ['method', 'endpoint', 'status'])
+        self.db_queries = registry.histogram(
+            'fakedaily_db_queries_per_request', 'DB-Queries pro Request', ['endpoint'],
+            buckets=self.QUERY_COUNT_BUCKETS)
+        self.db_time = registry.histogram(
+            'fakedaily_db_seconds_per_request', 'DB-Zeit pro Request', ['endpoint'])
+        self.query_duration = registry.histogram(
+            'fakedaily_db_query_duration_seconds', 'Dauer einzelner DB-Queries (auch außerhalb von Requests)',
+            buckets=self.FAST_BUCKETS)
+        self.markdown_time = registry.histogram(
+            'fakedaily_markdown_seconds_per_request', 'Markdown-Renderzeit pro Request (nur Requests mit Markdown)',
+            ['endpoint'], buckets=self.FAST_BUCKETS)
+        
+        add_query_observer(count_query)
+        add_query_observer(self.observe_query)
+        
+        @app.before_request
+        def start_request_timer():
+            g.request_stats = begin_request()
         
-        # Hook into Flask's request cycle
         @app.after_request
-        def log_request(response):
-            # Skip health checks (zu viel Noise)
-            if request.path == '/health':
+        def record_request(response):
+            stats = g.pop('request_stats', None)
+            if stats is None:
                 return response
-            
-            # Anonymisierte IP
-            anonymized_ip = anonymize_ip(request.remote_addr)
-            
-            # Log-Format ähnlich zu Werkzeug, aber mit anonymisierter IP
-            self.request_logger.info(
-                f'{anonymized_ip} - - "{request.method} {request.path} {request.environ.get("SERVER_PROTOCOL")}" {response.status_code} -'
-            )
+            method, endpoint, status = request.method, request.endpoint or 'unmatched', response.status_code
+            if response.is_streamed:
+                response.call_on_close(lambda: self.record(stats, method, endpoint, status))
+            else:
+                self.record(stats, method, endpoint, status)
             return response
+    
+    def record(self, stats, method, endpoint, status):
+        end_request(stats)
+        self.request_duration.observe(stats.elapsed, method=method, endpoint=endpoint)
+        self.requests.inc(method=method, endpoint=endpoint, status=status)
+        self.db_queries.observe(stats.db_queries, endpoint=endpoint)
+        self.db_time.observe(stats.db_seconds, endpoint=endpoint)
+        if stats.markdown_seconds:
+            self.markdown_time.observe(stats.markdown_seconds, endpoint=endpoint)
+    
+    def observe_query(self, event):
+        self.query_duration.observe(event.seconds)
+    
+    def observe_markdown(self, seconds):
+        stats = current_request()
+        if stats is not None:
+            stats.markdown_seconds += seconds
 
 # App-Prefix für Sub-Path-Deployment (z.B. /fakedaily)
 APP_PREFIX = os.environ.get('APP_PREFIX', '').rstrip('/')
@@ -267,28 +434,321 @@ ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp'}
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max
 
-# Database Manager initialisieren
-db = DatabaseManager()
+# Thumbnails: werden beim ersten Abruf erzeugt und auf Disk gecacht
+THUMBNAIL_FOLDER = BASE_DIR / 'media' / 'thumbs'
+THUMBNAIL_SIZES = {150, 300, 600}  # Erlaubte Kantenlängen (Allowlist gegen beliebige Größen)
+app.config['THUMBNAIL_FOLDER'] = THUMBNAIL_FOLDER
+
+# Tag-Übersicht als JSON: so lange dürfen Browser/Proxies sie ohne Nachfrage verwenden
+TAG_CACHE_SECONDS = 60
+
+# Atom-Feeds (/reader/feed.xml): Anzahl Einträge, Zeit ohne Nachfrage beim Client,
+# im Prozess gehaltene Feed-Dokumente (je Tag und Feed-Stand eines)
+FEED_SIZE = int(os.environ.get('FEED_SIZE', 20))
+FEED_CACHE_SECONDS = 60
+FEED_CACHE_SIZE = 100
+
+# Auslieferung von Bildern und Thumbnails (siehe send_media):
+#   flask       Flask liest die Datei selbst (default)
+#   x-accel     nginx überträgt die Datei (X-Accel-Redirect auf MEDIA_ACCEL_PREFIX)
+#   x-sendfile  Apache/lighttpd übertragen die Datei (X-Sendfile)
+MEDIA_DELIVERY_MODES = ('flask', 'x-accel', 'x-sendfile')
+app.config['MEDIA_DELIVERY'] = os.environ.get('MEDIA_DELIVERY', 'flask').strip().lower()
+app.config['MEDIA_ACCEL_PREFIX'] = os.environ.get('MEDIA_ACCEL_PREFIX', '/_media/')
+# Bilder werden unter gleichem Namen überschrieben (reprocess_images.py), Thumbnails neu
+# erzeugt. Lange und immutable nur für versionierte URLs (?v=<sha256>, siehe image_url),
+# alles andere kurz, damit geänderte Dateien bald ankommen
+app.config['MEDIA_CACHE_SECONDS'] = int(os.environ.get('MEDIA_CACHE_SECONDS', 365 * 24 * 3600))
+app.config['MEDIA_SHORT_CACHE_SECONDS'] = int(os.environ.get('MEDIA_SHORT_CACHE_SECONDS', 300))
+
+# Beim Start ausgewertet, per create_app(config) überschreibbar
+app.config['DB_PATH'] = DB_PATH
+app.config['LOG_DIR'] = LOG_DIR
+app.config['SLOW_QUERY_MS'] = float(os.environ.get('SLOW_QUERY_MS', SLOW_QUERY_MS))
+
+# Database Manager (öffnet erst bei Bedarf eine Verbindung). Geschrieben wird
+# nur über db; die öffentlichen Reader-Routen lesen über db.reader (read-only)
+db = DatabaseManager(str(DB_PATH))
+
+# WhatsApp-Texte pro (Artikel-ID, updated_at), pro Worker-Prozess
+whatsapp_cache = TextCache()
+
+# Atom-Feeds pro (Tag, Basis-URL, Feed-Stand) und Markdown-HTML pro Inhalt, pro Worker-Prozess
+feed_cache = TextCache(max_entries=FEED_CACHE_SIZE)
+markdown_cache = TextCache()
 
 # GDPR Request Logger initialisieren
-GDPRRequestLogger(app)
+gdpr_request_logger = GDPRRequestLogger(app)
+
+# Schreibt die Log-Einträge im Hintergrund (wird von setup_logging beim Start angelegt)
+log_queue = None
+
+# Metriken (GET /metrics)
+metrics_registry = MetricsRegistry()
+request_metrics = RequestMetrics(app, metrics_registry)
+thumbnail_cache_stats = CacheStats()
+
+# Query-Statistik und Slow-Query-Log (GET /admin/api/stats/queries)
+query_stats = QueryStats(threshold_ms=app.config['SLOW_QUERY_MS'])
+add_query_observer(query_stats.observe)
 
-# Markdown-Konverter
-md = markdown.Markdown(extensions=['fenced_code', 'tables', 'nl2br'])
+def _cache_counts():
+    """(Treffer, Fehlschläge) pro Cache"""
+    return {
+        'whatsapp': (whatsapp_cache.hits, whatsapp_cache.misses),
+        'feed': (feed_cache.hits, feed_cache.misses),
+        'markdown': (markdown_cache.hits, markdown_cache.misses),
+        'thumbnails': (thumbnail_cache_stats.hits, thumbnail_cache_stats.misses),
+    }
+
+metrics_registry.counter(
+    'fakedaily_cache_hits_total', 'Cache-Treffer', ['cache'],
+    callback=lambda: {(name,): hits for name, (hits, misses) in _cache_counts().items()})
+metrics_registry.counter(
+    'fakedaily_cache_misses_total', 'Cache-Fehlschläge', ['cache'],
+    callback=lambda: {(name,): misses for name, (hits, misses) in _cache_counts().items()})
+metrics_registry.counter(
+    'fakedaily_log_records_dropped_total', 'Wegen voller Log-Queue verworfene Log-Einträge',
+    callback=lambda: {(): log_queue.dropped} if log_queue else {})
+metrics_registry.gauge(
+    'fakedaily_log_queue_size', 'Wartende Log-Einträge',
+    callback=lambda: {(): log_queue.queue.qsize()} if log_queue else {})
+metrics_registry.gauge(
+    'fakedaily_cache_hit_ratio', 'Anteil der Cache-Treffer seit Prozessstart', ['cache'],
+    callback=lambda: {(name,): hits / (hits + misses)
+                      for name, (hits, misses) in _cache_counts().items() if hits + misses})
+
+# Markdown-Konverter: eine Instanz pro Thread, markdown.Markdown ist nicht
+# threadsicher (Gunicorn mit --threads rendert parallel)
+MARKDOWN_EXTENSIONS = ['fenced_code', 'tables', 'nl2br']
+_markdown_local = threading.local()
+
+def _markdown_converter():
+    """Markdown-Instanz des aktuellen Threads (beim ersten Aufruf angelegt)"""
+    md = getattr(_markdown_local, 'md', None)
+    if md is None:
+        md = _markdown_local.md = markdown.Markdown(extensions=MARKDOWN_EXTENSIONS)
+    return md
+
+def render_markdown(text):
+    """Markdown zu HTML (Renderzeit zählt für /metrics)"""
+    start = time.perf_counter()
+    md = _markdown_converter()
+    md.reset()
+    html = md.convert(text)
+    request_metrics.observe_markdown(time.perf_counter() - start)
+    return html
+
+def render_markdown_cached(text):
+    """render_markdown mit Cache; Schlüssel ist der Inhalt selbst (SHA-1), jede Änderung rendert neu"""
+    key = hashlib.sha1(text.encode('utf-8')).digest()
+    html = markdown_cache.get(key)
+    if html is None:
+        html = render_markdown(text)
+        markdown_cache.put(key, html)
+    return html
+
+# ===== Start (App-Factory) =====
+# Beim Import werden nur Routen, Hooks und Metriken registriert. DB-Migration,
+# Log-Handler und Aufwärmen laufen erst in startup(): explizit über
+# create_app() (Gunicorn: web.app:create_app(), mit preload einmal im Master)
+# oder spätestens beim ersten Request.
+
+_startup_hooks = []
+_startup_lock = threading.Lock()
+_ready = False
+startup_timings = {}
+
+def startup_hook(name):
+    """Registriert eine Funktion, die startup() einmal ausführt (in Reihenfolge der Registrierung)"""
+    def register(func):
+        _startup_hooks.append((name, func))
+        return func
+    return register
+
+@startup_hook('database')
+def _start_database():
+    init_database(app.config['DB_PATH'])
+
+@startup_hook('logging')
+def _start_logging():
+    """Log-Handler anlegen und in einen Hintergrund-Thread verlegen:
+    Requests legen Einträge nur noch in eine Queue, beim Beenden wird geflusht"""
+    global log_queue
+    log_dir = app.config['LOG_DIR']
+    setup_logging(log_dir)
+    gdpr_request_logger.setup_handlers(log_dir)
+    log_queue = QueueLogging([security_logger, app_logger, gdpr_request_logger.request_logger])
+    log_queue.start()
+    atexit.register(log_queue.stop)
+
+@startup_hook('media')
+def _start_media():
+    """Auslieferungsmodus für Bilder prüfen; x-sendfile übernimmt Flask selbst (USE_X_SENDFILE)"""
+    mode = app.config['MEDIA_DELIVERY']
+    if mode not in MEDIA_DELIVERY_MODES:
+        raise ValueError(f"Unbekannter MEDIA_DELIVERY-Modus '{mode}' (erlaubt: {', '.join(MEDIA_DELIVERY_MODES)})")
+    app.config['USE_X_SENDFILE'] = mode == 'x-sendfile'
+
+@startup_hook('warmup')
+def _warm_up():
+    """Templates kompilieren und Markdown-Erweiterungen laden (mit preload erben die Worker beides)"""
+    for template in ('reader_index.html', 'reader_article.html', 'index.html', 'view_article.html'):
+        app.jinja_env.get_template(template)
+    _markdown_converter()
+
+def startup():
+    """Führt die Startup-Hooks einmal aus (threadsicher) und misst Import bis bereit"""
+    global _ready
+    if _ready:
+        return
+    with _startup_lock:
+        if _ready:
+            return
+        started = time.perf_counter()
+        timings = {'import': _IMPORT_SECONDS}
+        for name, hook in _startup_hooks:
+            hook_started = time.perf_counter()
+            hook()
+            timings[name] = time.perf_counter() - hook_started
+        timings['startup'] = time.perf_counter() - started
+        timings['ready'] = timings['import'] + timings['startup']
+        startup_timings.update(timings)
+        _ready = True
+    
+    details = ', '.join(f"{name} {startup_timings[name] * 1000:.0f} ms" for name, _ in _startup_hooks)
+    app_logger.info(f"FakeDaily bereit nach {startup_timings['ready'] * 1000:.0f} ms "
+                    f"(Import {startup_timings['import'] * 1000:.0f} ms, Start: {details})")
+
+def create_app(config=None):
+    """App-Factory: übernimmt config und startet die App
+    
+    Args:
+        config: Überschreibt app.config vor dem Start, z.B. DB_PATH,
+                LOG_DIR, SLOW_QUERY_MS, UPLOAD_FOLDER
+    
+    Returns:
+        Die gestartete Flask-App
+    """
+    global db
+    if config:
+        if _ready:
+            raise RuntimeError("App ist bereits gestartet, Konfiguration nur vor dem Start möglich")
+        app.config.update(config)
+        if 'DB_PATH' in config:
+            db = DatabaseManager(str(config['DB_PATH']))
+        if 'SLOW_QUERY_MS' in config:
+            query_stats.threshold_ms = float(config['SLOW_QUERY_MS'])
+    startup()
+    return app
+
+@app.before_request
+def ensure_started():
+    """Startet die App beim ersten Request, falls create_app() nicht aufgerufen wurde"""
+    if not _ready:
+        startup()
+
+metrics_registry.gauge(
+    'fakedaily_startup_seconds', 'Dauer von Import und Start-Phasen (ready = Import bis bereit)', ['phase'],
+    callback=lambda: {(phase,): seconds for phase, seconds in startup_timings.items()})
 
 # Context Processor für globale Template-Variablen
 @app.context_processor
 def inject_globals():
     return {
         'SITE_TITLE': SITE_TITLE,
-        'APP_PREFIX': APP_PREFIX
+        'APP_PREFIX': APP_PREFIX,
+        'image_url': image_url
     }
 
+def image_url(image):
+    """URL eines Bildes (Zeile aus images) mit Inhalts-Version ?v=<sha256>
+    
+    Ändert sich die Datei (und damit der gespeicherte Hash), ändert sich die
+    URL; nur solche URLs liefert send_media mit langem max-age und immutable aus.
+    """
+    if image.get('sha256'):
+        return url_for('serve_image', filename=image['filename'], v=image['sha256'][:16])
+    return url_for('serve_image', filename=image['filename'])
+
 def allowed_file(filename):
     """Prüft ob Datei-Extension erlaubt ist"""
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
 
+# Feste Anzahl Locks (gestreift nach Hash), damit parallele Erst-Abrufe nicht
+# doppelt rechnen; wächst nicht mit der Zahl der Bilder. Verschiedene
+# Thumbnails auf demselben Lock warten nur aufeinander.
+THUMBNAIL_LOCK_STRIPES = 64
+_thumbnail_locks = [threading.Lock() for _ in range(THUMBNAIL_LOCK_STRIPES)]
+
+def _thumbnail_lock(key):
+    """Liefert das Lock für ein Thumbnail (size, filename)"""
+    return _thumbnail_locks[hash(key) % THUMBNAIL_LOCK_STRIPES]
+
+def ensure_thumbnail(filename, size):
+    """Erzeugt das Thumbnail für ein Bild falls nötig und gibt dessen Pfad zurück
+    
+    Args:
+        filename: Dateiname relativ zu UPLOAD_FOLDER
+        size: Kantenlänge aus THUMBNAIL_SIZES
+    
+    Returns:
+        Pfad zum Thumbnail oder None (unbekannte Größe, ungültiger Pfad, Original fehlt)
+    """
+    if size not in THUMBNAIL_SIZES:
+        return None
+    
+    source = safe_join(str(app.config['UPLOAD_FOLDER']), filename)
+    target = safe_join(str(app.config['THUMBNAIL_FOLDER']), str(size), filename)
+    if source is None or target is None or not os.path.isfile(source):
+        return None
+    
+    target = Path(target)
+    
+    def is_fresh():
+        return target.exists() and target.stat().st_mtime >= os.path.getmtime(source)
+    
+    if is_fresh():
+        thumbnail_cache_stats.hit()
+        return target
+    
+    with _thumbnail_lock((size, filename)):
+        # Ein paralleler Request könnte das Thumbnail inzwischen erzeugt haben
+        if is_fresh():
+            thumbnail_cache_stats.hit()
+            return target
+        
+        thumbnail_cache_stats.miss()
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # Erst temporär schreiben, dann atomar umbenennen: andere Prozesse
+        # (oder nginx) sehen nie eine halb geschriebene Datei
+        tmp_path = target.with_name(f".tmp-{os.getpid()}-{threading.get_ident()}-{target.name}")
+        try:
+            ImageProcessor().create_thumbnail(source, str(tmp_path), size=(size, size))
+            os.replace(tmp_path, target)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+    
+    return target
+
+def delete_thumbnails(filename):
+    """Löscht alle gecachten Thumbnails eines Bildes"""
+    for size in THUMBNAIL_SIZES:
+        thumb = safe_join(str(app.config['THUMBNAIL_FOLDER']), str(size), filename)
+        if thumb and os.path.isfile(thumb):
+            os.unlink(thumb)
+
+def read_image_metadata(filepath):
+    """Liest Bild-Metadaten (Größe, Bytes, MIME-Typ, Hash) - leeres Dict bei Fehler"""
+    try:
+        return ImageProcessor.read_metadata(str(filepath))
+    except Exception as e:
+        app_logger.warning(f"Bild-Metadaten konnten nicht gelesen werden: {filepath} ({e})")
+        return {}
+
+
 # ===== Routes =====
 
 # Health-Check Endpoint (ohne APP_PREFIX, damit Docker-Healthcheck unabhängig vom Prefix funktioniert)
@@ -300,6 +760,12 @@ def health():
         'service': 'FakeDaily CMS'
     }), 200
 
+# Metriken im Prometheus-Textformat (ohne APP_PREFIX, wie /health)
+@app.route('/metrics')
+def metrics():
+    """Metriken für Prometheus (Werte dieses Worker-Prozesses)"""
+    return Response(metrics_registry.render(), content_type=METRICS_CONTENT_TYPE)
+
 # Root zeigt Reader (Public)
 @app.route(f'{APP_PREFIX}/')
 def root():
@@ -348,14 +814,12 @@ def index():
         content = article['content']
         first_paragraph = content.split('\n\n')[0] if '\n\n' in content else content[:200]
         
-        md.reset()
-        article['excerpt_html'] = md.convert(first_paragraph)
+        article['excerpt_html'] = render_markdown(first_paragraph)
         
         # Falls der erste Absatz zu lang ist, auf 200 Zeichen kürzen
         if len(first_paragraph) > 200:
             truncated = first_paragraph[:200]
-            md.reset()
-            article['excerpt_html'] = md.convert(truncated) + '...'
+            article['excerpt_html'] = render_markdown(truncated) + '...'
     
     return render_template('index.html', 
                          articles=articles, 
@@ -373,8 +837,7 @@ def view_article(article_id):
         return redirect(url_for('index'))
     
     # Markdown zu HTML konvertieren
-    md.reset()
-    article['content_html'] = md.convert(article['content'])
+    article['content_html'] = render_markdown(article['content'])
     
     # Bilder laden
     images = db.get_images_for_article(article_id)
@@ -512,6 +975,7 @@ def delete_article(article_id):
         img_path = BASE_DIR / img['filepath']
         if img_path.exists():
             img_path.unlink()
+        delete_thumbnails(img['filename'])
     
     # Artikel löschen
     if db.delete_article(article_id):
@@ -547,6 +1011,7 @@ def delete_image(image_id):
         img_path = BASE_DIR / result['filepath']
         if img_path.exists():
             img_path.unlink()
+        delete_thumbnails(img_path.name)
         
         # Aus DB löschen
         if db.delete_image(image_id):
@@ -564,10 +1029,60 @@ def delete_image(image_id):
     return redirect(request.referrer or url_for('index'))
 
 
+def send_media(directory, filename, location, versioned=False):
+    """Liefert eine Datei aus directory aus (je nach MEDIA_DELIVERY)
+    
+    Flask prüft Pfad und Existenz immer selbst. Bei 'x-accel' antwortet es nur
+    mit X-Accel-Redirect auf MEDIA_ACCEL_PREFIX/location/filename, nginx
+    überträgt die Datei (interne Location, siehe nginx.conf.example) und der
+    Worker ist sofort wieder frei.
+    
+    Args:
+        directory: UPLOAD_FOLDER oder THUMBNAIL_FOLDER
+        filename: Pfad relativ zu directory (aus der URL)
+        location: Unterordner unter MEDIA_ACCEL_PREFIX ('images' oder 'thumbs')
+        versioned: URL enthält den Inhalts-Hash (?v=): MEDIA_CACHE_SECONDS und
+            immutable, sonst nur MEDIA_SHORT_CACHE_SECONDS
+    """
+    path = safe_join(str(directory), filename)
+    if path is None or not os.path.isfile(path):
+        abort(404)
+    
+    max_age = app.config['MEDIA_CACHE_SECONDS' if versioned else 'MEDIA_SHORT_CACHE_SECONDS']
+    if app.config['MEDIA_DELIVERY'] == 'x-accel':
+        response = Response(mimetype=mimetypes.guess_type(path)[0] or 'application/octet-stream')
+        prefix = app.config['MEDIA_ACCEL_PREFIX'].rstrip('/')
+        response.headers['X-Accel-Redirect'] = f"{prefix}/{location}/{quote(filename)}"
+        if max_age:
+            response.cache_control.public = True
+            response.cache_control.max_age = max_age
+    else:
+        response = send_from_directory(directory, filename, max_age=max_age)
+    if max_age and versioned:
+        response.cache_control.immutable = True
+    return response
+
+
 @app.route(f'{APP_PREFIX}/media/images/<path:filename>')
 def serve_image(filename):
-    """Bilder ausliefern"""
-    return send_from_directory(app.config['UPLOAD_FOLDER'], filename)
+    """Bilder ausliefern (mit ?v=<sha256> aus image_url lange cachebar)"""
+    return send_media(app.config['UPLOAD_FOLDER'], filename, 'images', versioned=bool(request.args.get('v')))
+
+
+@app.route(f'{APP_PREFIX}/media/thumbs/<int:size>/<path:filename>')
+def serve_thumbnail(size, filename):
+    """Thumbnail ausliefern (wird beim ersten Abruf erzeugt und gecacht)"""
+    try:
+        thumb_path = ensure_thumbnail(filename, size)
+    except Exception as e:
+        # Defektes Bild o.ä.: Original ausliefern statt Fehlerseite
+        app_logger.warning(f"Thumbnail konnte nicht erzeugt werden: {filename} ({e})")
+        return send_media(app.config['UPLOAD_FOLDER'], filename, 'images')
+    
+    if thumb_path is None:
+        abort(404)
+    
+    return send_media(app.config['THUMBNAIL_FOLDER'], f"{size}/{filename}", 'thumbs')
 
 
 # ===== API Routes =====
@@ -653,12 +1168,13 @@ def api_upload_images(article_id):
                     except Exception as e:
                         errors.append(f"Logo-Fehler für {filename}: {str(e)}")
                 
-                # In DB eintragen
+                # In DB eintragen (Metadaten nach dem Wasserzeichen lesen)
                 relative_path = f"media/images/{new_filename}"
                 db.add_image(
                     article_id=article_id,
                     filename=new_filename,
-                    filepath=relative_path
+                    filepath=relative_path,
+                    **read_image_metadata(filepath)
                 )
                 
                 # Security Log
@@ -697,12 +1213,8 @@ def whatsapp_export(article_id):
         flash('Artikel nicht gefunden', 'error')
         return redirect(url_for('index'))
     
-    # WhatsApp-formatierter Text
-    whatsapp_text = WhatsAppFormatter.format_article(
-        title=article['title'],
-        content=article['content'],
-        author=article.get('author')
-    )
+    # WhatsApp-formatierter Text (aus dem Cache, solange updated_at gleich ist)
+    whatsapp_text = format_cached(whatsapp_cache, article)
     
     # Bilder laden
     images = db.get_images_for_article(article_id)
@@ -747,12 +1259,13 @@ def upload_images(article_id, files):
                 except Exception as e:
                     flash(f'Warnung: Logo konnte nicht hinzugefügt werden: {e}', 'warning')
             
-            # In DB eintragen
+            # In DB eintragen (Metadaten nach dem Wasserzeichen lesen)
             relative_path = f"media/images/{new_filename}"
             db.add_image(
                 article_id=article_id,
                 filename=new_filename,
-                filepath=relative_path
+                filepath=relative_path,
+                **read_image_metadata(filepath)
             )
             
             # Security Log
@@ -787,6 +1300,11 @@ def export_articles_json():
                 'filename': img['filename'],
                 'alt_text': img.get('alt_text'),
                 'caption': img.get('caption'),
+                'width': img.get('width'),
+                'height': img.get('height'),
+                'file_size': img.get('file_size'),
+                'mime_type': img.get('mime_type'),
+                'sha256': img.get('sha256'),
                 'url': url_for('serve_image', filename=img['filename'], _external=True)
             }
             for img in images
@@ -799,62 +1317,123 @@ def export_articles_json():
     })
 
 
-# ============================================================================
-# SIMILARITY DETECTION (from docs/Aehnlichkeitserkennung.md)
-# ============================================================================
-
-def similarity(a: str, b: str) -> float:
-    """
-    Calculate similarity ratio between two strings using SequenceMatcher.
+@app.route(f'{APP_PREFIX}/admin/api/export/whatsapp')
+def export_whatsapp_digest():
+    """Mehrere Artikel als ein WhatsApp-Text (Digest), als Stream
     
-    Uses Longest Common Subsequence (LCS) algorithm:
-    ratio = 2.0 × M / T
-    where M = matching characters, T = total length
+    Usage:
+        curl "http://localhost:5001/admin/api/export/whatsapp?ids=12,15,9"
+        curl "http://localhost:5001/admin/api/export/whatsapp?from=2026-01-16"
+        curl "http://localhost:5001/admin/api/export/whatsapp?from=2026-01-01&to=2026-01-31&published=1"
     
-    Args:
-        a: First string
-        b: Second string
-        
-    Returns:
-        float: Similarity ratio between 0.0 (completely different) and 1.0 (identical)
+    ids: Artikel in dieser Reihenfolge; from/to: Erstellungsdatum (inklusive,
+    'to' ohne Angabe = 'from'), chronologisch. Die Texte kommen aus dem Cache
+    (Schlüssel: id + updated_at), nur geänderte Artikel werden neu formatiert.
     """
-    return SequenceMatcher(None, a.lower(), b.lower()).ratio()
+    ids_param = request.args.get('ids', '').strip()
+    created_from = request.args.get('from', '').strip() or None
+    created_to = request.args.get('to', '').strip() or created_from
+    
+    if not ids_param and not created_from:
+        return jsonify({'success': False, 'error': 'ids oder from (YYYY-MM-DD) angeben'}), 400
+    
+    article_ids = None
+    if ids_param:
+        try:
+            article_ids = [int(article_id) for article_id in ids_param.split(',') if article_id.strip()]
+        except ValueError:
+            return jsonify({'success': False, 'error': 'ids muss eine Liste von Zahlen sein'}), 400
+    
+    for value in (created_from, created_to):
+        if value:
+            try:
+                datetime.strptime(value, '%Y-%m-%d')
+            except ValueError:
+                return jsonify({'success': False, 'error': f'Ungültiges Datum: {value} (YYYY-MM-DD)'}), 400
+    
+    versions = db.get_article_versions(
+        article_ids=article_ids,
+        created_from=None if article_ids is not None else created_from,
+        created_to=None if article_ids is not None else created_to,
+        published_only=request.args.get('published') == '1'
+    )
+    
+    log_security_event(
+        f"API: WhatsApp digest requested - Articles={len(versions)}",
+        user_agent=request.headers.get('User-Agent', 'unknown')
+    )
+    
+    return Response(
+        iter_digest(db, versions, whatsapp_cache, request.args.get('separator', DIGEST_SEPARATOR)),
+        mimetype='text/plain',
+        headers={'X-Article-Count': str(len(versions))}
+    )
 
 
-def are_similar_articles(new_article: dict, existing_article: dict,
-                         title_threshold: float = 0.95,
-                         content_threshold: float = 0.90) -> bool:
+@app.route(f'{APP_PREFIX}/admin/api/export/archive')
+def export_articles_archive():
+    """Exportiert alle Artikel inkl. Bilddateien als Archiv (Stream)
+    
+    Usage:
+        curl -o export.tar "http://localhost:5001/admin/api/export/archive"
+        curl -o export.zip "http://localhost:5001/admin/api/export/archive?format=zip"
+    
+    Das Archiv wird beim Senden erzeugt (nichts wird auf Disk zwischengespeichert).
+    Inhalt: manifest.json, articles/*.ndjson, images/<filename>
     """
-    Check if two articles are similar based on similarity thresholds.
+    fmt = request.args.get('format', 'tar')
+    if fmt not in ARCHIVE_FORMATS:
+        return jsonify({'success': False, 'error': f'Unbekanntes Format: {fmt}'}), 400
     
-    Thresholds (documented in docs/Aehnlichkeitserkennung.md):
-    - Title: 95% similarity = duplicate
-    - Content: 90% similarity = duplicate (first 500 chars)
+    log_security_event(
+        f"API: Archive export requested - Format={fmt}",
+        user_agent=request.headers.get('User-Agent', 'unknown')
+    )
     
-    Args:
-        new_article: New article dict with 'title' and 'content'
-        existing_article: Existing article dict with 'title' and 'content'
-        title_threshold: Minimum title similarity (default: 0.95)
-        content_threshold: Minimum content similarity (default: 0.90)
-        
-    Returns:
-        bool: True if articles are considered similar/duplicates
+    filename = f"export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{fmt}"
+    return Response(
+        iter_archive(db, app.config['UPLOAD_FOLDER'], fmt),
+        mimetype=CONTENT_TYPES[fmt],
+        headers={
+            'Content-Disposition': f'attachment; filename="{filename}"',
+            'X-Accel-Buffering': 'no'  # nginx: direkt durchreichen statt puffern
+        }
+    )
+
+
+@app.route(f'{APP_PREFIX}/admin/api/import/archive', methods=['POST'])
+def import_articles_archive():
+    """Importiert ein mit /admin/api/export/archive erstelltes Archiv
+    
+    Usage:
+        curl -X POST "http://localhost:5001/admin/api/import/archive" \
+          -H "Content-Type: application/x-tar" --data-binary @export.tar
+    
+    Das Format kommt aus ?format=tar|zip oder dem Content-Type (Standard: tar).
+    tar wird direkt aus dem Request-Stream gelesen, zip über eine Temp-Datei.
+    Artikel werden per exaktem Titel zugeordnet (neuer gewinnt), Bilder per Dateiname.
     """
-    title_sim = similarity(new_article.get('title', ''), existing_article.get('title', ''))
+    fmt = request.args.get('format') or format_from_content_type(request.mimetype) or 'tar'
+    if fmt not in ARCHIVE_FORMATS:
+        return jsonify({'success': False, 'error': f'Unbekanntes Format: {fmt}'}), 400
     
-    # If titles are very similar, consider as duplicate
-    if title_sim > title_threshold:
-        return True
+    # Archive sind größer als normale Uploads; Speicher bleibt durch Streaming begrenzt
+    request.max_content_length = None
     
-    # Check content similarity (first 500 chars)
-    content1 = new_article.get('content', '')[:500]
-    content2 = existing_article.get('content', '')[:500]
-    content_sim = similarity(content1, content2)
+    importer = ArchiveImporter(db, app.config['UPLOAD_FOLDER'], ALLOWED_EXTENSIONS)
+    try:
+        stats = importer.import_stream(request.stream, fmt)
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
     
-    if content_sim > content_threshold:
-        return True
+    log_security_event(
+        f"API: Archive import completed - Imported={stats['imported']}, Updated={stats['updated']}, "
+        f"Skipped={stats['skipped']}, Images={stats['images']}, Errors={len(stats['errors'])}",
+        level=logging.WARNING if stats['errors'] else logging.INFO,
+        user_agent=request.headers.get('User-Agent', 'unknown')
+    )
     
-    return False
+    return jsonify({'success': True, **stats})
 
 
 @app.route(f'{APP_PREFIX}/admin/api/import/articles', methods=['POST'])
@@ -862,13 +1441,19 @@ def import_articles_json():
     """Importiert Artikel aus JSON mit Ähnlichkeitserkennung
     
     Importiert einen Artikel nur wenn:
-    - Der Titel noch nicht in der DB ist UND
+    - Der Titel noch nicht in der DB ist (Vergleich über title_key, d.h. ohne
+      Formatierung, Groß-/Kleinschreibung und doppelte Leerzeichen) UND
+    - Kein Artikel mit exakt gleichem Inhalt existiert (content_hash) UND
     - Kein ähnlicher Artikel existiert (Similarity Detection), ODER
     - Der Titel/ähnlicher Artikel existiert, aber updated_at im Import neuer ist
     
     Similarity Thresholds (siehe docs/Aehnlichkeitserkennung.md):
     - Title: 95% Ähnlichkeit = Duplikat
     - Content: 90% Ähnlichkeit (erste 500 Zeichen) = Duplikat
+    
+    Mit ?async=1 (oder "async": true im Body) wird nur ein Import-Job angelegt
+    und sofort mit 202 + job_id geantwortet; der Fortschritt ist unter
+    /admin/api/import/jobs/<job_id> abfragbar.
     """
     if not request.json:
         return jsonify({'success': False, 'error': 'Kein JSON-Body'}), 400
@@ -879,106 +1464,94 @@ def import_articles_json():
     if not articles_to_import:
         return jsonify({'success': False, 'error': 'Keine Artikel zum Importieren'}), 400
     
-    imported = 0
-    updated = 0
-    skipped = 0
-    errors = []
+    user_agent = request.headers.get('User-Agent', 'unknown')
     
-    for article_data in articles_to_import:
-        try:
-            title = article_data.get('title')
-            if not title:
-                errors.append('Artikel ohne Titel übersprungen')
-                skipped += 1
-                continue
-            
-            # Prüfen ob Artikel mit diesem Titel bereits existiert
-            existing = db.get_article_by_title(title)
-            
-            # Wenn kein exakter Titel-Match: Prüfe auf ähnliche Artikel (Similarity Detection)
-            if not existing:
-                all_articles = db.get_all_articles()
-                for article in all_articles:
-                    if are_similar_articles(article_data, article):
-                        existing = article
-                        app_logger.info(f"Similarity detected: '{title}' ~ '{article['title']}' (using existing)")
-                        break
-            
-            if existing:
-                # Timestamps vergleichen
-                import_updated = article_data.get('updated_at', article_data.get('created_at'))
-                existing_updated = existing.get('updated_at', existing.get('created_at'))
-                
-                if import_updated and existing_updated:
-                    # Vergleiche Timestamps
-                    import_dt = datetime.fromisoformat(import_updated)
-                    existing_dt = datetime.fromisoformat(existing_updated)
-                    
-                    if import_dt > existing_dt:
-                        # Import ist neuer - aktualisieren
-                        tags = article_data.get('tags', [])
-                        # Auto-Tagging wenn keine Tags vorhanden
-                        tags = add_auto_tags_if_empty(
-                            tags,
-                            article_data.get('title', ''),
-                            article_data.get('content', '')
-                        )
-                        
-                        db.update_article(
-                            existing['id'],
-                            title=article_data.get('title'),
-                            content=article_data.get('content'),
-                            author=article_data.get('author'),
-                            published=article_data.get('published', False),
-                            tags=tags
-                        )
-                        updated += 1
-                    else:
-                        # Existing ist neuer oder gleich - überspringen
-                        skipped += 1
-                else:
-                    # Kein Timestamp-Vergleich möglich - überspringen
-                    skipped += 1
-            else:
-                # Neuer Artikel - hinzufügen
-                tags = article_data.get('tags', [])
-                # Auto-Tagging wenn keine Tags vorhanden
-                tags = add_auto_tags_if_empty(
-                    tags,
-                    article_data.get('title', ''),
-                    article_data.get('content', '')
-                )
-                
-                db.add_article(
-                    title=article_data.get('title'),
-                    content=article_data.get('content', ''),
-                    author=article_data.get('author'),
-                    published=article_data.get('published', False),
-                    tags=tags,
-                    created_at=article_data.get('created_at')
-                )
-                imported += 1
-                
-        except Exception as e:
-            errors.append(f"Fehler bei '{article_data.get('title', 'unbekannt')}': {str(e)}")
-            skipped += 1
+    if request.args.get('async', '').lower() in ('1', 'true') or data.get('async') is True:
+        def log_job_result(job):
+            log_security_event(
+                f"API: Import job {job['id']} {job['status']} - Imported={job['imported']}, "
+                f"Updated={job['updated']}, Skipped={job['skipped']}, Errors={len(job['errors'])}",
+                level=logging.WARNING if job['errors'] or job['status'] == 'failed' else logging.INFO,
+                user_agent=user_agent
+            )
+        
+        job_id = start_import_job(db, articles_to_import, on_done=log_job_result)
+        log_security_event(f"API: Import job {job_id} queued - Articles={len(articles_to_import)}",
+                           user_agent=user_agent)
+        return jsonify({
+            'success': True,
+            'job_id': job_id,
+            'status': 'queued',
+            'total': len(articles_to_import),
+            'status_url': url_for('import_job_status', job_id=job_id)
+        }), 202
+    
+    stats = ArticleImporter(db).run(articles_to_import)
     
     # Security Log
     log_security_event(
-        f"API: Import completed - Imported={imported}, Updated={updated}, Skipped={skipped}, Errors={len(errors)}",
-        level=logging.WARNING if errors else logging.INFO,
-        user_agent=request.headers.get('User-Agent', 'unknown')
+        f"API: Import completed - Imported={stats['imported']}, Updated={stats['updated']}, "
+        f"Skipped={stats['skipped']}, Errors={len(stats['errors'])}",
+        level=logging.WARNING if stats['errors'] else logging.INFO,
+        user_agent=user_agent
     )
     
     return jsonify({
         'success': True,
-        'imported': imported,
-        'updated': updated,
-        'skipped': skipped,
-        'errors': errors
+        'imported': stats['imported'],
+        'updated': stats['updated'],
+        'skipped': stats['skipped'],
+        'errors': stats['errors']
+    })
+
+
+@app.route(f'{APP_PREFIX}/admin/api/import/jobs/<job_id>')
+def import_job_status(job_id):
+    """Status eines Import-Jobs: queued, running, done oder failed mit den bisherigen Zählern"""
+    job = get_import_job(db, job_id)
+    if job is None:
+        return jsonify({'success': False, 'error': 'Import-Job nicht gefunden'}), 404
+    return jsonify({'success': True, **job})
+
+
+@app.route(f'{APP_PREFIX}/admin/api/stats/queries', methods=['GET', 'DELETE'])
+def query_stats_api():
+    """Aggregierte DB-Statements dieses Worker-Prozesses (DELETE setzt zurück)
+    
+    Usage:
+        curl "http://localhost:5001/admin/api/stats/queries?sort=total&limit=20"
+        curl -X DELETE http://localhost:5001/admin/api/stats/queries
+    
+    sort: total, avg, max, count, rows oder slow (absteigend)
+    """
+    if request.method == 'DELETE':
+        query_stats.reset()
+        log_security_event("API: Query stats reset", user_agent=request.headers.get('User-Agent', 'unknown'))
+        return jsonify({'success': True})
+    
+    sort = request.args.get('sort', 'total')
+    if sort not in SORT_KEYS:
+        return jsonify({'success': False, 'error': f"sort muss einer von {', '.join(SORT_KEYS)} sein"}), 400
+    try:
+        limit = int(request.args.get('limit', 50))
+    except ValueError:
+        return jsonify({'success': False, 'error': 'limit muss eine Zahl sein'}), 400
+    
+    return jsonify({
+        'success': True,
+        'since': datetime.fromtimestamp(query_stats.started).isoformat(timespec='seconds'),
+        'slow_query_ms': query_stats.threshold_ms,
+        'queries': query_stats.snapshot(sort=sort, limit=limit)
     })
 
 
+@app.route(f'{APP_PREFIX}/admin/api/stats/tags')
+def tag_stats_api():
+    """Alle Tags mit Anzahl Artikel, gesamt und veröffentlicht (aus tag_stats)"""
+    tags = db.get_tag_stats()
+    return jsonify({'success': True, 'count': len(tags), 'tags': tags})
+
+
 # ===== Template Filters =====
 
 @app.template_filter('datetime')
@@ -1003,18 +1576,16 @@ def reader_index():
     
     if search_query:
         # Suche, aber nur in veröffentlichten
-        all_results = db.search_articles(search_query)
+        all_results = db.reader.search_articles(search_query)
         articles = [a for a in all_results if a.get('published')]
     else:
-        articles = db.get_all_articles(published_only=True)
+        articles = db.reader.get_all_articles(published_only=True)
     
     # Markdown zu HTML für Excerpts konvertieren
     for article in articles:
         # Nur ersten Teil konvertieren für Performance
         excerpt_text = article['content'][:300]
-        article['excerpt_html'] = md.convert(excerpt_text)
-        # Markdown-Renderer zurücksetzen für nächsten Artikel
-        md.reset()
+        article['excerpt_html'] = render_markdown(excerpt_text)
     
     return render_template('reader_index.html', articles=articles)
 
@@ -1024,22 +1595,117 @@ def reader_index():
 def reader_tag(tag):
     """Reader-Interface - Artikel nach Tag gefiltert"""
     # Nur veröffentlichte Artikel mit diesem Tag
-    articles = db.get_articles_by_tag(tag, published_only=True)
+    articles = db.reader.get_articles_by_tag(tag, published_only=True)
     
     # Markdown zu HTML für Excerpts konvertieren
     for article in articles:
         excerpt_text = article['content'][:300]
-        article['excerpt_html'] = md.convert(excerpt_text)
-        md.reset()
+        article['excerpt_html'] = render_markdown(excerpt_text)
     
     return render_template('reader_index.html', articles=articles, current_tag=tag)
 
 
+def published_tags():
+    """Tags veröffentlichter Artikel mit Anzahl und Stufe 1-5 für die Tag-Cloud"""
+    tags = db.reader.get_tag_stats(published_only=True)
+    most = max((tag['published'] for tag in tags), default=1)
+    return [
+        {
+            'tag': tag['tag'],
+            'count': tag['published'],
+            'level': 1 + round(4 * math.log(tag['published']) / math.log(most)) if most > 1 else 1,
+        }
+        for tag in tags
+    ]
+
+
+@app.route(f'{APP_PREFIX}/public/tags')
+@app.route(f'{APP_PREFIX}/reader/tags')
+def reader_tags():
+    """Reader-Interface - Übersicht aller Tags (Tag-Cloud)"""
+    return render_template('reader_tags.html', tags=published_tags())
+
+
+@app.route(f'{APP_PREFIX}/reader/api/tags')
+def reader_tags_json():
+    """Tags veröffentlichter Artikel als JSON (z.B. für Navigations-Widgets)
+    
+    Browser und Proxies dürfen die Antwort TAG_CACHE_SECONDS cachen und danach
+    per If-None-Match prüfen (304 ohne Body, solange sich nichts geändert hat).
+    """
+    tags = [dict(tag, url=url_for('reader_tag', tag=tag['tag'])) for tag in published_tags()]
+    response = jsonify({'success': True, 'count': len(tags), 'tags': tags})
+    response.cache_control.public = True
+    response.cache_control.max_age = TAG_CACHE_SECONDS
+    response.add_etag()
+    return response.make_conditional(request)
+
+
+def build_feed(tag, changed_at):
+    """Atom-Dokument der FEED_SIZE neuesten veröffentlichten Artikel (optional nur ein Tag)"""
+    articles = db.reader.get_feed_articles(FEED_SIZE, tag=tag)
+    entries = [
+        render_entry(article, url_for('reader_article', article_id=article['id'], _external=True),
+                     render_markdown_cached(article['content']))
+        for article in articles
+    ]
+    updated = max((atom_date(article['updated_at'] or article['created_at']) for article in articles),
+                  default=atom_date(changed_at))
+    return render_feed(
+        title=f"{SITE_TITLE} - {tag}" if tag else SITE_TITLE,
+        feed_url=url_for('reader_feed', tag=tag, _external=True),
+        site_url=url_for('reader_tag', tag=tag, _external=True) if tag else url_for('reader_index', _external=True),
+        updated=updated,
+        author=SITE_TITLE,
+        entries=entries,
+    )
+
+
+@app.route(f'{APP_PREFIX}/public/feed.xml')
+@app.route(f'{APP_PREFIX}/reader/feed.xml')
+@app.route(f'{APP_PREFIX}/public/tag/<tag>/feed.xml')
+@app.route(f'{APP_PREFIX}/reader/tag/<tag>/feed.xml')
+def reader_feed(tag=None):
+    """Atom-Feed der neuesten veröffentlichten Artikel, gesamt oder pro Tag
+    
+    Usage:
+        curl http://localhost:5001/reader/feed.xml
+        curl http://localhost:5001/reader/tag/Politik/feed.xml
+    
+    Pro Request wird nur der Feed-Stand gelesen (eine Zeile, feed_state). Kennt
+    der Client ihn schon (If-None-Match/If-Modified-Since), gibt es 304 ohne
+    Body. Sonst kommt das Dokument aus feed_cache; neu gebaut wird erst nach
+    einer Änderung an veröffentlichten Artikeln, und auch dann wird nur das
+    Markdown geänderter Artikel neu gerendert.
+    """
+    version, changed_at = db.reader.get_feed_state()
+    etag = hashlib.sha1(f"{version}|{changed_at}|{FEED_SIZE}".encode('utf-8')).hexdigest()[:20]
+    last_modified = parse_timestamp(changed_at)
+    
+    response = Response(content_type=FEED_CONTENT_TYPE)
+    response.set_etag(etag)
+    response.last_modified = last_modified
+    response.cache_control.public = True
+    response.cache_control.max_age = FEED_CACHE_SECONDS
+    
+    if not is_resource_modified(request.environ, etag=etag, last_modified=last_modified):
+        response.status_code = 304
+        return response
+    
+    key = (tag, request.url_root, etag)
+    body = feed_cache.get(key)
+    if body is None:
+        body = build_feed(tag, changed_at)
+        feed_cache.put(key, body)
+    response.set_data(body)
+    return response
+
+
 @app.route(f'{APP_PREFIX}/public/article/<int:article_id>')
 @app.route(f'{APP_PREFIX}/reader/article/<int:article_id>')
 def reader_article(article_id):
     """Reader-Interface - Einzelner Artikel"""
-    article = db.get_article(article_id)
+    article = db.reader.get_article(article_id)
     
     # Nur veröffentlichte Artikel anzeigen
     if not article or not article.get('published'):
@@ -1047,16 +1713,21 @@ def reader_article(article_id):
         return redirect(url_for('reader_index'))
     
     # Markdown zu HTML konvertieren
-    md.reset()
-    article['content_html'] = md.convert(article['content'])
+    article['content_html'] = render_markdown(article['content'])
     
     # Bilder laden
-    images = db.get_images_for_article(article_id)
+    images = db.reader.get_images_for_article(article_id)
     
     return render_template('reader_article.html', article=article, images=images)
 
 
+# Import abgeschlossen (Routen registriert), siehe startup()
+_IMPORT_SECONDS = time.perf_counter() - _IMPORT_STARTED
+
+
 if __name__ == '__main__':
+    create_app()
+    
     # Sicherstellen dass Upload-Ordner existiert
     UPLOAD_FOLDER.mkdir(parents=True, exist_ok=True)
     
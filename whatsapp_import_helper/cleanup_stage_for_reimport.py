@@ -5,8 +5,13 @@ Bereitet Stage DB für Re-Import vor:
 - Löscht alle Bilder außer 1_*
 """
 import sqlite3
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from db_manager import register_sql_functions
+
 DB_PATH = "database/articles.db"
 IMAGES_DIR = Path("media/images")
 
@@ -17,7 +22,7 @@ def main():
     print()
     
     # Verbinde mit DB
-    conn = sqlite3.connect(DB_PATH)
+    conn = register_sql_functions(sqlite3.connect(DB_PATH))  # für die Tag-Trigger beim Löschen
     cursor = conn.cursor()
     
     # Zähle aktuelle Artikel